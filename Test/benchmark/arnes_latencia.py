@@ -0,0 +1,301 @@
+"""
+Arnes de latencia de punta a punta del termostato
+
+Levanta el sistema completo desde Lanzador con los proxies socket en
+puertos efimeros, lo alimenta con SensorSocketProgramable (la version
+programatica de actores_externos/simulador_temperatura.py) y mide la
+latencia desde que se envia una lectura hasta que
+ActuadorClimatizadorGeneral escribe la accion resultante. Reporta
+p50/p95/p99 para tasas de lecturas crecientes.
+
+Las lecturas alternan entre una temperatura alta y una baja (fuera de
+la histeresis), de modo que cada lectura evaluada produce una accion.
+Cada valor es unico, asi la accion se asocia a la lectura exacta que
+la provoco; las lecturas que el lazo de control no llega a evaluar
+(porque llego otra antes) se cuentan como "sin accion".
+
+Uso (desde la raiz del repositorio):
+    PYTHONPATH=. python Test/benchmark/arnes_latencia.py
+    PYTHONPATH=. python Test/benchmark/arnes_latencia.py --tasas 10 50 100 --duracion 3 --json latencias.json
+
+El sistema corre en hilos daemon dentro del mismo proceso: la salida
+de consola del termostato se descarta y los archivos del actuador se
+escriben en un directorio temporal.
+"""
+# pylint: disable=duplicate-code
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from actores_externos.sensor_programable import SensorSocketProgramable
+from agentes_actuadores.actuador_climatizador import ActuadorClimatizadorGeneral
+from configurador.configurador import Configurador
+from servicios_aplicacion.lanzador import Lanzador
+
+
+HOST = "127.0.0.1"
+TEMPERATURA_ALTA = 30.0
+TEMPERATURA_BAJA = 14.0
+CARGA_BATERIA = 4.9
+TASAS_DEFAULT = (10, 20, 50, 100, 200)
+PERCENTILES = (50, 95, 99)
+
+CONFIGURACION = {
+    "proxy_bateria": "socket",
+    "proxy_sensor_temperatura": "socket",
+    "climatizador": "climatizador",
+    "actuador_climatizador": "general",
+    "selector_temperatura": "socket",
+    "seteo_temperatura": "socket",
+    "visualizador_bateria": "archivo",
+    "visualizador_temperatura": "archivo",
+    "visualizador_climatizador": "archivo",
+    "bateria": {"carga_maxima": 5.0, "umbral_carga_baja": 0.95},
+    "ambiente": {"histeresis": 2.0, "temperatura_inicial": 22.0, "incremento_ajuste": 1.0},
+    "red": {
+        "host_escucha": HOST,
+        "puertos": {
+            "bateria": 0,
+            "temperatura": 0,
+            "seteo_temperatura": 0,
+            "selector_temperatura": 0,
+        },
+        "api_url": "http://localhost:5050",
+    },
+}
+
+
+def percentil(valores, porcentaje):
+    """
+    Percentil por rango mas cercano.
+
+    Args:
+        valores (list): Muestras (no hace falta que esten ordenadas).
+        porcentaje (float): Percentil buscado, en (0, 100].
+
+    Returns:
+        float: Valor del percentil, o None si no hay muestras.
+    """
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    rango = max(math.ceil(porcentaje / 100.0 * len(ordenados)), 1)
+    return ordenados[rango - 1]
+
+
+class ActuadorCronometrado(ActuadorClimatizadorGeneral):
+    """ActuadorClimatizadorGeneral que avisa el instante de cada escritura"""
+
+    def __init__(self, al_accionar):
+        super().__init__()
+        self._al_accionar = al_accionar
+
+    def accionar_climatizador(self, accion):
+        super().accionar_climatizador(accion)
+        self._al_accionar(accion, time.monotonic())
+
+
+class ArnesLatencia:
+    """
+    Sistema completo instrumentado para medir latencia lectura -> accion.
+
+    Args:
+        periodo_control (float): Periodo del hilo del climatizador (s).
+        drenaje (float): Espera al final de cada tasa para recoger las
+            acciones de las ultimas lecturas enviadas (s).
+    """
+
+    def __init__(self, periodo_control=0.001, drenaje=0.5):
+        self._periodo_control = periodo_control
+        self._drenaje = drenaje
+        self._proxies = {}
+        self._temperatura_evaluada = None
+        self._envios = {}
+        self._acciones = {}
+        self._secuencia = 0
+        self._sensor_temperatura = None
+
+    def iniciar(self):
+        """
+        Levanta el termostato y completa su inicializacion.
+
+        Raises:
+            RuntimeError: Si el sistema no entra en operacion.
+        """
+        configuracion = dict(CONFIGURACION, operador={"periodos": {
+            "temperatura": 0,
+            "climatizador": self._periodo_control,
+            "presentacion": 1,
+            "seteo": 1,
+        }})
+        Configurador.configuracion_termostato = configuracion
+
+        configurar_climatizador = Configurador.configurar_climatizador
+        with patch.object(Configurador, "configurar_proxy_bateria",
+                          side_effect=self._capturar("bateria",
+                                                     Configurador.configurar_proxy_bateria)), \
+             patch.object(Configurador, "configurar_proxy_temperatura",
+                          side_effect=self._capturar("temperatura",
+                                                     Configurador.configurar_proxy_temperatura)), \
+             patch.object(Configurador, "configurar_climatizador",
+                          side_effect=lambda: self._instrumentar(configurar_climatizador())), \
+             patch.object(Configurador, "configurar_actuador_climatizador",
+                          side_effect=lambda: ActuadorCronometrado(self._al_accionar)):
+            lanzador = Lanzador()
+
+        hilo = threading.Thread(target=lanzador.ejecutar, daemon=True)
+        hilo.start()
+
+        bateria = SensorSocketProgramable(*self._proxies["bateria"].direccion)
+        self._sensor_temperatura = SensorSocketProgramable(*self._proxies["temperatura"].direccion)
+        bateria.enviar(CARGA_BATERIA)
+        self._sensor_temperatura.enviar(Configurador.obtener_temperatura_inicial())
+        hilo.join(timeout=5)
+        if hilo.is_alive():
+            raise RuntimeError("El termostato no completo la inicializacion")
+
+    def medir_tasa(self, tasa, duracion):
+        """
+        Envia lecturas a una tasa fija y mide la latencia de las acciones.
+
+        Args:
+            tasa (float): Lecturas por segundo.
+            duracion (float): Segundos de envio.
+
+        Returns:
+            dict: tasa, enviadas, fallidas, accionadas y latencias en ms
+                (p50, p95, p99, maxima).
+        """
+        periodo = 1.0 / tasa
+        cantidad = max(int(tasa * duracion), 1)
+        enviadas = []
+        fallidas = 0
+        proximo = time.monotonic()
+        for _ in range(cantidad):
+            espera = proximo - time.monotonic()
+            if espera > 0:
+                time.sleep(espera)
+            proximo += periodo
+            valor = self._proximo_valor()
+            try:
+                self._envios[valor] = self._sensor_temperatura.enviar(valor)
+                enviadas.append(valor)
+            except OSError:
+                fallidas += 1
+        time.sleep(self._drenaje)
+
+        latencias = [(self._acciones[valor] - self._envios[valor]) * 1000.0
+                     for valor in enviadas if valor in self._acciones]
+        resultado = {
+            "tasa": tasa,
+            "enviadas": len(enviadas),
+            "fallidas": fallidas,
+            "accionadas": len(latencias),
+        }
+        for porcentaje in PERCENTILES:
+            resultado["p{}_ms".format(porcentaje)] = percentil(latencias, porcentaje)
+        resultado["max_ms"] = max(latencias) if latencias else None
+        return resultado
+
+    def _proximo_valor(self):
+        """Temperatura unica, alternando alta y baja"""
+        self._secuencia += 1
+        base = TEMPERATURA_ALTA if self._secuencia % 2 else TEMPERATURA_BAJA
+        return round(base + self._secuencia / 100000.0, 5)
+
+    def _capturar(self, nombre, configurar):
+        """Envuelve un configurar_proxy_* para guardar el proxy creado"""
+        def configurar_y_guardar():
+            proxy = configurar()
+            self._proxies[nombre] = proxy
+            return proxy
+        return configurar_y_guardar
+
+    def _instrumentar(self, climatizador):
+        """
+        Hace que el climatizador recuerde la temperatura que evaluo.
+
+        evaluar_accion y la escritura del actuador ocurren una tras otra en
+        el hilo de control, asi la accion se asocia a la lectura evaluada
+        aunque el hilo de lectura ya haya recibido otra.
+        """
+        evaluar_accion = climatizador.evaluar_accion
+
+        def evaluar_y_recordar(ambiente):
+            self._temperatura_evaluada = ambiente.temperatura_ambiente
+            return evaluar_accion(ambiente)
+
+        climatizador.evaluar_accion = evaluar_y_recordar
+        return climatizador
+
+    def _al_accionar(self, _accion, instante):
+        """Asocia la escritura del actuador a la lectura que la provoco"""
+        valor = self._temperatura_evaluada
+        if valor in self._envios and valor not in self._acciones:
+            self._acciones[valor] = instante
+
+
+def formatear_reporte(resultados):
+    """
+    Arma la tabla de resultados por tasa.
+
+    Args:
+        resultados (list): Diccionarios devueltos por medir_tasa().
+
+    Returns:
+        str: Tabla de texto lista para imprimir.
+    """
+    def milisegundos(valor):
+        return "{:9.2f}".format(valor) if valor is not None else "{:>9}".format("-")
+
+    lineas = ["{:>8} {:>9} {:>9} {:>10} {:>9} {:>9} {:>9} {:>9}".format(
+        "tasa/s", "enviadas", "fallidas", "accionadas", "p50 ms", "p95 ms", "p99 ms", "max ms")]
+    for resultado in resultados:
+        lineas.append("{:>8g} {:>9} {:>9} {:>10} {} {} {} {}".format(
+            resultado["tasa"], resultado["enviadas"], resultado["fallidas"],
+            resultado["accionadas"], milisegundos(resultado["p50_ms"]),
+            milisegundos(resultado["p95_ms"]), milisegundos(resultado["p99_ms"]),
+            milisegundos(resultado["max_ms"])))
+    return "\n".join(lineas)
+
+
+def main(argv=None):
+    """Punto de entrada de linea de comandos"""
+    parser = argparse.ArgumentParser(description="Latencia lectura -> accion del termostato")
+    parser.add_argument("--tasas", type=float, nargs="+", default=list(TASAS_DEFAULT),
+                        help="lecturas por segundo a medir, en orden")
+    parser.add_argument("--duracion", type=float, default=5.0,
+                        help="segundos de envio por tasa")
+    parser.add_argument("--periodo-control", type=float, default=0.001,
+                        help="periodo del hilo del climatizador en segundos")
+    parser.add_argument("--json", dest="archivo_json",
+                        help="guarda los resultados en este archivo JSON")
+    argumentos = parser.parse_args(argv)
+
+    salida = sys.stdout
+    archivo_json = os.path.abspath(argumentos.archivo_json) if argumentos.archivo_json else None
+    # El termostato imprime desde sus hilos daemon durante toda la vida del proceso
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+    os.chdir(tempfile.mkdtemp(prefix="arnes_latencia_"))
+
+    arnes = ArnesLatencia(periodo_control=argumentos.periodo_control)
+    arnes.iniciar()
+    resultados = []
+    print(formatear_reporte([]), file=salida, flush=True)
+    for tasa in argumentos.tasas:
+        resultados.append(arnes.medir_tasa(tasa, argumentos.duracion))
+        print(formatear_reporte(resultados[-1:]).splitlines()[-1], file=salida, flush=True)
+    if archivo_json:
+        with open(archivo_json, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
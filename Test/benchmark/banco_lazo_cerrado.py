@@ -0,0 +1,216 @@
+"""
+Banco de lazo cerrado: calidad de control y throughput sin hardware
+
+Cierra el lazo entre el controlador real del termostato (Climatizador +
+GestorClimatizador, una instancia por habitacion) y un ModeloTermico
+vectorizado con miles de habitaciones. En cada periodo de control cada
+gestor evalua la temperatura medida de su habitacion y acciona un
+ActuadorHabitacion; entre evaluaciones el modelo avanza en pasos fijos
+para todas las habitaciones a la vez.
+
+Reporta por corrida:
+    - error medio absoluto y RMS respecto de la temperatura deseada
+    - fraccion del tiempo dentro de la banda de histeresis
+    - conmutaciones del equipo por habitacion y por hora
+    - fraccion del tiempo calentando / enfriando (proxy de energia)
+    - habitaciones-paso simulados por segundo real
+
+Uso (desde la raiz del repositorio):
+    PYTHONPATH=. python Test/benchmark/banco_lazo_cerrado.py
+    PYTHONPATH=. python Test/benchmark/banco_lazo_cerrado.py --habitaciones 5000 --duracion 86400 --json lazo.json
+"""
+# pylint: disable=duplicate-code
+import argparse
+import json
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from actores_externos.modelo_termico import ActuadorHabitacion, ModeloTermico
+from entidades.ambiente import Ambiente
+from entidades.climatizador import Climatizador
+from gestores_entidades.gestor_climatizador import GestorClimatizador
+
+
+class ResultadoLazoCerrado(namedtuple("ResultadoLazoCerrado", [
+        "habitaciones", "duracion_simulada", "error_medio", "error_rms", "en_banda",
+        "conmutaciones_por_hora", "fraccion_calefaccion", "fraccion_refrigeracion",
+        "duracion_real", "pasos_por_segundo"])):
+    """
+    Metricas de una corrida (promedios sobre habitaciones y tiempo).
+
+    Attributes:
+        habitaciones (int): Habitaciones simuladas.
+        duracion_simulada (float): Segundos simulados.
+        error_medio (float): Media de |T - deseada| (C).
+        error_rms (float): Raiz del error cuadratico medio (C).
+        en_banda (float): Fraccion del tiempo con |T - deseada| <= histeresis.
+        conmutaciones_por_hora (float): Cambios de modo del equipo por hora.
+        fraccion_calefaccion (float): Fraccion del tiempo calentando.
+        fraccion_refrigeracion (float): Fraccion del tiempo enfriando.
+        duracion_real (float): Segundos reales de la corrida.
+        pasos_por_segundo (float): Habitaciones-paso del modelo por segundo real.
+    """
+    __slots__ = ()
+
+    def como_dict(self):
+        """Retorna las metricas como dict serializable a JSON."""
+        return {campo: float(valor) for campo, valor in self._asdict().items()}
+
+
+class BancoLazoCerrado:
+    """
+    N habitaciones controladas cada una por su propio Climatizador.
+
+    Args:
+        modelo (ModeloTermico): Modelo con una habitacion por controlador.
+        deseadas: Temperatura deseada (escalar o arreglo por habitacion).
+        histeresis (float): Histeresis de los climatizadores.
+        periodo_control (float): Segundos simulados entre evaluaciones.
+        paso (float): Segundos simulados por paso del modelo.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, modelo, deseadas=22.0, histeresis=2.0, periodo_control=5.0, paso=1.0):
+        self._modelo = modelo
+        self._deseadas = np.broadcast_to(np.asarray(deseadas, dtype=np.float64),
+                                         (modelo.habitaciones,))
+        self._histeresis = histeresis
+        self._pasos_por_control = max(int(round(periodo_control / paso)), 1)
+        self._paso = paso
+        self._ambientes = [Ambiente(temperatura_deseada_inicial=float(deseada))
+                           for deseada in self._deseadas]
+        self._gestores = [GestorClimatizador(Climatizador(histeresis),
+                                             ActuadorHabitacion(modelo, indice), None)
+                          for indice in range(modelo.habitaciones)]
+
+    def _controlar(self):
+        """Evalua cada gestor con la temperatura medida de su habitacion."""
+        medidas = self._modelo.leer()
+        for ambiente, gestor, medida in zip(self._ambientes, self._gestores, medidas.tolist()):
+            ambiente.temperatura_ambiente = medida
+            gestor.accionar_climatizador(ambiente)
+
+    def correr(self, duracion):
+        """
+        Simula duracion segundos y mide calidad de control y throughput.
+
+        Args:
+            duracion (float): Segundos simulados.
+
+        Returns:
+            ResultadoLazoCerrado: Metricas de la corrida.
+        """
+        modelo = self._modelo
+        pasos = max(int(duracion / self._paso), 1)
+        error_abs = np.zeros(modelo.habitaciones)
+        error_cuadratico = np.zeros(modelo.habitaciones)
+        en_banda = np.zeros(modelo.habitaciones)
+        conmutaciones = np.zeros(modelo.habitaciones)
+        calefaccion_inicial = modelo.tiempo_calefaccion
+        refrigeracion_inicial = modelo.tiempo_refrigeracion
+
+        inicio = time.perf_counter()
+        for numero in range(pasos):
+            if numero % self._pasos_por_control == 0:
+                modos_previos = modelo.modos.copy()
+                self._controlar()
+                conmutaciones += modelo.modos != modos_previos
+            error = modelo.avanzar(self._paso) - self._deseadas
+            error_abs += np.abs(error)
+            error_cuadratico += error * error
+            en_banda += np.abs(error) <= self._histeresis
+        duracion_real = time.perf_counter() - inicio
+
+        simulado = pasos * self._paso
+        return ResultadoLazoCerrado(
+            habitaciones=modelo.habitaciones,
+            duracion_simulada=simulado,
+            error_medio=float(error_abs.mean() / pasos),
+            error_rms=float(np.sqrt(error_cuadratico.mean() / pasos)),
+            en_banda=float(en_banda.mean() / pasos),
+            conmutaciones_por_hora=float(conmutaciones.mean() * 3600.0 / simulado),
+            fraccion_calefaccion=float(
+                (modelo.tiempo_calefaccion - calefaccion_inicial).mean() / simulado),
+            fraccion_refrigeracion=float(
+                (modelo.tiempo_refrigeracion - refrigeracion_inicial).mean() / simulado),
+            duracion_real=duracion_real,
+            pasos_por_segundo=modelo.habitaciones * pasos / duracion_real if duracion_real else 0.0,
+        )
+
+
+def crear_modelo(habitaciones, dispersion=0.2, semilla=0, **parametros):
+    """
+    Crea un modelo con habitaciones heterogeneas.
+
+    La constante de tiempo y los saltos de cada habitacion se escalan por
+    un factor uniforme en [1 - dispersion, 1 + dispersion].
+
+    Args:
+        habitaciones (int): Cantidad de habitaciones.
+        dispersion (float): Variacion relativa de los parametros.
+        semilla (int): Semilla de la dispersion y del ruido.
+        **parametros: Parametros base de ModeloTermico.
+
+    Returns:
+        ModeloTermico: Modelo listo para BancoLazoCerrado.
+    """
+    generador = np.random.default_rng(semilla)
+    for clave, defecto in (("constante_tiempo", 1800.0), ("salto_calefaccion", 20.0),
+                           ("salto_refrigeracion", 15.0)):
+        factor = generador.uniform(1 - dispersion, 1 + dispersion, habitaciones)
+        parametros[clave] = parametros.get(clave, defecto) * factor
+    return ModeloTermico(habitaciones, semilla=semilla, **parametros)
+
+
+def formatear_reporte(resultado):
+    """Arma la tabla de texto del reporte."""
+    lineas = [
+        "habitaciones:            {}".format(resultado.habitaciones),
+        "tiempo simulado:         {:.0f} s".format(resultado.duracion_simulada),
+        "error medio |T-Td|:      {:.2f} C".format(resultado.error_medio),
+        "error RMS:               {:.2f} C".format(resultado.error_rms),
+        "tiempo en banda:         {:.1%}".format(resultado.en_banda),
+        "conmutaciones/hora:      {:.2f}".format(resultado.conmutaciones_por_hora),
+        "calentando / enfriando:  {:.1%} / {:.1%}".format(resultado.fraccion_calefaccion,
+                                                        resultado.fraccion_refrigeracion),
+        "tiempo real:             {:.2f} s".format(resultado.duracion_real),
+        "habitaciones-paso/s:     {:.0f}".format(resultado.pasos_por_segundo),
+    ]
+    return "\n".join(lineas)
+
+
+def main(argv=None):
+    """Punto de entrada de linea de comandos."""
+    parser = argparse.ArgumentParser(description="Banco de lazo cerrado del termostato")
+    parser.add_argument("--habitaciones", type=int, default=1000)
+    parser.add_argument("--duracion", type=float, default=6 * 3600.0, help="segundos simulados")
+    parser.add_argument("--paso", type=float, default=1.0, help="segundos por paso del modelo")
+    parser.add_argument("--periodo-control", type=float, default=5.0)
+    parser.add_argument("--deseada", type=float, default=22.0)
+    parser.add_argument("--histeresis", type=float, default=2.0)
+    parser.add_argument("--inicial", type=float, default=18.0)
+    parser.add_argument("--exterior", type=float, default=10.0)
+    parser.add_argument("--ruido", type=float, default=0.1, help="ruido del sensor (C)")
+    parser.add_argument("--dispersion", type=float, default=0.2)
+    parser.add_argument("--json", help="guarda las metricas en este archivo")
+    argumentos = parser.parse_args(argv)
+
+    modelo = crear_modelo(argumentos.habitaciones, argumentos.dispersion,
+                          temperatura_inicial=argumentos.inicial,
+                          temperatura_exterior=argumentos.exterior,
+                          ruido_medicion=argumentos.ruido)
+    banco = BancoLazoCerrado(modelo, argumentos.deseada, argumentos.histeresis,
+                             argumentos.periodo_control, argumentos.paso)
+    resultado = banco.correr(argumentos.duracion)
+    print(formatear_reporte(resultado))
+    if argumentos.json:
+        with open(argumentos.json, "w", encoding="utf-8") as archivo:
+            json.dump(resultado.como_dict(), archivo, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
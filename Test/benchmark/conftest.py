@@ -0,0 +1,209 @@
+"""
+Fixtures para la suite de benchmarks del camino de control
+
+Los tiempos (ops/seg) los mide pytest-benchmark y se comparan contra la
+ultima corrida guardada en .resultados; una media 25% mas lenta falla la
+corrida. Mientras no haya corridas guardadas la comparacion se omite.
+
+Ademas del tiempo, cada benchmark
+mide la memoria que asigna la operacion con tracemalloc y la compara con
+linea_base_memoria.json. La memoria es determinista, de modo que una
+regresion de asignaciones falla aunque el tiempo quede dentro del ruido.
+"""
+import gc
+import json
+import os
+import tracemalloc
+from contextlib import redirect_stdout
+
+import pytest
+from entidades.abs_actuador_climatizador import AbsProxyActuadorClimatizador
+from entidades.abs_visualizador_bateria import AbsVisualizadorBateria
+from entidades.abs_visualizador_climatizador import AbsVisualizadorClimatizador
+from entidades.abs_visualizador_temperatura import AbsVisualizadorTemperatura
+
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+ARCHIVO_LINEA_BASE = os.path.join(DIRECTORIO, "linea_base_memoria.json")
+DIRECTORIO_RESULTADOS = os.path.join(DIRECTORIO, ".resultados")
+ALMACENAMIENTO_DEFAULT = "file://./.benchmarks"
+REPETICIONES_MEMORIA = 200
+TOLERANCIA_PICO = 0.25
+MARGEN_PICO_BYTES = 256
+MARGEN_RETENIDA_BYTES = 16
+
+
+# ============ OBJETOS NULOS ============
+
+class ActuadorNulo(AbsProxyActuadorClimatizador):
+    """Actuador que no hace nada (aisla el costo del gestor)"""
+
+    def accionar_climatizador(self, accion):
+        pass
+
+
+class VisualizadorTemperaturaNulo(AbsVisualizadorTemperatura):
+    """Visualizador de temperatura que descarta los valores"""
+
+    def mostrar_temperatura_ambiente(self, temperatura_ambiente):
+        pass
+
+    def mostrar_temperatura_deseada(self, temperatura_deseada):
+        pass
+
+
+class VisualizadorBateriaNulo(AbsVisualizadorBateria):
+    """Visualizador de bateria que descarta los valores"""
+
+    def mostrar_tension(self, tension_bateria):
+        pass
+
+    def mostrar_indicador(self, indicador_bateria):
+        pass
+
+
+class VisualizadorClimatizadorNulo(AbsVisualizadorClimatizador):
+    """Visualizador de climatizador que descarta los valores"""
+
+    def mostrar_estado_climatizador(self, estado_climatizador):
+        pass
+
+
+# ============ MEDICION DE MEMORIA ============
+
+def medir_memoria(funcion, *args):
+    """
+    Mide la memoria asignada por funcion durante REPETICIONES_MEMORIA llamadas.
+
+    Returns:
+        dict: memoria_pico_bytes (maximo transitorio sobre el inicio) y
+              memoria_retenida_bytes (crecimiento neto por llamada, tras
+              una recoleccion).
+    """
+    funcion(*args)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        inicio, _ = tracemalloc.get_traced_memory()
+        for _ in range(REPETICIONES_MEMORIA):
+            funcion(*args)
+        _, pico = tracemalloc.get_traced_memory()
+        # La memoria en listas libres y basura pendiente no es retenida
+        gc.collect()
+        actual, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "memoria_pico_bytes": pico - inicio,
+        "memoria_retenida_bytes": round((actual - inicio) / REPETICIONES_MEMORIA, 2),
+    }
+
+
+def pytest_addoption(parser):
+    """Agrega la opcion para regrabar la linea base de memoria"""
+    parser.addoption("--actualizar-linea-base-memoria", action="store_true", default=False,
+                     help="Regraba linea_base_memoria.json con las mediciones actuales")
+
+
+def _hay_resultados_guardados():
+    """Indica si existe alguna corrida de tiempos guardada"""
+    for _, _, archivos in os.walk(DIRECTORIO_RESULTADOS):
+        if any(archivo.endswith(".json") for archivo in archivos):
+            return True
+    return False
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """
+    Prepara la sesion antes que pytest-benchmark.
+
+    Fija el almacenamiento de resultados junto a la suite, omite la
+    comparacion de tiempos si aun no hay linea base y carga la linea
+    base de memoria.
+    """
+    if config.getoption("benchmark_storage") == ALMACENAMIENTO_DEFAULT:
+        config.option.benchmark_storage = "file://" + DIRECTORIO_RESULTADOS
+    config.sin_linea_base_tiempos = not _hay_resultados_guardados()
+    if config.sin_linea_base_tiempos:
+        config.option.benchmark_compare = []
+        config.option.benchmark_compare_fail = None
+
+    config.linea_base_memoria = {}
+    if os.path.exists(ARCHIVO_LINEA_BASE):
+        with open(ARCHIVO_LINEA_BASE, "r", encoding="utf-8") as archivo:
+            config.linea_base_memoria = json.load(archivo)
+
+
+def pytest_report_header(config):
+    """Informa si la corrida se compara contra una linea base de tiempos"""
+    if config.sin_linea_base_tiempos:
+        return "benchmarks: sin linea base de tiempos (guardar con --benchmark-save=base)"
+    return "benchmarks: comparando contra la ultima corrida en {}".format(DIRECTORIO_RESULTADOS)
+
+
+def pytest_sessionfinish(session):
+    """Guarda la linea base de memoria si se pidio actualizarla"""
+    config = session.config
+    if config.getoption("--actualizar-linea-base-memoria"):
+        with open(ARCHIVO_LINEA_BASE, "w", encoding="utf-8") as archivo:
+            json.dump(config.linea_base_memoria, archivo, indent=2, sort_keys=True)
+            archivo.write("\n")
+
+
+def _verificar_linea_base(config, nombre, memoria):
+    """Falla si la memoria medida supera la linea base con su tolerancia"""
+    if config.getoption("--actualizar-linea-base-memoria"):
+        config.linea_base_memoria[nombre] = memoria
+        return
+    base = config.linea_base_memoria.get(nombre)
+    if base is None:
+        return
+    limite_pico = max(base["memoria_pico_bytes"] * (1 + TOLERANCIA_PICO),
+                      base["memoria_pico_bytes"] + MARGEN_PICO_BYTES)
+    limite_retenida = base["memoria_retenida_bytes"] + MARGEN_RETENIDA_BYTES
+    assert memoria["memoria_pico_bytes"] <= limite_pico, \
+        "Regresion de memoria pico en {}: {} > {} bytes".format(
+            nombre, memoria["memoria_pico_bytes"], limite_pico)
+    assert memoria["memoria_retenida_bytes"] <= limite_retenida, \
+        "Regresion de memoria retenida en {}: {} > {} bytes/llamada".format(
+            nombre, memoria["memoria_retenida_bytes"], limite_retenida)
+
+
+# ============ FIXTURES ============
+
+@pytest.fixture
+def medir(benchmark, request):
+    """
+    Mide tiempo (pytest-benchmark) y memoria de una funcion.
+
+    Los resultados de memoria quedan en benchmark.extra_info y se
+    verifican contra la linea base.
+    """
+    def _medir(funcion, *args):
+        resultado = benchmark(funcion, *args)
+        memoria = medir_memoria(funcion, *args)
+        benchmark.extra_info.update(memoria)
+        _verificar_linea_base(request.config, request.node.name, memoria)
+        return resultado
+    return _medir
+
+
+@pytest.fixture
+def salida_descartada():
+    """Redirige stdout a /dev/null mientras dura el benchmark"""
+    with open(os.devnull, "w", encoding="utf-8") as nulo, redirect_stdout(nulo):
+        yield
+
+
+@pytest.fixture
+def actuador_nulo():
+    """Actuador sin efectos"""
+    return ActuadorNulo()
+
+
+@pytest.fixture
+def visualizadores_nulos():
+    """Visualizadores (bateria, temperatura, climatizador) sin efectos"""
+    return (VisualizadorBateriaNulo(), VisualizadorTemperaturaNulo(),
+            VisualizadorClimatizadorNulo())
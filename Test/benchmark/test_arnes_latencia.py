@@ -0,0 +1,50 @@
+"""
+Tests del arnes de latencia de punta a punta
+
+Casos de prueba:
+- LAT-001: percentil por rango mas cercano
+- LAT-002: El arnes levanta el sistema y reporta latencias por tasa
+"""
+import json
+import os
+import subprocess
+import sys
+
+from arnes_latencia import percentil
+
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(os.path.dirname(DIRECTORIO))
+
+
+# LAT-001: Percentiles
+def test_percentil_rango_mas_cercano():
+    """p50/p99 sobre 1..100 y casos borde"""
+    valores = list(range(100, 0, -1))
+
+    assert percentil(valores, 50) == 50
+    assert percentil(valores, 99) == 99
+    assert percentil(valores, 100) == 100
+    assert percentil([7.0], 95) == 7.0
+    assert percentil([], 50) is None
+
+
+# LAT-002: Corrida corta de punta a punta
+def test_arnes_reporta_latencias(tmp_path):
+    """Una barrida corta produce acciones y latencias para cada tasa"""
+    archivo = tmp_path / "latencias.json"
+    entorno = dict(os.environ, PYTHONPATH=RAIZ)
+
+    subprocess.run(
+        [sys.executable, os.path.join(DIRECTORIO, "arnes_latencia.py"),
+         "--tasas", "10", "50", "--duracion", "1", "--json", str(archivo)],
+        cwd=str(tmp_path), env=entorno, check=True, timeout=60,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+    resultados = json.loads(archivo.read_text(encoding="utf-8"))
+    assert [resultado["tasa"] for resultado in resultados] == [10, 50]
+    for resultado in resultados:
+        assert resultado["enviadas"] > 0
+        assert resultado["accionadas"] > 0
+        assert 0 < resultado["p50_ms"] <= resultado["p95_ms"] <= resultado["p99_ms"]
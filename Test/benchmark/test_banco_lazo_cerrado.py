@@ -0,0 +1,53 @@
+"""
+Tests del banco de lazo cerrado con el modelo termico
+
+Casos de prueba:
+- LAZ-001: Las habitaciones llegan a la banda y se reportan las metricas
+- LAZ-002: La CLI guarda las metricas en JSON
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from banco_lazo_cerrado import BancoLazoCerrado, crear_modelo
+
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(os.path.dirname(DIRECTORIO))
+
+
+# LAZ-001: Calidad de control
+def test_banco_reporta_calidad_de_control():
+    """200 habitaciones heterogeneas durante 2 horas con el Climatizador real"""
+    modelo = crear_modelo(200, temperatura_inicial=18.0, temperatura_exterior=10.0,
+                          ruido_medicion=0.1)
+    banco = BancoLazoCerrado(modelo, deseadas=22.0, histeresis=2.0, periodo_control=5.0)
+
+    resultado = banco.correr(2 * 3600)
+
+    assert resultado.habitaciones == 200
+    assert resultado.duracion_simulada == pytest.approx(7200.0)
+    assert resultado.en_banda > 0.8
+    assert resultado.error_medio < resultado.error_rms < 3.0
+    assert resultado.conmutaciones_por_hora > 1.0
+    assert 0.3 < resultado.fraccion_calefaccion < 1.0
+    assert resultado.pasos_por_segundo > 0
+
+
+# LAZ-002: CLI
+def test_cli_guarda_json(tmp_path):
+    """Una corrida corta por linea de comandos escribe todas las metricas"""
+    archivo = tmp_path / "lazo.json"
+    entorno = dict(os.environ, PYTHONPATH=RAIZ)
+
+    subprocess.run(
+        [sys.executable, os.path.join(DIRECTORIO, "banco_lazo_cerrado.py"),
+         "--habitaciones", "50", "--duracion", "1800", "--json", str(archivo)],
+        check=True, env=entorno, capture_output=True, timeout=120)
+
+    metricas = json.loads(archivo.read_text())
+    assert metricas["habitaciones"] == 50
+    assert set(metricas) >= {"error_rms", "en_banda", "conmutaciones_por_hora",
+                             "pasos_por_segundo"}
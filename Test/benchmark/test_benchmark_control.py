@@ -0,0 +1,116 @@
+"""
+Benchmarks del camino de control del termostato
+
+Casos de prueba:
+- BEN-001: ControladorTemperatura.comparar_temperatura (alta, baja, normal)
+- BEN-002: Climatizador.evaluar_accion sobre una instantanea del ambiente
+- BEN-003: Climatizador.proximo_estado (ciclo calentar/apagar)
+- BEN-004: GestorClimatizador.accionar_climatizador sin accion
+- BEN-005: GestorClimatizador.accionar_climatizador con accion (actuador nulo)
+- BEN-006: Setter de Bateria.nivel_de_carga
+- BEN-007: Presentador.ejecutar con visualizadores nulos
+"""
+from unittest.mock import Mock
+
+import pytest
+from entidades.ambiente import Ambiente
+from entidades.bateria import Bateria
+from entidades.climatizador import Climatizador
+from gestores_entidades.gestor_ambiente import GestorAmbiente
+from gestores_entidades.gestor_bateria import GestorBateria
+from gestores_entidades.gestor_climatizador import GestorClimatizador
+from servicios_aplicacion.presentador import Presentador
+from servicios_dominio.controlador_climatizador import ControladorTemperatura
+
+
+def _ambiente(temperatura_ambiente, temperatura_deseada=22.0):
+    """Helper que crea un ambiente con ambas temperaturas"""
+    ambiente = Ambiente(temperatura_deseada_inicial=temperatura_deseada)
+    ambiente.temperatura_ambiente = temperatura_ambiente
+    return ambiente
+
+
+class TestBenchmarkDominio:
+    """Benchmarks de entidades y servicios de dominio"""
+
+    # BEN-001: comparar_temperatura
+    @pytest.mark.parametrize("temperatura", [25.0, 19.0, 22.0], ids=["alta", "baja", "normal"])
+    def test_comparar_temperatura(self, medir, temperatura):
+        """Comparacion con histeresis"""
+        medir(ControladorTemperatura.comparar_temperatura, temperatura, 22.0, 2.0)
+
+    # BEN-002: evaluar_accion
+    def test_evaluar_accion(self, medir):
+        """Evaluacion de la accion sobre una instantanea"""
+        climatizador = Climatizador(histeresis=2.0)
+        instantanea = _ambiente(25.0).instantanea()
+
+        assert medir(climatizador.evaluar_accion, instantanea) == "enfriar"
+
+    # BEN-003: proximo_estado
+    def test_proximo_estado(self, medir):
+        """Dos transiciones por iteracion para volver al estado inicial"""
+        climatizador = Climatizador(histeresis=2.0)
+
+        def ciclo():
+            climatizador.proximo_estado("calentar")
+            return climatizador.proximo_estado("apagar")
+
+        assert medir(ciclo) == "apagado"
+
+    # BEN-006: nivel_de_carga
+    def test_setter_nivel_de_carga(self, medir):
+        """Asignacion del nivel y recalculo del indicador"""
+        bateria = Bateria(carga_maxima=5.0, umbral_del_carga=0.8)
+
+        def asignar():
+            bateria.nivel_de_carga = 4.5
+
+        medir(asignar)
+        assert bateria.indicador == "NORMAL"
+
+
+class TestBenchmarkGestores:
+    """Benchmarks de gestores y servicios de aplicacion"""
+
+    # BEN-004: accionar_climatizador sin accion
+    def test_accionar_climatizador_sin_accion(self, medir, actuador_nulo, visualizadores_nulos):
+        """Temperatura normal: se evalua pero no se acciona"""
+        gestor = GestorClimatizador(Climatizador(histeresis=2.0), actuador_nulo,
+                                    visualizadores_nulos[2])
+        ambiente = _ambiente(22.0)
+
+        medir(gestor.accionar_climatizador, ambiente)
+        assert gestor.obtener_estado_climatizador() == "apagado"
+
+    # BEN-005: accionar_climatizador con accion
+    def test_accionar_climatizador_con_accion(self, medir, actuador_nulo, visualizadores_nulos):
+        """Ciclo enfriar/apagar: dos evaluaciones y dos acciones por iteracion"""
+        gestor = GestorClimatizador(Climatizador(histeresis=2.0), actuador_nulo,
+                                    visualizadores_nulos[2])
+        ambiente = _ambiente(25.0)
+
+        def ciclo():
+            ambiente.temperatura_ambiente = 25.0
+            gestor.accionar_climatizador(ambiente)
+            ambiente.temperatura_ambiente = 19.0
+            gestor.accionar_climatizador(ambiente)
+
+        medir(ciclo)
+        assert gestor.obtener_estado_climatizador() == "apagado"
+
+    # BEN-007: Presentador.ejecutar
+    def test_presentador_ejecutar(self, medir, actuador_nulo, visualizadores_nulos,
+                                  salida_descartada):
+        """Presentacion completa con visualizadores nulos y stdout descartado"""
+        visualizador_bateria, visualizador_temperatura, visualizador_climatizador = \
+            visualizadores_nulos
+        bateria = Bateria(carga_maxima=5.0, umbral_del_carga=0.8)
+        bateria.nivel_de_carga = 4.5
+        presentador = Presentador(
+            GestorBateria(bateria, Mock(), visualizador_bateria),
+            GestorAmbiente(_ambiente(22.0), Mock(), visualizador_temperatura),
+            GestorClimatizador(Climatizador(), actuador_nulo, visualizador_climatizador)
+        )
+
+        medir(presentador.ejecutar)
@@ -1,3 +0,0 @@
-"""
-Tests de la capa HAL (Hardware Abstraction Layer)
-"""
@@ -0,0 +1,150 @@
+"""
+Tests de integracion para el canal mapeado del actuador
+
+Casos de prueba:
+- CAC-001: Lector mapeado -> ve cada accion con su secuencia y marca sin reabrir
+- CAC-002: Canal existente -> el escritor continua la secuencia
+- CAC-003: Archivo que no es canal -> el lector lo rechaza, el escritor lo inicializa
+- CAC-004: Accion invalida -> ValueError sin alterar el canal
+- CAC-005: Actuador mapeado -> texto reemplazado por rename solo al cambiar la accion
+- CAC-006: Escritura interrumpida -> el lector reintenta y desiste con TimeoutError
+"""
+import os
+
+import pytest
+from agentes_actuadores.actuador_climatizador import ActuadorClimatizadorMapeado
+from agentes_actuadores.canal_actuador import (
+    CABECERA, SECUENCIA, CanalActuador, LectorCanalActuador,
+)
+from servicios_aplicacion.reloj import RelojVirtual
+
+
+@pytest.fixture(autouse=True)
+def directorio(tmp_path, monkeypatch):
+    """El actuador escribe en el directorio de trabajo"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+# CAC-001: Lectura sin reabrir
+def test_lector_ve_cada_accion_sin_reabrir(monkeypatch):
+    """Una vez mapeado el canal, el lector no abre archivos"""
+    canal = CanalActuador("climatizador.map")
+    lector = LectorCanalActuador("climatizador.map")
+    try:
+        assert lector.leer() is None
+        assert lector.version() == 0
+
+        def abrir(*args, **kwargs):
+            raise AssertionError("no deberia abrir archivos")
+
+        monkeypatch.setattr("builtins.open", abrir)
+        canal.escribir("calentar", 100.5)
+        assert tuple(lector.leer()) == ("calentar", 2, 100.5)
+        canal.escribir("calentar", 101.0)
+        assert tuple(lector.leer()) == ("calentar", 4, 101.0)
+        canal.escribir("apagar", 102.0)
+        assert lector.leer().accion == "apagar"
+        assert lector.version() == canal.secuencia == 6
+    finally:
+        lector.cerrar()
+        canal.cerrar()
+
+
+# CAC-002: Continuidad de la secuencia
+def test_escritor_continua_la_secuencia():
+    """Al reabrir el canal la secuencia no retrocede"""
+    canal = CanalActuador("climatizador.map")
+    canal.escribir("enfriar", 1.0)
+    canal.cerrar()
+
+    canal = CanalActuador("climatizador.map")
+    try:
+        assert canal.secuencia == 2
+        canal.escribir("apagar", 2.0)
+        assert canal.secuencia == 4
+    finally:
+        canal.cerrar()
+
+
+# CAC-003: Archivo ajeno
+def test_archivo_ajeno():
+    """Un archivo de texto no es un canal: el lector falla y el escritor lo reescribe"""
+    with open("climatizador.map", "w", encoding="utf-8") as archivo:
+        archivo.write("calentar" * 10)
+
+    with pytest.raises(ValueError):
+        LectorCanalActuador("climatizador.map")
+
+    canal = CanalActuador("climatizador.map")
+    canal.cerrar()
+    lector = LectorCanalActuador("climatizador.map")
+    try:
+        assert lector.leer() is None
+    finally:
+        lector.cerrar()
+
+
+# CAC-004: Accion invalida
+def test_accion_invalida():
+    """Una accion desconocida no se publica"""
+    canal = CanalActuador("climatizador.map")
+    try:
+        canal.escribir("apagar", 1.0)
+        with pytest.raises(ValueError):
+            canal.escribir("ventilar", 2.0)
+        assert canal.secuencia == 2
+    finally:
+        canal.cerrar()
+
+
+# CAC-005: Actuador mapeado
+def test_actuador_mapeado(directorio, monkeypatch):
+    """Cada accion va al canal; el texto se reemplaza por rename solo si cambia"""
+    reloj = RelojVirtual()
+    reemplazos = []
+    original = os.replace
+
+    def reemplazar(origen, destino):
+        reemplazos.append(destino)
+        original(origen, destino)
+
+    monkeypatch.setattr(os, "replace", reemplazar)
+    actuador = ActuadorClimatizadorMapeado(reloj)
+    lector = LectorCanalActuador("climatizador.map")
+    try:
+        actuador.accionar_climatizador("calentar")
+        actuador.accionar_climatizador("calentar")
+        actuador.accionar_climatizador("enfriar")
+
+        estado = lector.leer()
+        assert (estado.accion, estado.secuencia) == ("enfriar", 6)
+        assert estado.marca == reloj.ahora().timestamp()
+        assert (directorio / "climatizador").read_text() == "enfriar"
+        assert reemplazos == ["climatizador", "climatizador"]
+        assert not (directorio / "climatizador.tmp").exists()
+    finally:
+        lector.cerrar()
+        actuador.cerrar()
+
+
+# CAC-006: Escritura interrumpida
+def test_escritura_interrumpida():
+    """Con la secuencia impar el lector desiste; un escritor nuevo la repara"""
+    canal = CanalActuador("climatizador.map")
+    canal.escribir("calentar", 1.0)
+    SECUENCIA.pack_into(canal._mapa, CABECERA.size, 3)
+    lector = LectorCanalActuador("climatizador.map")
+    lector.ESPERA_MAXIMA = 0.05
+    try:
+        with pytest.raises(TimeoutError):
+            lector.leer()
+    finally:
+        lector.cerrar()
+        canal.cerrar()
+
+    canal = CanalActuador("climatizador.map")
+    try:
+        assert canal.secuencia == 4
+    finally:
+        canal.cerrar()
@@ -0,0 +1,182 @@
+"""
+Tests de integracion para la conexion persistente de los visualizadores socket
+
+Casos de prueba:
+- CSP-001: Varios envios -> una sola conexion, una linea por valor
+- CSP-002: Cartel ausente -> lineas pendientes y reintento con espera exponencial
+- CSP-003: Cartel que vuelve -> se entregan las lineas pendientes en orden
+- CSP-004: Cartel que cierra la conexion -> se reconecta sin perder el envio
+- CSP-005: Visualizadores socket -> formato de linea y conteo de errores
+- CSP-006: Servidor por lineas -> reensambla lineas y caracteres partidos
+- CSP-007: Cartel -> muestra el ultimo valor recibido
+"""
+import io
+import socket
+import time
+
+import pytest
+from actores_externos.cartel_socket import mostrar
+from agentes_actuadores.conexion_socket import ConexionSocketPersistente
+from agentes_actuadores.visualizador_bateria import VisualizadorBateriaSocket
+from agentes_actuadores.visualizador_temperatura import VisualizadorTemperaturaSocket
+from agentes_sensores.servidor_socket import ServidorSocketNoBloqueante
+from servicios_aplicacion.reloj import RelojVirtual
+from servicios_aplicacion.terminal import TerminalAnsi
+
+
+def _puerto_libre():
+    """Helper que obtiene un puerto sin nadie escuchando"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sonda:
+        sonda.bind(("127.0.0.1", 0))
+        return sonda.getsockname()[1]
+
+
+def _sondear_hasta(servidor, cantidad, limite=1.0):
+    """Helper que sondea hasta reunir la cantidad de mensajes esperada"""
+    mensajes = []
+    fin = time.monotonic() + limite
+    while len(mensajes) < cantidad and time.monotonic() < fin:
+        mensajes.extend(servidor.sondear(timeout=0.01))
+    return mensajes
+
+
+@pytest.fixture
+def cartel():
+    """Servidor por lineas en un puerto efimero, como el de los carteles"""
+    servidor = ServidorSocketNoBloqueante("127.0.0.1", 0, por_lineas=True)
+    yield servidor
+    servidor.cerrar()
+
+
+class TestConexionSocketPersistente:
+    """Tests para ConexionSocketPersistente"""
+
+    # CSP-001: Una sola conexion para todos los envios
+    def test_varios_envios_una_conexion(self, cartel):
+        """Todos los valores deben llegar por la misma conexion"""
+        conexion = ConexionSocketPersistente(*cartel.direccion)
+
+        for valor in range(5):
+            assert conexion.enviar("ambiente: {}".format(valor)) is True
+
+        assert _sondear_hasta(cartel, 5) == ["ambiente: {}".format(v) for v in range(5)]
+        assert conexion.conexiones == 1
+        assert cartel.cantidad_clientes == 1
+        conexion.cerrar()
+
+    # CSP-002: Cartel ausente
+    def test_cartel_ausente_espera_exponencial(self):
+        """Sin cartel, los envios quedan pendientes y no se reintenta antes de la espera"""
+        reloj = RelojVirtual()
+        conexion = ConexionSocketPersistente("127.0.0.1", _puerto_libre(), reloj=reloj)
+
+        assert conexion.enviar("1") is False
+        assert conexion.enviar("2") is False
+        assert conexion.pendientes == 2
+        assert conexion._espera == ConexionSocketPersistente.ESPERA_INICIAL
+
+        reloj.sleep(ConexionSocketPersistente.ESPERA_INICIAL)
+        assert conexion.enviar("3") is False
+        assert conexion._espera == 2 * ConexionSocketPersistente.ESPERA_INICIAL
+
+        reloj.sleep(1000)
+        for _ in range(10):
+            conexion.enviar("x")
+            reloj.sleep(1000)
+        assert conexion._espera == ConexionSocketPersistente.ESPERA_MAXIMA
+        assert conexion.conexiones == 0
+
+    # CSP-003: Cartel que vuelve
+    def test_cartel_que_vuelve_recibe_pendientes(self):
+        """Al reconectar se envian las lineas pendientes en orden"""
+        reloj = RelojVirtual()
+        puerto = _puerto_libre()
+        conexion = ConexionSocketPersistente("127.0.0.1", puerto, reloj=reloj)
+        conexion.enviar("uno")
+        conexion.enviar("dos")
+
+        servidor = ServidorSocketNoBloqueante("127.0.0.1", puerto, por_lineas=True)
+        try:
+            # Todavia dentro de la espera: no intenta conectar
+            assert conexion.enviar("tres") is False
+            reloj.sleep(ConexionSocketPersistente.ESPERA_INICIAL)
+            assert conexion.enviar("cuatro") is True
+
+            assert _sondear_hasta(servidor, 4) == ["uno", "dos", "tres", "cuatro"]
+            assert conexion.pendientes == 0
+        finally:
+            conexion.cerrar()
+            servidor.cerrar()
+
+    # CSP-004: Cartel que cierra la conexion
+    def test_cartel_que_cierra_se_reconecta(self, cartel):
+        """Si el cartel cierra la conexion, el siguiente envio reconecta y llega"""
+        conexion = ConexionSocketPersistente(*cartel.direccion)
+        conexion.enviar("antes")
+        assert _sondear_hasta(cartel, 1) == ["antes"]
+
+        # El cartel se reinicia: cierra todas sus conexiones
+        puerto = cartel.direccion[1]
+        cartel.cerrar()
+        nuevo = ServidorSocketNoBloqueante("127.0.0.1", puerto, por_lineas=True)
+        try:
+            time.sleep(0.05)
+            assert conexion.enviar("despues") is True
+            assert _sondear_hasta(nuevo, 1) == ["despues"]
+            assert conexion.conexiones == 2
+        finally:
+            conexion.cerrar()
+            nuevo.cerrar()
+
+    # CSP-005: Visualizadores socket
+    def test_visualizadores_envian_lineas_y_cuentan_errores(self, cartel):
+        """Los visualizadores envian una linea por valor y cuentan los envios pendientes"""
+        visualizador = VisualizadorTemperaturaSocket(*cartel.direccion)
+        visualizador.mostrar_temperatura_ambiente(25)
+        visualizador.mostrar_temperatura_deseada(22.5)
+
+        assert _sondear_hasta(cartel, 2) == ["ambiente: 25", "deseada: 22.5"]
+        assert visualizador.errores == 0
+
+        bateria = VisualizadorBateriaSocket("127.0.0.1", cartel.direccion[1], _puerto_libre())
+        bateria.mostrar_tension(4.5)
+        bateria.mostrar_indicador("BAJA")
+
+        assert _sondear_hasta(cartel, 1) == ["4.5"]
+        assert bateria.errores == 1
+
+
+class TestServidorPorLineas:
+    """Tests para ServidorSocketNoBloqueante con por_lineas=True"""
+
+    # CSP-006: Reensamblado de lineas
+    def test_lineas_fragmentadas_y_cliente_sin_terminador(self, cartel):
+        """Las lineas se entregan completas aunque lleguen partidas"""
+        cliente = socket.create_connection(cartel.direccion, timeout=1)
+        texto = "ambiente: 25\nclimatizador: señal\n".encode("utf-8")
+        corte = texto.index(b"\xc3") + 1
+        cliente.sendall(texto[:corte])
+        assert _sondear_hasta(cartel, 1) == ["ambiente: 25"]
+        cliente.sendall(texto[corte:])
+        assert _sondear_hasta(cartel, 1) == ["climatizador: señal"]
+        cliente.close()
+
+        # Cliente de una conexion por valor, sin salto de linea
+        legado = socket.create_connection(cartel.direccion, timeout=1)
+        legado.sendall(b"apagado")
+        legado.close()
+        assert _sondear_hasta(cartel, 1) == ["apagado"]
+
+    # CSP-007: Cartel muestra el ultimo valor
+    def test_cartel_muestra_ultimo_valor(self, cartel):
+        """El cartel redibuja con la ultima linea recibida"""
+        conexion = ConexionSocketPersistente(*cartel.direccion)
+        conexion.enviar("calentando")
+        conexion.enviar("apagado")
+        salida = io.StringIO()
+
+        valor = mostrar(cartel, TerminalAnsi(salida), "Climatizador", periodo=0.2, ciclos=3)
+
+        assert valor == "apagado"
+        assert "->  apagado" in salida.getvalue()
+        conexion.cerrar()
@@ -0,0 +1,106 @@
+"""
+Tests de integracion para el generador de carga asincronico
+
+Casos de prueba:
+- GEN-001: Modo por_lectura entrega todas las lecturas al proxy de temperatura
+- GEN-002: Modo persistente entrega los comandos por linea al servidor de seteo
+- GEN-003: desde_escenario resuelve puertos por nombre, cantidad y modo por defecto
+- GEN-004: Sin receptor los envios fallidos se cuentan como errores
+"""
+import socket
+import threading
+import time
+
+from actores_externos.formas_onda import FormaConstante, FormaSecuencia
+from actores_externos.generador_carga import GeneradorCarga, SensorCarga
+from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaSocket
+from agentes_sensores.servidor_socket import ServidorSocketNoBloqueante
+
+
+def _recibir_temperaturas(proxy, recibidas):
+    """Helper que lee del proxy indefinidamente en un hilo daemon"""
+    def leer():
+        while True:
+            recibidas.extend(proxy.leer_temperaturas())
+    threading.Thread(target=leer, daemon=True).start()
+
+
+def _puerto_libre():
+    """Helper que obtiene un puerto sin nadie escuchando"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# GEN-001: por_lectura contra el proxy de temperatura
+def test_por_lectura_entrega_todo_al_proxy():
+    """Cada lectura enviada llega al proxy, tambien con varias conexiones y lotes"""
+    proxy = ProxySensorTemperaturaSocket("127.0.0.1", 0)
+    recibidas = []
+    _recibir_temperaturas(proxy, recibidas)
+    sensor = SensorCarga("temperatura", "127.0.0.1", proxy.direccion[1],
+                         FormaConstante(21.5), tasa=400, conexiones=4, lote=2)
+
+    estadisticas = GeneradorCarga([sensor]).correr(0.5)
+    time.sleep(0.2)
+    proxy.cerrar()
+
+    assert estadisticas[0].errores == 0
+    assert estadisticas[0].enviadas == 200
+    assert len(recibidas) == 200
+    assert set(recibidas) == {21.5}
+
+
+# GEN-002: persistente contra el servidor de seteo
+def test_persistente_entrega_comandos_por_linea():
+    """Los comandos llegan uno por linea y en orden"""
+    servidor = ServidorSocketNoBloqueante("127.0.0.1", 0)
+    sensor = SensorCarga("seteo", "127.0.0.1", servidor.direccion[1],
+                         FormaSecuencia(["aumentar", "disminuir"], intervalo=0.01),
+                         tasa=100, modo="persistente")
+
+    estadisticas = GeneradorCarga([sensor]).correr(0.2)
+    comandos = []
+    fin = time.monotonic() + 1.0
+    while len(comandos) < estadisticas[0].enviadas and time.monotonic() < fin:
+        comandos.extend(servidor.sondear(timeout=0.01))
+    servidor.cerrar()
+
+    assert estadisticas[0].enviadas == 20
+    assert comandos == ["aumentar", "disminuir"] * 10
+
+
+# GEN-003: Escenario
+def test_desde_escenario():
+    """Resuelve el puerto por nombre, replica por cantidad y elige el modo"""
+    configuracion = {"raspberry_pi": {"host": "127.0.0.1",
+                                      "puertos": {"temperatura": 12000,
+                                                  "selector_temperatura": 14000}}}
+    escenario = {"sensores": [
+        {"sensor": "temperatura", "tasa": 10, "cantidad": 3,
+         "forma": {"tipo": "constante", "valor": 22}},
+        {"sensor": "selector_temperatura", "tasa": 1,
+         "forma": {"tipo": "secuencia", "valores": ["ambiente", "deseada"]}},
+    ]}
+
+    generador = GeneradorCarga.desde_escenario(escenario, configuracion, host="10.0.0.2")
+    sensores = generador._sensores
+
+    assert [s.estadisticas.nombre for s in sensores] == [
+        "temperatura#0", "temperatura#1", "temperatura#2", "selector_temperatura#0"]
+    assert {s._puerto for s in sensores[:3]} == {12000}
+    assert {s._host for s in sensores} == {"10.0.0.2"}
+    assert sensores[0]._modo == "por_lectura"
+    assert sensores[3]._modo == "persistente"
+
+
+# GEN-004: Sin receptor
+def test_sin_receptor_cuenta_errores():
+    """Conexion rechazada: no se cuenta como enviada"""
+    sensor = SensorCarga("temperatura", "127.0.0.1", _puerto_libre(),
+                         FormaConstante(22.0), tasa=20)
+
+    estadisticas = GeneradorCarga([sensor]).correr(0.2)
+
+    assert estadisticas[0].enviadas == 0
+    assert estadisticas[0].errores > 0
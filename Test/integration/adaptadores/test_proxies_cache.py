@@ -0,0 +1,130 @@
+"""
+Tests de integracion para los proxies cacheados de archivo
+
+Casos de prueba:
+- PCA-001: Dentro del TTL -> valor cacheado sin consultar el archivo
+- PCA-002: TTL vencido y archivo sin cambios -> solo un stat, sin reabrir
+- PCA-003: Archivo modificado -> se reabre y se entrega el valor nuevo
+- PCA-004: Archivo recien modificado -> no se confia en la firma
+- PCA-005: Lectura con error -> no se cachea
+- PCA-006: Selector cacheado entrega el modo del archivo
+"""
+import os
+import time
+
+import pytest
+from agentes_sensores.proxy_bateria import ProxyBateriaArchivo
+from agentes_sensores.proxy_cache import (
+    ProxyBateriaCache, ProxySensorTemperaturaCache, SelectorTemperaturaCache,
+)
+from agentes_sensores.proxy_selector_temperatura import SelectorTemperaturaArchivo
+from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaArchivo
+from servicios_aplicacion.reloj import RelojVirtual
+
+
+def _escribir(ruta, texto, antiguedad=60):
+    """Helper que escribe el archivo y lo fecha en el pasado (firma confiable)"""
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(texto)
+    if antiguedad:
+        instante = time.time() - antiguedad
+        os.utime(ruta, (instante, instante))
+
+
+@pytest.fixture(autouse=True)
+def directorio(tmp_path, monkeypatch):
+    """Los proxies de archivo leen del directorio de trabajo"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+# PCA-001: Dentro del TTL
+def test_dentro_del_ttl_no_consulta_el_archivo():
+    """Mientras no vence el TTL se entrega el valor aunque el archivo cambie"""
+    reloj = RelojVirtual()
+    _escribir("bateria", "4.5")
+    proxy = ProxyBateriaCache(ProxyBateriaArchivo(), ttl=2, ruta="bateria", reloj=reloj)
+
+    assert proxy.leer_carga() == 4.5
+    _escribir("bateria", "3.25", antiguedad=30)
+    reloj.sleep(1.5)
+    assert proxy.leer_carga() == 4.5
+    assert (proxy.cache.lecturas, proxy.cache.aciertos) == (1, 1)
+
+    reloj.sleep(0.5)
+    assert proxy.leer_carga() == 3.25
+
+
+# PCA-002: Archivo sin cambios
+def test_archivo_sin_cambios_no_se_reabre(monkeypatch):
+    """Vencido el TTL, una firma igual renueva el valor sin abrir el archivo"""
+    reloj = RelojVirtual()
+    _escribir("temperatura", "22")
+    proxy = ProxySensorTemperaturaCache(ProxySensorTemperaturaArchivo(), ttl=0,
+                                        ruta="temperatura", reloj=reloj)
+    assert proxy.leer_temperatura() == 22
+
+    def abrir(*args, **kwargs):
+        raise AssertionError("no deberia reabrir el archivo")
+
+    monkeypatch.setattr("builtins.open", abrir)
+    for _ in range(5):
+        reloj.sleep(1)
+        assert proxy.leer_temperaturas() == [22]
+    assert (proxy.cache.lecturas, proxy.cache.aciertos) == (1, 5)
+
+
+# PCA-003: Archivo modificado
+def test_archivo_modificado_se_reabre():
+    """Un cambio de mtime o tamano invalida el valor cacheado"""
+    reloj = RelojVirtual()
+    _escribir("temperatura", "22", antiguedad=60)
+    proxy = ProxySensorTemperaturaCache(ProxySensorTemperaturaArchivo(), ttl=0,
+                                        ruta="temperatura", reloj=reloj)
+    assert proxy.leer_temperatura() == 22
+
+    _escribir("temperatura", "23", antiguedad=30)
+    assert proxy.leer_temperatura() == 23
+    _escribir("temperatura", "124", antiguedad=30)
+    assert proxy.leer_temperatura() == 124
+    assert proxy.cache.lecturas == 3
+
+
+# PCA-004: Archivo recien modificado
+def test_archivo_reciente_se_relee():
+    """Con el mtime dentro del margen de resolucion se relee siempre"""
+    _escribir("bateria", "4.5", antiguedad=0)
+    proxy = ProxyBateriaCache(ProxyBateriaArchivo(), ttl=0, ruta="bateria",
+                              reloj=RelojVirtual())
+
+    assert proxy.leer_carga() == 4.5
+    _escribir("bateria", "4.6", antiguedad=0)
+    assert proxy.leer_carga() == 4.6
+    assert proxy.cache.aciertos == 0
+
+
+# PCA-005: Lectura con error
+def test_lectura_con_error_no_se_cachea():
+    """La excepcion se propaga y la proxima lectura vuelve al archivo"""
+    proxy = ProxySensorTemperaturaCache(ProxySensorTemperaturaArchivo(), ttl=10,
+                                        ruta="temperatura", reloj=RelojVirtual())
+
+    with pytest.raises(IOError):
+        proxy.leer_temperatura()
+    _escribir("temperatura", "21")
+    assert proxy.leer_temperatura() == 21
+
+
+# PCA-006: Selector cacheado
+def test_selector_cacheado():
+    """El selector cacheado entrega el modo y lo revalida por stat"""
+    reloj = RelojVirtual()
+    _escribir("tipo_temperatura", "deseada\n")
+    selector = SelectorTemperaturaCache(SelectorTemperaturaArchivo(reloj), ttl=0,
+                                        ruta="tipo_temperatura", reloj=reloj)
+
+    assert selector.obtener_selector() == "deseada"
+    assert selector.obtener_selector() == "deseada"
+    _escribir("tipo_temperatura", "ambiente\n", antiguedad=30)
+    assert selector.obtener_selector() == "ambiente"
+    assert (selector.cache.lecturas, selector.cache.aciertos) == (2, 1)
@@ -0,0 +1,150 @@
+"""
+Tests de integracion para los proxies sobre el HAL ADC
+
+Casos de prueba:
+- PHA-001: ProxySensorTemperaturaHAL convierte el bloque a grados
+- PHA-002: ProxySensorTemperaturaHAL sin inicializar -> IOError
+- PHA-003: ProxyBateriaHAL convierte a voltios
+- PHA-004: ProxyBateriaHAL sin inicializar -> None
+- PHA-005: Configurador arma proxies "hal" que comparten el ADC
+- PHA-006: Calibracion de termistor aplicada por el simulado y el proxy
+- PHA-007: Canales reasignados: el simulado genera y calibra cada sensor en su canal
+"""
+import pytest
+from agentes_sensores.proxy_bateria import ProxyBateriaHAL
+from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaHAL
+from configurador.configurador import Configurador
+from hal.hal_adc_mock import HAL_ADC_Mock
+from hal.hal_adc_simulado import HAL_ADC_Simulado
+from hal.conversion import celsius_a_cuentas, voltios_bateria_a_cuentas
+
+
+def _mock_inicializado(valores):
+    """Helper que crea un ADC mock listo para leer"""
+    hal = HAL_ADC_Mock(valores_adc=valores)
+    hal.inicializar()
+    return hal
+
+
+class TestProxySensorTemperaturaHAL:
+    """Tests para ProxySensorTemperaturaHAL"""
+
+    # PHA-001: Conversion del bloque
+    def test_convierte_bloque_a_grados(self):
+        """Entrega un valor en grados por cada grupo decimado"""
+        cuentas = round(celsius_a_cuentas(25.0))
+        proxy = ProxySensorTemperaturaHAL(_mock_inicializado([cuentas]), canal=0,
+                                          lecturas=3, sobremuestreo=4)
+
+        temperaturas = proxy.leer_temperaturas()
+
+        assert len(temperaturas) == 3
+        assert temperaturas == pytest.approx([25.0] * 3, abs=0.2)
+        assert proxy.leer_temperatura() == pytest.approx(25.0, abs=0.2)
+
+    # PHA-002: Sin inicializar
+    def test_sin_inicializar_lanza_ioerror(self):
+        """El error del ADC llega al gestor como IOError"""
+        proxy = ProxySensorTemperaturaHAL(HAL_ADC_Mock([200]))
+
+        with pytest.raises(IOError):
+            proxy.leer_temperatura()
+
+
+class TestProxyBateriaHAL:
+    """Tests para ProxyBateriaHAL"""
+
+    # PHA-003: Conversion a voltios
+    def test_convierte_a_voltios(self):
+        """La carga se informa en voltios de bateria"""
+        cuentas = round(voltios_bateria_a_cuentas(4.5))
+        proxy = ProxyBateriaHAL(_mock_inicializado([cuentas]), canal=1)
+
+        assert proxy.leer_carga() == pytest.approx(4.5, abs=0.01)
+
+    # PHA-004: Sin inicializar
+    def test_sin_inicializar_retorna_none(self):
+        """Como ProxyBateriaArchivo, un error de lectura retorna None"""
+        proxy = ProxyBateriaHAL(HAL_ADC_Mock([200]))
+
+        assert proxy.leer_carga() is None
+
+
+class TestConfiguradorHAL:
+    """Tests para la configuracion de proxies "hal" """
+
+    # PHA-005: ADC compartido
+    def test_proxies_hal_comparten_adc(self):
+        """Temperatura y bateria usan la misma instancia inicializada"""
+        Configurador.configuracion_termostato = {
+            "proxy_bateria": "hal",
+            "proxy_sensor_temperatura": "hal",
+            "hal": {"tipo": "simulado", "temperatura_base": 20.0, "semilla": 3}
+        }
+        Configurador.hal_adc = None
+
+        proxy_bateria = Configurador.configurar_proxy_bateria()
+        proxy_temperatura = Configurador.configurar_proxy_temperatura()
+
+        assert isinstance(Configurador.hal_adc, HAL_ADC_Simulado)
+        assert Configurador.hal_adc.inicializado
+        assert proxy_temperatura.leer_temperatura() == pytest.approx(20.0, abs=1.0)
+        assert proxy_bateria.leer_carga() == pytest.approx(4.5, abs=0.1)
+
+        # Cleanup
+        Configurador.hal_adc.finalizar()
+        Configurador.hal_adc = None
+        Configurador.configuracion_termostato = None
+
+    # PHA-006: Calibracion de termistor
+    def test_calibracion_termistor_en_simulado_y_proxy(self):
+        """Con un termistor configurado el proxy lee la temperatura simulada"""
+        Configurador.configuracion_termostato = {
+            "proxy_sensor_temperatura": "hal",
+            "hal": {
+                "tipo": "simulado",
+                "temperatura_base": 30.0,
+                "ruido_std": 0.2,
+                "semilla": 5,
+                "calibracion": {"temperatura": {"modelo": "termistor", "beta": 3950}}
+            }
+        }
+        Configurador.hal_adc = None
+
+        proxy_temperatura = Configurador.configurar_proxy_temperatura()
+
+        assert proxy_temperatura.leer_temperatura() == pytest.approx(30.0, abs=0.5)
+
+        # Cleanup
+        Configurador.hal_adc.finalizar()
+        Configurador.hal_adc = None
+        Configurador.configuracion_termostato = None
+
+    # PHA-007: Canales reasignados
+    def test_calibracion_en_canales_reasignados(self):
+        """La calibracion y la senal siguen al canal configurado de cada sensor"""
+        Configurador.configuracion_termostato = {
+            "proxy_bateria": "hal",
+            "proxy_sensor_temperatura": "hal",
+            "hal": {
+                "tipo": "simulado",
+                "temperatura_base": 30.0,
+                "ruido_std": 0.2,
+                "semilla": 5,
+                "canales": {"temperatura": 3, "bateria": 2},
+                "calibracion": {"temperatura": {"modelo": "termistor", "beta": 3950}}
+            }
+        }
+        Configurador.hal_adc = None
+
+        proxy_temperatura = Configurador.configurar_proxy_temperatura()
+        proxy_bateria = Configurador.configurar_proxy_bateria()
+
+        assert proxy_temperatura.leer_temperatura() == pytest.approx(30.0, abs=0.5)
+        assert proxy_bateria.leer_carga() == pytest.approx(4.5, abs=0.1)
+        assert Configurador.hal_adc.leer_adc(0) < 10
+
+        # Cleanup
+        Configurador.hal_adc.finalizar()
+        Configurador.hal_adc = None
+        Configurador.configuracion_termostato = None
@@ -0,0 +1,139 @@
+"""
+Tests de integracion para los proxies socket de sensores
+
+Casos de prueba:
+- PSK-001: ProxySensorTemperaturaSocket en puerto efimero expone su direccion
+- PSK-002: Lecturas sucesivas reutilizan el mismo socket de escucha
+- PSK-003: Varios valores en una conexion -> leer_temperaturas los entrega todos
+- PSK-004: ProxyBateriaSocket recibe la carga del sensor programable
+- PSK-005: Conexiones encoladas -> cada lectura entrega el valor mas reciente
+- PSK-006: Sin conexion dentro de la espera -> la lectura no trae valor
+"""
+import socket
+import threading
+import time
+
+import pytest
+from actores_externos.sensor_programable import SensorSocketProgramable
+from agentes_sensores.proxy_bateria import ProxyBateriaSocket
+from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaSocket
+
+
+def _leer_en_hilo(lectura):
+    """Helper que ejecuta una lectura bloqueante en un hilo y retorna el resultado"""
+    resultado = []
+    hilo = threading.Thread(target=lambda: resultado.append(lectura()), daemon=True)
+    hilo.start()
+    return hilo, resultado
+
+
+@pytest.fixture
+def proxy_temperatura():
+    """Proxy de temperatura escuchando en un puerto efimero"""
+    proxy = ProxySensorTemperaturaSocket("127.0.0.1", 0)
+    yield proxy
+    proxy.cerrar()
+
+
+class TestProxySensorTemperaturaSocket:
+    """Tests para ProxySensorTemperaturaSocket"""
+
+    # PSK-001: Puerto efimero
+    def test_puerto_efimero_expone_direccion(self, proxy_temperatura):
+        """Con puerto 0 la direccion informa el puerto asignado"""
+        host, puerto = proxy_temperatura.direccion
+
+        assert host == "127.0.0.1"
+        assert puerto > 0
+
+    # PSK-002: Socket de escucha persistente
+    def test_lecturas_sucesivas_mismo_socket(self, proxy_temperatura):
+        """Dos lecturas seguidas usan el mismo puerto de escucha"""
+        direccion = proxy_temperatura.direccion
+        sensor = SensorSocketProgramable(*direccion)
+
+        for valor in (21.5, 23.0):
+            hilo, resultado = _leer_en_hilo(proxy_temperatura.leer_temperatura)
+            sensor.enviar(valor)
+            hilo.join(timeout=2)
+            assert resultado == [valor]
+
+        assert proxy_temperatura.direccion == direccion
+        assert sensor.enviadas == 2
+
+    # PSK-003: Varios valores por conexion
+    def test_varios_valores_en_una_conexion(self, proxy_temperatura):
+        """leer_temperaturas entrega todos los valores enviados juntos"""
+        sensor = SensorSocketProgramable(*proxy_temperatura.direccion)
+
+        hilo, resultado = _leer_en_hilo(proxy_temperatura.leer_temperaturas)
+        sensor.enviar(20.0, 20.5, 21.0)
+        hilo.join(timeout=2)
+
+        assert resultado == [[20.0, 20.5, 21.0]]
+
+
+class TestProxyBateriaSocket:
+    """Tests para ProxyBateriaSocket"""
+
+    # PSK-004: Carga desde el sensor programable
+    def test_recibe_carga(self):
+        """La carga enviada llega al proxy como float"""
+        proxy = ProxyBateriaSocket("127.0.0.1", 0)
+        sensor = SensorSocketProgramable(*proxy.direccion)
+
+        hilo, resultado = _leer_en_hilo(proxy.leer_carga)
+        sensor.enviar(4.8)
+        hilo.join(timeout=2)
+        proxy.cerrar()
+
+        assert resultado == [4.8]
+
+
+def _encolar(direccion, *valores):
+    """Helper que envia cada valor en su conexion antes de que el proxy lea"""
+    for valor in valores:
+        with socket.create_connection(direccion) as conexion:
+            conexion.sendall(str(valor).encode("utf-8"))
+    # Las conexiones quedan en la cola de escucha del proxy
+    time.sleep(0.05)
+
+
+class TestLecturaMasReciente:
+    """Tests de lecturas con conexiones encoladas"""
+
+    # PSK-005: Sensor mas rapido que el controlador
+    def test_conexiones_encoladas_entregan_la_mas_reciente(self, proxy_temperatura):
+        """Las lecturas viejas encoladas se descartan en favor de la ultima"""
+        _encolar(proxy_temperatura.direccion, 20, 21, 22, 23, 24)
+        assert proxy_temperatura.leer_temperatura() == 24.0
+
+        _encolar(proxy_temperatura.direccion, 25, 26)
+        assert proxy_temperatura.leer_temperaturas() == [26.0]
+
+        proxy_bateria = ProxyBateriaSocket("127.0.0.1", 0)
+        try:
+            _encolar(proxy_bateria.direccion, 4.9, 4.8, 4.7)
+            assert proxy_bateria.leer_carga() == 4.7
+        finally:
+            proxy_bateria.cerrar()
+
+
+class TestEsperaLectura:
+    """Tests de la espera maxima de las lecturas socket"""
+
+    # PSK-006: Espera vencida
+    def test_espera_vencida_sin_valor(self):
+        """Sin sensor, cada lectura retorna al vencer la espera"""
+        proxy_temperatura = ProxySensorTemperaturaSocket("127.0.0.1", 0, espera=0.05)
+        proxy_bateria = ProxyBateriaSocket("127.0.0.1", 0, espera=0.05)
+        inicio = time.monotonic()
+        try:
+            assert proxy_temperatura.leer_temperaturas() == []
+            assert proxy_temperatura.leer_temperatura() is None
+            assert proxy_bateria.leer_carga() is None
+        finally:
+            proxy_temperatura.cerrar()
+            proxy_bateria.cerrar()
+
+        assert 0.15 <= time.monotonic() - inicio < 1
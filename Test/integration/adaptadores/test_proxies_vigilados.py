@@ -0,0 +1,175 @@
+"""
+Tests de integracion para los vigias de archivo y los proxies vigilados
+
+Casos de prueba:
+- PVI-001: VigiaInotify -> despierta con la escritura y vence sin ella
+- PVI-002: VigiaInotify -> detecta el reemplazo por rename e ignora otros archivos
+- PVI-003: VigiaSondeo -> detecta cambios de firma; un borrado no cuenta
+- PVI-004: Proxy vigilado -> primera lectura inmediata, luego espera la escritura
+- PVI-005: Proxy vigilado -> sin escrituras entrega el ultimo valor sin abrir el archivo
+- PVI-006: Proxy vigilado -> tras un error se vuelve a leer
+- PVI-007: crear_vigia sin inotify -> sondeo
+- PVI-008: VigiaSondeo con reloj virtual -> sondea y vence en tiempo simulado
+"""
+import os
+import threading
+import time
+
+import pytest
+from agentes_sensores import vigia_archivo
+from agentes_sensores.proxy_bateria import ProxyBateriaArchivo
+from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaArchivo
+from agentes_sensores.proxy_vigilado import ProxyBateriaVigilado, ProxySensorTemperaturaVigilado
+from agentes_sensores.vigia_archivo import VigiaInotify, VigiaSondeo, crear_vigia
+from servicios_aplicacion.reloj import RelojVirtual
+
+requiere_inotify = pytest.mark.skipif(not vigia_archivo.inotify_disponible(),
+                                      reason="inotify no disponible")
+
+
+def _escribir(ruta, texto):
+    """Helper que escribe el archivo como los simuladores"""
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(texto)
+
+
+def _escribir_despues(ruta, texto, demora=0.1):
+    """Helper que escribe el archivo desde otro hilo tras una demora"""
+    hilo = threading.Timer(demora, _escribir, args=(ruta, texto))
+    hilo.start()
+    return hilo
+
+
+@pytest.fixture(autouse=True)
+def directorio(tmp_path, monkeypatch):
+    """Los proxies de archivo leen del directorio de trabajo"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+# PVI-001: Despertar por escritura
+@requiere_inotify
+def test_inotify_despierta_con_la_escritura():
+    """La espera termina con la escritura, no con el timeout"""
+    _escribir("temperatura", "22")
+    vigia = VigiaInotify("temperatura")
+    try:
+        assert vigia.esperar(timeout=0.05) is False
+
+        escritor = _escribir_despues("temperatura", "23")
+        inicio = time.monotonic()
+        assert vigia.esperar(timeout=5) is True
+        assert time.monotonic() - inicio < 1
+        escritor.join()
+    finally:
+        vigia.cerrar()
+
+
+# PVI-002: Reemplazo atomico y otros archivos
+@requiere_inotify
+def test_inotify_reemplazo_y_otros_archivos(directorio):
+    """Un rename sobre el archivo cuenta; escribir otro archivo no"""
+    vigia = VigiaInotify(str(directorio / "bateria"))
+    try:
+        _escribir("temperatura", "22")
+        assert vigia.esperar(timeout=0.1) is False
+
+        _escribir("bateria.tmp", "4.5")
+        os.replace("bateria.tmp", "bateria")
+        assert vigia.esperar(timeout=1) is True
+    finally:
+        vigia.cerrar()
+
+
+# PVI-003: Sondeo de firma
+def test_sondeo_detecta_cambios_de_firma():
+    """El sondeo detecta la escritura; borrar el archivo no despierta"""
+    _escribir("bateria", "4.5")
+    vigia = VigiaSondeo("bateria", periodo=0.01)
+
+    assert vigia.esperar(timeout=0.05) is False
+    _escribir("bateria", "4.25")
+    assert vigia.esperar(timeout=1) is True
+
+    os.remove("bateria")
+    assert vigia.esperar(timeout=0.05) is False
+    _escribir("bateria", "4.0")
+    assert vigia.esperar(timeout=1) is True
+
+
+# PVI-004: Primera lectura inmediata, luego espera
+def test_proxy_vigilado_espera_la_escritura():
+    """La segunda lectura entrega el valor escrito mientras esperaba"""
+    _escribir("temperatura", "22")
+    proxy = ProxySensorTemperaturaVigilado(ProxySensorTemperaturaArchivo(),
+                                           crear_vigia("temperatura", 0.01), espera=5)
+    try:
+        assert proxy.leer_temperatura() == 22
+
+        escritor = _escribir_despues("temperatura", "24")
+        assert proxy.leer_temperaturas() == [24]
+        escritor.join()
+        assert proxy.lectura.lecturas == 2
+    finally:
+        proxy.cerrar()
+
+
+# PVI-005: Sin escrituras
+def test_proxy_vigilado_sin_escrituras_no_abre_el_archivo(monkeypatch):
+    """Al vencer la espera se entrega el ultimo valor"""
+    _escribir("bateria", "4.5")
+    proxy = ProxyBateriaVigilado(ProxyBateriaArchivo(), crear_vigia("bateria", 0.01),
+                                 espera=0.05)
+    try:
+        assert proxy.leer_carga() == 4.5
+
+        def abrir(*args, **kwargs):
+            raise AssertionError("no deberia abrir el archivo")
+
+        monkeypatch.setattr("builtins.open", abrir)
+        assert proxy.leer_carga() == 4.5
+        assert (proxy.lectura.lecturas, proxy.lectura.vencidas) == (1, 1)
+    finally:
+        proxy.cerrar()
+
+
+# PVI-006: Error de lectura
+def test_proxy_vigilado_reintenta_tras_un_error():
+    """Sin archivo la lectura falla; cuando se crea, se lee"""
+    proxy = ProxySensorTemperaturaVigilado(ProxySensorTemperaturaArchivo(),
+                                           crear_vigia("temperatura", 0.01), espera=0.05)
+    try:
+        with pytest.raises(IOError):
+            proxy.leer_temperatura()
+        with pytest.raises(IOError):
+            proxy.leer_temperatura()
+
+        _escribir("temperatura", "21")
+        assert proxy.leer_temperatura() == 21
+    finally:
+        proxy.cerrar()
+
+
+# PVI-007: Alternativa por sondeo
+def test_crear_vigia_sin_inotify_usa_sondeo(monkeypatch):
+    """Donde no hay inotify el vigia sondea la firma del archivo"""
+    monkeypatch.setattr(vigia_archivo, "_inotify_init1", None)
+
+    vigia = crear_vigia("temperatura", periodo_sondeo=0.2)
+
+    assert isinstance(vigia, VigiaSondeo)
+    assert vigia._periodo == 0.2
+
+
+# PVI-008: Reloj inyectado
+def test_sondeo_con_reloj_virtual(monkeypatch):
+    """Los sondeos y el plazo corren en el reloj inyectado, sin esperas reales"""
+    monkeypatch.setattr(vigia_archivo, "_inotify_init1", None)
+    _escribir("bateria", "4.5")
+    reloj = RelojVirtual()
+    vigia = crear_vigia("bateria", periodo_sondeo=1, reloj=reloj)
+
+    inicio = time.monotonic()
+    assert vigia.esperar(timeout=30) is False
+    assert reloj.monotonic() == pytest.approx(30)
+    assert time.monotonic() - inicio < 1
@@ -0,0 +1,100 @@
+"""
+Tests de integracion para el endpoint HTTP de metricas
+
+Casos de prueba:
+- SMT-001: GET /metrics -> 200 con el formato de texto de Prometheus
+- SMT-002: Otra ruta -> 404
+- SMT-003: Configurador con seccion metricas -> proxies, visualizadores y
+  operador medidos sobre el mismo registro, visibles en el endpoint
+"""
+import urllib.error
+import urllib.request
+from unittest.mock import Mock, patch
+
+import pytest
+from configurador.configurador import Configurador
+from metricas.registro import RegistroMetricas
+from metricas.servidor import ServidorMetricas
+from servicios_aplicacion.operador_paralelo import OperadorParalelo
+
+
+def _obtener(servidor, ruta):
+    """Helper: GET a la ruta del servidor"""
+    host, puerto = servidor.direccion
+    return urllib.request.urlopen("http://{}:{}{}".format(host, puerto, ruta), timeout=2)
+
+
+@pytest.fixture
+def registro():
+    """Registro con una metrica de ejemplo"""
+    registro = RegistroMetricas()
+    registro.contador("termostato_lecturas_total", "Lecturas",
+                      ("dispositivo",)).etiquetas("bateria").incrementar(3)
+    return registro
+
+
+@pytest.fixture
+def servidor(registro):
+    """Servidor de metricas en un puerto efimero"""
+    servidor = ServidorMetricas(registro, "127.0.0.1", 0)
+    servidor.iniciar()
+    yield servidor
+    servidor.detener()
+
+
+# SMT-001: Scrape
+def test_get_metrics_expone_el_registro(servidor, registro):
+    """El cuerpo es la exposicion del registro al momento del pedido"""
+    with _obtener(servidor, "/metrics") as respuesta:
+        assert respuesta.status == 200
+        assert respuesta.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert 'termostato_lecturas_total{dispositivo="bateria"} 3' in respuesta.read().decode()
+
+    registro.obtener("termostato_lecturas_total").etiquetas("bateria").incrementar()
+    with _obtener(servidor, "/metrics") as respuesta:
+        assert 'termostato_lecturas_total{dispositivo="bateria"} 4' in respuesta.read().decode()
+
+
+# SMT-002: Ruta desconocida
+def test_otra_ruta_responde_404(servidor):
+    """Solo /metrics es una ruta valida"""
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _obtener(servidor, "/")
+    assert error.value.code == 404
+
+
+# SMT-003: Configurador con metricas
+def test_configurador_mide_agentes_y_operador(tmp_path, monkeypatch):
+    """Lectura, visualizacion y tarea del operador aparecen en el endpoint"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "bateria").write_text("4.5")
+    Configurador.configuracion_termostato = {
+        "proxy_bateria": "archivo", "visualizador_bateria": "archivo",
+        "metricas": {"host": "127.0.0.1", "puerto": 0},
+    }
+    Configurador.metricas = None
+    try:
+        proxy = Configurador.configurar_proxy_bateria()
+        with patch("builtins.print"):
+            Configurador.configurar_visualizador_bateria().mostrar_tension(4.5)
+        with patch("servicios_aplicacion.selector_entrada.Configurador"):
+            operador = OperadorParalelo(Mock(), Mock(), Mock(),
+                                        metricas=Configurador.configurar_metricas())
+        with operador._medir("bateria"):
+            assert proxy.leer_carga() == 4.5
+        servidor = Configurador.configurar_servidor_metricas()
+        servidor.iniciar()
+        try:
+            with _obtener(servidor, "/metrics") as respuesta:
+                texto = respuesta.read().decode()
+        finally:
+            servidor.detener()
+    finally:
+        Configurador.configuracion_termostato = None
+        Configurador.metricas = None
+
+    assert 'termostato_lectura_segundos_count{dispositivo="bateria"} 1' in texto
+    assert 'termostato_ultima_lectura{dispositivo="bateria"} 4.5' in texto
+    assert 'termostato_visualizacion_segundos_count{visualizador="bateria"} 1' in texto
+    assert 'termostato_tarea_segundos_count{tarea="bateria"} 1' in texto
+    assert 'termostato_cola_profundidad{cola="comandos"} 0' in texto
@@ -0,0 +1,137 @@
+"""
+Tests de integracion para el servidor socket no bloqueante
+
+Casos de prueba:
+- SSN-001: Sin clientes -> sondear retorna [] sin bloquear
+- SSN-002: Varios comandos en un paquete -> se entregan todos en orden
+- SSN-003: Mensaje fragmentado -> se reensambla
+- SSN-004: Varios clientes simultaneos -> se reciben mensajes de todos
+- SSN-005: Comando sin separador y cierre -> se entrega al cerrar
+- SSN-006: SeteoTemperaturaSocket entrega cada comando del paquete
+- SSN-007: SelectorTemperaturaSocket conserva el ultimo modo valido
+"""
+import socket
+import time
+
+import pytest
+from agentes_sensores.servidor_socket import ServidorSocketNoBloqueante
+from agentes_sensores.proxy_seteo_temperatura import SeteoTemperaturaSocket
+from agentes_sensores.proxy_selector_temperatura import SelectorTemperaturaSocket
+
+
+def _conectar(direccion):
+    """Helper para conectar un cliente TCP al servidor"""
+    return socket.create_connection(("127.0.0.1", direccion[1]), timeout=1)
+
+
+def _sondear_hasta(servidor, cantidad, limite=1.0):
+    """Helper que sondea hasta reunir la cantidad de mensajes esperada"""
+    mensajes = []
+    fin = time.monotonic() + limite
+    while len(mensajes) < cantidad and time.monotonic() < fin:
+        mensajes.extend(servidor.sondear(timeout=0.01))
+    return mensajes
+
+
+@pytest.fixture
+def servidor():
+    """Servidor escuchando en un puerto efimero"""
+    servidor = ServidorSocketNoBloqueante("127.0.0.1", 0)
+    yield servidor
+    servidor.cerrar()
+
+
+class TestServidorSocketNoBloqueante:
+    """Tests para ServidorSocketNoBloqueante"""
+
+    # SSN-001: Sin clientes no bloquea
+    def test_sondear_sin_clientes_no_bloquea(self, servidor):
+        """Sin clientes debe retornar lista vacia inmediatamente"""
+        inicio = time.monotonic()
+        assert servidor.sondear(timeout=0) == []
+        assert time.monotonic() - inicio < 0.05
+
+    # SSN-002: Varios comandos en un paquete
+    def test_varios_comandos_en_un_paquete(self, servidor):
+        """Todos los comandos de un paquete deben entregarse en orden"""
+        cliente = _conectar(servidor.direccion)
+        cliente.sendall(b"aumentar\naumentar\ndisminuir\n")
+
+        mensajes = _sondear_hasta(servidor, 3)
+        cliente.close()
+
+        assert mensajes == ["aumentar", "aumentar", "disminuir"]
+
+    # SSN-003: Mensaje fragmentado
+    def test_mensaje_fragmentado_se_reensambla(self, servidor):
+        """Un mensaje partido en dos envios debe entregarse completo"""
+        cliente = _conectar(servidor.direccion)
+        cliente.sendall(b"aumen")
+        assert _sondear_hasta(servidor, 1, limite=0.1) == []
+
+        cliente.sendall(b"tar\n")
+        mensajes = _sondear_hasta(servidor, 1)
+        cliente.close()
+
+        assert mensajes == ["aumentar"]
+
+    # SSN-004: Varios clientes simultaneos
+    def test_varios_clientes_simultaneos(self, servidor):
+        """Debe recibir mensajes de varios clientes conectados a la vez"""
+        cliente_1 = _conectar(servidor.direccion)
+        cliente_2 = _conectar(servidor.direccion)
+        cliente_1.sendall(b"aumentar\n")
+        cliente_2.sendall(b"disminuir\n")
+
+        mensajes = _sondear_hasta(servidor, 2)
+        cliente_1.close()
+        cliente_2.close()
+
+        assert sorted(mensajes) == ["aumentar", "disminuir"]
+
+    # SSN-005: Sin separador, se entrega al cerrar
+    def test_comando_sin_separador_se_entrega_al_cerrar(self, servidor):
+        """Compatibilidad con simuladores que envian un comando y cierran"""
+        cliente = _conectar(servidor.direccion)
+        cliente.sendall(b"deseada")
+        cliente.close()
+
+        assert _sondear_hasta(servidor, 1) == ["deseada"]
+
+
+class TestProxiesEntradaNoBloqueantes:
+    """Tests para SeteoTemperaturaSocket y SelectorTemperaturaSocket"""
+
+    # SSN-006: Seteo entrega cada comando
+    def test_seteo_entrega_cada_comando_del_paquete(self):
+        """Cada comando valido del paquete debe obtenerse por separado"""
+        seteo = SeteoTemperaturaSocket("127.0.0.1", 0)
+        cliente = _conectar(seteo._servidor.direccion)
+        cliente.sendall(b"aumentar invalido disminuir\n")
+
+        comandos = []
+        fin = time.monotonic() + 1.0
+        while len(comandos) < 2 and time.monotonic() < fin:
+            comando = seteo.obtener_seteo()
+            if comando is not None:
+                comandos.append(comando)
+        cliente.close()
+
+        assert comandos == ["aumentar", "disminuir"]
+        assert seteo.obtener_seteo() is None
+
+    # SSN-007: Selector conserva ultimo modo
+    def test_selector_conserva_ultimo_modo_valido(self):
+        """El selector debe quedar en el ultimo modo valido recibido"""
+        selector = SelectorTemperaturaSocket("127.0.0.1", 0)
+        assert selector.obtener_selector() == "ambiente"
+
+        cliente = _conectar(selector._servidor.direccion)
+        cliente.sendall(b"deseada\notro\n")
+
+        fin = time.monotonic() + 1.0
+        while selector.obtener_selector() != "deseada" and time.monotonic() < fin:
+            time.sleep(0.01)
+        cliente.close()
+
+        assert selector.obtener_selector() == "deseada"
@@ -0,0 +1,141 @@
+"""
+Tests de integracion del bus de eventos entre gestores y salidas
+
+Casos de prueba:
+- BEV-001: Gestores -> publican solo cuando cambia su estado
+- BEV-002: Presentador suscripto -> redibuja solo las secciones que cambiaron
+- BEV-003: Metricas -> cuentan los eventos por tipo
+- BEV-004: Operador con bus -> el hilo de presentacion despacha en lugar de sondear
+"""
+import io
+from unittest.mock import Mock
+
+import pytest
+from entidades.ambiente import Ambiente
+from entidades.bateria import Bateria
+from entidades.climatizador import Climatizador
+from eventos.bus import BusEventos, EntregaLimitada
+from eventos.tipos import (
+    CambioBateria, CambioClimatizador, CambioTemperaturaAMostrar, CambioTemperaturaAmbiente,
+    CambioTemperaturaDeseada,
+)
+from gestores_entidades.gestor_ambiente import GestorAmbiente
+from gestores_entidades.gestor_bateria import GestorBateria
+from gestores_entidades.gestor_climatizador import GestorClimatizador
+from metricas.instrumentos import registrar_eventos
+from metricas.registro import RegistroMetricas
+from servicios_aplicacion.operador_paralelo import OperadorParalelo
+from servicios_aplicacion.presentador import Presentador
+from servicios_aplicacion.reloj import RelojVirtual
+from servicios_aplicacion.terminal import TerminalAnsi
+
+
+@pytest.fixture
+def sistema():
+    """Gestores reales con proxies simulados publicando en un bus"""
+    reloj = RelojVirtual()
+    bus = BusEventos(reloj)
+    proxy_bateria = Mock()
+    proxy_bateria.leer_carga.return_value = 4.8
+    proxy_sensor = Mock()
+    proxy_sensor.leer_temperatura.return_value = 20
+    visualizador_bateria, visualizador_temperatura = Mock(), Mock()
+    gestores = (
+        GestorBateria(Bateria(5.0, 0.95), proxy_bateria, visualizador_bateria,
+                      reloj=reloj, bus=bus),
+        GestorAmbiente(Ambiente(temperatura_deseada_inicial=24), proxy_sensor,
+                       visualizador_temperatura, reloj=reloj, bus=bus),
+        GestorClimatizador(Climatizador(), Mock(), Mock(), bus=bus),
+    )
+    return reloj, bus, proxy_sensor, gestores
+
+
+# BEV-001: Los gestores publican solo cambios
+def test_gestores_publican_solo_cambios(sistema):
+    """Lecturas repetidas no generan eventos; cada cambio genera uno de su tipo"""
+    _, bus, proxy_sensor, (bateria, ambiente, climatizador) = sistema
+    eventos = []
+    bus.suscribir(eventos.extend)
+
+    for _ in range(3):
+        bateria.verificar_nivel_de_carga()
+        ambiente.leer_temperatura_ambiente()
+    proxy_sensor.leer_temperatura.side_effect = OSError("sensor desconectado")
+    ambiente.leer_temperatura_ambiente()
+    ambiente.aumentar_temperatura_deseada()
+    ambiente.ajustar_temperatura_deseada(0)
+    ambiente.indicar_temperatura_a_mostrar("deseada")
+    proxy_sensor.leer_temperatura.side_effect = None
+    ambiente.leer_temperatura_ambiente()
+    climatizador.accionar_climatizador(ambiente.ambiente)
+
+    assert eventos == [
+        CambioBateria(4.8, "NORMAL"),
+        CambioTemperaturaAmbiente(20),
+        CambioTemperaturaAmbiente(None),
+        CambioTemperaturaDeseada(25),
+        CambioTemperaturaAMostrar("deseada"),
+        CambioTemperaturaAmbiente(20),
+        CambioClimatizador("calentando"),
+    ]
+
+
+# BEV-002: Presentador suscripto
+def test_presentador_redibuja_secciones_cambiadas(sistema):
+    """Con entrega limitada el presentador solo muestra lo que cambio, al despachar"""
+    reloj, bus, proxy_sensor, (bateria, ambiente, climatizador) = sistema
+    salida = io.StringIO()
+    presentador = Presentador(bateria, ambiente, climatizador, TerminalAnsi(salida))
+    bus.suscribir(presentador.presentar_cambios, politica=EntregaLimitada(5))
+
+    bateria.verificar_nivel_de_carga()
+    ambiente.leer_temperatura_ambiente()
+    assert salida.getvalue() == ""
+    bus.despachar()
+    assert "BATERIA" in salida.getvalue()
+    assert "TEMPERATURA" in salida.getvalue()
+
+    salida.truncate(0)
+    salida.seek(0)
+    proxy_sensor.leer_temperatura.return_value = 21
+    ambiente.leer_temperatura_ambiente()
+    bus.despachar()
+    assert salida.getvalue() == ""
+    reloj.sleep(5)
+    bus.despachar()
+    assert "TEMPERATURA" in salida.getvalue()
+    assert "BATERIA" not in salida.getvalue()
+    assert "CLIMATIZADOR" not in salida.getvalue()
+
+
+# BEV-003: Metricas de eventos
+def test_metricas_cuentan_eventos_por_tipo(sistema):
+    """termostato_eventos_total se incrementa por cada evento publicado"""
+    _, bus, proxy_sensor, (bateria, ambiente, _) = sistema
+    registro = RegistroMetricas()
+    registrar_eventos(registro, bus)
+
+    bateria.verificar_nivel_de_carga()
+    ambiente.leer_temperatura_ambiente()
+    proxy_sensor.leer_temperatura.return_value = 21
+    ambiente.leer_temperatura_ambiente()
+
+    texto = registro.exponer()
+    assert 'termostato_eventos_total{evento="CambioTemperaturaAmbiente"} 2' in texto
+    assert 'termostato_eventos_total{evento="CambioBateria"} 1' in texto
+
+
+# BEV-004: Operador con bus
+def test_operador_con_bus_despacha_en_lugar_de_sondear():
+    """El hilo de presentacion no llama al presentador cuando hay bus"""
+    reloj = RelojVirtual()
+    bus = Mock()
+    operador = OperadorParalelo(Mock(), Mock(), Mock(), reloj=reloj, bus=bus)
+    operador._presentador = Mock()
+    reloj.sleep = Mock(side_effect=[None, StopIteration])
+
+    with pytest.raises(StopIteration):
+        operador.muestra_parametros()
+
+    assert bus.despachar.call_count == 2
+    operador._presentador.ejecutar.assert_not_called()
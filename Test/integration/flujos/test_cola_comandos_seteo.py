@@ -0,0 +1,99 @@
+"""
+Tests de integracion para el modo cola de SelectorEntradaTemperatura
+
+Casos de prueba:
+- SCO-001: Cinco "aumentar" en modo deseada -> un unico ajuste de +5
+- SCO-002: Comandos en modo ambiente -> se descartan
+- SCO-003: Cambio de modo dentro del lote -> solo cuentan los posteriores
+- SCO-004: Lote con cambio de setpoint -> climatizador evaluado una vez
+- SCO-005: Cola vacia -> retorna 0 tras el timeout
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+from entidades.ambiente import Ambiente
+from gestores_entidades.gestor_ambiente import GestorAmbiente
+from servicios_aplicacion.selector_entrada import SelectorEntradaTemperatura
+
+
+@pytest.fixture
+def gestor_ambiente():
+    """GestorAmbiente real con setpoint inicial 22"""
+    return GestorAmbiente(
+        ambiente=Ambiente(temperatura_deseada_inicial=22.0),
+        proxy_sensor=Mock(),
+        visualizador=Mock(),
+        incremento_temperatura=1.0
+    )
+
+
+def _crear_selector(gestor_ambiente, gestor_climatizador=None):
+    """Helper para crear el selector sin fuentes reales"""
+    with patch('servicios_aplicacion.selector_entrada.Configurador'):
+        return SelectorEntradaTemperatura(gestor_ambiente,
+                                          gestor_climatizador=gestor_climatizador)
+
+
+class TestSelectorModoCola:
+    """Tests del modo cola (push) del selector de entrada"""
+
+    # SCO-001: Agrupacion de comandos
+    def test_cinco_aumentar_se_agrupan_en_un_ajuste(self, gestor_ambiente):
+        """Cinco "aumentar" deben aplicarse como un unico ajuste de +5"""
+        gestor_ambiente.indicar_temperatura_a_mostrar("deseada")
+        gestor_ambiente.ajustar_temperatura_deseada = Mock(
+            wraps=gestor_ambiente.ajustar_temperatura_deseada)
+        selector = _crear_selector(gestor_ambiente)
+
+        for _ in range(5):
+            selector.encolar_comando("aumentar")
+        procesados = selector.ejecutar_cola(timeout=0)
+
+        assert procesados == 5
+        assert gestor_ambiente.obtener_temperatura_deseada() == 27.0
+        gestor_ambiente.ajustar_temperatura_deseada.assert_called_once_with(5)
+
+    # SCO-002: Comandos fuera de modo deseada
+    def test_comandos_en_modo_ambiente_se_descartan(self, gestor_ambiente):
+        """En modo ambiente los ajustes no modifican el setpoint"""
+        selector = _crear_selector(gestor_ambiente)
+
+        selector.encolar_comando("aumentar")
+        selector.encolar_comando("aumentar")
+        selector.ejecutar_cola(timeout=0)
+
+        assert gestor_ambiente.obtener_temperatura_deseada() == 22.0
+
+    # SCO-003: Cambio de modo en el lote
+    def test_cambio_de_modo_dentro_del_lote(self, gestor_ambiente):
+        """Solo cuentan los ajustes recibidos mientras el modo es deseada"""
+        selector = _crear_selector(gestor_ambiente)
+
+        for comando in ["aumentar", "deseada", "aumentar", "aumentar",
+                        "disminuir", "ambiente", "aumentar"]:
+            selector.encolar_comando(comando)
+        selector.ejecutar_cola(timeout=0)
+
+        assert gestor_ambiente.obtener_temperatura_deseada() == 23.0
+        assert gestor_ambiente.ambiente.temperatura_a_mostrar == "ambiente"
+
+    # SCO-004: Climatizador evaluado una vez por lote
+    def test_climatizador_evaluado_una_vez_por_lote(self, gestor_ambiente):
+        """Un lote con cambio de setpoint reevalua el climatizador una vez"""
+        gestor_climatizador = Mock()
+        selector = _crear_selector(gestor_ambiente, gestor_climatizador)
+
+        selector.encolar_comando("deseada")
+        for _ in range(3):
+            selector.encolar_comando("disminuir")
+        selector.ejecutar_cola(timeout=0)
+
+        gestor_climatizador.accionar_climatizador.assert_called_once_with(
+            gestor_ambiente.ambiente)
+
+    # SCO-005: Cola vacia
+    def test_cola_vacia_retorna_cero(self, gestor_ambiente):
+        """Sin comandos debe retornar 0 al vencer el timeout"""
+        selector = _crear_selector(gestor_ambiente)
+
+        assert selector.ejecutar_cola(timeout=0.01) == 0
@@ -0,0 +1,84 @@
+"""
+Tests de integracion del lazo cerrado termostato <-> habitacion simulada
+
+El termostato real (GestorAmbiente con ProxySensorTemperaturaArchivo,
+GestorClimatizador con ActuadorClimatizadorGeneral) y SimuladorHabitacion
+se comunican solo por los archivos "temperatura" y "climatizador".
+
+Casos de prueba:
+- LZC-001: leer_accion_actuador ignora archivos ausentes o invalidos
+- LZC-002: Desde 16 C la habitacion calienta y queda en la banda de 22 +/- 2
+- LZC-003: Con RelojVirtual el simulador corre sin esperar tiempo real
+"""
+import time
+
+import pytest
+from actores_externos.modelo_termico import ModeloTermico
+from actores_externos.simulador_habitacion import (
+    SalidaArchivo, SimuladorHabitacion, leer_accion_actuador
+)
+from agentes_actuadores.actuador_climatizador import ActuadorClimatizadorGeneral
+from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaArchivo
+from entidades.ambiente import Ambiente
+from entidades.climatizador import Climatizador
+from gestores_entidades.gestor_ambiente import GestorAmbiente
+from gestores_entidades.gestor_climatizador import GestorClimatizador
+from servicios_aplicacion.reloj import RelojVirtual
+
+
+@pytest.fixture
+def directorio(tmp_path, monkeypatch):
+    """Directorio de trabajo con los archivos del actuador y del sensor"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+# LZC-001: Lectura del actuador
+def test_leer_accion_actuador(directorio):
+    """Sin archivo o con contenido desconocido no hay accion"""
+    assert leer_accion_actuador() is None
+    (directorio / "climatizador").write_text("ventilar")
+    assert leer_accion_actuador() is None
+    (directorio / "climatizador").write_text("calentar\n")
+    assert leer_accion_actuador() == "calentar"
+
+
+# LZC-002: Lazo cerrado por archivos
+def test_lazo_cerrado_por_archivos(directorio):
+    """El controlador real lleva la habitacion a la banda de histeresis"""
+    modelo = ModeloTermico(temperatura_inicial=16.0, temperatura_exterior=10.0,
+                           constante_tiempo=1800.0)
+    simulador = SimuladorHabitacion(modelo, SalidaArchivo(), periodo=5.0)
+    ambiente = GestorAmbiente(Ambiente(temperatura_deseada_inicial=22.0),
+                              ProxySensorTemperaturaArchivo(), None)
+    climatizador = GestorClimatizador(Climatizador(histeresis=2.0),
+                                      ActuadorClimatizadorGeneral(), None)
+
+    temperaturas = []
+    for _ in range(3 * 720):  # 3 horas en pasos de 5 s
+        temperaturas.append(simulador.paso())
+        ambiente.leer_temperatura_ambiente()
+        climatizador.accionar_climatizador(ambiente.ambiente)
+
+    ultima_hora = temperaturas[-720:]
+    assert temperaturas[0] < 17.0
+    assert min(ultima_hora) > 19.0
+    assert max(ultima_hora) < 25.5
+    assert (directorio / "climatizador").read_text() in ("calentar", "enfriar", "apagar")
+
+
+# LZC-003: Reloj virtual
+def test_simulador_con_reloj_virtual(directorio):
+    """Una hora simulada a velocidad 1 sobre RelojVirtual no espera"""
+    reloj = RelojVirtual()
+    modelo = ModeloTermico(temperatura_inicial=20.0)
+    simulador = SimuladorHabitacion(modelo, SalidaArchivo(), periodo=10.0, reloj=reloj)
+
+    inicio = time.monotonic()
+    simulador.ejecutar(pasos=360)
+
+    assert time.monotonic() - inicio < 2
+    assert reloj.monotonic() == pytest.approx(3600.0)
+    assert modelo.instante == pytest.approx(3600.0)
+    assert int((directorio / "temperatura").read_text()) == round(modelo.temperaturas[0])
+    assert simulador.errores == 0
@@ -0,0 +1,114 @@
+"""
+Tests de integracion para la grabacion y reproduccion de trazas
+
+Casos de prueba:
+- RPT-001: Reproducir la misma traza dos veces da las mismas acciones
+- RPT-002: Una semana de entradas se reproduce en segundos (reloj virtual)
+- RPT-003: El climatizador se evalua cada periodo_control virtual
+- RPT-004: Los comandos de seteo solo ajustan en modo "deseada"
+- RPT-005: Configurador con seccion "traza" graba las entradas del Lanzador
+"""
+from configurador.configurador import Configurador
+from entidades.ambiente import Ambiente
+from entidades.bateria import Bateria
+from entidades.climatizador import Climatizador
+from servicios_aplicacion.reloj import RelojVirtual
+from trazas.grabadores import ProxyBateriaGrabador
+from trazas.reproductor import ReproductorTraza
+from trazas.traza import Evento, GrabadorTraza, leer_traza
+
+
+def _reproductor(periodo_control=5.0, deseada=24.0, reloj=None):
+    """Helper que arma un reproductor con climatizador de histeresis 2"""
+    return ReproductorTraza(Bateria(5.0, 0.95), Ambiente(temperatura_deseada_inicial=deseada),
+                            Climatizador(histeresis=2.0), reloj=reloj,
+                            periodo_control=periodo_control)
+
+
+def _grabar_dias_oscilantes(ruta, dias=1, periodo=2.0):
+    """Helper que graba una lectura de temperatura por periodo, alternando 16/32 cada 10 min"""
+    reloj = [0.0]
+    with GrabadorTraza(ruta, reloj=lambda: reloj[0]) as grabador:
+        for paso in range(int(dias * 86400 / periodo)):
+            reloj[0] = paso * periodo
+            grabador.registrar("temperatura", 32.0 if (reloj[0] // 600) % 2 else 16.0)
+            if paso % 30 == 0:
+                grabador.registrar("bateria", 4.9)
+
+
+# RPT-001: Determinismo
+def test_reproduccion_determinista(tmp_path):
+    """Las mismas entradas producen las mismas acciones en los mismos instantes"""
+    ruta = str(tmp_path / "dia.trz")
+    _grabar_dias_oscilantes(ruta)
+
+    primera = _reproductor().reproducir(leer_traza(ruta))
+    segunda = _reproductor().reproducir(leer_traza(ruta))
+
+    assert primera.acciones == segunda.acciones
+    assert len(primera.acciones) > 100
+    assert primera.duracion_virtual == 86398.0
+
+
+# RPT-002: Una semana en segundos
+def test_semana_en_segundos(tmp_path):
+    """Una lectura cada 10 s durante 7 dias se reproduce sin esperas reales"""
+    ruta = str(tmp_path / "semana.trz.gz")
+    _grabar_dias_oscilantes(ruta, dias=7, periodo=10.0)
+
+    resultado = _reproductor().reproducir(leer_traza(ruta))
+
+    assert resultado.duracion_virtual > 6.9 * 86400
+    assert resultado.duracion_real < 10
+    assert len(resultado.acciones) > 1000
+
+
+# RPT-003: Periodo de control
+def test_periodo_de_control_virtual():
+    """La accion ocurre en el primer tick de control posterior a la lectura"""
+    eventos = [Evento(0.0, "bateria", 4.9), Evento(7.0, "temperatura", 30.0)]
+
+    resultado = _reproductor(periodo_control=5.0).reproducir(eventos)
+    inmediato = _reproductor(periodo_control=None).reproducir(eventos)
+
+    assert resultado.acciones == []
+    assert inmediato.acciones == [(7.0, "enfriar")]
+
+    eventos.append(Evento(12.0, "temperatura", 30.0))
+    assert _reproductor(periodo_control=5.0).reproducir(eventos).acciones == [(10.0, "enfriar")]
+
+
+# RPT-004: Seteo solo en modo deseada
+def test_seteo_solo_en_modo_deseada():
+    """Los aumentos en modo ambiente se ignoran"""
+    reproductor = _reproductor(periodo_control=None, deseada=22.0)
+    reproductor.reproducir([
+        Evento(0.0, "seteo", "aumentar"),
+        Evento(1.0, "selector", "deseada"),
+        Evento(2.0, "seteo", "aumentar"),
+        Evento(3.0, "seteo", "aumentar"),
+        Evento(4.0, "selector", "ambiente"),
+        Evento(5.0, "seteo", "disminuir"),
+    ])
+
+    assert reproductor.gestor_ambiente.obtener_temperatura_deseada() == 24.0
+
+
+# RPT-005: Grabacion desde el Configurador
+def test_configurador_graba_entradas(tmp_path, monkeypatch):
+    """Con seccion traza los proxies quedan envueltos y graban en el archivo"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "bateria").write_text("4.7", encoding="utf-8")
+    Configurador.configuracion_termostato = {"proxy_bateria": "archivo",
+                                             "traza": {"archivo": "entradas.trz"}}
+    Configurador.grabador_traza = None
+    try:
+        proxy = Configurador.configurar_proxy_bateria()
+        proxy.leer_carga()
+        Configurador.grabador_traza.cerrar()
+    finally:
+        Configurador.configuracion_termostato = None
+        Configurador.grabador_traza = None
+
+    assert isinstance(proxy, ProxyBateriaGrabador)
+    assert [(e.fuente, e.valor) for e in leer_traza("entradas.trz")] == [("bateria", 4.7)]
@@ -0,0 +1,103 @@
+"""
+Tests de integracion para la operacion sobre un reloj virtual
+
+Casos de prueba:
+- SIM-001: OperadorParalelo -> una hora virtual con los periodos de cada hilo
+- SIM-002: OperadorSecuencial -> cada ciclo dura 9 segundos virtuales
+- SIM-003: ActuadorClimatizadorGeneral audita con la fecha del reloj
+"""
+import datetime
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from agentes_actuadores.actuador_climatizador import ActuadorClimatizadorGeneral
+from servicios_aplicacion.operador_paralelo import OperadorParalelo
+from servicios_aplicacion.operador_secuencial import OperadorSecuencial
+from servicios_aplicacion.reloj import RelojVirtual
+
+
+class FinSimulacion(Exception):
+    """Corta los bucles infinitos del operador al llegar al limite virtual"""
+
+
+def _registrar_hasta(reloj, limite, instantes):
+    """side_effect que anota el instante virtual y corta al llegar al limite"""
+    def registrar(*_):
+        if reloj.monotonic() >= limite:
+            raise FinSimulacion()
+        instantes.append(reloj.monotonic())
+    return registrar
+
+
+def _crear_operador(clase, reloj, **kwargs):
+    """Helper para crear el operador sin fuentes reales de seteo"""
+    with patch('servicios_aplicacion.selector_entrada.Configurador'):
+        return clase(Mock(), Mock(), Mock(), reloj=reloj, **kwargs)
+
+
+# SIM-001: Operador paralelo en tiempo virtual
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_operador_paralelo_una_hora_virtual():
+    """Cada hilo corre con su periodo y la hora virtual no consume tiempo real"""
+    reloj = RelojVirtual()
+    operador = _crear_operador(OperadorParalelo, reloj)
+    limite = 3600
+    instantes = {nombre: [] for nombre in ("bateria", "temperatura", "climatizador",
+                                           "presentacion", "seteo")}
+    operador._gestor_bateria.verificar_nivel_de_carga.side_effect = \
+        _registrar_hasta(reloj, limite, instantes["bateria"])
+    operador._gestor_ambiente.leer_temperatura_ambiente.side_effect = \
+        _registrar_hasta(reloj, limite, instantes["temperatura"])
+    operador._gestor_ambiente.temperatura_vigente.side_effect = \
+        _registrar_hasta(reloj, limite, instantes["climatizador"])
+    operador._presentador = Mock(ejecutar=Mock(
+        side_effect=_registrar_hasta(reloj, limite, instantes["presentacion"])))
+    operador._selector = Mock(ejecutar=Mock(
+        side_effect=_registrar_hasta(reloj, limite, instantes["seteo"])))
+
+    previos = set(threading.enumerate())
+    inicio = time.monotonic()
+    with patch('builtins.print'):
+        operador.ejecutar()
+        for hilo in set(threading.enumerate()) - previos:
+            hilo.join(timeout=30)
+
+    assert time.monotonic() - inicio < 20
+    assert reloj.participantes == 0
+    assert instantes["bateria"] == list(range(0, limite, 1))
+    assert instantes["temperatura"] == list(range(0, limite, 2))
+    assert instantes["climatizador"] == list(range(0, limite, 5))
+    assert instantes["presentacion"] == list(range(0, limite, 5))
+    assert instantes["seteo"] == list(range(0, limite, 5))
+
+
+# SIM-002: Operador secuencial en tiempo virtual
+def test_operador_secuencial_ciclo_de_nueve_segundos():
+    """Las esperas del ciclo (1+1+1+1+5 s) transcurren en el reloj virtual"""
+    reloj = RelojVirtual()
+    operador = _crear_operador(OperadorSecuencial, reloj)
+    instantes = []
+    operador._gestor_bateria.verificar_nivel_de_carga.side_effect = \
+        _registrar_hasta(reloj, 27, instantes)
+    operador._presentador = Mock()
+
+    with patch('builtins.print'), pytest.raises(FinSimulacion):
+        operador.ejecutar()
+
+    assert instantes == [0, 9, 18]
+
+
+# SIM-003: Fechas del actuador
+def test_actuador_audita_con_fecha_del_reloj(tmp_path, monkeypatch):
+    """La auditoria usa reloj.ahora(), no datetime.now()"""
+    monkeypatch.chdir(tmp_path)
+    reloj = RelojVirtual(fecha_inicio=datetime.datetime(2024, 1, 1))
+    actuador = ActuadorClimatizadorGeneral(reloj)
+
+    reloj.sleep(3600)
+    actuador.accionar_climatizador("calentar")
+
+    assert "fecha_hora: 2024-01-01 01:00:00" in (tmp_path / "registro_auditoria").read_text()
+    assert (tmp_path / "climatizador").read_text() == "calentar"
@@ -0,0 +1,112 @@
+"""
+Tests de integracion del supervisor multi-zona
+
+Casos de prueba:
+- SUP-001: Los trabajadores controlan sus zonas en procesos separados
+  y el supervisor publica el estado agregado
+- SUP-002: Un trabajador que termina se relanza
+"""
+import os
+import signal
+import time
+
+import pytest
+from configurador.configurador import Configurador
+from zonas.supervisor import SupervisorZonas, crear_supervisor
+
+
+class _PublicadorMemoria:
+    """Publicador que guarda las publicaciones"""
+
+    def __init__(self):
+        self.publicaciones = []
+
+    def publicar(self, zonas):
+        self.publicaciones.append(zonas)
+
+
+@pytest.fixture
+def configuracion(tmp_path, monkeypatch):
+    """Configuracion de cuatro zonas con ADC simulado sin ruido"""
+    monkeypatch.chdir(tmp_path)
+    Configurador.configuracion_termostato = {
+        "proxy_bateria": "hal",
+        "proxy_sensor_temperatura": "hal",
+        "actuador_climatizador": "mmap",
+        "visualizador_temperatura": "archivo",
+        "visualizador_bateria": "archivo",
+        "visualizador_climatizador": "archivo",
+        "climatizador": "climatizador",
+        "selector_temperatura": "archivo",
+        "seteo_temperatura": "archivo",
+        "ambiente": {"histeresis": 1.0, "temperatura_inicial": 22.0},
+        "hal": {"tipo": "simulado", "ruido_std": 0, "ruido_bateria_std": 0},
+        "zonas": {
+            "procesos": 2,
+            "periodo": 0.05,
+            "lista": [
+                {"nombre": "z{}".format(numero),
+                 "hal": {"temperatura_base": 15.0 if numero % 2 else 30.0},
+                 "actuador": {"canal": "z{}.map".format(numero), "texto": None}}
+                for numero in range(4)
+            ],
+        },
+    }
+    yield Configurador.configuracion_termostato
+    Configurador.configuracion_termostato = None
+
+
+def _esperar_estados(supervisor, espera=10):
+    """Helper: espera que todas las zonas hayan publicado"""
+    limite = time.monotonic() + espera
+    while time.monotonic() < limite:
+        estados = supervisor.estados()
+        if all(estado is not None for _, estado in estados):
+            return estados
+        time.sleep(0.05)
+    raise AssertionError("las zonas no publicaron su estado")
+
+
+# SUP-001: Operacion multi-proceso
+def test_trabajadores_controlan_zonas_y_supervisor_publica(configuracion):
+    """Cada zona se controla en su trabajador; el supervisor publica todas juntas"""
+    supervisor = crear_supervisor()
+    publicador = _PublicadorMemoria()
+    supervisor._publicador = publicador
+    assert supervisor.fragmentos == [[0, 2], [1, 3]]
+
+    supervisor.iniciar()
+    try:
+        estados = dict(_esperar_estados(supervisor))
+        supervisor.publicar()
+    finally:
+        supervisor.detener()
+        supervisor.tabla.liberar()
+
+    assert estados["z0"].climatizador == "enfriando"
+    assert estados["z1"].climatizador == "calentando"
+    assert [nombre for nombre, _ in publicador.publicaciones[0]] == ["z0", "z1", "z2", "z3"]
+    pids = {proceso.pid for proceso in supervisor._trabajadores}
+    assert len(pids) == 2 and os.getpid() not in pids
+
+
+# SUP-002: Relanzamiento
+def test_trabajador_terminado_se_relanza(configuracion):
+    """vigilar() relanza un trabajador muerto con el mismo fragmento"""
+    zonas = configuracion["zonas"]["lista"]
+    supervisor = SupervisorZonas(configuracion, zonas, _PublicadorMemoria(), procesos=2,
+                                 periodo=0.05)
+    supervisor.iniciar()
+    try:
+        _esperar_estados(supervisor)
+        muerto = supervisor._trabajadores[0]
+        os.kill(muerto.pid, signal.SIGKILL)
+        muerto.join(5)
+
+        assert supervisor.vigilar() == 1
+        assert supervisor._trabajadores[0].is_alive()
+        assert supervisor.vigilar() == 0
+    finally:
+        supervisor.detener()
+        supervisor.tabla.liberar()
+    assert not any(proceso.is_alive() for proceso in supervisor._trabajadores)
@@ -8,6 +8,8 @@ Casos de prueba del Plan de Pruebas:
 - GAM-004: Disminuir temperatura -> temperatura_deseada -= 1
 - GAM-005: Mostrar temp ambiente -> mostrar_temperatura_ambiente() invocado
 - GAM-006: Mostrar temp deseada -> mostrar_temperatura_deseada() invocado
+- GAM-007: Lectura exitosa -> lectura registrada con secuencia y vigente
+- GAM-008: Lectura fallida -> conserva la ultima lectura valida
 """
 import pytest
 from unittest.mock import Mock
@@ -223,3 +225,47 @@ class TestGestorAmbienteFlujoCompleto:
 
         mock_visualizador.mostrar_temperatura_ambiente.assert_called_with(18.0)
         mock_visualizador.mostrar_temperatura_deseada.assert_called_with(24.0)
+
+
+class TestGestorAmbienteLecturas:
+    """Tests de marca de tiempo y vigencia de lecturas de temperatura"""
+
+    # GAM-007: Lectura registrada
+    def test_lectura_exitosa_se_registra(self):
+        """Cada lectura valida debe registrarse con secuencia creciente"""
+        mock_proxy = Mock()
+        mock_proxy.leer_temperatura.side_effect = [21.0, 21.5]
+        gestor = GestorAmbiente(
+            ambiente=Ambiente(),
+            proxy_sensor=mock_proxy,
+            visualizador=Mock(),
+            antiguedad_maxima=60
+        )
+        assert gestor.temperatura_vigente() is False
+
+        gestor.leer_temperatura_ambiente()
+        gestor.leer_temperatura_ambiente()
+
+        lectura = gestor.obtener_lectura_temperatura()
+        assert (lectura.valor, lectura.secuencia) == (21.5, 2)
+        assert gestor.temperatura_vigente() is True
+        assert gestor.hay_temperatura_nueva(1) is True
+        assert gestor.hay_temperatura_nueva(2) is False
+
+    # GAM-008: Lectura fallida
+    def test_lectura_fallida_conserva_ultima_valida(self):
+        """Un error de sensor no reemplaza la ultima lectura valida"""
+        mock_proxy = Mock()
+        mock_proxy.leer_temperatura.side_effect = [21.0, OSError("Sensor caido")]
+        gestor = GestorAmbiente(
+            ambiente=Ambiente(),
+            proxy_sensor=mock_proxy,
+            visualizador=Mock()
+        )
+
+        gestor.leer_temperatura_ambiente()
+        gestor.leer_temperatura_ambiente()
+
+        assert gestor.obtener_temperatura_ambiente() is None
+        assert gestor.obtener_lectura_temperatura().valor == 21.0
+        assert gestor.obtener_antiguedad_temperatura() >= 0
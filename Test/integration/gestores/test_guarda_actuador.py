@@ -0,0 +1,122 @@
+"""
+Tests de integracion para la guarda de accionamiento del climatizador
+
+Casos de prueba:
+- GUA-001: Orden duplicada -> suprimida, sin consumir fichas
+- GUA-002: Minimo encendido -> no se apaga antes de tiempo
+- GUA-003: Minimo apagado -> no se enciende antes de tiempo
+- GUA-004: Balde de fichas -> rafaga de capacidad ordenes y reposicion por tasa
+- GUA-005: Gestor con guarda -> una orden retenida no cambia el estado y se reintenta
+- GUA-006: Gestor con guarda -> una orden duplicada cambia el estado sin accionar
+"""
+from unittest.mock import Mock
+
+from entidades.ambiente import Ambiente
+from entidades.climatizador import Climatizador
+from gestores_entidades.gestor_climatizador import GestorClimatizador
+from gestores_entidades.guarda_actuador import (
+    DUPLICADA, MINIMO_APAGADO, MINIMO_ENCENDIDO, TASA, GuardaActuador,
+)
+from servicios_aplicacion.reloj import RelojVirtual
+
+
+def _ambiente(temperatura_ambiente, temperatura_deseada=22):
+    """Helper que crea un ambiente con las temperaturas dadas"""
+    ambiente = Ambiente()
+    ambiente.temperatura_ambiente = temperatura_ambiente
+    ambiente.temperatura_deseada = temperatura_deseada
+    return ambiente
+
+
+# GUA-001: Orden duplicada
+def test_orden_duplicada():
+    """La misma orden que la ultima enviada no se repite"""
+    guarda = GuardaActuador(capacidad=1, tasa=0.001, reloj=RelojVirtual())
+
+    assert guarda.autorizar("calentar") is None
+    assert guarda.autorizar("calentar") == DUPLICADA
+    assert guarda.enviadas == 1
+    assert guarda.suprimidas[DUPLICADA] == 1
+    assert guarda.suprimidas[TASA] == 0
+
+
+# GUA-002: Minimo encendido
+def test_minimo_encendido():
+    """Encendido, no se apaga ni cambia de modo hasta cumplir el minimo"""
+    reloj = RelojVirtual()
+    guarda = GuardaActuador(minimo_encendido=180, reloj=reloj)
+    assert guarda.autorizar("enfriar") is None
+
+    reloj.sleep(100)
+    assert guarda.autorizar("apagar") == MINIMO_ENCENDIDO
+    assert guarda.autorizar("calentar") == MINIMO_ENCENDIDO
+    reloj.sleep(80)
+    assert guarda.autorizar("apagar") is None
+    assert guarda.suprimidas[MINIMO_ENCENDIDO] == 2
+
+
+# GUA-003: Minimo apagado
+def test_minimo_apagado():
+    """Apagado, no se vuelve a encender hasta cumplir el minimo"""
+    reloj = RelojVirtual()
+    guarda = GuardaActuador(minimo_apagado=300, reloj=reloj)
+    assert guarda.autorizar("apagar") is None
+
+    reloj.sleep(299)
+    assert guarda.autorizar("calentar") == MINIMO_APAGADO
+    reloj.sleep(1)
+    assert guarda.autorizar("calentar") is None
+
+
+# GUA-004: Balde de fichas
+def test_balde_de_fichas():
+    """Se envian capacidad ordenes seguidas; luego una cada 1/tasa segundos"""
+    reloj = RelojVirtual()
+    guarda = GuardaActuador(capacidad=2, tasa=0.1, reloj=reloj)
+
+    assert guarda.autorizar("calentar") is None
+    assert guarda.autorizar("apagar") is None
+    assert guarda.autorizar("calentar") == TASA
+    reloj.sleep(5)
+    assert guarda.autorizar("calentar") == TASA
+    reloj.sleep(5)
+    assert guarda.autorizar("calentar") is None
+    assert (guarda.enviadas, guarda.suprimidas[TASA]) == (3, 2)
+
+    reloj.sleep(1000)
+    assert guarda.autorizar("apagar") is None
+    assert guarda.autorizar("calentar") is None
+    assert guarda.autorizar("apagar") == TASA
+
+
+# GUA-005: Orden retenida
+def test_gestor_retiene_la_orden_y_la_reintenta():
+    """Con la orden retenida el climatizador sigue en su estado"""
+    reloj = RelojVirtual()
+    actuador = Mock()
+    gestor = GestorClimatizador(Climatizador(), actuador, Mock(),
+                                guarda=GuardaActuador(minimo_encendido=60, reloj=reloj))
+
+    assert gestor.accionar_climatizador(_ambiente(18)) is True
+    assert gestor.accionar_climatizador(_ambiente(25)) is False
+    assert gestor.obtener_estado_climatizador() == "calentando"
+    actuador.accionar_climatizador.assert_called_once_with("calentar")
+
+    reloj.sleep(60)
+    assert gestor.accionar_climatizador(_ambiente(25)) is True
+    assert gestor.obtener_estado_climatizador() == "apagado"
+    assert actuador.accionar_climatizador.call_count == 2
+
+
+# GUA-006: Orden duplicada en el gestor
+def test_gestor_no_repite_la_orden_duplicada():
+    """Si el dispositivo ya recibio la orden, solo cambia el estado"""
+    guarda = GuardaActuador(reloj=RelojVirtual())
+    guarda.autorizar("calentar")
+    actuador = Mock()
+    gestor = GestorClimatizador(Climatizador(), actuador, Mock(), guarda=guarda)
+
+    gestor.accionar_climatizador(_ambiente(18))
+
+    assert gestor.obtener_estado_climatizador() == "calentando"
+    actuador.accionar_climatizador.assert_not_called()
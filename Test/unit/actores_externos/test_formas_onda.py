@@ -0,0 +1,107 @@
+"""
+Tests unitarios para las formas de onda del generador de carga
+
+Casos de prueba:
+- FON-001: Escalon cambia de valor en el instante del salto
+- FON-002: Rampa crece con la pendiente y respeta las cotas
+- FON-003: Senoidal oscila alrededor de la media con el periodo dado
+- FON-004: Ruido con semilla es reproducible y se suma a la base
+- FON-005: Secuencia recorre los valores ciclicamente por intervalo
+- FON-006: Traza retiene la ultima muestra y se repite en bucle
+- FON-007: crear_forma arma formas anidadas y rechaza tipos desconocidos
+"""
+import pytest
+from actores_externos.formas_onda import (
+    FormaEscalon, FormaRampa, FormaSenoidal, FormaRuido, FormaSecuencia,
+    FormaTraza, crear_forma
+)
+
+
+# FON-001: Escalon
+def test_escalon():
+    """Antes del salto el valor inicial, desde el salto el final"""
+    forma = FormaEscalon(20.0, 25.0, instante_salto=3.0)
+
+    assert forma.valor(0.0) == 20.0
+    assert forma.valor(2.99) == 20.0
+    assert forma.valor(3.0) == 25.0
+
+
+# FON-002: Rampa con cotas
+def test_rampa_con_cotas():
+    """La rampa sigue la pendiente hasta la cota"""
+    forma = FormaRampa(5.0, -0.5, minimo=4.0)
+
+    assert forma.valor(0.0) == 5.0
+    assert forma.valor(1.0) == 4.5
+    assert forma.valor(10.0) == 4.0
+
+
+# FON-003: Senoidal
+def test_senoidal():
+    """Media en el origen, maximo a un cuarto de periodo"""
+    forma = FormaSenoidal(22.0, 4.0, periodo=60.0)
+
+    assert forma.valor(0.0) == pytest.approx(22.0)
+    assert forma.valor(15.0) == pytest.approx(26.0)
+    assert forma.valor(60.0) == pytest.approx(22.0)
+
+    with pytest.raises(ValueError):
+        FormaSenoidal(22.0, 4.0, periodo=0)
+
+
+# FON-004: Ruido reproducible
+def test_ruido_reproducible():
+    """Misma semilla, misma secuencia; se suma a la base"""
+    forma_1 = FormaRuido(0.5, media=22.0, semilla=7)
+    forma_2 = FormaRuido(0.5, media=22.0, semilla=7)
+    valores = [forma_1.valor(t) for t in range(5)]
+
+    assert valores == [forma_2.valor(t) for t in range(5)]
+    assert len(set(valores)) == 5
+    assert all(abs(valor - 22.0) < 5 for valor in valores)
+    assert FormaRuido(0.0, base=FormaEscalon(1.0, 2.0, 1.0)).valor(1.5) == 2.0
+
+
+# FON-005: Secuencia
+def test_secuencia_ciclica():
+    """Cada valor dura un intervalo y la lista se repite"""
+    forma = FormaSecuencia(["aumentar", "disminuir"], intervalo=0.5)
+
+    assert [forma.valor(t) for t in (0.0, 0.4, 0.5, 1.0, 1.6)] == [
+        "aumentar", "aumentar", "disminuir", "aumentar", "disminuir"]
+
+    with pytest.raises(ValueError):
+        FormaSecuencia([])
+
+
+# FON-006: Traza
+def test_traza_retencion_y_bucle(tmp_path):
+    """Retiene la ultima muestra y repite la traza al terminar"""
+    archivo = tmp_path / "traza.txt"
+    archivo.write_text("# instante valor\n10 20.0\n11 21.0\n\n13 23.0\n", encoding="utf-8")
+
+    forma = FormaTraza.desde_archivo(str(archivo))
+    assert forma.valor(0.0) == 20.0
+    assert forma.valor(1.5) == 21.0
+    assert forma.valor(2.9) == 21.0
+    assert forma.valor(3.5) == 20.0
+
+    sin_bucle = FormaTraza([(0, 1.0), (1, 2.0)], bucle=False)
+    assert sin_bucle.valor(5.0) == 2.0
+
+    archivo.write_text("20.0\n21.0\n22.0\n", encoding="utf-8")
+    assert FormaTraza.desde_archivo(str(archivo), periodo=0.1, bucle=False).valor(0.15) == 21.0
+
+
+# FON-007: Factory
+def test_crear_forma():
+    """Arma formas anidadas desde dict y rechaza tipos desconocidos"""
+    forma = crear_forma({"tipo": "ruido", "desvio": 0.0,
+                         "base": {"tipo": "rampa", "inicial": 1.0, "pendiente": 1.0}})
+
+    assert forma.valor(2.0) == 3.0
+    assert crear_forma({"tipo": "constante", "valor": 4.9}).valor(100) == 4.9
+
+    with pytest.raises(ValueError):
+        crear_forma({"tipo": "triangular"})
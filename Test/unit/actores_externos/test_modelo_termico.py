@@ -0,0 +1,113 @@
+"""
+Tests unitarios para el modelo termico de habitaciones
+
+Casos de prueba:
+- MTE-001: Apagado tiende al exterior con la solucion exponencial exacta
+- MTE-002: El resultado no depende del tamano del paso
+- MTE-003: Cada habitacion sigue su propio modo y parametros
+- MTE-004: Calentando y enfriando acumulan tiempo y tienden a su regimen
+- MTE-005: Adaptadores de actuador y sensor sobre una habitacion
+- MTE-006: Exterior como forma de onda y acciones invalidas
+"""
+import math
+
+import numpy as np
+import pytest
+from actores_externos.formas_onda import FormaEscalon
+from actores_externos.modelo_termico import (
+    ActuadorHabitacion, ModeloTermico, ProxySensorHabitacion
+)
+
+
+# MTE-001: Enfriamiento libre
+def test_apagado_tiende_al_exterior():
+    """T(t) = Text + (T0 - Text) * exp(-t / tau)"""
+    modelo = ModeloTermico(temperatura_inicial=20.0, temperatura_exterior=10.0,
+                           constante_tiempo=1000.0)
+
+    modelo.avanzar(500.0)
+
+    assert modelo.temperaturas[0] == pytest.approx(10.0 + 10.0 * math.exp(-0.5))
+    assert modelo.instante == 500.0
+
+
+# MTE-002: Independencia del paso
+def test_resultado_independiente_del_paso():
+    """Un paso de 600 s equivale a 600 pasos de 1 s"""
+    grueso = ModeloTermico(temperatura_inicial=15.0, constante_tiempo=900.0)
+    fino = ModeloTermico(temperatura_inicial=15.0, constante_tiempo=900.0)
+    grueso.accionar("calentar")
+    fino.accionar("calentar")
+
+    grueso.avanzar(600.0)
+    for _ in range(600):
+        fino.avanzar(1.0)
+
+    assert fino.temperaturas[0] == pytest.approx(grueso.temperaturas[0])
+
+
+# MTE-003: Habitaciones independientes
+def test_habitaciones_independientes():
+    """Modos y constantes de tiempo por habitacion"""
+    modelo = ModeloTermico(3, temperatura_inicial=20.0, temperatura_exterior=10.0,
+                           constante_tiempo=[100.0, 100.0, 1e9])
+    modelo.accionar("calentar", 0)
+    modelo.fijar_modos([1, -1, 1])
+
+    temperaturas = modelo.avanzar(10_000.0)
+
+    assert temperaturas[0] == pytest.approx(30.0)
+    assert temperaturas[1] == pytest.approx(-5.0)
+    assert temperaturas[2] == pytest.approx(20.0, abs=1e-3)
+    assert list(modelo.modos) == [1, -1, 1]
+    with pytest.raises(ValueError):
+        modelo.temperaturas[0] = 0.0
+
+
+# MTE-004: Regimen y tiempos de uso
+def test_regimen_y_tiempos_de_uso():
+    """Cada modo tiende a exterior +/- su salto y suma su tiempo"""
+    modelo = ModeloTermico(2, temperatura_exterior=5.0, salto_calefaccion=[20.0, 30.0],
+                           salto_refrigeracion=15.0)
+    modelo.fijar_modos(np.array([1, 1]))
+    modelo.avanzar(100.0)
+    modelo.accionar("enfriar", 1)
+    modelo.avanzar(50.0)
+
+    assert list(modelo.tiempo_calefaccion) == [150.0, 100.0]
+    assert list(modelo.tiempo_refrigeracion) == [0.0, 50.0]
+
+    modelo.avanzar(1e6)
+    assert modelo.temperaturas == pytest.approx([25.0, -10.0])
+
+
+# MTE-005: Adaptadores
+def test_actuador_y_sensor_de_habitacion():
+    """El actuador fija el modo de su habitacion y el sensor la lee con ruido"""
+    modelo = ModeloTermico(2, temperatura_inicial=[18.0, 24.0], ruido_medicion=0.5, semilla=1)
+    ActuadorHabitacion(modelo, 1).accionar_climatizador("enfriar")
+    sensor = ProxySensorHabitacion(modelo, 0)
+
+    lecturas = [sensor.leer_temperatura() for _ in range(500)]
+
+    assert list(modelo.modos) == [0, -1]
+    assert np.mean(lecturas) == pytest.approx(18.0, abs=0.1)
+    assert np.std(lecturas) == pytest.approx(0.5, rel=0.15)
+
+
+# MTE-006: Exterior variable y validaciones
+def test_exterior_forma_de_onda_y_validaciones():
+    """La forma de onda se evalua en el instante del modelo"""
+    modelo = ModeloTermico(temperatura_inicial=0.0, constante_tiempo=1.0,
+                           temperatura_exterior=FormaEscalon(0.0, 10.0, instante_salto=100.0))
+    modelo.avanzar(100.0)
+    assert modelo.temperaturas[0] == pytest.approx(0.0)
+    modelo.avanzar(100.0)
+    assert modelo.temperaturas[0] == pytest.approx(10.0)
+
+    with pytest.raises(ValueError):
+        modelo.accionar("ventilar")
+    with pytest.raises(ValueError):
+        ModeloTermico(0)
+    with pytest.raises(ValueError):
+        ModeloTermico(constante_tiempo=0.0)
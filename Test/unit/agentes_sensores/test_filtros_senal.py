@@ -0,0 +1,164 @@
+"""
+Tests unitarios para los filtros de senal y el proxy filtrado
+
+Casos de prueba:
+- FSE-001: BufferCircular conserva los ultimos valores en orden
+- FSE-002: Media movil por bloque == lectura por lectura
+- FSE-003: Suavizado exponencial por bloque == recurrencia
+- FSE-004: Mediana elimina un pico aislado
+- FSE-005: Rechazo de atipicos reemplaza el valor por la mediana
+- FSE-006: Cadena aplica los filtros en orden
+- FSE-007: Parametros invalidos -> ValueError
+- FSE-008: Proxy filtrado filtra en bloque las lecturas del proxy
+- FSE-009: Proxy filtrado sin lecturas -> None
+- FSE-010: Rafaga de atipicos por bloque == lectura por lectura
+"""
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from agentes_sensores.filtros_senal import (
+    BufferCircular,
+    CadenaFiltros,
+    FiltroExponencial,
+    FiltroMediaMovil,
+    FiltroMediana,
+    FiltroRechazoAtipicos
+)
+from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaFiltrado
+
+
+LECTURAS = [20.0, 21.0, 22.0, 35.0, 22.5, 23.0, 22.0, 21.5, 21.0, 20.5]
+
+
+def _filtrar_de_a_uno(filtro, valores):
+    """Helper que filtra los valores de a una lectura"""
+    return [filtro.filtrar(valor) for valor in valores]
+
+
+class TestBufferCircular:
+    """Tests para BufferCircular"""
+
+    # FSE-001: Conserva los ultimos valores
+    def test_conserva_ultimos_valores_en_orden(self):
+        """Al superar la capacidad se descartan los mas antiguos"""
+        buffer = BufferCircular(3)
+        buffer.agregar([1.0, 2.0])
+        buffer.agregar(3.0)
+        buffer.agregar([4.0, 5.0])
+
+        assert len(buffer) == 3
+        assert list(buffer.valores()) == [3.0, 4.0, 5.0]
+
+
+class TestFiltros:
+    """Tests para los filtros de senal"""
+
+    # FSE-002: Media movil
+    def test_media_movil_bloque_equivale_a_lecturas_sueltas(self):
+        """Filtrar en bloque debe dar lo mismo que de a una lectura"""
+        en_bloque = FiltroMediaMovil(ventana=3).filtrar_bloque(LECTURAS)
+        sueltas = _filtrar_de_a_uno(FiltroMediaMovil(ventana=3), LECTURAS)
+
+        assert np.allclose(en_bloque, sueltas)
+        assert en_bloque[2] == pytest.approx(21.0)
+
+    # FSE-003: Suavizado exponencial
+    def test_exponencial_bloque_equivale_a_recurrencia(self):
+        """La forma cerrada por tramos debe coincidir con la recurrencia"""
+        valores = np.linspace(15.0, 30.0, 100)
+        filtro = FiltroExponencial(alfa=0.3)
+
+        esperado = []
+        anterior = valores[0]
+        for valor in valores:
+            anterior = 0.3 * valor + 0.7 * anterior
+            esperado.append(anterior)
+
+        assert np.allclose(filtro.filtrar_bloque(valores), esperado)
+
+    # FSE-004: Mediana
+    def test_mediana_elimina_pico_aislado(self):
+        """El pico de 35 grados no debe aparecer en la salida"""
+        en_bloque = FiltroMediana(ventana=3).filtrar_bloque(LECTURAS)
+        sueltas = _filtrar_de_a_uno(FiltroMediana(ventana=3), LECTURAS)
+
+        assert np.allclose(en_bloque, sueltas)
+        assert max(en_bloque) < 30.0
+
+    # FSE-005: Rechazo de atipicos
+    def test_atipicos_reemplaza_por_mediana(self):
+        """Un valor alejado mas del umbral se reemplaza por la mediana previa"""
+        filtro = FiltroRechazoAtipicos(umbral=5.0, ventana=3)
+        filtro.filtrar_bloque([22.0, 22.0, 22.0])
+
+        resultado = filtro.filtrar_bloque([22.5, 40.0, 23.0])
+
+        assert list(resultado) == [22.5, 22.0, 23.0]
+
+    # FSE-010: Rafaga de atipicos
+    def test_atipicos_rafaga_bloque_equivale_a_lecturas_sueltas(self):
+        """Una rafaga de atipicos no pasa a ser la referencia del bloque"""
+        historia = [20.0, 20.5, 19.5, 20.0, 20.5]
+        lecturas = [20.0, 100.0, 100.0, 100.0, 20.5, 19.5, 20.0]
+        en_bloque = FiltroRechazoAtipicos(umbral=5.0, ventana=5)
+        sueltas = FiltroRechazoAtipicos(umbral=5.0, ventana=5)
+        en_bloque.filtrar_bloque(historia)
+        sueltas.filtrar_bloque(historia)
+
+        resultado = en_bloque.filtrar_bloque(lecturas)
+
+        assert np.allclose(resultado, _filtrar_de_a_uno(sueltas, lecturas))
+        assert max(resultado) < 25.0
+
+    # FSE-006: Cadena de filtros
+    def test_cadena_aplica_filtros_en_orden(self):
+        """La salida de cada filtro alimenta al siguiente"""
+        cadena = CadenaFiltros([FiltroRechazoAtipicos(umbral=5.0, ventana=3),
+                                FiltroMediaMovil(ventana=2)])
+
+        resultado = cadena.filtrar_bloque([20.0, 20.0, 20.0, 50.0, 22.0])
+
+        assert list(resultado) == [20.0, 20.0, 20.0, 20.0, 21.0]
+
+    # FSE-007: Parametros invalidos
+    @pytest.mark.parametrize("crear", [
+        lambda: FiltroMediaMovil(ventana=0),
+        lambda: FiltroMediana(ventana=0),
+        lambda: FiltroExponencial(alfa=0),
+        lambda: FiltroExponencial(alfa=1.5),
+        lambda: FiltroRechazoAtipicos(umbral=0),
+    ])
+    def test_parametros_invalidos(self, crear):
+        """Parametros fuera de rango deben lanzar ValueError"""
+        with pytest.raises(ValueError):
+            crear()
+
+
+class TestProxySensorTemperaturaFiltrado:
+    """Tests para ProxySensorTemperaturaFiltrado"""
+
+    # FSE-008: Filtra en bloque
+    def test_filtra_en_bloque_lecturas_del_proxy(self):
+        """Todas las lecturas disponibles se filtran en una sola llamada"""
+        proxy = Mock()
+        proxy.leer_temperaturas.return_value = [20.0, None, 22.0, 24.0]
+        filtro = Mock()
+        filtro.filtrar_bloque.return_value = np.array([20.0, 21.0, 22.0])
+
+        filtrado = ProxySensorTemperaturaFiltrado(proxy, filtro)
+
+        assert filtrado.leer_temperatura() == 22.0
+        filtro.filtrar_bloque.assert_called_once_with([20.0, 22.0, 24.0])
+
+    # FSE-009: Sin lecturas
+    def test_sin_lecturas_retorna_none(self):
+        """Si el proxy no entrega valores no se invoca al filtro"""
+        proxy = Mock()
+        proxy.leer_temperaturas.return_value = [None]
+        filtro = Mock()
+
+        filtrado = ProxySensorTemperaturaFiltrado(proxy, filtro)
+
+        assert filtrado.leer_temperatura() is None
+        filtro.filtrar_bloque.assert_not_called()
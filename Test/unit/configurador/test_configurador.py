@@ -11,6 +11,8 @@ import pytest
 import json
 from unittest.mock import patch, mock_open
 from configurador.configurador import Configurador
+from servicios_aplicacion.inicializador import Inicializador, ParametrosSensor
+from servicios_aplicacion.reloj import RelojReal, RelojVirtual
 
 
 class TestConfiguradorCargarConfiguracion:
@@ -297,3 +299,449 @@ class TestConfiguradorMetodosRed:
 
         # Cleanup
         Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorFiltrosTemperatura:
+    """Tests para la configuracion de filtros de temperatura"""
+
+    def test_proxy_temperatura_con_filtros_se_envuelve(self):
+        """Con ambiente.filtros el proxy debe quedar envuelto en el filtrado"""
+        Configurador.configuracion_termostato = {
+            "proxy_sensor_temperatura": "archivo",
+            "ambiente": {"filtros": [{"tipo": "atipicos", "umbral": 3},
+                                     {"tipo": "exponencial", "alfa": 0.5}]}
+        }
+
+        from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaFiltrado
+        resultado = Configurador.configurar_proxy_temperatura()
+        assert isinstance(resultado, ProxySensorTemperaturaFiltrado)
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+    def test_proxy_temperatura_sin_filtros_no_se_envuelve(self):
+        """Sin filtros configurados se retorna el proxy original"""
+        Configurador.configuracion_termostato = {"proxy_sensor_temperatura": "archivo"}
+
+        from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaArchivo
+        resultado = Configurador.configurar_proxy_temperatura()
+        assert isinstance(resultado, ProxySensorTemperaturaArchivo)
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+    def test_filtro_desconocido_lanza_valueerror(self):
+        """Un tipo de filtro desconocido debe lanzar ValueError"""
+        Configurador.configuracion_termostato = {"ambiente": {"filtros": [{"tipo": "kalman"}]}}
+
+        with pytest.raises(ValueError):
+            Configurador.configurar_filtro_temperatura()
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorPeriodosOperador:
+    """Tests para Configurador.obtener_periodos_operador()"""
+
+    def test_periodos_con_config(self):
+        """Retorna los periodos de la seccion operador"""
+        Configurador.configuracion_termostato = {
+            "operador": {"periodos": {"temperatura": 0.5, "climatizador": 1}}
+        }
+
+        resultado = Configurador.obtener_periodos_operador()
+        assert resultado == {"temperatura": 0.5, "climatizador": 1}
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+    def test_periodos_sin_config_retorna_vacio(self):
+        """Sin seccion operador retorna {} (el operador usa sus defaults)"""
+        Configurador.configuracion_termostato = {}
+
+        assert Configurador.obtener_periodos_operador() == {}
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorReloj:
+    """Tests para Configurador.configurar_reloj()"""
+
+    def test_reloj_sin_config_es_real_y_compartido(self):
+        """Sin seccion reloj se crea un unico RelojReal"""
+        Configurador.configuracion_termostato = {}
+        Configurador.reloj = None
+
+        reloj = Configurador.configurar_reloj()
+        assert isinstance(reloj, RelojReal)
+        assert Configurador.configurar_reloj() is reloj
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+        Configurador.reloj = None
+
+    def test_reloj_virtual_con_velocidad(self):
+        """La seccion reloj selecciona el tipo y la velocidad"""
+        Configurador.configuracion_termostato = {"reloj": {"tipo": "virtual", "velocidad": 60}}
+        Configurador.reloj = None
+
+        reloj = Configurador.configurar_reloj()
+        assert isinstance(reloj, RelojVirtual)
+        assert reloj.velocidad == 60
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+        Configurador.reloj = None
+
+    def test_reloj_desconocido_lanza_error(self):
+        """Un tipo de reloj desconocido es un error de configuracion"""
+        Configurador.configuracion_termostato = {"reloj": {"tipo": "atomico"}}
+        Configurador.reloj = None
+
+        with pytest.raises(ValueError):
+            Configurador.configurar_reloj()
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorMetricas:
+    """Tests para Configurador.configurar_metricas()"""
+
+    def test_sin_seccion_no_mide(self):
+        """Sin seccion metricas los componentes no se envuelven"""
+        Configurador.configuracion_termostato = {"visualizador_climatizador": "archivo"}
+        Configurador.metricas = None
+
+        assert Configurador.configurar_metricas() is None
+        assert Configurador.configurar_servidor_metricas() is None
+        visualizador = Configurador.configurar_visualizador_climatizador()
+        assert type(visualizador).__name__ == "VisualizadorClimatizador"
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+    def test_con_seccion_registro_compartido(self):
+        """Con seccion metricas se mide sobre un unico registro"""
+        Configurador.configuracion_termostato = {
+            "visualizador_climatizador": "archivo",
+            "metricas": {"puerto": 9200},
+        }
+        Configurador.metricas = None
+
+        registro = Configurador.configurar_metricas()
+        assert Configurador.configurar_metricas() is registro
+        assert Configurador.obtener_host_metricas() == "localhost"
+        assert Configurador.obtener_puerto_metricas() == 9200
+        visualizador = Configurador.configurar_visualizador_climatizador()
+        assert type(visualizador).__name__ == "VisualizadorClimatizadorMedido"
+        assert Configurador.configurar_perfilador() is not None
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+        Configurador.metricas = None
+
+
+class TestConfiguradorZonas:
+    """Tests para la seccion "zonas" del Configurador"""
+
+    def test_sin_seccion_valores_por_defecto(self):
+        """Sin seccion zonas no hay zonas y se publica en la bitacora"""
+        Configurador.configuracion_termostato = {}
+
+        assert Configurador.obtener_zonas() == []
+        assert Configurador.obtener_procesos_zonas() is None
+        assert Configurador.obtener_periodo_zonas() == 2
+        assert Configurador.obtener_periodo_publicacion_zonas() == 5
+        publicador = Configurador.configurar_publicador_zonas()
+        assert type(publicador).__name__ == "PublicadorZonasBitacora"
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+    def test_configuracion_de_zona_combina_secciones(self):
+        """La definicion de la zona reemplaza solo las claves que indica"""
+        Configurador.configuracion_termostato = {
+            "proxy_bateria": "socket",
+            "red": {"host_escucha": "0.0.0.0", "puertos": {"bateria": 11000,
+                                                          "temperatura": 12000}},
+            "zonas": {"lista": [{"nombre": "cocina"}]},
+        }
+
+        zona = Configurador.obtener_configuracion_zona(
+            {"nombre": "cocina", "red": {"puertos": {"temperatura": 12001}}})
+        assert zona == {
+            "proxy_bateria": "socket",
+            "red": {"host_escucha": "0.0.0.0", "puertos": {"bateria": 11000,
+                                                          "temperatura": 12001}},
+        }
+        assert Configurador.configuracion_termostato["red"]["puertos"]["temperatura"] == 12000
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+    def test_publicador_api_y_desconocido(self):
+        """El publicador api usa red.api_url; un tipo desconocido es un error"""
+        Configurador.configuracion_termostato = {
+            "red": {"api_url": "http://api:5050"},
+            "zonas": {"publicador": "api"},
+        }
+        publicador = Configurador.configurar_publicador_zonas()
+        assert type(publicador).__name__ == "PublicadorZonasApi"
+        assert publicador._api_url == "http://api:5050"
+
+        Configurador.configuracion_termostato = {"zonas": {"publicador": "mqtt"}}
+        with pytest.raises(ValueError):
+            Configurador.configurar_publicador_zonas()
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorEstadoCompartido:
+    """Tests para Configurador.configurar_estado_compartido()"""
+
+    def test_sin_seccion_no_publica(self):
+        """Sin seccion estado_compartido no se crea tabla"""
+        Configurador.configuracion_termostato = {}
+
+        assert Configurador.obtener_nombre_estado_compartido() is None
+        assert Configurador.configurar_estado_compartido() is None
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+    def test_con_seccion_tabla_de_una_fila(self):
+        """Con seccion se crea el bloque con el nombre configurado"""
+        Configurador.configuracion_termostato = {"estado_compartido": {"nombre": "termostato-test"}}
+
+        tabla = Configurador.configurar_estado_compartido()
+        try:
+            assert tabla.nombre == "termostato-test"
+            assert tabla.nombres == ["termostato"]
+        finally:
+            tabla.liberar()
+
+        Configurador.configuracion_termostato = {"estado_compartido": {}}
+        assert Configurador.obtener_nombre_estado_compartido() == "termostato"
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorEventos:
+    """Tests para la seccion "eventos" del Configurador"""
+
+    def test_sin_seccion_no_hay_bus(self):
+        """Sin seccion eventos los gestores no publican"""
+        Configurador.configuracion_termostato = {}
+        Configurador.reloj = None
+
+        assert Configurador.configurar_bus_eventos() is None
+        assert Configurador.obtener_bitacora_eventos() is False
+        politica = Configurador.configurar_politica_eventos("presentacion", "limitada")
+        assert type(politica).__name__ == "EntregaLimitada"
+        assert politica._intervalo == 5
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+        Configurador.reloj = None
+
+    def test_con_seccion_bus_y_politicas(self):
+        """Cada suscriptor toma su politica de la seccion eventos"""
+        Configurador.configuracion_termostato = {"eventos": {
+            "presentacion": {"politica": "inmediata"},
+            "bitacora": {"politica": "lotes", "lote": 20, "intervalo": 30},
+        }}
+        Configurador.reloj = None
+
+        bus = Configurador.configurar_bus_eventos()
+        assert type(bus).__name__ == "BusEventos"
+        assert bus._reloj is Configurador.configurar_reloj()
+        assert Configurador.obtener_bitacora_eventos() is True
+        presentacion = Configurador.configurar_politica_eventos("presentacion", "limitada")
+        assert type(presentacion).__name__ == "EntregaInmediata"
+        bitacora = Configurador.configurar_politica_eventos("bitacora")
+        assert (bitacora._tamano, bitacora._intervalo) == (20, 30)
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+        Configurador.reloj = None
+
+    def test_politica_desconocida_lanza_error(self):
+        """Una politica desconocida es un error de configuracion"""
+        Configurador.configuracion_termostato = {"eventos": {"presentacion": {"politica": "x"}}}
+
+        with pytest.raises(ValueError):
+            Configurador.configurar_politica_eventos("presentacion")
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorInicio:
+    """Tests para Configurador.configurar_inicializador()"""
+
+    def test_sin_seccion_sin_plazos(self):
+        """Sin seccion inicio se espera cada sensor sin plazo"""
+        Configurador.configuracion_termostato = {}
+
+        inicializador = Configurador.configurar_inicializador()
+        assert inicializador._plazo is None
+        assert inicializador._sensores["bateria"] == Inicializador.PARAMETROS_DEFECTO
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+    def test_con_seccion_plazos_y_sensores(self):
+        """Cada sensor toma sus parametros; los ausentes usan los defaults"""
+        Configurador.configuracion_termostato = {"inicio": {
+            "plazo": 60, "espera": 2,
+            "sensores": {"bateria": {"timeout": 20, "reintentos": 3, "requerido": False}},
+        }}
+
+        inicializador = Configurador.configurar_inicializador()
+        assert (inicializador._plazo, inicializador._espera) == (60, 2)
+        assert inicializador._sensores["bateria"] == ParametrosSensor(20, 3, False)
+        assert inicializador._sensores["temperatura"] == Inicializador.PARAMETROS_DEFECTO
+
+        Configurador.configuracion_termostato = {"inicio": {"sensores": {"humedad": {}}}}
+        with pytest.raises(ValueError):
+            Configurador.configurar_inicializador()
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorCache:
+    """Tests para la seccion "cache" del Configurador"""
+
+    def test_sin_seccion_no_cachea(self):
+        """Sin seccion cache los proxies de archivo leen el archivo en cada lectura"""
+        Configurador.configuracion_termostato = {"proxy_bateria": "archivo"}
+        Configurador.metricas = None
+
+        proxy = Configurador.configurar_proxy_bateria()
+        assert type(proxy).__name__ == "ProxyBateriaArchivo"
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+    def test_con_seccion_cachea_solo_archivos(self):
+        """Los proxies de archivo se cachean con su ruta; los socket no"""
+        Configurador.configuracion_termostato = {
+            "proxy_sensor_temperatura": "archivo",
+            "selector_temperatura": "archivo",
+            "proxy_bateria": "socket",
+            "cache": {"ttl": 0.5},
+        }
+        Configurador.metricas = None
+        Configurador.grabador_traza = None
+
+        proxy = Configurador.configurar_proxy_temperatura()
+        assert type(proxy).__name__ == "ProxySensorTemperaturaCache"
+        assert (proxy.cache._ttl, proxy.cache._ruta) == (0.5, "temperatura")
+        selector = Configurador.configurar_selector_temperatura()
+        assert type(selector).__name__ == "SelectorTemperaturaCache"
+        assert type(Configurador.configurar_proxy_bateria()).__name__ == "ProxyBateriaSocket"
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorInotify:
+    """Tests para los proxies "inotify" del Configurador"""
+
+    def test_proxies_vigilados_y_periodo_cero(self, tmp_path, monkeypatch):
+        """Los sensores inotify se vigilan y su hilo no duerme salvo configuracion"""
+        monkeypatch.chdir(tmp_path)
+        Configurador.configuracion_termostato = {
+            "proxy_bateria": "inotify",
+            "proxy_sensor_temperatura": "inotify",
+            "inotify": {"espera": 10, "periodo_sondeo": 0.2},
+            "operador": {"periodos": {"temperatura": 1}},
+        }
+        Configurador.metricas = None
+        Configurador.grabador_traza = None
+
+        proxy = Configurador.configurar_proxy_bateria()
+        try:
+            assert type(proxy).__name__ == "ProxyBateriaVigilado"
+            assert proxy.lectura._espera == 10
+        finally:
+            proxy.cerrar()
+        assert Configurador.obtener_periodos_operador() == {"temperatura": 1, "bateria": 0}
+
+        Configurador.configuracion_termostato = {"proxy_sensor_temperatura": "inotify"}
+        assert Configurador.obtener_parametros_inotify() == {"espera": None,
+                                                             "periodo_sondeo": 0.5}
+        proxy = Configurador.configurar_proxy_temperatura()
+        try:
+            assert type(proxy).__name__ == "ProxySensorTemperaturaVigilado"
+        finally:
+            proxy.cerrar()
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorActuadorMapeado:
+    """Tests para el actuador "mmap" del Configurador"""
+
+    def test_actuador_mapeado_con_archivos_configurados(self, tmp_path, monkeypatch):
+        """El actuador mmap usa los archivos de la seccion "actuador" o los por defecto"""
+        monkeypatch.chdir(tmp_path)
+        Configurador.configuracion_termostato = {
+            "actuador_climatizador": "mmap",
+            "actuador": {"canal": "salida.map", "texto": None},
+        }
+        Configurador.metricas = None
+
+        actuador = Configurador.configurar_actuador_climatizador()
+        try:
+            assert type(actuador).__name__ == "ActuadorClimatizadorMapeado"
+            actuador.accionar_climatizador("enfriar")
+        finally:
+            actuador.cerrar()
+        assert (tmp_path / "salida.map").exists()
+        assert not (tmp_path / "climatizador").exists()
+
+        Configurador.configuracion_termostato = {"actuador_climatizador": "mmap"}
+        assert Configurador.obtener_parametros_actuador() == {
+            "ruta_canal": "climatizador.map", "ruta_texto": "climatizador"}
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+
+
+class TestConfiguradorGuarda:
+    """Tests para la guarda de accionamiento del Configurador"""
+
+    def test_guarda_configurada_y_medida(self):
+        """La seccion "guarda" crea la guarda y publica las ordenes suprimidas"""
+        Configurador.configuracion_termostato = {
+            "guarda": {"minimo_encendido": 180, "capacidad": 3, "tasa": 0.01},
+            "metricas": {},
+        }
+        Configurador.metricas = None
+
+        guarda = Configurador.configurar_guarda_actuador()
+        guarda.autorizar("calentar")
+        guarda.autorizar("calentar")
+
+        assert guarda._minimo_encendido == 180
+        assert guarda._minimo_apagado == 0
+        assert (guarda._capacidad, guarda._tasa) == (3, 0.01)
+        texto = Configurador.metricas.exponer()
+        assert "# TYPE termostato_acciones_suprimidas_total counter" in texto
+        assert 'termostato_acciones_suprimidas_total{motivo="duplicada"} 1' in texto
+        assert 'termostato_acciones_suprimidas_total{motivo="tasa"} 0' in texto
+
+        Configurador.configuracion_termostato = {}
+        assert Configurador.configurar_guarda_actuador() is None
+
+        # Cleanup
+        Configurador.configuracion_termostato = None
+        Configurador.metricas = None
@@ -7,9 +7,14 @@ Casos de prueba del Plan de Pruebas:
 - AMB-003: Setear temperatura deseada -> temperatura_deseada=22.0
 - AMB-004: Cambiar temperatura a mostrar -> temperatura_a_mostrar="deseada"
 - AMB-005: Temperatura negativa -> temperatura_ambiente=-5.0
+- AMB-006: Instantanea -> tupla inmutable con los valores actuales
+- AMB-007: Instantanea previa -> no cambia al modificar el ambiente
+- AMB-008: Ajustes concurrentes -> no se pierden incrementos
 """
+import threading
+
 import pytest
-from entidades.ambiente import Ambiente
+from entidades.ambiente import Ambiente, EstadoAmbiente
 
 
 class TestAmbiente:
@@ -99,3 +104,43 @@ class TestAmbienteRepr:
         assert "temperatura_ambiente=25" in repr_str
         assert "temperatura_deseada=22" in repr_str
         assert "temperatura_a_mostrar='ambiente'" in repr_str
+
+
+class TestAmbienteInstantanea:
+    """Tests para la instantanea inmutable del estado"""
+
+    # AMB-006: Instantanea con valores actuales
+    def test_instantanea_refleja_estado_actual(self, ambiente_frio):
+        """La instantanea debe contener los valores vigentes"""
+        estado = ambiente_frio.instantanea()
+
+        assert isinstance(estado, EstadoAmbiente)
+        assert estado.temperatura_ambiente == 18
+        assert estado.temperatura_deseada == 22
+        assert estado.temperatura_a_mostrar == "ambiente"
+
+    # AMB-007: Instantanea previa inmutable
+    def test_instantanea_previa_no_cambia(self, ambiente_frio):
+        """Modificar el ambiente no debe alterar una instantanea ya tomada"""
+        estado = ambiente_frio.instantanea()
+
+        ambiente_frio.temperatura_ambiente = 30
+
+        assert estado.temperatura_ambiente == 18
+        assert ambiente_frio.instantanea().temperatura_ambiente == 30
+        assert ambiente_frio.instantanea().marca_tiempo >= estado.marca_tiempo
+
+    # AMB-008: Ajustes concurrentes
+    def test_ajustes_concurrentes_no_se_pierden(self, ambiente_default):
+        """Ajustes desde varios hilos deben acumularse sin perdidas"""
+        def ajustar():
+            for _ in range(1000):
+                ambiente_default.ajustar_temperatura_deseada(1)
+
+        hilos = [threading.Thread(target=ajustar) for _ in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert ambiente_default.temperatura_deseada == 22 + 4000
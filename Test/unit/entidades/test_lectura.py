@@ -0,0 +1,96 @@
+"""
+Tests unitarios para Lectura y SeguimientoLectura
+
+Casos de prueba:
+- LEC-001: Sin lecturas -> ultima=None, antiguedad=None, no vigente
+- LEC-002: Registrar -> secuencia creciente desde 1
+- LEC-003: Sin antiguedad maxima -> siempre vigente
+- LEC-004: Lectura vencida -> no vigente
+- LEC-005: hay_novedad compara contra la secuencia procesada
+- LEC-006: Antiguedad maxima negativa -> ValueError
+- LEC-007: Con un reloj inyectado la antiguedad se mide en su tiempo
+"""
+from unittest.mock import patch
+
+import pytest
+from entidades.lectura import Lectura, SeguimientoLectura
+from servicios_aplicacion.reloj import RelojVirtual
+
+
+class TestSeguimientoLectura:
+    """Tests para SeguimientoLectura"""
+
+    # LEC-001: Sin lecturas
+    def test_sin_lecturas(self):
+        """Sin lecturas registradas no hay valor ni vigencia"""
+        seguimiento = SeguimientoLectura(antiguedad_maxima=10)
+
+        assert seguimiento.ultima is None
+        assert seguimiento.antiguedad() is None
+        assert seguimiento.es_vigente() is False
+
+    # LEC-002: Secuencia creciente
+    def test_registrar_asigna_secuencia_creciente(self):
+        """Cada lectura registrada incrementa la secuencia en 1"""
+        seguimiento = SeguimientoLectura()
+
+        primera = seguimiento.registrar(21.5)
+        segunda = seguimiento.registrar(22.0)
+
+        assert isinstance(primera, Lectura)
+        assert (primera.valor, primera.secuencia) == (21.5, 1)
+        assert (segunda.valor, segunda.secuencia) == (22.0, 2)
+        assert segunda.marca_tiempo >= primera.marca_tiempo
+        assert seguimiento.ultima == segunda
+
+    # LEC-003: Sin limite siempre vigente
+    def test_sin_antiguedad_maxima_siempre_vigente(self):
+        """Sin antiguedad maxima la lectura nunca vence"""
+        seguimiento = SeguimientoLectura()
+        with patch("entidades.lectura.time.monotonic", return_value=0.0):
+            seguimiento.registrar(20)
+        with patch("entidades.lectura.time.monotonic", return_value=1e6):
+            assert seguimiento.es_vigente() is True
+
+    # LEC-004: Lectura vencida
+    def test_lectura_vencida_no_es_vigente(self):
+        """Una lectura mas antigua que la antiguedad maxima no es vigente"""
+        seguimiento = SeguimientoLectura(antiguedad_maxima=5)
+        with patch("entidades.lectura.time.monotonic", return_value=100.0):
+            seguimiento.registrar(20)
+        with patch("entidades.lectura.time.monotonic", return_value=104.0):
+            assert seguimiento.antiguedad() == 4.0
+            assert seguimiento.es_vigente() is True
+        with patch("entidades.lectura.time.monotonic", return_value=106.0):
+            assert seguimiento.es_vigente() is False
+
+    # LEC-005: Deteccion de novedades
+    def test_hay_novedad(self):
+        """hay_novedad indica si hay lecturas posteriores a la procesada"""
+        seguimiento = SeguimientoLectura()
+        assert seguimiento.hay_novedad(None) is False
+
+        lectura = seguimiento.registrar(20)
+        assert seguimiento.hay_novedad(None) is True
+        assert seguimiento.hay_novedad(lectura.secuencia) is False
+
+    # LEC-006: Antiguedad maxima invalida
+    def test_antiguedad_maxima_negativa_lanza_error(self):
+        """Una antiguedad maxima negativa es invalida"""
+        with pytest.raises(ValueError):
+            SeguimientoLectura(antiguedad_maxima=-1)
+
+    # LEC-007: Reloj inyectado
+    def test_antiguedad_con_reloj_virtual(self):
+        """La lectura vence segun el reloj inyectado, no el tiempo real"""
+        reloj = RelojVirtual(inicio=100.0)
+        seguimiento = SeguimientoLectura(antiguedad_maxima=10, reloj=reloj)
+
+        lectura = seguimiento.registrar(21.0)
+        reloj.sleep(10)
+        assert lectura.marca_tiempo == 100.0
+        assert seguimiento.es_vigente() is True
+
+        reloj.sleep(0.5)
+        assert seguimiento.antiguedad() == 10.5
+        assert seguimiento.es_vigente() is False
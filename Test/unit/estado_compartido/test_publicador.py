@@ -0,0 +1,68 @@
+"""
+Tests unitarios para la publicacion del estado compartido
+
+Casos de prueba:
+- EPU-001: PublicadorEstado vuelca el estado de los gestores en su fila
+- EPU-002: El operador publica despues de cada iteracion
+"""
+from unittest.mock import Mock
+
+import pytest
+from estado_compartido.lector import LectorEstado
+from estado_compartido.publicador import PublicadorEstado
+from estado_compartido.tabla import TablaEstado
+from servicios_aplicacion.operador_paralelo import OperadorParalelo
+from servicios_aplicacion.reloj import RelojVirtual
+
+
+@pytest.fixture
+def gestores():
+    """Gestores simulados con un estado fijo"""
+    gestor_bateria = Mock()
+    gestor_bateria.obtener_nivel_de_carga.return_value = 4.2
+    gestor_bateria.obtener_indicador_de_carga.return_value = "BAJA"
+    gestor_ambiente = Mock()
+    gestor_ambiente.obtener_temperatura_ambiente.return_value = 19.0
+    gestor_ambiente.obtener_temperatura_deseada.return_value = 22.0
+    gestor_climatizador = Mock()
+    gestor_climatizador.obtener_estado_climatizador.return_value = "calentando"
+    return gestor_bateria, gestor_ambiente, gestor_climatizador
+
+
+@pytest.fixture
+def tabla():
+    """Tabla de una fila que se borra al terminar"""
+    tabla = TablaEstado(["termostato"])
+    yield tabla
+    tabla.liberar()
+
+
+# EPU-001: Volcado de los gestores
+def test_publicador_vuelca_los_gestores(gestores, tabla):
+    """La fila refleja temperaturas, bateria y climatizador"""
+    reloj = RelojVirtual(inicio=100.0)
+    PublicadorEstado(tabla, *gestores, reloj=reloj).publicar()
+
+    with LectorEstado(tabla.nombre) as lector:
+        estado = lector.leer()
+    assert estado.temperatura_ambiente == 19.0
+    assert estado.temperatura_deseada == 22.0
+    assert estado.nivel_de_carga == 4.2
+    assert estado.carga_baja is True
+    assert estado.climatizador == "calentando"
+    assert estado.actualizacion == reloj.ahora().timestamp()
+
+
+# EPU-002: Publicacion desde el operador
+def test_operador_publica_tras_cada_lectura(gestores):
+    """Las lecturas de bateria y temperatura publican el estado"""
+    publicador = Mock()
+    operador = OperadorParalelo(*gestores, estado=publicador)
+    operador._reloj.sleep = Mock(side_effect=StopIteration)
+
+    with pytest.raises(StopIteration):
+        operador.lee_carga_bateria()
+    with pytest.raises(StopIteration):
+        operador.lee_temperatura_ambiente()
+
+    assert publicador.publicar.call_count == 2
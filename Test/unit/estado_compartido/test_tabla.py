@@ -0,0 +1,166 @@
+"""
+Tests unitarios para la tabla de estado compartido
+
+Casos de prueba:
+- EST-001: Escribir y leer una fila -> mismo estado
+- EST-002: Fila sin escribir -> None; valores ausentes -> None
+- EST-003: Escritura en otro proceso -> visible en el proceso padre
+- EST-004: LectorEstado se adjunta por nombre y lee nombres y filas
+- EST-005: Lecturas concurrentes con un escritor en otro proceso -> siempre consistentes
+- EST-006: Fila a medio escribir -> TimeoutError; la siguiente escritura la repara
+- EST-007: Un lector en otro proceso no borra el bloque al terminar
+- EST-008: Un bloque existente se reemplaza solo si es una tabla vencida
+"""
+import multiprocessing
+import subprocess
+import sys
+import time
+
+import pytest
+from estado_compartido.lector import LectorEstado
+from estado_compartido.tabla import EstadoTermostato, SECUENCIA, TablaEstado
+
+
+def _estado(**cambios):
+    """Helper: estado completo"""
+    estado = EstadoTermostato(temperatura_ambiente=21.5, temperatura_deseada=23.0,
+                              nivel_de_carga=4.8, carga_baja=False,
+                              climatizador="calentando", actualizacion=1700000000.0)
+    return estado._replace(**cambios)
+
+
+@pytest.fixture
+def tabla():
+    """Tabla de tres filas que se borra al terminar"""
+    tabla = TablaEstado(["living", "cocina", "dormitorio"])
+    yield tabla
+    tabla.liberar()
+
+
+# EST-001: Ida y vuelta
+def test_escribir_y_leer_fila(tabla):
+    """Cada fila conserva el estado escrito sin pisar a las demas"""
+    tabla.escribir(0, _estado())
+    tabla.escribir(2, _estado(climatizador="enfriando", carga_baja=True))
+
+    assert tabla.leer(0) == _estado()
+    assert tabla.leer(2) == _estado(climatizador="enfriando", carga_baja=True)
+    assert tabla.leer_todas()[0] == ("living", _estado())
+    assert tabla.version(0) == 2
+
+
+# EST-002: Ausencias
+def test_fila_sin_escribir_y_valores_ausentes(tabla):
+    """Las filas sin escribir y los valores None se leen como None"""
+    tabla.escribir(1, _estado(temperatura_ambiente=None, carga_baja=None))
+
+    assert tabla.leer(0) is None
+    leido = tabla.leer(1)
+    assert leido.temperatura_ambiente is None
+    assert leido.carga_baja is None
+    assert leido.climatizador == "calentando"
+    with pytest.raises(IndexError):
+        tabla.leer(3)
+
+
+def _escribir_en_hijo(tabla):
+    tabla.escribir(1, _estado(temperatura_ambiente=30.0))
+
+
+# EST-003: Entre procesos
+def test_escritura_de_otro_proceso_es_visible(tabla):
+    """La fila escrita por un proceso hijo se lee en el padre"""
+    proceso = multiprocessing.Process(target=_escribir_en_hijo, args=(tabla,))
+    proceso.start()
+    proceso.join(10)
+
+    assert proceso.exitcode == 0
+    assert tabla.leer(1).temperatura_ambiente == 30.0
+
+
+# EST-004: Lector por nombre
+def test_lector_se_adjunta_por_nombre(tabla):
+    """El lector ve los nombres de fila y las escrituras posteriores"""
+    with LectorEstado(tabla.nombre) as lector:
+        assert lector.nombres == ["living", "cocina", "dormitorio"]
+        assert lector.indice("cocina") == 1
+        assert lector.leer(1) is None
+
+        tabla.escribir(1, _estado())
+        assert lector.version(1) == 2
+        assert lector.leer(1) == _estado()
+
+    with pytest.raises(FileNotFoundError):
+        LectorEstado("termostato-inexistente")
+
+
+def _escribir_sin_pausa(tabla, vueltas):
+    for valor in range(vueltas):
+        tabla.escribir(0, _estado(temperatura_ambiente=float(valor),
+                                  temperatura_deseada=float(valor),
+                                  nivel_de_carga=float(valor)))
+
+
+# EST-005: Consistencia bajo escritura concurrente
+def test_lecturas_concurrentes_son_consistentes(tabla):
+    """Nunca se lee una fila con valores de dos escrituras distintas"""
+    escritor = multiprocessing.Process(target=_escribir_sin_pausa, args=(tabla, 20000))
+    escritor.start()
+    lecturas = 0
+    while escritor.is_alive() or lecturas == 0:
+        estado = tabla.leer(0)
+        if estado is not None:
+            lecturas += 1
+            assert (estado.temperatura_ambiente == estado.temperatura_deseada
+                    == estado.nivel_de_carga)
+    escritor.join(10)
+
+    assert tabla.leer(0).temperatura_ambiente == 19999.0
+    assert tabla.version(0) == 40000
+
+
+# EST-006: Escritor muerto a mitad de una escritura
+def test_fila_a_medio_escribir(tabla):
+    """Una secuencia impar agota los reintentos; la siguiente escritura la repara"""
+    tabla.escribir(0, _estado())
+    buf = tabla._bloque.buf
+    desplazamiento = tabla._desplazamiento(0)
+    SECUENCIA.pack_into(buf, desplazamiento, 3)
+
+    with pytest.raises(TimeoutError):
+        tabla.leer(0)
+
+    tabla.escribir(0, _estado(climatizador="apagado"))
+    assert tabla.version(0) % 2 == 0
+    assert tabla.leer(0).climatizador == "apagado"
+
+
+# EST-007: Lector externo
+def test_lector_externo_no_borra_el_bloque(tabla):
+    """Un proceso independiente lee la tabla y al terminar el bloque sigue existiendo"""
+    tabla.escribir(2, _estado(temperatura_ambiente=19.5))
+    codigo = ("from estado_compartido.lector import LectorEstado; "
+              "print(LectorEstado({!r}).leer(2).temperatura_ambiente)".format(tabla.nombre))
+
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True,
+                            timeout=30, check=True)
+
+    assert salida.stdout.strip() == "19.5"
+    with LectorEstado(tabla.nombre) as lector:
+        assert lector.leer(2).temperatura_ambiente == 19.5
+
+
+# EST-008: Bloque existente con el mismo nombre
+def test_bloque_existente_solo_se_reemplaza_vencido(tabla):
+    """Una tabla en uso no se pisa; una sin escrituras recientes se reemplaza"""
+    tabla.escribir(0, _estado(actualizacion=time.time()))
+
+    with pytest.raises(FileExistsError, match="en uso"):
+        TablaEstado(["otra"], tabla.nombre)
+    assert tabla.leer(0).temperatura_ambiente == 21.5
+
+    tabla.escribir(0, _estado(actualizacion=time.time() - TablaEstado.VIGENCIA - 1))
+    nueva = TablaEstado(["otra"], tabla.nombre)
+    assert nueva.nombres == ["otra"]
+    assert nueva.leer(0) is None
+    nueva.cerrar()
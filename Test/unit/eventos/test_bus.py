@@ -0,0 +1,131 @@
+"""
+Tests unitarios para el bus de eventos
+
+Casos de prueba:
+- EVB-001: Entrega inmediata -> cada evento, solo de los tipos suscriptos
+- EVB-002: Entrega limitada -> una entrega por intervalo con el ultimo de cada tipo,
+  solo al despachar
+- EVB-003: Entrega por lotes -> al despachar un lote completo o vencido
+- EVB-004: Manejador con error -> se cuenta y no afecta a los demas
+- EVB-005: Cancelar -> el manejador deja de recibir
+- EVB-006: EmisorCambios -> publica solo cambios, por tipo
+"""
+from eventos.bus import (
+    BusEventos, EmisorCambios, EntregaLimitada, EntregaPorLotes,
+)
+from eventos.tipos import (
+    CambioBateria, CambioClimatizador, CambioTemperaturaAmbiente, CambioTemperaturaDeseada,
+)
+from servicios_aplicacion.reloj import RelojVirtual
+
+
+# EVB-001: Entrega inmediata
+def test_entrega_inmediata_filtra_por_tipo():
+    """Cada evento se entrega al publicarse, solo a los suscriptores de su tipo"""
+    bus = BusEventos(RelojVirtual())
+    todos, climatizador = [], []
+    bus.suscribir(todos.append)
+    bus.suscribir(climatizador.append, tipos=(CambioClimatizador,))
+
+    bus.publicar(CambioBateria(4.8, "NORMAL"))
+    bus.publicar(CambioClimatizador("calentando"))
+
+    assert todos == [[CambioBateria(4.8, "NORMAL")], [CambioClimatizador("calentando")]]
+    assert climatizador == [[CambioClimatizador("calentando")]]
+
+
+# EVB-002: Entrega limitada
+def test_entrega_limitada_conserva_el_ultimo_de_cada_tipo():
+    """Entre entregas solo queda el ultimo evento de cada tipo"""
+    reloj = RelojVirtual()
+    bus = BusEventos(reloj)
+    entregas = []
+    bus.suscribir(entregas.append, politica=EntregaLimitada(5))
+
+    bus.publicar(CambioTemperaturaAmbiente(20))
+    assert entregas == []
+    bus.despachar()
+    assert entregas == [[CambioTemperaturaAmbiente(20)]]
+
+    for temperatura in (21, 22, 23):
+        bus.publicar(CambioTemperaturaAmbiente(temperatura))
+    bus.publicar(CambioBateria(4.8, "NORMAL"))
+    bus.despachar()
+    assert len(entregas) == 1
+
+    reloj.sleep(5)
+    bus.despachar()
+    bus.despachar()
+    assert entregas[1:] == [[CambioTemperaturaAmbiente(23), CambioBateria(4.8, "NORMAL")]]
+
+
+# EVB-003: Entrega por lotes
+def test_entrega_por_lotes():
+    """El lote se entrega completo o cuando el evento mas viejo cumple el intervalo"""
+    reloj = RelojVirtual()
+    bus = BusEventos(reloj)
+    lotes = []
+    bus.suscribir(lotes.append, politica=EntregaPorLotes(3, 10))
+
+    for temperatura in (20, 21, 22):
+        bus.publicar(CambioTemperaturaAmbiente(temperatura))
+    assert lotes == []
+    bus.despachar()
+    assert lotes == [[CambioTemperaturaAmbiente(t) for t in (20, 21, 22)]]
+
+    bus.publicar(CambioTemperaturaAmbiente(23))
+    reloj.sleep(9)
+    bus.despachar()
+    assert len(lotes) == 1
+    reloj.sleep(1)
+    bus.despachar()
+    assert lotes[1] == [CambioTemperaturaAmbiente(23)]
+
+
+# EVB-004: Manejador con error
+def test_manejador_con_error_no_afecta_a_los_demas():
+    """La excepcion de un suscriptor se cuenta y no llega al publicador"""
+    bus = BusEventos(RelojVirtual())
+    recibidos = []
+
+    def fallar(eventos):
+        raise RuntimeError("visualizador caido")
+
+    bus.suscribir(fallar)
+    bus.suscribir(recibidos.append)
+    bus.publicar(CambioClimatizador("apagado"))
+
+    assert bus.errores == 1
+    assert recibidos == [[CambioClimatizador("apagado")]]
+
+
+# EVB-005: Cancelar
+def test_cancelar_suscripcion():
+    """Tras cancelar no se reciben mas eventos"""
+    bus = BusEventos(RelojVirtual())
+    recibidos = []
+    suscripcion = bus.suscribir(recibidos.append)
+    bus.cancelar(suscripcion)
+
+    bus.publicar(CambioClimatizador("apagado"))
+
+    assert recibidos == []
+    assert bus.suscripciones == 0
+
+
+# EVB-006: EmisorCambios
+def test_emisor_publica_solo_cambios_por_tipo():
+    """Valores repetidos no se publican; tipos distintos con igual valor si"""
+    bus = BusEventos(RelojVirtual())
+    recibidos = []
+    bus.suscribir(recibidos.extend)
+    emisor = EmisorCambios(bus)
+
+    emisor.emitir(CambioTemperaturaAmbiente(22))
+    emisor.emitir(CambioTemperaturaAmbiente(22))
+    emisor.emitir(CambioTemperaturaDeseada(22))
+    emisor.emitir(CambioTemperaturaAmbiente(23))
+    EmisorCambios(None).emitir(CambioTemperaturaAmbiente(24))
+
+    assert recibidos == [CambioTemperaturaAmbiente(22), CambioTemperaturaDeseada(22),
+                         CambioTemperaturaAmbiente(23)]
@@ -0,0 +1,76 @@
+"""
+Tests unitarios para las tablas de calibracion del ADC
+
+Casos de prueba:
+- CAL-001: Tabla lineal coincide con la formula de conversion
+- CAL-002: Cuentas enteras por indice, decimales por interpolacion
+- CAL-003: Termistor: t0 a mitad de escala y tabla decreciente
+- CAL-004: Puntos de calibracion interpolados y saturados en los extremos
+- CAL-005: cuentas_para invierte la tabla
+- CAL-006: Parametros invalidos -> ValueError
+"""
+import numpy as np
+import pytest
+from hal.calibracion import TablaCalibracion
+from hal.conversion import cuentas_a_celsius
+
+
+class TestTablaCalibracion:
+    """Tests para TablaCalibracion"""
+
+    # CAL-001: Tabla lineal
+    def test_tabla_lineal_coincide_con_formula(self):
+        """Cada entrada debe ser la formula evaluada en esa cuenta"""
+        tabla = TablaCalibracion.lineal_temperatura()
+        cuentas = np.arange(1024)
+
+        assert tabla.valores.shape == (1024,)
+        assert np.allclose(tabla.convertir(cuentas), cuentas_a_celsius(cuentas))
+
+    # CAL-002: Indice e interpolacion
+    def test_enteras_por_indice_decimales_interpolados(self):
+        """Una cuenta con fraccion cae entre las entradas vecinas"""
+        tabla = TablaCalibracion.desde_funcion(lambda cuentas: cuentas ** 2)
+
+        assert tabla.convertir(np.array([3, 4], dtype=np.uint16)).tolist() == [9.0, 16.0]
+        assert float(tabla.convertir(3.5)) == pytest.approx(12.5)
+        assert float(tabla.convertir(1023.0)) == pytest.approx(1023.0 ** 2)
+
+    # CAL-003: Termistor
+    def test_termistor_t0_a_mitad_de_escala(self):
+        """Con r_serie == r0, la mitad de escala corresponde a t0"""
+        tabla = TablaCalibracion.termistor(beta=3950, r0=10000, t0=25, r_serie=10000)
+
+        assert float(tabla.convertir(511.5)) == pytest.approx(25.0, abs=0.1)
+        assert np.all(np.diff(tabla.valores) < 0)
+
+    # CAL-004: Puntos de calibracion
+    def test_puntos_interpolados_y_saturados(self):
+        """Entre puntos se interpola; fuera se mantiene el extremo"""
+        tabla = TablaCalibracion.desde_puntos([[900, 40.0], [100, 0.0]])
+
+        assert float(tabla.convertir(500)) == pytest.approx(20.0)
+        assert float(tabla.convertir(0)) == 0.0
+        assert float(tabla.convertir(1023)) == 40.0
+
+    # CAL-005: Conversion inversa
+    @pytest.mark.parametrize("tabla", [
+        TablaCalibracion.lineal_temperatura(),
+        TablaCalibracion.termistor(),
+    ])
+    def test_cuentas_para_invierte_la_tabla(self, tabla):
+        """Convertir la cuenta inversa debe devolver el valor original"""
+        cuenta = tabla.cuentas_para(22.0)
+
+        assert float(tabla.convertir(cuenta)) == pytest.approx(22.0, abs=0.01)
+
+    # CAL-006: Parametros invalidos
+    @pytest.mark.parametrize("crear", [
+        lambda: TablaCalibracion(np.zeros(10)),
+        lambda: TablaCalibracion.termistor(beta=0),
+        lambda: TablaCalibracion.desde_puntos([[0, 1.0]]),
+    ])
+    def test_parametros_invalidos(self, crear):
+        """Tamano incorrecto o modelo invalido deben lanzar ValueError"""
+        with pytest.raises(ValueError):
+            crear()
@@ -0,0 +1,108 @@
+"""
+Tests unitarios para la lectura por bloques del HAL ADC
+
+Casos de prueba:
+- HAD-001: leer_bloque llena un buffer NumPy preasignado
+- HAD-002: leer_bloque acepta array('H') como destino
+- HAD-003: Buffer insuficiente -> ValueError
+- HAD-004: Canal fuera de rango -> ValueError
+- HAD-005: leer_decimado promedia de a factor muestras
+- HAD-006: Sobremuestreo del simulado reduce el ruido
+- HAD-007: Conversion vectorizada de cuentas a grados y voltios
+"""
+from array import array
+
+import numpy as np
+import pytest
+from hal.hal_adc_mock import HAL_ADC_Mock
+from hal.hal_adc_simulado import HAL_ADC_Simulado
+from hal.conversion import (
+    celsius_a_cuentas,
+    cuentas_a_celsius,
+    cuentas_a_voltios_bateria,
+    voltios_bateria_a_cuentas
+)
+
+
+@pytest.fixture
+def mock_adc():
+    """ADC mock inicializado con una secuencia conocida"""
+    hal = HAL_ADC_Mock(valores_adc=[100, 200, 300, 400])
+    hal.inicializar()
+    yield hal
+    hal.finalizar()
+
+
+class TestLecturaBloques:
+    """Tests para leer_bloque"""
+
+    # HAD-001: Buffer NumPy preasignado
+    def test_llena_buffer_numpy_preasignado(self, mock_adc):
+        """Debe escribir en el buffer recibido, sin crear otro"""
+        buffer = np.zeros(6, dtype=np.uint16)
+
+        resultado = mock_adc.leer_bloque(0, 6, buffer)
+
+        assert resultado is buffer
+        assert list(buffer) == [100, 200, 300, 400, 100, 200]
+        assert mock_adc.obtener_llamadas_bloque() == 1
+
+    # HAD-002: Destino array('H')
+    def test_acepta_array_como_destino(self, mock_adc):
+        """Un array('H') preasignado tambien es un destino valido"""
+        buffer = array("H", bytes(2 * 3))
+
+        mock_adc.leer_bloque(0, 3, buffer)
+
+        assert list(buffer) == [100, 200, 300]
+
+    # HAD-003: Buffer insuficiente
+    def test_buffer_insuficiente(self, mock_adc):
+        """Un buffer mas chico que la cantidad pedida es un error"""
+        with pytest.raises(ValueError):
+            mock_adc.leer_bloque(0, 10, np.empty(5, dtype=np.uint16))
+
+    # HAD-004: Canal fuera de rango
+    def test_canal_fuera_de_rango(self, mock_adc):
+        """El ADC tiene 8 canales (0-7)"""
+        with pytest.raises(ValueError):
+            mock_adc.leer_adc(8)
+
+
+class TestDecimacion:
+    """Tests para el sobremuestreo y la decimacion"""
+
+    # HAD-005: Promedio de a factor muestras
+    def test_decimado_promedia_de_a_factor(self, mock_adc):
+        """Cada valor decimado es el promedio de factor muestras consecutivas"""
+        valores = mock_adc.leer_decimado(0, 2, 2)
+
+        assert list(valores) == [150.0, 350.0]
+        assert mock_adc.leer_sobremuestreado(0, 4) == 250.0
+
+    # HAD-006: Sobremuestreo reduce el ruido
+    def test_sobremuestreo_reduce_ruido(self):
+        """El desvio de los valores decimados debe ser menor que el crudo"""
+        hal = HAL_ADC_Simulado(temperatura_base=22.0, ruido_std=2.0, semilla=1)
+        hal.inicializar()
+
+        crudas = hal.leer_bloque(0, 1000).astype(float)
+        decimadas = hal.leer_decimado(0, 1000, 16)
+
+        assert decimadas.std() < crudas.std() / 2
+        assert decimadas.mean() == pytest.approx(celsius_a_cuentas(22.0), abs=1.0)
+        hal.finalizar()
+
+
+class TestConversion:
+    """Tests para la conversion de cuentas"""
+
+    # HAD-007: Conversion vectorizada
+    def test_conversion_vectorizada_ida_y_vuelta(self):
+        """Convertir un arreglo de cuentas y volver debe ser la identidad"""
+        temperaturas = np.array([0.0, 22.0, 35.5])
+        voltajes = np.array([3.0, 4.5, 5.0])
+
+        assert np.allclose(cuentas_a_celsius(celsius_a_cuentas(temperaturas)), temperaturas)
+        assert np.allclose(cuentas_a_voltios_bateria(voltios_bateria_a_cuentas(voltajes)),
+                           voltajes)
@@ -0,0 +1,125 @@
+"""
+Tests unitarios para el perfilador de tareas
+
+Casos de prueba:
+- PRF-001: Iteracion bloqueada -> pared ~ bloqueo, CPU ~ 0
+- PRF-002: Iteracion mas larga que el periodo -> vencimiento y uso > 1
+- PRF-003: Captura cProfile -> al cerrarse la ventana se escribe un .prof
+  con las funciones de todas las tareas
+- PRF-004: La senal abre una captura
+"""
+import os
+import pstats
+import signal
+import threading
+import time
+
+import pytest
+from metricas.perfilador import PerfiladorTareas
+from metricas.registro import RegistroMetricas
+
+
+def _serie(registro, nombre, tarea):
+    """Helper: serie de una metrica por tarea"""
+    return registro.obtener(nombre).etiquetas(tarea)
+
+
+# PRF-001: Tiempo bloqueado
+def test_iteracion_bloqueada_no_consume_cpu():
+    """Una espera dentro del cuerpo cuenta como bloqueo, no como CPU"""
+    registro = RegistroMetricas()
+    perfilador = PerfiladorTareas(registro)
+
+    with perfilador.medir("temperatura", periodo=2):
+        time.sleep(0.05)
+
+    pared = _serie(registro, "termostato_tarea_segundos", "temperatura")
+    cpu = _serie(registro, "termostato_tarea_cpu_segundos", "temperatura")
+    bloqueo = _serie(registro, "termostato_tarea_bloqueo_segundos", "temperatura")
+    assert pared.cantidad == cpu.cantidad == bloqueo.cantidad == 1
+    assert pared.suma >= 0.05
+    assert cpu.suma < 0.02
+    assert bloqueo.suma == pytest.approx(pared.suma - cpu.suma)
+
+
+# PRF-002: Vencimientos
+def test_iteracion_larga_vence_el_periodo():
+    """Solo las iteraciones mas largas que el periodo son vencimientos"""
+    registro = RegistroMetricas()
+    perfilador = PerfiladorTareas(registro)
+
+    with perfilador.medir("bateria", periodo=0.01):
+        time.sleep(0.03)
+    with perfilador.medir("bateria", periodo=10):
+        pass
+
+    vencimientos = _serie(registro, "termostato_tarea_vencimientos_total", "bateria")
+    assert vencimientos.valor == 1
+    assert _serie(registro, "termostato_tarea_uso", "bateria").valor < 1
+
+    with perfilador.medir("bateria", periodo=0.01):
+        time.sleep(0.03)
+    assert vencimientos.valor == 2
+    assert _serie(registro, "termostato_tarea_uso", "bateria").valor > 1
+
+
+def _trabajo_bateria():
+    return sum(range(1000))
+
+
+def _trabajo_temperatura():
+    return sorted(range(1000), reverse=True)
+
+
+# PRF-003: Captura cProfile
+def test_captura_combina_los_hilos_de_las_tareas(tmp_path):
+    """Cada hilo se perfila por separado y el archivo las combina"""
+    perfilador = PerfiladorTareas(RegistroMetricas(), str(tmp_path))
+    perfilador.solicitar_perfil(0.2)
+    assert perfilador.capturando
+
+    def tarea(nombre, trabajo):
+        fin = time.monotonic() + 0.4
+        while time.monotonic() < fin:
+            with perfilador.medir(nombre, periodo=1):
+                trabajo()
+            time.sleep(0.01)
+
+    hilos = [threading.Thread(target=tarea, args=("bateria", _trabajo_bateria)),
+             threading.Thread(target=tarea, args=("temperatura", _trabajo_temperatura))]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert not perfilador.capturando
+    assert len(perfilador.archivos) == 1
+    ruta = perfilador.archivos[0]
+    assert os.path.dirname(ruta) == str(tmp_path)
+    funciones = {funcion for _, _, funcion in pstats.Stats(ruta).stats}
+    assert {"_trabajo_bateria", "_trabajo_temperatura"} <= funciones
+
+
+def test_sin_iteraciones_no_escribe_archivo(tmp_path):
+    """Una captura vacia no deja archivo"""
+    perfilador = PerfiladorTareas(RegistroMetricas(), str(tmp_path))
+    perfilador.solicitar_perfil(10)
+
+    assert perfilador.volcar_perfil() is None
+    assert not perfilador.capturando
+    assert not list(tmp_path.iterdir())
+
+
+# PRF-004: Senal
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="Requiere SIGUSR1")
+def test_senal_abre_captura():
+    """SIGUSR1 abre una captura de la duracion configurada"""
+    perfilador = PerfiladorTareas(RegistroMetricas(), duracion_perfil=30)
+    anterior = signal.getsignal(signal.SIGUSR1)
+    try:
+        assert perfilador.instalar_senal()
+        os.kill(os.getpid(), signal.SIGUSR1)
+        time.sleep(0.01)
+        assert perfilador.capturando
+    finally:
+        signal.signal(signal.SIGUSR1, anterior)
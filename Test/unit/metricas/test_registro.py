@@ -0,0 +1,187 @@
+"""
+Tests unitarios para el registro de metricas y los instrumentos
+
+Casos de prueba:
+- MET-001: Contador con etiquetas -> una linea por serie, no decrementa
+- MET-002: Indicador fijo y por funcion (profundidad de cola)
+- MET-003: Histograma -> cubetas acumulativas, _sum y _count
+- MET-004: Alta repetida retorna la misma metrica; otro tipo -> ValueError
+- MET-005: Etiquetas incorrectas -> ValueError; valores se escapan
+- MET-006: Proxy medido -> duracion, lecturas, errores y ultima lectura
+- MET-007: Visualizador medido cuenta los errores que el agente no propaga
+- MET-008: Actuador y seteo medidos -> acciones, comandos y cola pendiente
+"""
+from unittest.mock import Mock
+
+import pytest
+from metricas.registro import RegistroMetricas
+from metricas.instrumentos import (
+    ActuadorClimatizadorMedido, ProxyBateriaMedido, ProxySensorTemperaturaMedido,
+    SeteoTemperaturaMedido, VisualizadorTemperaturaMedido
+)
+
+
+def _lineas(registro):
+    """Helper: lineas de la exposicion sin los comentarios"""
+    return [linea for linea in registro.exponer().splitlines()
+            if not linea.startswith("#")]
+
+
+# MET-001: Contador
+def test_contador_con_etiquetas():
+    """Cada combinacion de etiquetas es una serie propia"""
+    registro = RegistroMetricas()
+    errores = registro.contador("errores_total", "Errores", ("dispositivo",))
+    errores.etiquetas("bateria").incrementar()
+    errores.etiquetas("temperatura").incrementar(2)
+    errores.etiquetas("bateria").incrementar()
+
+    texto = registro.exponer()
+    assert "# HELP errores_total Errores" in texto
+    assert "# TYPE errores_total counter" in texto
+    assert _lineas(registro) == ['errores_total{dispositivo="bateria"} 2',
+                                 'errores_total{dispositivo="temperatura"} 2']
+    with pytest.raises(ValueError):
+        errores.etiquetas("bateria").incrementar(-1)
+
+
+# MET-002: Indicador
+def test_indicador_fijo_y_por_funcion():
+    """Una funcion se evalua en cada exposicion"""
+    registro = RegistroMetricas()
+    cola = []
+    registro.indicador("temperatura", "Temperatura").fijar(21.5)
+    registro.indicador("cola", "Pendientes").fijar_funcion(lambda: len(cola))
+
+    assert _lineas(registro) == ["cola 0", "temperatura 21.5"]
+    cola.extend([1, 2, 3])
+    assert _lineas(registro)[0] == "cola 3"
+
+
+# MET-003: Histograma
+def test_histograma_cubetas_acumulativas():
+    """Las cubetas cuentan las observaciones <= limite y +Inf todas"""
+    registro = RegistroMetricas()
+    histograma = registro.histograma("lectura_segundos", "Lecturas", limites=(0.1, 1.0))
+    for valor in (0.05, 0.5, 0.5, 3.0):
+        histograma.observar(valor)
+
+    assert _lineas(registro) == [
+        'lectura_segundos_bucket{le="0.1"} 1',
+        'lectura_segundos_bucket{le="1"} 3',
+        'lectura_segundos_bucket{le="+Inf"} 4',
+        "lectura_segundos_sum 4.05",
+        "lectura_segundos_count 4",
+    ]
+
+
+def test_histograma_cronometra_aunque_lance():
+    """cronometrar() observa tambien si el bloque lanza una excepcion"""
+    histograma = RegistroMetricas().histograma("tarea_segundos", "Tareas", ("tarea",))
+    serie = histograma.etiquetas("bateria")
+
+    with pytest.raises(RuntimeError):
+        with serie.cronometrar():
+            raise RuntimeError("sensor")
+
+    assert serie.cantidad == 1
+    assert serie.suma >= 0
+
+
+# MET-004: Alta repetida
+def test_alta_repetida_retorna_la_misma_metrica():
+    """Los componentes declaran sus metricas sin coordinarse"""
+    registro = RegistroMetricas()
+    contador = registro.contador("lecturas_total", "Lecturas", ("dispositivo",))
+
+    assert registro.contador("lecturas_total", "Lecturas", ("dispositivo",)) is contador
+    assert registro.obtener("lecturas_total") is contador
+    with pytest.raises(ValueError):
+        registro.indicador("lecturas_total", "Lecturas", ("dispositivo",))
+    with pytest.raises(ValueError):
+        registro.contador("lecturas_total", "Lecturas", ("otra",))
+
+
+# MET-005: Etiquetas
+def test_etiquetas_invalidas_y_escapadas():
+    """La cantidad de valores debe coincidir; comillas y barras se escapan"""
+    registro = RegistroMetricas()
+    contador = registro.contador("eventos_total", "Eventos", ("origen",))
+
+    with pytest.raises(ValueError):
+        contador.etiquetas()
+    with pytest.raises(ValueError):
+        contador.incrementar()
+    contador.etiquetas('a"b\\c').incrementar()
+    assert _lineas(registro) == ['eventos_total{origen="a\\"b\\\\c"} 1']
+
+
+# MET-006: Proxy medido
+def test_proxy_medido_registra_lecturas_y_errores():
+    """La excepcion se propaga y se cuenta como error"""
+    registro = RegistroMetricas()
+    proxy = Mock(leer_temperatura=Mock(side_effect=[21.5, OSError("socket")]),
+                 leer_temperaturas=Mock(return_value=[20.0, 20.5]))
+    medido = ProxySensorTemperaturaMedido(proxy, registro)
+
+    assert medido.leer_temperatura() == 21.5
+    with pytest.raises(OSError):
+        medido.leer_temperatura()
+    assert medido.leer_temperaturas() == [20.0, 20.5]
+
+    lineas = _lineas(registro)
+    assert 'termostato_lecturas_total{dispositivo="temperatura"} 3' in lineas
+    assert 'termostato_lectura_errores_total{dispositivo="temperatura"} 1' in lineas
+    assert 'termostato_ultima_lectura{dispositivo="temperatura"} 20.5' in lineas
+    assert 'termostato_lectura_segundos_count{dispositivo="temperatura"} 3' in lineas
+
+    bateria = ProxyBateriaMedido(Mock(leer_carga=Mock(return_value=4.5)), registro)
+    assert bateria.leer_carga() == 4.5
+    assert 'termostato_ultima_lectura{dispositivo="bateria"} 4.5' in _lineas(registro)
+
+
+# MET-007: Visualizador medido
+def test_visualizador_medido_cuenta_errores_no_propagados():
+    """Los errores que el visualizador solo informa se leen de su contador"""
+
+    class VisualizadorCaido:
+        """Visualizador que informa el error sin propagarlo"""
+        errores = 0
+
+        def mostrar_temperatura_ambiente(self, _):
+            self.errores += 1
+
+        def mostrar_temperatura_deseada(self, _):
+            pass
+
+    registro = RegistroMetricas()
+    medido = VisualizadorTemperaturaMedido(VisualizadorCaido(), registro)
+    medido.mostrar_temperatura_ambiente(21)
+    medido.mostrar_temperatura_ambiente(21)
+    medido.mostrar_temperatura_deseada(22)
+
+    lineas = _lineas(registro)
+    assert 'termostato_visualizacion_errores_total{visualizador="temperatura"} 2' in lineas
+    assert 'termostato_visualizacion_segundos_count{visualizador="temperatura"} 3' in lineas
+
+
+# MET-008: Actuador y seteo medidos
+def test_actuador_y_seteo_medidos():
+    """Acciones por etiqueta, comandos por fuente y pendientes de la fuente"""
+    registro = RegistroMetricas()
+    actuador = Mock()
+    medido = ActuadorClimatizadorMedido(actuador, registro)
+    for accion in ("calentar", "calentar", "apagar"):
+        medido.accionar_climatizador(accion)
+    assert actuador.accionar_climatizador.call_count == 3
+
+    fuente = Mock(pendientes=4, obtener_seteo=Mock(side_effect=["aumentar", None]))
+    seteo = SeteoTemperaturaMedido(fuente, registro)
+    seteo.obtener_seteo()
+    seteo.obtener_seteo()
+
+    lineas = _lineas(registro)
+    assert 'termostato_acciones_total{accion="apagar"} 1' in lineas
+    assert 'termostato_acciones_total{accion="calentar"} 2' in lineas
+    assert 'termostato_comandos_total{fuente="seteo"} 1' in lineas
+    assert 'termostato_cola_profundidad{cola="seteo"} 4' in lineas
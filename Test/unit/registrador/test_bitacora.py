@@ -0,0 +1,92 @@
+"""
+Tests unitarios para la bitacora estructurada
+
+Casos de prueba:
+- BIT-001: Registro -> una linea logfmt con nivel, origen, mensaje y campos
+- BIT-002: El mensaje se formatea en el hilo de fondo, no al registrar
+- BIT-003: Nivel deshabilitado -> no se encola nada
+- BIT-004: Cola llena -> se descarta sin bloquear y se cuenta
+"""
+import io
+import logging
+import queue
+import threading
+
+import pytest
+from registrador.bitacora import (
+    FormateadorEstructurado, ManejadorCola, configurar_bitacora, detener_bitacora
+)
+
+
+@pytest.fixture
+def salida():
+    """Bitacora configurada sobre un buffer de texto"""
+    buffer = io.StringIO()
+    configurar_bitacora("INFO", buffer)
+    yield buffer
+    detener_bitacora()
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+# BIT-001: Formato logfmt
+def test_registro_en_formato_logfmt(salida):
+    """Los valores con espacios van entre comillas; los campos se agregan ordenados"""
+    logging.getLogger("operador").info("lee %s", "bateria",
+                                       extra={"campos": {"tarea": "bateria", "ms": 3}})
+    detener_bitacora()
+
+    linea = salida.getvalue().strip()
+    assert linea.startswith("ts=")
+    assert 'nivel=INFO hilo=MainThread origen=operador msg="lee bateria" ms=3 tarea=bateria' \
+        in linea
+
+
+# BIT-002: Formato diferido
+def test_mensaje_se_formatea_en_el_hilo_de_fondo(salida):
+    """str() de los argumentos corre en el listener, no en el hilo que registra"""
+    hilos = []
+
+    class Argumento:
+        """Anota el hilo donde se lo convierte a texto"""
+        def __str__(self):
+            hilos.append(threading.current_thread())
+            return "valor"
+
+    # Sin el handler de captura de pytest, que formatea en el hilo que registra
+    raiz = logging.getLogger()
+    otros = [manejador for manejador in raiz.handlers
+             if not isinstance(manejador, ManejadorCola)]
+    for manejador in otros:
+        raiz.removeHandler(manejador)
+    try:
+        logging.getLogger("gestor").warning("lectura %s", Argumento())
+        detener_bitacora()
+    finally:
+        for manejador in otros:
+            raiz.addHandler(manejador)
+
+    assert "msg=\"lectura valor\"" in salida.getvalue()
+    assert hilos and threading.current_thread() not in hilos
+
+
+# BIT-003: Nivel deshabilitado
+def test_nivel_deshabilitado_no_encola(salida):
+    """Un debug con nivel INFO no llega a la cola"""
+    logging.getLogger("operador").debug("lee %s", "bateria")
+    detener_bitacora()
+
+    assert salida.getvalue() == ""
+
+
+# BIT-004: Cola llena
+def test_cola_llena_descarta_sin_bloquear():
+    """Con la cola llena el registro se descarta y se cuenta"""
+    manejador = ManejadorCola(queue.Queue(1))
+    manejador.setFormatter(FormateadorEstructurado())
+    registro = logging.LogRecord("operador", logging.INFO, __file__, 1, "msg", None, None)
+
+    manejador.handle(registro)
+    manejador.handle(registro)
+
+    assert manejador.queue.qsize() == 1
+    assert manejador.descartados == 1
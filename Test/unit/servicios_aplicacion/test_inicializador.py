@@ -0,0 +1,191 @@
+"""
+Tests unitarios para el Inicializador
+
+Casos de prueba:
+- INI-001: Sensores lentos -> se verifican en paralelo
+- INI-002: Sensor que no responde -> vence el plazo global y el inicio falla
+- INI-003: Timeout por sensor -> vence antes que el plazo global
+- INI-004: Lecturas invalidas -> se reintentan hasta agotar los reintentos
+- INI-005: Sensor no requerido sin lectura -> inicio degradado sin esperarlo
+- INI-006: Proxy socket vencido -> su lectura y la del operador conviven
+- INI-007: Los plazos se cuentan con el reloj inyectado
+"""
+import socket
+import threading
+import time
+from unittest.mock import Mock
+
+from agentes_sensores.proxy_bateria import ProxyBateriaSocket
+from servicios_aplicacion.inicializador import (
+    FALLO, OK, VENCIDO, Inicializador, ParametrosSensor,
+)
+from servicios_aplicacion.reloj import RelojVirtual
+
+
+def _lenta(segundos, valida=True):
+    """Helper que simula una lectura que demora"""
+    def verificacion():
+        time.sleep(segundos)
+        return valida
+    return verificacion
+
+
+def _sin_respuesta(liberar):
+    """Helper que simula una lectura bloqueada hasta que se libera"""
+    def verificacion():
+        liberar.wait()
+        return False
+    return verificacion
+
+
+def _gestores(lectura_bateria, lectura_temperatura):
+    """Helper que arma gestores simulados cuyas lecturas ejecutan los callables"""
+    gestor_bateria = Mock()
+    gestor_bateria.verificar_nivel_de_carga.side_effect = lectura_bateria
+    gestor_bateria.obtener_indicador_de_carga.return_value = "NORMAL"
+    gestor_ambiente = Mock()
+    gestor_ambiente.leer_temperatura_ambiente.side_effect = lectura_temperatura
+    gestor_ambiente.obtener_temperatura_ambiente.return_value = 22
+    return gestor_bateria, gestor_ambiente
+
+
+# INI-001: Verificacion en paralelo
+def test_sensores_lentos_se_verifican_en_paralelo():
+    """Dos lecturas de 0.2 s no suman 0.4 s"""
+    inicio = time.monotonic()
+    estados = Inicializador().verificar({"bateria": _lenta(0.2), "temperatura": _lenta(0.2)})
+
+    assert estados == {"bateria": OK, "temperatura": OK}
+    assert time.monotonic() - inicio < 0.35
+
+
+# INI-002: Plazo global
+def test_sensor_sin_respuesta_vence_el_plazo():
+    """El inicio no espera mas que el plazo por un sensor bloqueado"""
+    liberar = threading.Event()
+    gestor_bateria, gestor_ambiente = _gestores(lambda: liberar.wait(), None)
+    presentador = Mock()
+    inicio = time.monotonic()
+
+    try:
+        assert Inicializador(plazo=0.2).iniciar(gestor_bateria, gestor_ambiente,
+                                                presentador) is False
+    finally:
+        liberar.set()
+
+    assert 0.2 <= time.monotonic() - inicio < 1
+    presentador.ejecutar.assert_not_called()
+
+
+# INI-003: Timeout por sensor
+def test_timeout_por_sensor_antes_del_plazo():
+    """El timeout del sensor acota su espera aunque el plazo global sea mayor"""
+    liberar = threading.Event()
+    inicializador = Inicializador(plazo=5, sensores={
+        "temperatura": ParametrosSensor(timeout=0.1, reintentos=0, requerido=True)})
+    inicio = time.monotonic()
+
+    try:
+        estados = inicializador.verificar({"bateria": _lenta(0.01),
+                                           "temperatura": _sin_respuesta(liberar)})
+    finally:
+        liberar.set()
+
+    assert estados == {"bateria": OK, "temperatura": VENCIDO}
+    assert time.monotonic() - inicio < 1
+
+
+# INI-004: Reintentos
+def test_lecturas_invalidas_se_reintentan():
+    """Cada sensor se reintenta hasta su cantidad de reintentos"""
+    resultados = iter([False, ValueError("valor invalido"), True])
+    intentos = []
+
+    def intermitente():
+        intentos.append("temperatura")
+        resultado = next(resultados)
+        if isinstance(resultado, Exception):
+            raise resultado
+        return resultado
+
+    def invalida():
+        intentos.append("bateria")
+        return False
+
+    inicializador = Inicializador(espera=0.01, sensores={
+        "temperatura": ParametrosSensor(timeout=None, reintentos=2, requerido=True),
+        "bateria": ParametrosSensor(timeout=None, reintentos=1, requerido=True)})
+
+    assert inicializador.verificar({"temperatura": intermitente}) == {"temperatura": OK}
+    assert inicializador.verificar({"bateria": invalida}) == {"bateria": FALLO}
+    assert intentos == ["temperatura"] * 3 + ["bateria"] * 2
+
+
+# INI-005: Inicio degradado
+def test_sensor_no_requerido_no_demora_el_inicio():
+    """Con la bateria opcional el control empieza apenas hay temperatura"""
+    liberar = threading.Event()
+    gestor_bateria, gestor_ambiente = _gestores(lambda: liberar.wait(), None)
+    presentador = Mock()
+    inicializador = Inicializador(sensores={
+        "bateria": ParametrosSensor(timeout=None, reintentos=0, requerido=False)})
+    inicio = time.monotonic()
+
+    try:
+        assert inicializador.iniciar(gestor_bateria, gestor_ambiente, presentador) is True
+    finally:
+        liberar.set()
+
+    assert time.monotonic() - inicio < 0.5
+    assert gestor_ambiente.ambiente.temperatura_deseada == 24
+    presentador.ejecutar.assert_called_once()
+    presentador.terminal.limpiar.assert_called_once()
+
+
+# INI-006: Proxy socket compartido tras vencer
+def test_proxy_socket_vencido_convive_con_el_operador():
+    """La lectura vencida sigue esperando sin romper las lecturas del operador"""
+    proxy = ProxyBateriaSocket("127.0.0.1", 0, espera=0.3)
+    inicializador = Inicializador(sensores={
+        "bateria": ParametrosSensor(timeout=0.05, reintentos=0, requerido=True)})
+    estados = inicializador.verificar({"bateria": lambda: proxy.leer_carga() is not None})
+    detener = threading.Event()
+
+    def sensor():
+        while not detener.is_set():
+            with socket.create_connection(proxy.direccion) as conexion:
+                conexion.sendall(b"4.5")
+            time.sleep(0.005)
+
+    emisor = threading.Thread(target=sensor, daemon=True)
+    emisor.start()
+    try:
+        cargas = [proxy.leer_carga() for _ in range(20)]
+    finally:
+        detener.set()
+        emisor.join(timeout=2)
+
+    assert estados == {"bateria": VENCIDO}
+    assert 4.5 in cargas
+    time.sleep(0.4)
+    assert not any(hilo.name == "inicio-bateria" for hilo in threading.enumerate())
+    proxy.cerrar()
+
+
+# INI-007: Reloj inyectado
+def test_plazos_con_reloj_virtual():
+    """Un timeout de 30 s virtuales vence sin esperar 30 s reales"""
+    liberar = threading.Event()
+    reloj = RelojVirtual()
+    inicializador = Inicializador(reloj=reloj, sensores={
+        "temperatura": ParametrosSensor(timeout=30, reintentos=0, requerido=True)})
+    inicio = time.monotonic()
+
+    try:
+        estados = inicializador.verificar({"temperatura": _sin_respuesta(liberar)})
+    finally:
+        liberar.set()
+
+    assert estados == {"temperatura": VENCIDO}
+    assert reloj.monotonic() >= 30
+    assert time.monotonic() - inicio < 1
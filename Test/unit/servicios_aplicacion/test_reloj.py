@@ -0,0 +1,155 @@
+"""
+Tests unitarios para los relojes
+
+Casos de prueba:
+- REL-001: RelojVirtual avanza solo al dormir, sin esperar tiempo real
+- REL-002: avanzar_hasta no retrocede
+- REL-003: Con velocidad espera la fraccion de tiempo real correspondiente
+- REL-004: Hilos registrados se intercalan en orden de tiempo virtual
+- REL-005: ahora() de RelojVirtual y RelojMonotono avanza con su reloj
+- REL-006: Un hilo que abandona no detiene a los demas
+- REL-007: Un hilo de periodo cero cede el turno y el reloj sigue avanzando
+- REL-008: Con velocidad la espera real no retiene el lock del reloj
+"""
+import datetime
+import threading
+import time
+
+import pytest
+from servicios_aplicacion.reloj import RelojMonotono, RelojReal, RelojVirtual
+
+
+# REL-001: Avance instantaneo
+def test_reloj_virtual_avanza_al_dormir():
+    """Una hora virtual no consume tiempo real"""
+    reloj = RelojVirtual(inicio=10.0)
+    inicio = time.monotonic()
+
+    reloj.sleep(3600)
+
+    assert reloj.monotonic() == 3610.0
+    assert time.monotonic() - inicio < 0.1
+
+
+# REL-002: No retrocede
+def test_avanzar_hasta_no_retrocede():
+    """Un instante pasado no modifica la hora"""
+    reloj = RelojVirtual()
+    reloj.avanzar_hasta(5.0)
+    reloj.avanzar_hasta(2.0)
+    reloj.sleep(-1)
+
+    assert reloj.monotonic() == 5.0
+
+
+# REL-003: Velocidad
+def test_velocidad_espera_tiempo_real():
+    """A velocidad 100, 5 s virtuales son ~50 ms reales"""
+    reloj = RelojVirtual(velocidad=100)
+    inicio = time.monotonic()
+
+    reloj.sleep(5)
+
+    assert time.monotonic() - inicio >= 0.045
+    assert reloj.monotonic() == 5.0
+
+    with pytest.raises(ValueError):
+        RelojVirtual(velocidad=0)
+
+
+def _periodico(reloj, nombre, periodo, iteraciones, eventos):
+    """Hilo que registra (instante, nombre) y duerme periodo, iteraciones veces"""
+    try:
+        for _ in range(iteraciones):
+            eventos.append((reloj.monotonic(), nombre))
+            reloj.sleep(periodo)
+    finally:
+        reloj.abandonar()
+
+
+def _correr_hilos(reloj, especificaciones):
+    """Registra y corre un hilo por (nombre, periodo, iteraciones)"""
+    eventos = []
+    hilos = [threading.Thread(target=_periodico, args=(reloj, nombre, periodo, iteraciones, eventos))
+             for nombre, periodo, iteraciones in especificaciones]
+    for _ in hilos:
+        reloj.unir()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join(timeout=5)
+    assert not any(hilo.is_alive() for hilo in hilos)
+    return eventos
+
+
+# REL-004: Intercalado por eventos discretos
+def test_hilos_registrados_se_intercalan():
+    """Periodos 1 y 3: cada hilo ve su propio ritmo en tiempo virtual"""
+    reloj = RelojVirtual()
+
+    eventos = _correr_hilos(reloj, [("rapido", 1, 9), ("lento", 3, 3)])
+
+    assert [t for t, nombre in eventos if nombre == "rapido"] == list(range(9))
+    assert [t for t, nombre in eventos if nombre == "lento"] == [0, 3, 6]
+    assert [t for t, _ in eventos] == sorted(t for t, _ in eventos)
+    assert reloj.monotonic() == 9
+
+
+# REL-005: Fecha y hora
+def test_ahora_avanza_con_el_reloj():
+    """La fecha virtual es fecha_inicio mas el tiempo virtual transcurrido"""
+    fecha = datetime.datetime(2024, 1, 1, 8, 0, 0)
+    reloj = RelojVirtual(inicio=50.0, fecha_inicio=fecha)
+    reloj.sleep(90 * 60)
+
+    assert reloj.ahora() == datetime.datetime(2024, 1, 1, 9, 30, 0)
+
+    monotono = RelojMonotono()
+    antes = monotono.ahora()
+    monotono.sleep(0.01)
+    assert monotono.ahora() - antes >= datetime.timedelta(seconds=0.01)
+    assert abs(RelojReal().ahora() - datetime.datetime.now()) < datetime.timedelta(seconds=1)
+
+
+# REL-006: Abandono
+def test_hilo_que_abandona_no_detiene_a_los_demas():
+    """Cuando el hilo corto termina el largo sigue avanzando solo"""
+    reloj = RelojVirtual()
+
+    eventos = _correr_hilos(reloj, [("corto", 1, 2), ("largo", 5, 4)])
+
+    assert [t for t, nombre in eventos if nombre == "largo"] == [0, 5, 10, 15]
+    assert reloj.participantes == 0
+    assert reloj.monotonic() == 20
+
+
+# REL-007: Periodo cero
+def test_hilo_de_periodo_cero_cede_el_turno():
+    """sleep(0) de un hilo registrado lo despierta en el proximo salto"""
+    reloj = RelojVirtual()
+
+    eventos = _correr_hilos(reloj, [("cero", 0, 4), ("uno", 1, 3)])
+
+    assert [t for t, nombre in eventos if nombre == "cero"] == [0, 1, 2, 3]
+    assert [t for t, nombre in eventos if nombre == "uno"] == [0, 1, 2]
+    assert reloj.monotonic() == 3
+
+
+# REL-008: Espera real sin lock
+def test_espera_real_no_retiene_el_lock():
+    """Mientras un hilo registrado espera, unir() y abandonar() no se bloquean"""
+    reloj = RelojVirtual(velocidad=10)
+    reloj.unir()
+    hilo = threading.Thread(target=_periodico, args=(reloj, "unico", 1, 1, []))
+    hilo.start()
+    time.sleep(0.02)
+
+    inicio = time.monotonic()
+    reloj.unir()
+    reloj.abandonar()
+    demora = time.monotonic() - inicio
+    hilo.join(timeout=5)
+
+    assert demora < 0.05
+    assert not hilo.is_alive()
+    assert reloj.monotonic() == 1
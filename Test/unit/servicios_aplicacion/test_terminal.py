@@ -0,0 +1,82 @@
+"""
+Tests unitarios para la terminal ANSI y el presentador
+
+Casos de prueba:
+- TER-001: limpiar() en una terminal escribe la secuencia ANSI (sin "clear")
+- TER-002: limpiar() fuera de una terminal no escribe nada
+- TER-003: El presentador agrupa los encabezados y los intercala con los valores
+- TER-004: presentar_cambios() muestra solo las secciones de los eventos recibidos
+"""
+import io
+from unittest.mock import Mock
+
+from eventos.tipos import CambioBateria, CambioTemperaturaDeseada
+from servicios_aplicacion.presentador import Presentador
+from servicios_aplicacion.terminal import TerminalAnsi
+
+
+class SalidaTerminal(io.StringIO):
+    """Buffer que se declara terminal interactiva"""
+
+    def isatty(self):
+        return True
+
+
+# TER-001: Limpiar en terminal
+def test_limpiar_en_terminal_usa_ansi():
+    """Cursor al inicio y borrado de pantalla en una sola escritura"""
+    salida = SalidaTerminal()
+    TerminalAnsi(salida).limpiar()
+
+    assert salida.getvalue() == "\x1b[H\x1b[2J"
+
+
+# TER-002: Limpiar fuera de terminal
+def test_limpiar_fuera_de_terminal_no_escribe():
+    """En un archivo o tuberia no se escriben secuencias de escape"""
+    salida = io.StringIO()
+    TerminalAnsi(salida).limpiar()
+
+    assert salida.getvalue() == ""
+
+
+# TER-003: Presentador
+def test_presentador_intercala_encabezados_y_valores():
+    """Cada seccion muestra su encabezado antes de los valores del gestor"""
+    salida = io.StringIO()
+    gestor_bateria = Mock(mostrar_nivel_de_carga=lambda: salida.write("4.5\n"),
+                          mostrar_indicador_de_carga=lambda: salida.write("NORMAL\n"))
+    gestor_ambiente = Mock(mostrar_temperatura=lambda: salida.write("22\n"))
+    gestor_climatizador = Mock(mostrar_estado_climatizador=lambda: salida.write("apagado\n"))
+    presentador = Presentador(gestor_bateria, gestor_ambiente, gestor_climatizador,
+                              TerminalAnsi(salida))
+
+    presentador.ejecutar()
+
+    lineas = salida.getvalue().splitlines()
+    assert [linea for linea in lineas if not linea.startswith("-") and linea] == [
+        "4.5", "NORMAL", "22", "apagado"]
+    assert lineas[0] == "------------- BATERIA --------------"
+    assert lineas.index("22") == lineas.index("----------- TEMPERATURA ------------") + 1
+    assert lineas[-1] == ""
+
+
+# TER-004: Presentar cambios
+def test_presentar_cambios_solo_secciones_afectadas():
+    """Cada seccion se muestra una vez aunque varios eventos la afecten"""
+    salida = io.StringIO()
+    gestor_bateria = Mock(mostrar_nivel_de_carga=lambda: salida.write("4.5\n"),
+                          mostrar_indicador_de_carga=lambda: salida.write("NORMAL\n"))
+    gestor_ambiente = Mock(mostrar_temperatura=lambda: salida.write("22\n"))
+    gestor_climatizador = Mock()
+    presentador = Presentador(gestor_bateria, gestor_ambiente, gestor_climatizador,
+                              TerminalAnsi(salida))
+
+    presentador.presentar_cambios([CambioTemperaturaDeseada(22), CambioBateria(4.5, "NORMAL"),
+                                   CambioTemperaturaDeseada(23)])
+
+    lineas = salida.getvalue().splitlines()
+    assert [linea for linea in lineas if not linea.startswith("-") and linea] == [
+        "4.5", "NORMAL", "22"]
+    assert lineas[0] == "------------- BATERIA --------------"
+    gestor_climatizador.mostrar_estado_climatizador.assert_not_called()
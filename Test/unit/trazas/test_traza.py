@@ -0,0 +1,182 @@
+"""
+Tests unitarios para el formato de trazas y los grabadores
+
+Casos de prueba:
+- TRZ-001: Ida y vuelta de lecturas y comandos con sus instantes
+- TRZ-002: Lectura fallida (None) se graba como NaN y vuelve como None
+- TRZ-003: Traza .gz comprimida se lee igual
+- TRZ-004: Registro final incompleto se ignora; cabecera invalida -> ValueError
+- TRZ-005: Grabadores de sensores registran cada valor (tambien en bloque y con error)
+- TRZ-006: Grabador de selector registra solo cambios; seteo registra cada comando
+- TRZ-007: Traza .gz sin cierre (proceso interrumpido) -> eventos hasta el ultimo completo
+- TRZ-008: Grabadores delegan direccion y cerrar; otros errores no se graban como None
+"""
+from unittest.mock import Mock
+
+import pytest
+from trazas.traza import GrabadorTraza, Evento, leer_traza
+from trazas.grabadores import (
+    ProxyBateriaGrabador, ProxySensorTemperaturaGrabador,
+    SelectorTemperaturaGrabador, SeteoTemperaturaGrabador
+)
+
+
+class RelojManual:
+    """Reloj que el test adelanta a mano"""
+
+    def __init__(self):
+        self.ahora = 100.0
+
+    def __call__(self):
+        return self.ahora
+
+
+# TRZ-001: Ida y vuelta
+def test_ida_y_vuelta(tmp_path):
+    """Los eventos se leen con el instante relativo al inicio"""
+    ruta = str(tmp_path / "entradas.trz")
+    reloj = RelojManual()
+    with GrabadorTraza(ruta, reloj=reloj) as grabador:
+        reloj.ahora = 100.5
+        grabador.registrar("temperatura", 21.25)
+        reloj.ahora = 101.0
+        grabador.registrar("bateria", 4.8)
+        grabador.registrar("selector", "deseada")
+        grabador.registrar("seteo", "aumentar")
+
+    assert list(leer_traza(ruta)) == [
+        Evento(0.5, "temperatura", 21.25),
+        Evento(1.0, "bateria", 4.8),
+        Evento(1.0, "selector", "deseada"),
+        Evento(1.0, "seteo", "aumentar"),
+    ]
+    assert grabador.eventos == 4
+
+
+# TRZ-002: None
+def test_lectura_fallida(tmp_path):
+    """None ida y vuelta"""
+    ruta = str(tmp_path / "entradas.trz")
+    with GrabadorTraza(ruta) as grabador:
+        grabador.registrar("temperatura", None)
+
+    assert [evento.valor for evento in leer_traza(ruta)] == [None]
+
+
+# TRZ-003: gzip
+def test_traza_comprimida(tmp_path):
+    """Con extension .gz se comprime y se lee transparentemente"""
+    ruta = str(tmp_path / "entradas.trz.gz")
+    with GrabadorTraza(ruta) as grabador:
+        for valor in range(10000):
+            grabador.registrar("temperatura", 20.0 + valor % 5)
+
+    eventos = list(leer_traza(ruta))
+    assert len(eventos) == 10000
+    assert (tmp_path / "entradas.trz.gz").stat().st_size < 10000 * 17
+
+
+# TRZ-004: Truncada e invalida
+def test_traza_truncada_e_invalida(tmp_path):
+    """El registro incompleto se descarta; un archivo ajeno falla"""
+    ruta = tmp_path / "entradas.trz"
+    with GrabadorTraza(str(ruta)) as grabador:
+        grabador.registrar("temperatura", 20.0)
+        grabador.registrar("temperatura", 21.0)
+    ruta.write_bytes(ruta.read_bytes()[:-3])
+
+    assert [evento.valor for evento in leer_traza(str(ruta))] == [20.0]
+
+    ajeno = tmp_path / "otro.trz"
+    ajeno.write_bytes(b"hola mundo")
+    with pytest.raises(ValueError):
+        list(leer_traza(str(ajeno)))
+
+
+# TRZ-005: Grabadores de sensores
+def test_grabadores_de_sensores():
+    """Cada valor entregado se registra; un error se registra como None"""
+    grabador = Mock()
+    proxy = Mock()
+    proxy.leer_temperatura.return_value = 22.0
+    proxy.leer_temperaturas.return_value = [21.0, 21.5]
+    temperatura = ProxySensorTemperaturaGrabador(proxy, grabador)
+
+    assert temperatura.leer_temperatura() == 22.0
+    assert temperatura.leer_temperaturas() == [21.0, 21.5]
+
+    proxy_bateria = Mock()
+    proxy_bateria.leer_carga.side_effect = OSError("desconectado")
+    with pytest.raises(OSError):
+        ProxyBateriaGrabador(proxy_bateria, grabador).leer_carga()
+
+    assert [llamada.args for llamada in grabador.registrar.call_args_list] == [
+        ("temperatura", 22.0), ("temperatura", 21.0), ("temperatura", 21.5),
+        ("bateria", None)]
+
+
+# TRZ-006: Selector y seteo
+def test_grabadores_de_comandos():
+    """El selector graba cambios de modo; el seteo cada comando, tambien en modo push"""
+    grabador = Mock()
+    selector = Mock()
+    selector.obtener_selector.side_effect = ["ambiente", "ambiente", "deseada", "deseada"]
+    selector_grabador = SelectorTemperaturaGrabador(selector, grabador)
+    for _ in range(4):
+        selector_grabador.obtener_selector()
+
+    seteo = Mock()
+    seteo.obtener_seteo.side_effect = [None, "aumentar"]
+    seteo.escuchar.side_effect = lambda destino, timeout: destino("disminuir")
+    seteo_grabador = SeteoTemperaturaGrabador(seteo, grabador)
+    seteo_grabador.obtener_seteo()
+    seteo_grabador.obtener_seteo()
+    recibidos = []
+    seteo_grabador.escuchar(recibidos.append)
+
+    assert recibidos == ["disminuir"]
+    assert [llamada.args for llamada in grabador.registrar.call_args_list] == [
+        ("selector", "ambiente"), ("selector", "deseada"),
+        ("seteo", "aumentar"), ("seteo", "disminuir")]
+
+
+# TRZ-007: gzip interrumpido
+def test_traza_comprimida_interrumpida(tmp_path):
+    """Sin el cierre de gzip se leen los eventos ya volcados, sin error"""
+    ruta = tmp_path / "entradas.trz.gz"
+    grabador = GrabadorTraza(str(ruta), intervalo_volcado=0)
+    for valor in range(1000):
+        grabador.registrar("temperatura", float(valor))
+    interrumpida = tmp_path / "interrumpida.trz.gz"
+    interrumpida.write_bytes(ruta.read_bytes())
+    grabador.cerrar()
+
+    assert [evento.valor for evento in leer_traza(str(interrumpida))] == \
+        [float(valor) for valor in range(1000)]
+
+    datos = interrumpida.read_bytes()
+    interrumpida.write_bytes(datos[:len(datos) // 2])
+    valores = [evento.valor for evento in leer_traza(str(interrumpida))]
+    assert 0 < len(valores) < 1000
+    assert valores == [float(valor) for valor in range(len(valores))]
+
+
+# TRZ-008: Delegacion en el proxy envuelto
+def test_grabadores_delegan_en_el_proxy():
+    """direccion y cerrar llegan al proxy; un error de programacion no es una lectura"""
+    grabador = Mock()
+    proxy = Mock(direccion=("127.0.0.1", 14001))
+    temperatura = ProxySensorTemperaturaGrabador(proxy, grabador)
+
+    assert temperatura.direccion == ("127.0.0.1", 14001)
+    temperatura.cerrar()
+    proxy.cerrar.assert_called_once_with()
+
+    proxy_bateria = Mock()
+    proxy_bateria.leer_carga.side_effect = TypeError("error de programacion")
+    bateria = ProxyBateriaGrabador(proxy_bateria, grabador)
+    with pytest.raises(TypeError):
+        bateria.leer_carga()
+    bateria.cerrar()
+    proxy_bateria.cerrar.assert_called_once_with()
+    grabador.registrar.assert_not_called()
@@ -0,0 +1,185 @@
+"""
+Tests unitarios para el trabajador multi-zona
+
+Casos de prueba:
+- ZTR-001: Cada zona arma sus gestores con su propia configuracion
+- ZTR-002: Un ciclo controla cada zona y publica su estado en la tabla
+- ZTR-003: Un error en una zona no detiene a las demas
+- ZTR-004: Reparto de zonas entre procesos
+- ZTR-005: Se rechazan zonas que comparten archivos de entrada o salida
+- ZTR-006: Se rechazan zonas que comparten un puerto de escucha
+- ZTR-007: Un sensor socket que no envia no demora a las demas zonas
+- ZTR-008: Lecturas con las mismas temperaturas no reevaluan el climatizador,
+  salvo que la guarda haya retenido la orden
+"""
+import time
+from unittest.mock import Mock
+
+import pytest
+from configurador.configurador import Configurador
+from entidades.ambiente import EstadoAmbiente
+from servicios_aplicacion.reloj import RelojReal
+from zonas.supervisor import repartir
+from estado_compartido.tabla import TablaEstado
+from zonas.trabajador import TrabajadorZonas, Zona, crear_zonas
+
+
+@pytest.fixture
+def configuracion(tmp_path, monkeypatch):
+    """Configuracion con ADC simulado sin ruido (los actuadores escriben en tmp_path)"""
+    monkeypatch.chdir(tmp_path)
+    Configurador.configuracion_termostato = {
+        "proxy_bateria": "hal",
+        "proxy_sensor_temperatura": "hal",
+        "actuador_climatizador": "mmap",
+        "visualizador_temperatura": "archivo",
+        "visualizador_bateria": "archivo",
+        "visualizador_climatizador": "archivo",
+        "climatizador": "climatizador",
+        "selector_temperatura": "archivo",
+        "seteo_temperatura": "archivo",
+        "ambiente": {"histeresis": 1.0, "temperatura_inicial": 22.0},
+        "hal": {"tipo": "simulado", "ruido_std": 0, "ruido_bateria_std": 0},
+    }
+    Configurador.hal_adc = None
+    yield Configurador.configuracion_termostato
+    Configurador.configuracion_termostato = None
+    Configurador.hal_adc = None
+
+
+def _definiciones():
+    return [
+        {"nombre": "living", "hal": {"temperatura_base": 15.0},
+         "actuador": {"canal": "living.map", "texto": None}},
+        {"nombre": "cocina", "hal": {"temperatura_base": 30.0},
+         "actuador": {"canal": "cocina.map", "texto": None}},
+        {"nombre": "dormitorio", "ambiente": {"temperatura_inicial": 18.0},
+         "actuador": {"canal": "dormitorio.map", "texto": None}},
+    ]
+
+
+# ZTR-001: Configuracion por zona
+def test_cada_zona_con_su_configuracion(configuracion):
+    """Las secciones de la zona se combinan con la configuracion general"""
+    zonas = crear_zonas(_definiciones(), [0, 1, 2], RelojReal())
+
+    assert [zona.nombre for zona in zonas] == ["living", "cocina", "dormitorio"]
+    assert zonas[2].gestor_ambiente.obtener_temperatura_deseada() == 18.0
+    assert zonas[0].gestor_ambiente.obtener_temperatura_deseada() == 22.0
+    assert Configurador.configuracion_termostato is configuracion
+    zona = Configurador.obtener_configuracion_zona(_definiciones()[0])
+    assert zona["hal"] == {"tipo": "simulado", "ruido_std": 0, "ruido_bateria_std": 0,
+                           "temperatura_base": 15.0}
+
+
+# ZTR-002: Ciclo
+def test_ciclo_controla_y_publica_cada_zona(configuracion):
+    """Cada zona acciona su climatizador segun su propio sensor"""
+    tabla = TablaEstado(["living", "cocina", "dormitorio"])
+    trabajador = TrabajadorZonas(crear_zonas(_definiciones(), [0, 1, 2], RelojReal()), tabla)
+
+    trabajador.ciclo()
+
+    living, cocina, dormitorio = (estado for _, estado in tabla.leer_todas())
+    tabla.liberar()
+    assert living.temperatura_ambiente == pytest.approx(15.0, abs=0.5)
+    assert living.climatizador == "calentando"
+    assert cocina.climatizador == "enfriando"
+    assert dormitorio.temperatura_deseada == 18.0
+    assert dormitorio.temperatura_ambiente == pytest.approx(22.0, abs=0.5)
+    assert dormitorio.carga_baja is True
+
+
+# ZTR-003: Aislamiento de errores
+def test_error_en_una_zona_no_detiene_las_demas(configuracion):
+    """La zona con error publica su ultimo estado y las demas se controlan"""
+    tabla = TablaEstado(["living", "cocina", "dormitorio"])
+    zonas = crear_zonas(_definiciones(), [0, 1, 2], RelojReal())
+
+    def fallar():
+        raise RuntimeError("sensor roto")
+
+    zonas[0].gestor_bateria.verificar_nivel_de_carga = fallar
+    TrabajadorZonas(zonas, tabla).ciclo()
+
+    living, cocina, _ = (estado for _, estado in tabla.leer_todas())
+    tabla.liberar()
+    assert living.climatizador == "apagado"
+    assert cocina.climatizador == "enfriando"
+
+
+# ZTR-004: Reparto
+def test_reparto_circular_sin_fragmentos_vacios():
+    """Los fragmentos difieren en a lo sumo una zona"""
+    assert repartir(5, 2) == [[0, 2, 4], [1, 3]]
+    assert repartir(2, 8) == [[0], [1]]
+    assert repartir(3, 1) == [[0, 1, 2]]
+
+
+# ZTR-005: Archivos compartidos
+@pytest.mark.parametrize("cambios, mensaje", [
+    ({"proxy_sensor_temperatura": "archivo"}, "proxy_sensor_temperatura 'archivo'"),
+    ({"proxy_bateria": "inotify"}, "proxy_bateria 'inotify'"),
+    ({"actuador_climatizador": "general"}, "actuador_climatizador 'general'"),
+    ({"actuador": {"canal": "living.map"}}, "comparten el archivo del actuador 'living.map'"),
+])
+def test_zonas_con_archivos_compartidos_se_rechazan(configuracion, cambios, mensaje):
+    """Los archivos fijos del directorio de trabajo serian comunes a todas las zonas"""
+    definiciones = _definiciones()
+    definiciones[1].update(cambios)
+
+    with pytest.raises(ValueError, match=mensaje):
+        crear_zonas(definiciones, [0, 1, 2], RelojReal())
+
+
+# ZTR-006: Puertos compartidos
+def test_zonas_con_puerto_compartido_se_rechazan(configuracion):
+    """Dos zonas no pueden escuchar en el mismo puerto"""
+    definiciones = _definiciones()
+    for definicion in definiciones[:2]:
+        definicion.update({"proxy_sensor_temperatura": "socket",
+                           "red": {"puertos": {"temperatura": 12001}}})
+
+    with pytest.raises(ValueError, match="comparten el puerto de escucha 12001"):
+        crear_zonas(definiciones, [0, 1, 2], RelojReal())
+
+    definiciones[1]["red"]["puertos"]["temperatura"] = 12002
+    Configurador.validar_zonas(definiciones)
+
+
+# ZTR-007: Sensor socket sin datos
+def test_sensor_socket_callado_no_demora_las_demas_zonas(configuracion):
+    """La lectura socket de la zona espera a lo sumo la espera del trabajador"""
+    definiciones = _definiciones()
+    definiciones[0].update({"proxy_sensor_temperatura": "socket",
+                            "red": {"puertos": {"temperatura": 0}}})
+    tabla = TablaEstado(["living", "cocina", "dormitorio"])
+    zonas = crear_zonas(definiciones, [0, 1, 2], RelojReal(), espera=0.1)
+
+    inicio = time.monotonic()
+    TrabajadorZonas(zonas, tabla).ciclo()
+    duracion = time.monotonic() - inicio
+
+    _, cocina, _ = (estado for _, estado in tabla.leer_todas())
+    tabla.liberar()
+    assert duracion < 2
+    assert cocina.climatizador == "enfriando"
+
+
+# ZTR-008: Evaluacion por valor
+def test_misma_temperatura_no_reevalua_el_climatizador():
+    """Cada lectura arma una instantanea nueva: se comparan las temperaturas"""
+    lecturas = iter([20.0, 20.0, 20.0, 21.0, 21.0])
+    ambiente = Mock()
+    ambiente.obtener_instantanea.side_effect = \
+        lambda: EstadoAmbiente(next(lecturas), 24.0, "ambiente", time.monotonic())
+    climatizador = Mock()
+    climatizador.accionar_climatizador.side_effect = [True, False, True, True]
+    tabla = Mock()
+    trabajador = TrabajadorZonas([Zona("living", 0, Mock(), ambiente, climatizador)], tabla)
+
+    for _ in range(5):
+        trabajador.ciclo()
+
+    # 20 (resuelta), 21 (retenida), 21 (reintento); las lecturas repetidas se omiten
+    assert climatizador.accionar_climatizador.call_count == 3
@@ -9,6 +9,15 @@ Simuladores (clientes socket):
     - simulador_temperatura: Envia lecturas de temperatura
     - simulador_selector_temperatura: Alterna modo ambiente/deseada
     - simulador_seteo_temperatura_deseada: Ajusta temperatura objetivo
+    - sensor_programable: Cliente para enviar lecturas desde codigo
+
+Generador de carga (asyncio, no interactivo):
+    - generador_carga: Emula N sensores con tasas y formas de onda
+    - formas_onda: Escalon, rampa, senoidal, ruido, secuencia y traza
+
+Planta simulada (lazo cerrado):
+    - modelo_termico: Habitaciones de primer orden vectorizadas con NumPy
+    - simulador_habitacion: Lee el actuador y envia la temperatura resultante
 
 Displays (servidores socket):
     - cartel_bateria: Muestra tension de bateria
@@ -0,0 +1,86 @@
+"""
+Display del estado del termostato desde memoria compartida.
+
+A diferencia de cartel_temperatura, cartel_bateria y cartel_climatizador
+(un servidor socket por valor), lee todas las filas de la tabla de
+estado compartido con LectorEstado: no abre sockets ni hace llamadas al
+sistema por lectura, y solo redibuja cuando alguna fila cambio.
+
+Requiere que el termostato corra en el mismo equipo con la seccion
+"estado_compartido" en termostato.json (o el nombre de la tabla que
+informa el supervisor multi-zona).
+
+Uso:
+    python -m actores_externos.cartel_estado
+    python -m actores_externos.cartel_estado --nombre termostato --periodo 0.5
+
+Patron de Diseno:
+    - Observer (por sondeo): Muestra el estado cuando cambia su version
+"""
+import argparse
+import time
+
+from estado_compartido.lector import LectorEstado
+from servicios_aplicacion.terminal import TerminalAnsi
+
+
+def formatear(nombre, estado):
+    """
+    Arma la linea de una fila.
+
+    Args:
+        nombre (str): Nombre de la fila.
+        estado (EstadoTermostato): Estado leido (None si no se publico).
+
+    Returns:
+        str: Linea a mostrar.
+    """
+    if estado is None:
+        return "{:<12} sin datos".format(nombre)
+    return "{:<12} ambiente={} deseada={} bateria={} {} climatizador={}".format(
+        nombre, estado.temperatura_ambiente, estado.temperatura_deseada,
+        estado.nivel_de_carga, "BAJA" if estado.carga_baja else "NORMAL",
+        estado.climatizador)
+
+
+def mostrar(lector, terminal, periodo, ciclos=None):
+    """
+    Redibuja el estado cada vez que alguna fila cambia.
+
+    Args:
+        lector (LectorEstado): Lector adjuntado a la tabla.
+        terminal (TerminalAnsi): Consola destino.
+        periodo (float): Segundos entre sondeos.
+        ciclos (int): Cantidad de sondeos (None = sin fin).
+    """
+    versiones = None
+    while ciclos is None or ciclos > 0:
+        actuales = [lector.version(fila) for fila in range(lector.filas)]
+        if actuales != versiones:
+            versiones = actuales
+            terminal.limpiar()
+            terminal.titulo("Estado ({})".format(lector.nombre))
+            for nombre, estado in lector.leer_todas():
+                terminal.escribir(formatear(nombre, estado))
+            terminal.volcar()
+        if ciclos is not None:
+            ciclos -= 1
+        time.sleep(periodo)
+
+
+def main(argv=None):
+    """Punto de entrada de linea de comandos."""
+    parser = argparse.ArgumentParser(description="Estado del termostato en memoria compartida")
+    parser.add_argument("--nombre", default="termostato", help="nombre del bloque compartido")
+    parser.add_argument("--periodo", type=float, default=1.0, help="segundos entre sondeos")
+    argumentos = parser.parse_args(argv)
+
+    with LectorEstado(argumentos.nombre) as lector:
+        try:
+            mostrar(lector, TerminalAnsi(), argumentos.periodo)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Display comun de los carteles socket.
+
+Los carteles (temperatura, bateria, climatizador) reciben los valores
+de los visualizadores socket del termostato por conexiones
+persistentes, una linea por valor. Un ServidorSocketNoBloqueante
+multiplexa las conexiones y reensambla las lineas; la pantalla se
+redibuja en una sola escritura y solo cuando llega un valor nuevo.
+
+Patron de Diseno:
+    - Template Method: Los carteles solo definen titulo y puerto
+"""
+import argparse
+
+from agentes_sensores.servidor_socket import ServidorSocketNoBloqueante
+from servicios_aplicacion.terminal import TerminalAnsi
+
+
+def dibujar(terminal, titulo, valor):
+    """
+    Redibuja el cartel con el ultimo valor recibido.
+
+    Args:
+        terminal (TerminalAnsi): Consola destino.
+        titulo (str): Titulo del cartel.
+        valor (str): Ultimo valor recibido (None si todavia no hubo).
+    """
+    terminal.limpiar()
+    terminal.escribir(titulo)
+    terminal.escribir("->  {}".format(valor))
+    terminal.escribir()
+    terminal.volcar()
+
+
+def mostrar(servidor, terminal, titulo, periodo=1.0, ciclos=None):
+    """
+    Espera valores y redibuja el cartel cada vez que llega alguno.
+
+    Si en un sondeo llegan varias lineas se muestra la ultima.
+
+    Args:
+        servidor (ServidorSocketNoBloqueante): Servidor por lineas.
+        terminal (TerminalAnsi): Consola destino.
+        titulo (str): Titulo del cartel.
+        periodo (float): Segundos maximos de espera por sondeo.
+        ciclos (int): Cantidad de sondeos (None = sin fin).
+
+    Returns:
+        str: Ultimo valor mostrado.
+    """
+    valor = None
+    dibujar(terminal, titulo, valor)
+    while ciclos is None or ciclos > 0:
+        mensajes = servidor.sondear(timeout=periodo)
+        if mensajes:
+            valor = mensajes[-1]
+            dibujar(terminal, titulo, valor)
+        if ciclos is not None:
+            ciclos -= 1
+    return valor
+
+
+def ejecutar_cartel(titulo, puerto, argv=None):
+    """
+    Punto de entrada comun de los carteles.
+
+    Args:
+        titulo (str): Titulo del cartel.
+        puerto (int): Puerto por defecto del cartel.
+        argv (list): Argumentos de linea de comandos (None = sys.argv).
+    """
+    parser = argparse.ArgumentParser(description="Cartel de {}".format(titulo.lower()))
+    parser.add_argument("--host", default="localhost", help="direccion de escucha")
+    parser.add_argument("--puerto", type=int, default=puerto, help="puerto de escucha")
+    argumentos = parser.parse_args(argv)
+
+    servidor = ServidorSocketNoBloqueante(argumentos.host, argumentos.puerto, por_lineas=True)
+    try:
+        mostrar(servidor, TerminalAnsi(), titulo)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.cerrar()
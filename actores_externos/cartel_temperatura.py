@@ -2,41 +2,19 @@
 Display de temperatura via socket TCP.
 
 Este script actua como servidor socket que recibe y muestra
-en consola las lecturas de temperatura enviadas por el termostato.
-"""
-# pylint: disable=invalid-name,duplicate-code
-# Las variables de script (temperatura, etc.) son mutables, no constantes.
-# El codigo duplicado entre carteles es aceptable (scripts independientes).
-
-import socket
-import time
-from os import system
-
+en consola las lecturas de temperatura enviadas por el termostato
+(lineas "ambiente: 25" y "deseada: 22" por una conexion persistente).
 
-servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-servidor.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Permite reusar puerto
-direccion_servidor = ('localhost', 14001)
-servidor.bind(direccion_servidor)
-
-servidor.listen(1)
-temperatura = None
+Uso:
+    python -m actores_externos.cartel_temperatura
+"""
+from actores_externos.cartel_socket import ejecutar_cartel
 
-while True:
-    print("Temperatura")
-    print('-> ', temperatura, "\n")
 
-    conexion, direccion_cliente = servidor.accept()
-    try:
-        while True:
-            datos = conexion.recv(4096)
-            if not datos:
-                break
-            temperatura = str(datos.decode("utf-8"))
+def main(argv=None):
+    """Punto de entrada de linea de comandos."""
+    ejecutar_cartel("Temperatura", 14001, argv)
 
-    except ConnectionError as e:  # FIX: sintaxis correcta
-        print(f"Error en la lectura de la temperatura: {e}")
-    finally:  # FIX: Asegurar cierre de conexión
-        conexion.close()
 
-    time.sleep(1)
-    system("clear")
+if __name__ == "__main__":
+    main()
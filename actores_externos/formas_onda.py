@@ -0,0 +1,287 @@
+"""
+Formas de onda para generar lecturas de sensores simulados.
+
+Cada forma responde el valor del sensor en funcion de los segundos
+transcurridos desde el inicio de la simulacion. Las usa el generador
+de carga para reemplazar los valores que los simuladores interactivos
+piden por consola.
+
+Patron de Diseno:
+    - Strategy: Cada forma es intercambiable detras de AbsFormaOnda
+    - Factory Method: crear_forma() arma la forma desde su especificacion
+"""
+import bisect
+import math
+import random
+from abc import ABCMeta, abstractmethod
+
+
+class AbsFormaOnda(metaclass=ABCMeta):
+    """Interfaz de las formas de onda."""
+
+    @abstractmethod
+    def valor(self, instante):
+        """
+        Retorna el valor de la forma en un instante.
+
+        Args:
+            instante (float): Segundos desde el inicio de la simulacion.
+
+        Returns:
+            Valor del sensor (float, o str para secuencias de comandos).
+        """
+
+
+# pylint: disable=too-few-public-methods
+class FormaConstante(AbsFormaOnda):
+    """
+    Valor fijo.
+
+    Args:
+        valor: Valor entregado en todo instante.
+    """
+
+    def __init__(self, valor):
+        """Guarda el valor fijo."""
+        self._valor = valor
+
+    def valor(self, instante):
+        """Retorna el valor fijo."""
+        return self._valor
+
+
+# pylint: disable=too-few-public-methods
+class FormaEscalon(AbsFormaOnda):
+    """
+    Salto de un valor inicial a uno final en un instante dado.
+
+    Args:
+        inicial (float): Valor antes del salto.
+        final (float): Valor desde el salto en adelante.
+        instante_salto (float): Segundos hasta el salto.
+    """
+
+    def __init__(self, inicial, final, instante_salto):
+        """Guarda los valores y el instante del salto."""
+        self._inicial = inicial
+        self._final = final
+        self._instante_salto = instante_salto
+
+    def valor(self, instante):
+        """Retorna el valor inicial antes del salto y el final desde el salto."""
+        return self._final if instante >= self._instante_salto else self._inicial
+
+
+# pylint: disable=too-few-public-methods
+class FormaRampa(AbsFormaOnda):
+    """
+    Variacion lineal, opcionalmente acotada.
+
+    Args:
+        inicial (float): Valor en el instante 0.
+        pendiente (float): Unidades por segundo.
+        minimo (float): Cota inferior (None = sin cota).
+        maximo (float): Cota superior (None = sin cota).
+    """
+
+    def __init__(self, inicial, pendiente, minimo=None, maximo=None):
+        """Guarda el valor inicial, la pendiente y las cotas."""
+        self._inicial = inicial
+        self._pendiente = pendiente
+        self._minimo = minimo
+        self._maximo = maximo
+
+    def valor(self, instante):
+        """Retorna la rampa en el instante, recortada a las cotas."""
+        valor = self._inicial + self._pendiente * instante
+        if self._minimo is not None:
+            valor = max(valor, self._minimo)
+        if self._maximo is not None:
+            valor = min(valor, self._maximo)
+        return valor
+
+
+# pylint: disable=too-few-public-methods
+class FormaSenoidal(AbsFormaOnda):
+    """
+    Oscilacion senoidal alrededor de una media.
+
+    Args:
+        media (float): Valor medio.
+        amplitud (float): Desvio maximo respecto de la media.
+        periodo (float): Segundos por ciclo (> 0).
+        fase (float): Desfase en radianes.
+
+    Raises:
+        ValueError: Si periodo <= 0.
+    """
+
+    def __init__(self, media, amplitud, periodo, fase=0.0):
+        """Guarda la media, la amplitud, la frecuencia angular y la fase."""
+        if periodo <= 0:
+            raise ValueError("periodo debe ser > 0, recibido: {}".format(periodo))
+        self._media = media
+        self._amplitud = amplitud
+        self._omega = 2 * math.pi / periodo
+        self._fase = fase
+
+    def valor(self, instante):
+        """Retorna la senoidal en el instante."""
+        return self._media + self._amplitud * math.sin(self._omega * instante + self._fase)
+
+
+# pylint: disable=too-few-public-methods
+class FormaRuido(AbsFormaOnda):
+    """
+    Ruido gaussiano sumado a otra forma (o a una media fija).
+
+    Args:
+        desvio (float): Desvio estandar del ruido.
+        base (AbsFormaOnda): Forma a la que se suma el ruido; si es None
+            se usa una constante igual a media.
+        media (float): Valor medio cuando no hay base.
+        semilla (int): Semilla para reproducir la secuencia.
+    """
+
+    def __init__(self, desvio, base=None, media=0.0, semilla=None):
+        """Guarda el desvio, la forma base y el generador aleatorio."""
+        self._desvio = desvio
+        self._base = base if base is not None else FormaConstante(media)
+        self._aleatorio = random.Random(semilla)
+
+    def valor(self, instante):
+        """Retorna la forma base mas una muestra de ruido gaussiano."""
+        return self._base.valor(instante) + self._aleatorio.gauss(0.0, self._desvio)
+
+
+# pylint: disable=too-few-public-methods
+class FormaSecuencia(AbsFormaOnda):
+    """
+    Recorre una lista de valores, uno por intervalo.
+
+    Sirve para los comandos de seteo ("aumentar", "disminuir") y de
+    selector ("ambiente", "deseada").
+
+    Args:
+        valores (list): Valores a recorrer en orden (ciclicamente).
+        intervalo (float): Segundos que dura cada valor (> 0).
+
+    Raises:
+        ValueError: Si valores esta vacia o intervalo <= 0.
+    """
+
+    def __init__(self, valores, intervalo=1.0):
+        """Guarda los valores y la duracion de cada uno."""
+        if not valores:
+            raise ValueError("La secuencia necesita al menos un valor")
+        if intervalo <= 0:
+            raise ValueError("intervalo debe ser > 0, recibido: {}".format(intervalo))
+        self._valores = list(valores)
+        self._intervalo = intervalo
+
+    def valor(self, instante):
+        """Retorna el valor del intervalo que contiene al instante."""
+        return self._valores[int(instante / self._intervalo) % len(self._valores)]
+
+
+class FormaTraza(AbsFormaOnda):
+    """
+    Reproduce una traza grabada de (instante, valor).
+
+    En cada instante entrega la ultima muestra cuyo instante no es
+    posterior (retencion de orden cero).
+
+    Args:
+        muestras (list): Pares (instante, valor) ordenados por instante.
+        bucle (bool): Si es True, la traza se repite al terminar; si no,
+            se mantiene el ultimo valor.
+
+    Raises:
+        ValueError: Si no hay muestras.
+    """
+
+    def __init__(self, muestras, bucle=True):
+        """Guarda los instantes relativos a la primera muestra y sus valores."""
+        if not muestras:
+            raise ValueError("La traza necesita al menos una muestra")
+        inicio = muestras[0][0]
+        self._instantes = [instante - inicio for instante, _ in muestras]
+        self._valores = [valor for _, valor in muestras]
+        self._bucle = bucle
+        self._duracion = self._instantes[-1]
+
+    @classmethod
+    def desde_archivo(cls, ruta, periodo=1.0, bucle=True):
+        """
+        Carga una traza de texto.
+
+        Cada linea tiene "instante valor" o solo "valor"; en el segundo
+        caso las muestras se suponen separadas por periodo segundos.
+        Las lineas vacias y las que empiezan con # se ignoran.
+
+        Args:
+            ruta (str): Archivo de la traza.
+            periodo (float): Separacion de las muestras sin instante.
+            bucle (bool): Repetir la traza al terminar.
+
+        Returns:
+            FormaTraza: Traza cargada.
+        """
+        muestras = []
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            for linea in archivo:
+                campos = linea.split()
+                if not campos or campos[0].startswith("#"):
+                    continue
+                if len(campos) == 1:
+                    muestras.append((len(muestras) * periodo, float(campos[0])))
+                else:
+                    muestras.append((float(campos[0]), float(campos[1])))
+        return cls(muestras, bucle)
+
+    def valor(self, instante):
+        """Retorna la ultima muestra no posterior al instante."""
+        if self._bucle and self._duracion > 0:
+            instante = instante % self._duracion
+        indice = bisect.bisect_right(self._instantes, instante) - 1
+        return self._valores[max(indice, 0)]
+
+
+FORMAS = {
+    "constante": FormaConstante,
+    "escalon": FormaEscalon,
+    "rampa": FormaRampa,
+    "senoidal": FormaSenoidal,
+    "secuencia": FormaSecuencia,
+}
+
+
+def crear_forma(especificacion):
+    """
+    Crea una forma de onda desde su especificacion.
+
+    Args:
+        especificacion (dict): {"tipo": ..., parametros}. Tipos:
+            "constante" (valor), "escalon" (inicial, final, instante_salto),
+            "rampa" (inicial, pendiente, minimo, maximo),
+            "senoidal" (media, amplitud, periodo, fase),
+            "ruido" (desvio, media, semilla, base: otra especificacion),
+            "secuencia" (valores, intervalo),
+            "traza" (archivo, periodo, bucle).
+
+    Returns:
+        AbsFormaOnda: Forma creada.
+
+    Raises:
+        ValueError: Si el tipo es desconocido.
+    """
+    parametros = dict(especificacion)
+    tipo = parametros.pop("tipo", None)
+    if tipo == "ruido":
+        base = parametros.pop("base", None)
+        return FormaRuido(base=crear_forma(base) if base else None, **parametros)
+    if tipo == "traza":
+        return FormaTraza.desde_archivo(parametros.pop("archivo"), **parametros)
+    if tipo not in FORMAS:
+        raise ValueError("Forma de onda desconocida: {}".format(tipo))
+    return FORMAS[tipo](**parametros)
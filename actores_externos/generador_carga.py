@@ -0,0 +1,355 @@
+"""
+Generador de carga no interactivo para el termostato.
+
+Reemplaza a los simuladores interactivos cuando se quiere estresar el
+camino de ingreso de lecturas: emula N sensores a la vez, cada uno con
+su tasa, su forma de onda (escalon, rampa, senoidal, ruido, secuencia o
+traza grabada) y su cantidad de conexiones concurrentes, usando asyncio
+para sostener miles de lecturas por segundo desde un solo proceso.
+Lee host y puertos del mismo simuladores_config.json.
+
+Modos de envio:
+    - "por_lectura": abre una conexion, envia y la cierra, como los
+      simuladores (proxies socket de temperatura y bateria). Con lote > 1
+      se envian varios valores por conexion, separados por espacios.
+    - "persistente": mantiene la conexion abierta y envia un valor por
+      linea (entradas de seteo y selector, que aceptan varios comandos
+      por conexion).
+
+Uso (desde la raiz del repositorio):
+    python -m actores_externos.generador_carga actores_externos/escenario_carga.json
+    python -m actores_externos.generador_carga escenario.json --duracion 30 --host 192.168.1.50
+
+Formato del escenario:
+    {
+      "duracion": 10,
+      "sensores": [
+        {"sensor": "temperatura", "tasa": 2000, "conexiones": 4, "lote": 1,
+         "cantidad": 1, "forma": {"tipo": "senoidal", "media": 22,
+                                  "amplitud": 4, "periodo": 60}},
+        {"sensor": "seteo_temperatura", "tasa": 5,
+         "forma": {"tipo": "secuencia", "valores": ["aumentar", "disminuir"]}}
+      ]
+    }
+
+Patron de Diseno:
+    - Test Double (Fake): Reemplaza a los sensores fisicos
+    - Strategy: La forma de onda de cada sensor es intercambiable
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from actores_externos.formas_onda import crear_forma
+
+
+MODOS = ("por_lectura", "persistente")
+MODOS_DEFAULT = {
+    "temperatura": "por_lectura",
+    "bateria": "por_lectura",
+    "seteo_temperatura": "persistente",
+    "selector_temperatura": "persistente",
+}
+
+
+def cargar_configuracion(archivo="simuladores_config.json"):
+    """
+    Carga simuladores_config.json.
+
+    Busca el archivo en la ruta dada, en el directorio padre (como los
+    simuladores) y junto a este modulo.
+
+    Args:
+        archivo (str): Ruta del archivo de configuracion.
+
+    Returns:
+        dict: Configuracion cargada.
+
+    Raises:
+        FileNotFoundError: Si no se encuentra el archivo.
+    """
+    candidatos = [
+        archivo,
+        os.path.join("..", archivo),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), os.path.basename(archivo)),
+    ]
+    for candidato in candidatos:
+        if os.path.exists(candidato):
+            with open(candidato, "r", encoding="utf-8") as configuracion:
+                return json.load(configuracion)
+    raise FileNotFoundError("No se encontro {} en: {}".format(archivo, candidatos))
+
+
+def _formatear(valor):
+    """Texto a enviar: los comandos van tal cual y los numeros con 3 decimales."""
+    if isinstance(valor, str):
+        return valor
+    return "{:.3f}".format(valor)
+
+
+class EstadisticasSensor:
+    """
+    Contadores de envio de un sensor.
+
+    Attributes:
+        nombre (str): Identificador del sensor.
+        enviadas (int): Lecturas enviadas con exito.
+        errores (int): Envios fallidos (conexion rechazada, timeout).
+        duracion (float): Segundos efectivos de envio.
+    """
+
+    def __init__(self, nombre):
+        """Inicia los contadores del sensor nombre en cero."""
+        self.nombre = nombre
+        self.enviadas = 0
+        self.errores = 0
+        self.duracion = 0.0
+
+    @property
+    def tasa_lograda(self):
+        """float: Lecturas por segundo efectivamente enviadas."""
+        return self.enviadas / self.duracion if self.duracion > 0 else 0.0
+
+    def como_dict(self):
+        """Retorna las estadisticas como diccionario."""
+        return {
+            "nombre": self.nombre,
+            "enviadas": self.enviadas,
+            "errores": self.errores,
+            "duracion": self.duracion,
+            "tasa_lograda": self.tasa_lograda,
+        }
+
+
+class SensorCarga:
+    """
+    Sensor emulado que envia lecturas a tasa fija sobre asyncio.
+
+    La tasa total se reparte entre las conexiones, que envian desfasadas
+    para no llegar todas juntas. Los envios siguen un calendario
+    absoluto: si el receptor se atrasa, los pendientes salen seguidos
+    hasta recuperar el ritmo, y lo que no se llego a enviar al cumplirse
+    la duracion se descarta (la tasa lograda lo refleja).
+
+    Args:
+        nombre (str): Identificador del sensor (para el reporte).
+        host (str): Host del termostato.
+        puerto (int): Puerto del proxy o entrada.
+        forma (AbsFormaOnda): Forma de onda de los valores.
+        tasa (float): Lecturas por segundo (> 0).
+        conexiones (int): Conexiones concurrentes (>= 1).
+        modo (str): "por_lectura" o "persistente".
+        lote (int): Valores por envio (>= 1).
+        timeout (float): Segundos maximos para conectar y enviar.
+
+    Raises:
+        ValueError: Si algun parametro esta fuera de rango.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(self, nombre, host, puerto, forma, tasa, conexiones=1,
+                 modo="por_lectura", lote=1, timeout=1.0):
+        if tasa <= 0:
+            raise ValueError("tasa debe ser > 0, recibido: {}".format(tasa))
+        if conexiones < 1 or lote < 1:
+            raise ValueError("conexiones y lote deben ser >= 1")
+        if modo not in MODOS:
+            raise ValueError("Modo de envio desconocido: {}".format(modo))
+        self._host = host
+        self._puerto = puerto
+        self._forma = forma
+        self._tasa = tasa
+        self._conexiones = conexiones
+        self._modo = modo
+        self._lote = lote
+        self._timeout = timeout
+        self.estadisticas = EstadisticasSensor(nombre)
+
+    async def ejecutar(self, duracion):
+        """
+        Envia lecturas durante duracion segundos.
+
+        Args:
+            duracion (float): Segundos de envio.
+
+        Returns:
+            EstadisticasSensor: Contadores del sensor.
+        """
+        reloj = asyncio.get_running_loop().time
+        inicio = reloj()
+        envios = round(duracion * self._tasa / self._lote)
+        await asyncio.gather(*(self._emitir(indice, envios, inicio, inicio + duracion)
+                               for indice in range(self._conexiones)))
+        self.estadisticas.duracion = reloj() - inicio
+        return self.estadisticas
+
+    async def _emitir(self, indice, envios, inicio, fin):
+        """Bucle de una conexion: envia los lotes indice, indice + conexiones, ..."""
+        reloj = asyncio.get_running_loop().time
+        escritor = None
+        try:
+            for numero in range(indice, envios, self._conexiones):
+                instante = numero * self._lote / self._tasa
+                espera = inicio + instante - reloj()
+                if espera > 0:
+                    await asyncio.sleep(espera)
+                elif reloj() >= fin:
+                    break
+                valores = [_formatear(self._forma.valor(instante + k / self._tasa))
+                           for k in range(self._lote)]
+                try:
+                    escritor = await self._enviar(valores, escritor)
+                    self.estadisticas.enviadas += len(valores)
+                except (OSError, asyncio.TimeoutError):
+                    self.estadisticas.errores += 1
+                    escritor = await self._cerrar(escritor)
+        finally:
+            await self._cerrar(escritor)
+
+    async def _enviar(self, valores, escritor):
+        """
+        Envia un lote de valores segun el modo.
+
+        Returns:
+            asyncio.StreamWriter: Conexion abierta (modo persistente) o None.
+        """
+        if escritor is None:
+            _, escritor = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._puerto), self._timeout)
+        if self._modo == "persistente":
+            escritor.write(("\n".join(valores) + "\n").encode("utf-8"))
+            await asyncio.wait_for(escritor.drain(), self._timeout)
+            return escritor
+        escritor.write(" ".join(valores).encode("utf-8"))
+        await asyncio.wait_for(escritor.drain(), self._timeout)
+        return await self._cerrar(escritor)
+
+    @staticmethod
+    async def _cerrar(escritor):
+        """Cierra la conexion si esta abierta; siempre retorna None."""
+        if escritor is not None:
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except OSError:
+                pass
+        return None
+
+
+class GeneradorCarga:
+    """
+    Ejecuta varios sensores emulados en paralelo sobre un mismo loop.
+
+    Args:
+        sensores (list): Instancias de SensorCarga.
+    """
+
+    def __init__(self, sensores):
+        self._sensores = list(sensores)
+
+    @classmethod
+    def desde_escenario(cls, escenario, configuracion, host=None):
+        """
+        Arma el generador desde un escenario y simuladores_config.json.
+
+        Cada entrada de escenario["sensores"] indica el puerto por nombre
+        ("sensor", clave de raspberry_pi.puertos) o por numero ("puerto"),
+        y "cantidad" crea varios sensores iguales.
+
+        Args:
+            escenario (dict): Escenario de carga (ver docstring del modulo).
+            configuracion (dict): Contenido de simuladores_config.json.
+            host (str): Host que reemplaza al de la configuracion.
+
+        Returns:
+            GeneradorCarga: Generador listo para ejecutar.
+        """
+        raspberry = configuracion["raspberry_pi"]
+        host = host or raspberry["host"]
+        sensores = []
+        for entrada in escenario["sensores"]:
+            nombre = entrada.get("sensor", "puerto_{}".format(entrada.get("puerto")))
+            puerto = entrada.get("puerto", raspberry["puertos"].get(nombre))
+            for numero in range(entrada.get("cantidad", 1)):
+                sensores.append(SensorCarga(
+                    nombre="{}#{}".format(nombre, numero),
+                    host=host,
+                    puerto=puerto,
+                    forma=crear_forma(entrada["forma"]),
+                    tasa=entrada["tasa"],
+                    conexiones=entrada.get("conexiones", 1),
+                    modo=entrada.get("modo", MODOS_DEFAULT.get(nombre, "por_lectura")),
+                    lote=entrada.get("lote", 1),
+                    timeout=entrada.get("timeout", 1.0),
+                ))
+        return cls(sensores)
+
+    async def ejecutar(self, duracion):
+        """
+        Ejecuta todos los sensores durante duracion segundos.
+
+        Args:
+            duracion (float): Segundos de envio.
+
+        Returns:
+            list: EstadisticasSensor de cada sensor, en orden.
+        """
+        return await asyncio.gather(*(sensor.ejecutar(duracion) for sensor in self._sensores))
+
+    def correr(self, duracion):
+        """Version sincronica de ejecutar(): crea y cierra su propio loop."""
+        return asyncio.run(self.ejecutar(duracion))
+
+
+def formatear_reporte(estadisticas):
+    """
+    Arma la tabla de resultados por sensor.
+
+    Args:
+        estadisticas (list): EstadisticasSensor de cada sensor.
+
+    Returns:
+        str: Tabla de texto lista para imprimir.
+    """
+    lineas = ["{:<28} {:>10} {:>8} {:>12}".format("sensor", "enviadas", "errores", "lecturas/s")]
+    for estadistica in estadisticas:
+        lineas.append("{:<28} {:>10} {:>8} {:>12.1f}".format(
+            estadistica.nombre, estadistica.enviadas, estadistica.errores,
+            estadistica.tasa_lograda))
+    lineas.append("{:<28} {:>10} {:>8} {:>12.1f}".format(
+        "total", sum(e.enviadas for e in estadisticas), sum(e.errores for e in estadisticas),
+        sum(e.tasa_lograda for e in estadisticas)))
+    return "\n".join(lineas)
+
+
+def main(argv=None):
+    """Punto de entrada de linea de comandos."""
+    parser = argparse.ArgumentParser(description="Generador de carga para el termostato")
+    parser.add_argument("escenario", help="archivo JSON con el escenario de carga")
+    parser.add_argument("--config", default="simuladores_config.json",
+                        help="configuracion de host y puertos")
+    parser.add_argument("--host", help="host que reemplaza al de la configuracion")
+    parser.add_argument("--duracion", type=float,
+                        help="segundos de envio (reemplaza al del escenario)")
+    parser.add_argument("--json", dest="archivo_json",
+                        help="guarda las estadisticas en este archivo JSON")
+    argumentos = parser.parse_args(argv)
+
+    with open(argumentos.escenario, "r", encoding="utf-8") as archivo:
+        escenario = json.load(archivo)
+    generador = GeneradorCarga.desde_escenario(escenario,
+                                               cargar_configuracion(argumentos.config),
+                                               argumentos.host)
+    estadisticas = generador.correr(argumentos.duracion or escenario.get("duracion", 10))
+
+    print(formatear_reporte(estadisticas))
+    if argumentos.archivo_json:
+        with open(argumentos.archivo_json, "w", encoding="utf-8") as archivo:
+            json.dump([e.como_dict() for e in estadisticas], archivo, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""
+Modelo termico de habitaciones para pruebas de lazo cerrado.
+
+Simula N habitaciones en paralelo, cada una como una masa termica de
+primer orden acoplada al exterior:
+
+    dT/dt = (T_eq - T) / constante_tiempo
+    T_eq  = T_exterior + salto_calefaccion   (calentando)
+          = T_exterior - salto_refrigeracion (enfriando)
+          = T_exterior                       (apagado)
+
+constante_tiempo es R*C (resistencia termica por capacidad) y cada
+salto es la potencia del equipo por R: los grados que el equipo
+sostiene por encima o por debajo del exterior en regimen. Cada paso usa
+la solucion exacta de la ecuacion (no Euler), de modo que el resultado
+no depende del tamano del paso, y se calcula sobre arreglos NumPy para
+todas las habitaciones a la vez.
+
+El modo de cada habitacion lo fijan las acciones del climatizador
+("calentar", "enfriar", "apagar"), las mismas que escribe
+ActuadorClimatizadorGeneral; las temperaturas resultantes alimentan a
+los proxies de temperatura (ProxySensorHabitacion en el mismo proceso o
+simulador_habitacion por socket).
+
+Patron de Diseno:
+    - Test Double (Fake): Reemplaza a la habitacion y al equipo reales
+    - Adapter: ActuadorHabitacion y ProxySensorHabitacion exponen una
+      habitacion del modelo con las interfaces del termostato
+
+Dependencias:
+    Requiere NumPy (dependencia opcional, extra "filtros"). Si no esta
+    instalado el modulo se puede importar, pero crear un modelo lanza
+    ImportError.
+"""
+from entidades.abs_actuador_climatizador import AbsProxyActuadorClimatizador
+from entidades.abs_sensor_temperatura import AbsProxySensorTemperatura
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+
+# Modo del equipo que corresponde a cada accion del climatizador
+MODOS = {"apagar": 0, "calentar": 1, "enfriar": -1}
+
+
+class ModeloTermico:
+    """
+    Habitaciones de primer orden simuladas de forma vectorizada.
+
+    Los parametros aceptan un escalar (igual para todas las habitaciones)
+    o un arreglo de largo habitaciones. temperatura_exterior acepta
+    ademas una forma de onda (AbsFormaOnda) que se evalua en el instante
+    del modelo en cada paso.
+
+    Args:
+        habitaciones (int): Cantidad de habitaciones.
+        temperatura_inicial (float): Temperatura inicial (C).
+        temperatura_exterior: Temperatura exterior (C) o forma de onda.
+        constante_tiempo (float): R*C en segundos.
+        salto_calefaccion (float): Grados sobre el exterior en regimen calentando.
+        salto_refrigeracion (float): Grados bajo el exterior en regimen enfriando.
+        ruido_medicion (float): Desvio estandar del ruido de leer() (C).
+        semilla (int): Semilla del generador de ruido.
+
+    Raises:
+        ImportError: Si NumPy no esta instalado.
+        ValueError: Si habitaciones < 1 o alguna constante de tiempo <= 0.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(self, habitaciones=1, temperatura_inicial=20.0, temperatura_exterior=10.0,
+                 constante_tiempo=3600.0, salto_calefaccion=20.0, salto_refrigeracion=15.0,
+                 ruido_medicion=0.0, semilla=None):
+        """
+        Inicializa las habitaciones apagadas en temperatura_inicial.
+
+        Args:
+            habitaciones (int): Cantidad de habitaciones.
+            temperatura_inicial (float): Temperatura inicial (C).
+            temperatura_exterior: Temperatura exterior (C) o forma de onda.
+            constante_tiempo (float): R*C en segundos.
+            salto_calefaccion (float): Grados sobre el exterior calentando.
+            salto_refrigeracion (float): Grados bajo el exterior enfriando.
+            ruido_medicion (float): Desvio estandar del ruido de leer() (C).
+            semilla (int): Semilla del generador de ruido.
+
+        Raises:
+            ImportError: Si NumPy no esta instalado.
+            ValueError: Si habitaciones < 1 o alguna constante de tiempo <= 0.
+        """
+        if np is None:
+            raise ImportError("El modelo termico requiere NumPy: pip install numpy")
+        if habitaciones < 1:
+            raise ValueError("habitaciones debe ser >= 1, recibido: {}".format(habitaciones))
+        self._temperaturas = self._por_habitacion(temperatura_inicial, habitaciones).copy()
+        self._constante_tiempo = self._por_habitacion(constante_tiempo, habitaciones)
+        if np.any(self._constante_tiempo <= 0):
+            raise ValueError("constante_tiempo debe ser > 0")
+        self._salto_calefaccion = self._por_habitacion(salto_calefaccion, habitaciones)
+        self._salto_refrigeracion = self._por_habitacion(salto_refrigeracion, habitaciones)
+        self._exterior = temperatura_exterior
+        self._ruido_medicion = ruido_medicion
+        self._generador = np.random.default_rng(semilla)
+        self._modos = np.zeros(habitaciones, dtype=np.int8)
+        self._tiempo_calefaccion = np.zeros(habitaciones)
+        self._tiempo_refrigeracion = np.zeros(habitaciones)
+        self._instante = 0.0
+        self._paso_cacheado = None
+        self._decaimiento = None
+
+    @staticmethod
+    def _por_habitacion(valor, habitaciones):
+        """Expande un escalar o valida un arreglo de largo habitaciones."""
+        return np.broadcast_to(np.asarray(valor, dtype=np.float64), (habitaciones,))
+
+    @property
+    def habitaciones(self):
+        """int: Cantidad de habitaciones simuladas."""
+        return self._temperaturas.shape[0]
+
+    @property
+    def instante(self):
+        """float: Segundos simulados desde la creacion."""
+        return self._instante
+
+    @property
+    def temperaturas(self):
+        """numpy.ndarray: Temperaturas actuales (vista de solo lectura)."""
+        vista = self._temperaturas.view()
+        vista.flags.writeable = False
+        return vista
+
+    @property
+    def modos(self):
+        """numpy.ndarray: Modo de cada equipo: 1 calentando, -1 enfriando, 0 apagado."""
+        vista = self._modos.view()
+        vista.flags.writeable = False
+        return vista
+
+    @property
+    def tiempo_calefaccion(self):
+        """numpy.ndarray: Segundos acumulados calentando por habitacion."""
+        return self._tiempo_calefaccion.copy()
+
+    @property
+    def tiempo_refrigeracion(self):
+        """numpy.ndarray: Segundos acumulados enfriando por habitacion."""
+        return self._tiempo_refrigeracion.copy()
+
+    def temperatura_exterior(self):
+        """
+        Retorna la temperatura exterior en el instante actual.
+
+        Returns:
+            float o numpy.ndarray: Temperatura exterior (C).
+        """
+        if hasattr(self._exterior, "valor"):
+            return self._exterior.valor(self._instante)
+        return self._exterior
+
+    def accionar(self, accion, indice=None):
+        """
+        Aplica una accion del climatizador a una o todas las habitaciones.
+
+        Args:
+            accion (str): "calentar", "enfriar" o "apagar".
+            indice: Habitacion, arreglo de indices/mascara, o None para todas.
+
+        Raises:
+            ValueError: Si la accion es desconocida.
+        """
+        if accion not in MODOS:
+            raise ValueError("Accion desconocida: {}".format(accion))
+        if indice is None:
+            self._modos[:] = MODOS[accion]
+        else:
+            self._modos[indice] = MODOS[accion]
+
+    def fijar_modos(self, modos):
+        """
+        Fija el modo de todas las habitaciones de una vez.
+
+        Args:
+            modos: Arreglo de largo habitaciones con 1, -1 o 0.
+        """
+        self._modos[:] = np.sign(modos)
+
+    def avanzar(self, segundos):
+        """
+        Avanza la simulacion segundos con los modos actuales.
+
+        La temperatura exterior se evalua al inicio del paso y se
+        mantiene constante durante el.
+
+        Args:
+            segundos (float): Paso de simulacion (> 0).
+
+        Returns:
+            numpy.ndarray: Temperaturas al final del paso (solo lectura).
+        """
+        if segundos <= 0:
+            return self.temperaturas
+        if segundos != self._paso_cacheado:
+            self._decaimiento = np.exp(-segundos / self._constante_tiempo)
+            self._paso_cacheado = segundos
+        calentando = self._modos == 1
+        enfriando = self._modos == -1
+        equilibrio = (self.temperatura_exterior()
+                      + self._salto_calefaccion * calentando
+                      - self._salto_refrigeracion * enfriando)
+        # T = T_eq + (T - T_eq) * exp(-dt/tau), en el lugar
+        self._temperaturas -= equilibrio
+        self._temperaturas *= self._decaimiento
+        self._temperaturas += equilibrio
+        self._tiempo_calefaccion += segundos * calentando
+        self._tiempo_refrigeracion += segundos * enfriando
+        self._instante += segundos
+        return self.temperaturas
+
+    def leer(self, indice=None):
+        """
+        Lee la temperatura como la mediria un sensor (con ruido_medicion).
+
+        Args:
+            indice (int): Habitacion a leer, o None para todas.
+
+        Returns:
+            float o numpy.ndarray: Temperatura(s) medida(s).
+        """
+        valores = self._temperaturas if indice is None else self._temperaturas[indice]
+        if self._ruido_medicion:
+            valores = valores + self._generador.normal(0.0, self._ruido_medicion,
+                                                       np.shape(valores))
+        return float(valores) if indice is not None else np.array(valores)
+
+
+# pylint: disable=too-few-public-methods
+class ActuadorHabitacion(AbsProxyActuadorClimatizador):
+    """
+    Actuador que aplica las acciones a una habitacion del modelo.
+
+    Args:
+        modelo (ModeloTermico): Modelo compartido.
+        indice (int): Habitacion que controla este actuador.
+    """
+
+    def __init__(self, modelo, indice=0):
+        """
+        Inicializa el actuador sobre una habitacion del modelo.
+
+        Args:
+            modelo (ModeloTermico): Modelo compartido.
+            indice (int): Habitacion que controla este actuador.
+        """
+        self._modelo = modelo
+        self._indice = indice
+
+    def accionar_climatizador(self, accion):
+        """
+        Aplica la accion a la habitacion del actuador.
+
+        Args:
+            accion (str): "calentar", "enfriar" o "apagar".
+
+        Raises:
+            ValueError: Si la accion es desconocida.
+        """
+        self._modelo.accionar(accion, self._indice)
+
+
+class ProxySensorHabitacion(AbsProxySensorTemperatura):
+    """
+    Proxy de temperatura que lee una habitacion del modelo.
+
+    Args:
+        modelo (ModeloTermico): Modelo compartido.
+        indice (int): Habitacion que mide este sensor.
+    """
+
+    def __init__(self, modelo, indice=0):
+        """
+        Inicializa el proxy sobre una habitacion del modelo.
+
+        Args:
+            modelo (ModeloTermico): Modelo compartido.
+            indice (int): Habitacion que mide este sensor.
+        """
+        self._modelo = modelo
+        self._indice = indice
+
+    def leer_temperatura(self):
+        """
+        Lee la temperatura de la habitacion (con el ruido de medicion del modelo).
+
+        Returns:
+            float: Temperatura medida.
+        """
+        return self._modelo.leer(self._indice)
@@ -0,0 +1,86 @@
+"""
+Sensor socket programable.
+
+Version programatica de los simuladores de sensores: en lugar de pedir
+los valores por consola, se usa desde codigo (arneses de medicion,
+pruebas de integracion) para enviar lecturas a un proxy socket del
+termostato y conocer el instante exacto de cada envio.
+
+Patron de Diseno:
+    - Test Double (Fake): Reemplaza al sensor fisico del otro lado del socket
+"""
+import json
+import os
+import socket
+import time
+
+
+class SensorSocketProgramable:
+    """
+    Cliente TCP que envia lecturas de un sensor al termostato.
+
+    Cada envio abre una conexion, escribe el valor y la cierra, igual
+    que simulador_temperatura y simulador_bateria.
+
+    Args:
+        host (str): Host donde escucha el proxy del termostato.
+        puerto (int): Puerto del proxy.
+        timeout (float): Segundos maximos para conectar y enviar.
+    """
+
+    def __init__(self, host, puerto, timeout=1.0):
+        """
+        Inicializa el sensor con la direccion del proxy.
+
+        Args:
+            host (str): Host donde escucha el proxy del termostato.
+            puerto (int): Puerto del proxy.
+            timeout (float): Segundos maximos para conectar y enviar.
+        """
+        self._direccion = (host, puerto)
+        self._timeout = timeout
+        self._enviadas = 0
+
+    @property
+    def enviadas(self):
+        """int: Cantidad de lecturas enviadas con exito."""
+        return self._enviadas
+
+    @classmethod
+    def desde_configuracion(cls, nombre_sensor, archivo="simuladores_config.json"):
+        """
+        Crea el sensor con host y puerto de simuladores_config.json.
+
+        Args:
+            nombre_sensor (str): Clave del puerto ("temperatura", "bateria").
+            archivo (str): Ruta del archivo de configuracion; si no existe
+                se busca en el directorio padre, como hacen los simuladores.
+
+        Returns:
+            SensorSocketProgramable: Sensor apuntando al puerto configurado.
+        """
+        if not os.path.exists(archivo):
+            archivo = os.path.join("..", archivo)
+        with open(archivo, "r", encoding="utf-8") as configuracion:
+            raspberry = json.load(configuracion)["raspberry_pi"]
+        return cls(raspberry["host"], raspberry["puertos"][nombre_sensor])
+
+    def enviar(self, *valores):
+        """
+        Envia una o varias lecturas en una misma conexion.
+
+        Args:
+            *valores (float): Lecturas a enviar, separadas por espacios.
+
+        Returns:
+            float: time.monotonic() inmediatamente antes de escribir.
+
+        Raises:
+            OSError: Si no se puede conectar o enviar.
+        """
+        mensaje = " ".join("{}".format(valor) for valor in valores)
+        with socket.create_connection(self._direccion, timeout=self._timeout) as cliente:
+            enviado = time.monotonic()
+            cliente.sendall(mensaje.encode("utf-8"))
+        self._enviadas += 1
+        return enviado
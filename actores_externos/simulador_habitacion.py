@@ -0,0 +1,171 @@
+"""
+Simulador de habitacion en lazo cerrado con el termostato.
+
+Reemplaza a simulador_temperatura (que envia lo que se tipea) por una
+habitacion fisica: en cada paso lee la ultima accion que escribio
+ActuadorClimatizadorGeneral en el archivo "climatizador", avanza el
+ModeloTermico y envia la temperatura resultante al proxy de temperatura
+del termostato, por socket (ProxySensorTemperaturaSocket) o escribiendo
+el archivo "temperatura" (ProxySensorTemperaturaArchivo).
+
+Uso (desde el directorio donde corre el termostato):
+    python -m actores_externos.simulador_habitacion
+    python -m actores_externos.simulador_habitacion --exterior 5 --velocidad 60
+    python -m actores_externos.simulador_habitacion --salida archivo
+
+Patron de Diseno:
+    - Test Double (Fake): Sensor y planta fisica del otro lado del termostato
+"""
+import argparse
+import sys
+
+from actores_externos.modelo_termico import ModeloTermico, MODOS
+from actores_externos.sensor_programable import SensorSocketProgramable
+from servicios_aplicacion.reloj import RelojReal
+
+
+def leer_accion_actuador(ruta="climatizador"):
+    """
+    Lee la ultima accion escrita por ActuadorClimatizadorGeneral.
+
+    Args:
+        ruta (str): Archivo del actuador.
+
+    Returns:
+        str: "calentar", "enfriar" o "apagar"; None si el archivo no
+            existe todavia o no contiene una accion valida.
+    """
+    try:
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            accion = archivo.read().strip()
+    except OSError:
+        return None
+    return accion if accion in MODOS else None
+
+
+class SalidaArchivo:
+    """
+    Escribe la temperatura en el archivo que lee ProxySensorTemperaturaArchivo.
+
+    El proxy de archivo interpreta el contenido con int(), por lo que se
+    escribe la temperatura redondeada a grados enteros.
+
+    Args:
+        ruta (str): Archivo de temperatura.
+    """
+
+    def __init__(self, ruta="temperatura"):
+        self._ruta = ruta
+
+    def enviar(self, temperatura):
+        """Escribe la temperatura redondeada en el archivo."""
+        with open(self._ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(str(int(round(temperatura))))
+
+
+class SimuladorHabitacion:
+    """
+    Habitacion simulada que cierra el lazo con el termostato.
+
+    Args:
+        modelo (ModeloTermico): Modelo de una habitacion.
+        salida: Objeto con enviar(temperatura) (SensorSocketProgramable o
+            SalidaArchivo).
+        archivo_actuador (str): Archivo que escribe el actuador.
+        periodo (float): Segundos simulados por paso.
+        reloj (AbsReloj): Reloj de la espera entre pasos (por defecto
+            RelojReal; un RelojVirtual corre sin esperar).
+        velocidad (float): Segundos simulados por segundo de reloj.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, modelo, salida, archivo_actuador="climatizador", periodo=1.0,
+                 reloj=None, velocidad=1.0):
+        self._modelo = modelo
+        self._salida = salida
+        self._archivo_actuador = archivo_actuador
+        self._periodo = periodo
+        self._reloj = reloj if reloj is not None else RelojReal()
+        self._velocidad = velocidad
+        self._errores = 0
+
+    @property
+    def errores(self):
+        """int: Envios fallidos (termostato no disponible)."""
+        return self._errores
+
+    def paso(self):
+        """
+        Lee la accion, avanza el modelo un periodo y envia la temperatura.
+
+        Returns:
+            float: Temperatura medida enviada.
+        """
+        accion = leer_accion_actuador(self._archivo_actuador)
+        if accion is not None:
+            self._modelo.accionar(accion)
+        self._modelo.avanzar(self._periodo)
+        temperatura = self._modelo.leer(0)
+        try:
+            self._salida.enviar(round(temperatura, 2))
+        except OSError:
+            self._errores += 1
+        return temperatura
+
+    def ejecutar(self, pasos=None):
+        """
+        Corre la simulacion, un paso cada periodo / velocidad segundos de reloj.
+
+        Args:
+            pasos (int): Cantidad de pasos; None corre indefinidamente.
+        """
+        realizados = 0
+        while pasos is None or realizados < pasos:
+            temperatura = self.paso()
+            print("t={:8.0f} s  modo={:+d}  T={:6.2f} C".format(
+                self._modelo.instante, int(self._modelo.modos[0]), temperatura))
+            self._reloj.sleep(self._periodo / self._velocidad)
+            realizados += 1
+
+
+def main(argv=None):
+    """Punto de entrada de linea de comandos."""
+    parser = argparse.ArgumentParser(description="Habitacion simulada en lazo cerrado")
+    parser.add_argument("--salida", choices=("socket", "archivo"), default="socket")
+    parser.add_argument("--config", default="simuladores_config.json",
+                        help="configuracion de host y puertos (salida socket)")
+    parser.add_argument("--actuador", default="climatizador",
+                        help="archivo que escribe ActuadorClimatizadorGeneral")
+    parser.add_argument("--periodo", type=float, default=1.0, help="segundos simulados por paso")
+    parser.add_argument("--velocidad", type=float, default=1.0,
+                        help="segundos simulados por segundo real")
+    parser.add_argument("--pasos", type=int, help="cantidad de pasos (por defecto sin fin)")
+    parser.add_argument("--inicial", type=float, default=18.0, help="temperatura inicial (C)")
+    parser.add_argument("--exterior", type=float, default=10.0, help="temperatura exterior (C)")
+    parser.add_argument("--constante-tiempo", type=float, default=1800.0, help="R*C (s)")
+    parser.add_argument("--salto-calefaccion", type=float, default=20.0)
+    parser.add_argument("--salto-refrigeracion", type=float, default=15.0)
+    parser.add_argument("--ruido", type=float, default=0.0, help="ruido del sensor (C)")
+    argumentos = parser.parse_args(argv)
+
+    modelo = ModeloTermico(temperatura_inicial=argumentos.inicial,
+                           temperatura_exterior=argumentos.exterior,
+                           constante_tiempo=argumentos.constante_tiempo,
+                           salto_calefaccion=argumentos.salto_calefaccion,
+                           salto_refrigeracion=argumentos.salto_refrigeracion,
+                           ruido_medicion=argumentos.ruido)
+    if argumentos.salida == "socket":
+        salida = SensorSocketProgramable.desde_configuracion("temperatura", argumentos.config)
+    else:
+        salida = SalidaArchivo()
+    simulador = SimuladorHabitacion(modelo, salida, argumentos.actuador, argumentos.periodo,
+                                    velocidad=argumentos.velocidad)
+    try:
+        simulador.ejecutar(argumentos.pasos)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,14 @@
 """
 Clase que simula el accionamiento del climatizador.
 Aqui la accion es escribir en un archivo externo.
-"""
-import datetime
 
+ActuadorClimatizadorMapeado publica ademas la accion en un canal mapeado
+en memoria (ver canal_actuador) que los drivers leen sin reabrir archivos.
+"""
+from agentes_actuadores.canal_actuador import CanalActuador, escribir_atomico
 from registrador.registrador import AbsRegistrador, AbsAuditor
 from entidades.abs_actuador_climatizador import AbsProxyActuadorClimatizador
+from servicios_aplicacion.reloj import RelojReal
 
 
 class ActuadorClimatizadorGeneral(AbsProxyActuadorClimatizador, AbsRegistrador, AbsAuditor):
@@ -18,8 +21,22 @@ class ActuadorClimatizadorGeneral(AbsProxyActuadorClimatizador, AbsRegistrador,
     Patron de Diseno:
         - Proxy: Representa el actuador real del climatizador
         - Observer: Registra eventos de auditoria y errores
+        - Template Method: _escribir_accion define el medio de salida
+
+    Args:
+        reloj (AbsReloj): Reloj de las marcas de auditoria y error
+            (por defecto RelojReal).
     """
 
+    def __init__(self, reloj=None):
+        """
+        Inicializa el actuador con el reloj de sus registros.
+
+        Args:
+            reloj (AbsReloj): Reloj de las marcas de fecha y hora.
+        """
+        self._reloj = reloj if reloj is not None else RelojReal()
+
     def accionar_climatizador(self, accion):
         """
         Acciona el climatizador escribiendo la accion en archivo.
@@ -31,19 +48,31 @@ class ActuadorClimatizadorGeneral(AbsProxyActuadorClimatizador, AbsRegistrador,
         mensaje_accion = "accionando el climatizador"
         ActuadorClimatizadorGeneral.auditar_funcion(ActuadorClimatizadorGeneral.__name__,
                                                     mensaje_accion,
-                                                    str(datetime.datetime.now()))
+                                                    str(self._reloj.ahora()))
         try:
-            with open("climatizador", "w", encoding="utf-8") as archivo_climatizador:
-                archivo_climatizador.write(accion)
+            self._escribir_accion(accion)
         except IOError:
             mensaje_error = "Error al quierer actuar en el climatizador"
             registro_error = ActuadorClimatizadorGeneral._armar_registro_error(
-                str(datetime.datetime.now()),
+                str(self._reloj.ahora()),
                 str(IOError),
                 mensaje_error)
 
             ActuadorClimatizadorGeneral.registrar_error(registro_error)
 
+    def _escribir_accion(self, accion):
+        """
+        Escribe la accion en el archivo del climatizador.
+
+        Args:
+            accion (str): Accion a escribir.
+
+        Raises:
+            IOError: Si no se puede escribir el archivo.
+        """
+        with open("climatizador", "w", encoding="utf-8") as archivo_climatizador:
+            archivo_climatizador.write(accion)
+
     @staticmethod
     def _armar_registro_error(fecha_hora, tipo_de_error, mensaje):
         """
@@ -105,3 +134,47 @@ class ActuadorClimatizadorGeneral(AbsProxyActuadorClimatizador, AbsRegistrador,
                 archivo_auditoria.write(registro)
         except IOError as exc:
             raise IOError("Error al escribir el archivo de auditoria") from exc
+
+
+class ActuadorClimatizadorMapeado(ActuadorClimatizadorGeneral):
+    """
+    Actuador que publica la accion en un canal mapeado en memoria.
+
+    Cada accion se escribe en el canal con su secuencia y marca de
+    tiempo, sin abrir ni truncar archivos. Para los consumidores de
+    texto plano el archivo de texto se reemplaza por rename solo cuando
+    la accion cambia.
+
+    Args:
+        reloj (AbsReloj): Reloj de las marcas de auditoria, error y canal
+            (por defecto RelojReal).
+        ruta_canal (str): Archivo del canal mapeado.
+        ruta_texto (str): Archivo de texto para consumidores simples
+            (None = no se escribe).
+    """
+
+    def __init__(self, reloj=None, ruta_canal="climatizador.map", ruta_texto="climatizador"):
+        super().__init__(reloj)
+        self.canal = CanalActuador(ruta_canal)
+        self._ruta_texto = ruta_texto
+        self._ultima_texto = None
+
+    def _escribir_accion(self, accion):
+        """
+        Publica la accion en el canal y, si cambio, en el archivo de texto.
+
+        Args:
+            accion (str): Accion a publicar.
+
+        Raises:
+            ValueError: Si la accion no es valida.
+            IOError: Si no se puede reemplazar el archivo de texto.
+        """
+        self.canal.escribir(accion, self._reloj.ahora().timestamp())
+        if self._ruta_texto is not None and accion != self._ultima_texto:
+            escribir_atomico(self._ruta_texto, accion)
+            self._ultima_texto = accion
+
+    def cerrar(self):
+        """Desmapea el canal."""
+        self.canal.cerrar()
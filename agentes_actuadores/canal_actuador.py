@@ -0,0 +1,180 @@
+"""
+Canal mapeado en memoria para la salida del actuador del climatizador.
+
+Formato del archivo (little endian, 40 bytes):
+    - Cabecera (16 bytes): magia "ACT1", version, relleno
+    - Registro (24 bytes): secuencia uint64, codigo int32, relleno,
+      marca float64
+
+El codigo es el indice de la accion en ACCIONES y la marca el instante
+(epoch) de la accion. El actuador es el unico escritor y usa el mismo
+protocolo seqlock que estado_compartido: incrementa la secuencia (queda
+impar), escribe codigo y marca y la vuelve a incrementar (queda par).
+Los drivers mapean el archivo una vez y leen sin reabrirlo ni tomar
+locks; la secuencia cambia con cada accion aunque se repita la accion.
+
+Para consumidores de texto plano escribir_atomico() reemplaza un archivo
+por rename: un lector ve el contenido anterior o el nuevo, nunca un
+archivo truncado a medio escribir.
+
+Patron de Diseno:
+    - Memory-Mapped I/O: La salida se publica escribiendo memoria
+    - Seqlock: Lectores sin bloqueo validados por numero de secuencia
+"""
+import mmap
+import os
+import struct
+import time
+from collections import namedtuple
+
+EstadoActuador = namedtuple("EstadoActuador", ["accion", "secuencia", "marca"])
+
+ACCIONES = ("apagar", "calentar", "enfriar")
+
+MAGIA = b"ACT1"
+VERSION = 1
+CABECERA = struct.Struct("<4sH10x")
+SECUENCIA = struct.Struct("<Q")
+REGISTRO = struct.Struct("<Qi4xd")
+TAMANO = CABECERA.size + REGISTRO.size
+
+
+def escribir_atomico(ruta, texto):
+    """
+    Reemplaza el contenido de un archivo de texto por rename.
+
+    Args:
+        ruta (str): Archivo destino.
+        texto (str): Contenido nuevo.
+
+    Raises:
+        IOError: Si no se puede escribir el archivo temporal o renombrarlo.
+    """
+    temporal = "{}.tmp".format(ruta)
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        archivo.write(texto)
+    os.replace(temporal, ruta)
+
+
+class CanalActuador:
+    """
+    Extremo escritor del canal del actuador.
+
+    Si el archivo ya es un canal valido continua su secuencia (los
+    lectores no ven retroceder la version al reiniciar el termostato);
+    si no existe o no es un canal, lo inicializa.
+
+    Args:
+        ruta (str): Archivo del canal.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        descriptor = os.open(ruta, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(descriptor).st_size < TAMANO:
+                os.ftruncate(descriptor, TAMANO)
+            self._mapa = mmap.mmap(descriptor, TAMANO)
+        finally:
+            os.close(descriptor)
+        magia, version = CABECERA.unpack_from(self._mapa, 0)
+        if magia != MAGIA or version != VERSION:
+            self._mapa[:TAMANO] = bytes(TAMANO)
+            CABECERA.pack_into(self._mapa, 0, MAGIA, VERSION)
+        secuencia = SECUENCIA.unpack_from(self._mapa, CABECERA.size)[0]
+        # Un escritor anterior detenido a mitad de una escritura la dejo impar
+        self._secuencia = secuencia + secuencia % 2
+
+    @property
+    def secuencia(self):
+        """int: Secuencia de la ultima accion escrita (0 = ninguna)."""
+        return self._secuencia
+
+    def escribir(self, accion, marca=None):
+        """
+        Publica una accion en el canal.
+
+        Args:
+            accion (str): Accion ("apagar", "calentar" o "enfriar").
+            marca (float): Instante epoch de la accion (None = ahora).
+
+        Raises:
+            ValueError: Si la accion no es valida.
+        """
+        if accion not in ACCIONES:
+            raise ValueError("Accion de climatizador no valida: {}".format(accion))
+        codigo = ACCIONES.index(accion)
+        marca = time.time() if marca is None else marca
+        SECUENCIA.pack_into(self._mapa, CABECERA.size, self._secuencia + 1)
+        REGISTRO.pack_into(self._mapa, CABECERA.size, self._secuencia + 1, codigo, marca)
+        self._secuencia += 2
+        SECUENCIA.pack_into(self._mapa, CABECERA.size, self._secuencia)
+
+    def cerrar(self):
+        """Desmapea el canal (el archivo queda con la ultima accion)."""
+        self._mapa.close()
+
+
+class LectorCanalActuador:
+    """
+    Extremo lector del canal del actuador.
+
+    Mapea el archivo una sola vez; cada lectura copia 24 bytes sin
+    llamadas al sistema.
+
+    Args:
+        ruta (str): Archivo del canal.
+
+    Raises:
+        ValueError: Si el archivo no es un canal del actuador.
+    """
+
+    # Segundos de reintentos antes de desistir de una lectura
+    ESPERA_MAXIMA = 0.5
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        with open(ruta, "rb") as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), TAMANO, access=mmap.ACCESS_READ)
+        magia, version = CABECERA.unpack_from(self._mapa, 0)
+        if magia != MAGIA or version != VERSION:
+            self._mapa.close()
+            mensaje = "{} no es un canal del actuador (magia={}, version={})"
+            raise ValueError(mensaje.format(ruta, magia, version))
+
+    def version(self):
+        """
+        Retorna la secuencia actual (cambia con cada accion).
+
+        Returns:
+            int: Secuencia (0 = sin acciones; impar = en escritura).
+        """
+        return SECUENCIA.unpack_from(self._mapa, CABECERA.size)[0]
+
+    def leer(self):
+        """
+        Lee la ultima accion sin tomar locks.
+
+        Returns:
+            EstadoActuador: Accion, secuencia y marca, o None si no hubo acciones.
+
+        Raises:
+            TimeoutError: Si el registro sigue en escritura tras ESPERA_MAXIMA
+                segundos (escritor detenido a mitad de una escritura).
+        """
+        limite = None
+        while True:
+            secuencia, codigo, marca = REGISTRO.unpack_from(self._mapa, CABECERA.size)
+            if secuencia % 2 == 0 and self.version() == secuencia:
+                if secuencia == 0:
+                    return None
+                return EstadoActuador(ACCIONES[codigo], secuencia, marca)
+            if limite is None:
+                limite = time.monotonic() + self.ESPERA_MAXIMA
+            elif time.monotonic() > limite:
+                raise TimeoutError("El canal {} sigue en escritura".format(self.ruta))
+            time.sleep(0)
+
+    def cerrar(self):
+        """Desmapea el canal."""
+        self._mapa.close()
@@ -0,0 +1,176 @@
+"""
+Conexion TCP persistente de salida para los visualizadores socket.
+
+En lugar de abrir, escribir y cerrar una conexion por cada valor, la
+conexion se abre en el primer envio y se reutiliza. Cada mensaje es
+una linea terminada en "\\n", de modo que el cartel del otro lado puede
+separar los valores que llegan juntos en un mismo paquete.
+
+Si el cartel no esta escuchando o cierra la conexion, los mensajes
+quedan en un buffer acotado y se reintenta conectar con espera
+exponencial (sin bloquear al hilo del operador entre intentos). Al
+reconectar se envian las lineas pendientes en una sola escritura.
+
+Patron de Diseno:
+    - Proxy: Oculta la conexion, la reconexion y el buffer de escritura
+    - DIP: Recibe host, puerto y reloj via inyeccion de dependencias
+"""
+import collections
+import logging
+import select
+import socket
+import threading
+
+from servicios_aplicacion.reloj import RelojReal
+
+_bitacora = logging.getLogger(__name__)
+
+
+class ConexionSocketPersistente:
+    """
+    Conexion TCP que se mantiene abierta entre envios.
+
+    Es segura para hilos: los visualizadores se invocan desde los
+    distintos hilos del operador.
+
+    Args:
+        host (str): Host donde escucha el cartel.
+        puerto (int): Puerto del cartel.
+        timeout (float): Segundos maximos para conectar y escribir.
+        reloj (AbsReloj): Reloj de la espera entre reintentos (None = RelojReal).
+    """
+
+    # Espera entre reintentos de conexion: se duplica hasta el maximo
+    ESPERA_INICIAL = 0.5
+    ESPERA_MAXIMA = 30.0
+    # Lineas retenidas sin conexion (se descartan las mas viejas)
+    MAXIMO_PENDIENTES = 100
+
+    def __init__(self, host, puerto, timeout=1.0, reloj=None):
+        """
+        Inicializa la conexion sin conectar (se conecta en el primer envio).
+
+        Args:
+            host (str): Host donde escucha el cartel.
+            puerto (int): Puerto del cartel.
+            timeout (float): Segundos maximos para conectar y escribir.
+            reloj (AbsReloj): Reloj de la espera entre reintentos.
+        """
+        self._direccion = (host, puerto)
+        self._timeout = timeout
+        self._reloj = reloj if reloj is not None else RelojReal()
+        self._socket = None
+        self._pendientes = collections.deque(maxlen=self.MAXIMO_PENDIENTES)
+        self._espera = 0.0
+        self._proximo_intento = None
+        self._conexiones = 0
+        self._lock = threading.Lock()
+
+    @property
+    def direccion(self):
+        """tuple: Direccion (host, puerto) del cartel."""
+        return self._direccion
+
+    @property
+    def conectada(self):
+        """bool: True si hay una conexion abierta."""
+        return self._socket is not None
+
+    @property
+    def pendientes(self):
+        """int: Lineas a la espera de una conexion."""
+        return len(self._pendientes)
+
+    @property
+    def conexiones(self):
+        """int: Conexiones establecidas (la primera y cada reconexion)."""
+        return self._conexiones
+
+    def enviar(self, mensaje):
+        """
+        Envia una linea, junto con las que hayan quedado pendientes.
+
+        Args:
+            mensaje (str): Texto a enviar (sin salto de linea final).
+
+        Returns:
+            bool: True si todo lo pendiente se escribio en la conexion;
+                False si no hay conexion y la linea quedo en el buffer.
+        """
+        with self._lock:
+            self._pendientes.append((str(mensaje) + "\n").encode("utf-8"))
+            if self._socket is not None and self._cerrada_por_el_cartel():
+                _bitacora.info("cartel %s:%s cerro la conexion", *self._direccion)
+                self._desconectar()
+            if self._socket is None and not self._conectar():
+                return False
+            try:
+                self._socket.sendall(b"".join(self._pendientes))
+            except OSError as e:
+                # Lo que llego a escribirse puede repetirse al reconectar:
+                # para un cartel, que muestra el ultimo valor, es inocuo
+                _bitacora.warning("error al enviar a %s:%s: %s", self._direccion[0],
+                                  self._direccion[1], e)
+                self._desconectar()
+                self._programar_reintento()
+                return False
+            self._pendientes.clear()
+            return True
+
+    def cerrar(self):
+        """Cierra la conexion (un envio posterior vuelve a conectar)."""
+        with self._lock:
+            self._desconectar()
+
+    def _conectar(self):
+        """
+        Intenta conectar si ya paso la espera desde el ultimo intento.
+
+        Returns:
+            bool: True si quedo conectada.
+        """
+        if self._proximo_intento is not None and self._reloj.monotonic() < self._proximo_intento:
+            return False
+        try:
+            self._socket = socket.create_connection(self._direccion, timeout=self._timeout)
+        except OSError as e:
+            self._programar_reintento()
+            _bitacora.warning("cartel %s:%s no disponible (%s), se reintenta en %.1f s",
+                              self._direccion[0], self._direccion[1], e, self._espera)
+            return False
+        # Las lineas ya se agrupan en el buffer: no esperar al algoritmo de Nagle
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._espera = 0.0
+        self._proximo_intento = None
+        self._conexiones += 1
+        _bitacora.debug("conectado a %s:%s", *self._direccion)
+        return True
+
+    def _programar_reintento(self):
+        """Duplica la espera (hasta ESPERA_MAXIMA) y fija el proximo intento."""
+        self._espera = min(max(self._espera * 2, self.ESPERA_INICIAL), self.ESPERA_MAXIMA)
+        self._proximo_intento = self._reloj.monotonic() + self._espera
+
+    def _cerrada_por_el_cartel(self):
+        """
+        Detecta si el cartel cerro la conexion.
+
+        El cartel nunca escribe: si el socket tiene algo para leer es el
+        fin de flujo (o un error) de una conexion cerrada del otro lado.
+        Sin esta verificacion, el primer envio tras el cierre se
+        perderia sin error.
+
+        Returns:
+            bool: True si la conexion ya no sirve.
+        """
+        try:
+            legible, _, _ = select.select([self._socket], [], [], 0)
+            return bool(legible) and not self._socket.recv(4096)
+        except OSError:
+            return True
+
+    def _desconectar(self):
+        """Cierra el socket actual, si lo hay."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
@@ -6,11 +6,14 @@ Clase dummy que simula la visualizacion de los parametros.
 # pylint: disable=duplicate-code
 # El codigo de socket es similar entre visualizadores (patron comun aceptable)
 
-import socket
+import logging
 import requests
 
+from agentes_actuadores.conexion_socket import ConexionSocketPersistente
 from entidades.abs_visualizador_bateria import AbsVisualizadorBateria
 
+_bitacora = logging.getLogger(__name__)
+
 
 class VisualizadorBateria(AbsVisualizadorBateria):
     """
@@ -47,12 +50,36 @@ class VisualizadorBateriaSocket(AbsVisualizadorBateria):
     Visualizador de bateria via socket TCP.
 
     Implementa la interfaz AbsVisualizadorBateria enviando
-    los datos a un servidor remoto via socket.
+    los datos a un servidor remoto via socket, por una conexion
+    persistente a cada cartel con una linea por valor.
 
     Patron de Diseno:
         - Proxy: Envia datos a visualizador remoto
+
+    Args:
+        host (str): Host de los carteles.
+        puerto_tension (int): Puerto del cartel de tension.
+        puerto_indicador (int): Puerto del cartel del indicador.
+        reloj (AbsReloj): Reloj de la espera entre reconexiones.
     """
 
+    # Envios fallidos: los errores de red se informan y no se propagan
+    errores = 0
+
+    def __init__(self, host="localhost", puerto_tension=14000, puerto_indicador=13005,
+                 reloj=None):
+        """
+        Inicializa el visualizador (conecta en el primer envio).
+
+        Args:
+            host (str): Host de los carteles.
+            puerto_tension (int): Puerto del cartel de tension.
+            puerto_indicador (int): Puerto del cartel del indicador.
+            reloj (AbsReloj): Reloj de la espera entre reconexiones.
+        """
+        self._conexion_tension = ConexionSocketPersistente(host, puerto_tension, reloj=reloj)
+        self._conexion_indicador = ConexionSocketPersistente(host, puerto_indicador, reloj=reloj)
+
     def mostrar_tension(self, tension_bateria):
         """
         Envia la tension de la bateria via socket TCP.
@@ -60,15 +87,8 @@ class VisualizadorBateriaSocket(AbsVisualizadorBateria):
         Args:
             tension_bateria: Valor de tension a enviar.
         """
-        try:
-            cliente = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            direccion_servidor = ("localhost", 14000)
-            cliente.connect(direccion_servidor)
-
-            cliente.send(bytes(str(tension_bateria).encode()))
-            cliente.close()
-        except ConnectionError:
-            print("Intentar de vuelta")
+        if not self._conexion_tension.enviar(str(tension_bateria)):
+            self.errores += 1
 
     def mostrar_indicador(self, indicador_bateria):
         """
@@ -77,15 +97,8 @@ class VisualizadorBateriaSocket(AbsVisualizadorBateria):
         Args:
             indicador_bateria: Valor del indicador a enviar.
         """
-        try:
-            cliente = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            direccion_servidor = ("localhost", 13005)
-            cliente.connect(direccion_servidor)
-
-            cliente.send(bytes(str(indicador_bateria).encode()))
-            cliente.close()
-        except ConnectionError:
-            print("Intentar de vuelta")
+        if not self._conexion_indicador.enviar(str(indicador_bateria)):
+            self.errores += 1
 
 
 class VisualizadorBateriaApi(AbsVisualizadorBateria):
@@ -103,6 +116,9 @@ class VisualizadorBateriaApi(AbsVisualizadorBateria):
         api_url: URL base de la API REST.
     """
 
+    # Envios fallidos: los errores de red se informan y no se propagan
+    errores = 0
+
     def __init__(self, api_url):
         """
         Inicializa el visualizador con la URL de la API.
@@ -124,7 +140,8 @@ class VisualizadorBateriaApi(AbsVisualizadorBateria):
                          json={"bateria": tension_bateria},
                          timeout=5)
         except requests.RequestException as e:
-            print("Error al enviar tensión batería: {}".format(e))
+            self.errores += 1
+            _bitacora.warning("error al enviar tension de bateria: %s", e)
 
     def mostrar_indicador(self, indicador_bateria):
         """
@@ -138,4 +155,5 @@ class VisualizadorBateriaApi(AbsVisualizadorBateria):
                          json={"indicador": indicador_bateria},
                          timeout=5)
         except requests.RequestException as e:
-            print("Error al enviar indicador batería: {}".format(e))
+            self.errores += 1
+            _bitacora.warning("error al enviar indicador de bateria: %s", e)
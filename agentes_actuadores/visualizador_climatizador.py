@@ -2,10 +2,13 @@
 Muestra los valores del estado del climatizador
 Clase dummy que simula la visualizacion de los parametros
 """
-import socket
+import logging
 import requests
+from agentes_actuadores.conexion_socket import ConexionSocketPersistente
 from entidades.abs_visualizador_climatizador import AbsVisualizadorClimatizador
 
+_bitacora = logging.getLogger(__name__)
+
 
 # pylint: disable=too-few-public-methods
 class VisualizadorClimatizador(AbsVisualizadorClimatizador):
@@ -35,12 +38,32 @@ class VisualizadorClimatizadorSocket(AbsVisualizadorClimatizador):
     Visualizador de climatizador via socket TCP.
 
     Implementa la interfaz AbsVisualizadorClimatizador enviando
-    el estado a un servidor remoto via socket.
+    el estado a un servidor remoto via socket, por una conexion
+    persistente con una linea por estado.
 
     Patron de Diseno:
         - Proxy: Envia datos a visualizador remoto
+
+    Args:
+        host (str): Host del cartel del climatizador.
+        puerto (int): Puerto del cartel del climatizador.
+        reloj (AbsReloj): Reloj de la espera entre reconexiones.
     """
 
+    # Envios fallidos: los errores de red se informan y no se propagan
+    errores = 0
+
+    def __init__(self, host="localhost", puerto=14002, reloj=None):
+        """
+        Inicializa el visualizador (conecta en el primer envio).
+
+        Args:
+            host (str): Host del cartel del climatizador.
+            puerto (int): Puerto del cartel del climatizador.
+            reloj (AbsReloj): Reloj de la espera entre reconexiones.
+        """
+        self._conexion = ConexionSocketPersistente(host, puerto, reloj=reloj)
+
     def mostrar_estado_climatizador(self, estado_climatizador):
         """
         Envia el estado del climatizador via socket TCP.
@@ -48,15 +71,8 @@ class VisualizadorClimatizadorSocket(AbsVisualizadorClimatizador):
         Args:
             estado_climatizador: Estado actual del climatizador.
         """
-        try:
-            cliente = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            direccion_servidor = ("localhost", 14002)
-            cliente.connect(direccion_servidor)
-
-            cliente.send(bytes(str(estado_climatizador).encode()))
-            cliente.close()
-        except ConnectionError:
-            print("Intentar de vuelta")
+        if not self._conexion.enviar(str(estado_climatizador)):
+            self.errores += 1
 
 
 # pylint: disable=too-few-public-methods
@@ -75,6 +91,9 @@ class VisualizadorClimatizadorApi(AbsVisualizadorClimatizador):
         api_url: URL base de la API REST.
     """
 
+    # Envios fallidos: los errores de red se informan y no se propagan
+    errores = 0
+
     def __init__(self, api_url):
         """
         Inicializa el visualizador con la URL de la API.
@@ -96,4 +115,5 @@ class VisualizadorClimatizadorApi(AbsVisualizadorClimatizador):
                          json={"climatizador": estado_climatizador},
                          timeout=5)
         except requests.RequestException as e:
-            print("Error al enviar estado climatizador: {}".format(e))
+            self.errores += 1
+            _bitacora.warning("error al enviar estado climatizador: %s", e)
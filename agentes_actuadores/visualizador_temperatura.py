@@ -6,10 +6,13 @@ Clase dummy que simula la visualizacion de los parametros.
 # pylint: disable=duplicate-code
 # El codigo de socket es similar entre visualizadores (patron comun aceptable)
 
-import socket
+import logging
 import requests
+from agentes_actuadores.conexion_socket import ConexionSocketPersistente
 from entidades.abs_visualizador_temperatura import AbsVisualizadorTemperatura
 
+_bitacora = logging.getLogger(__name__)
+
 
 class VisualizadorTemperatura(AbsVisualizadorTemperatura):
     """
@@ -46,12 +49,32 @@ class VisualizadorTemperaturaSocket(AbsVisualizadorTemperatura):
     Visualizador de temperatura via socket TCP.
 
     Implementa la interfaz AbsVisualizadorTemperatura enviando
-    los datos a un servidor remoto via socket.
+    los datos a un servidor remoto via socket, por una conexion
+    persistente con una linea por valor ("ambiente: 25").
 
     Patron de Diseno:
         - Proxy: Envia datos a visualizador remoto
+
+    Args:
+        host (str): Host del cartel de temperatura.
+        puerto (int): Puerto del cartel de temperatura.
+        reloj (AbsReloj): Reloj de la espera entre reconexiones.
     """
 
+    # Envios fallidos: los errores de red se informan y no se propagan
+    errores = 0
+
+    def __init__(self, host="localhost", puerto=14001, reloj=None):
+        """
+        Inicializa el visualizador (conecta en el primer envio).
+
+        Args:
+            host (str): Host del cartel de temperatura.
+            puerto (int): Puerto del cartel de temperatura.
+            reloj (AbsReloj): Reloj de la espera entre reconexiones.
+        """
+        self._conexion = ConexionSocketPersistente(host, puerto, reloj=reloj)
+
     def mostrar_temperatura_ambiente(self, temperatura_ambiente):
         """
         Envia la temperatura ambiente via socket TCP.
@@ -59,15 +82,8 @@ class VisualizadorTemperaturaSocket(AbsVisualizadorTemperatura):
         Args:
             temperatura_ambiente: Valor de temperatura ambiente.
         """
-        try:
-            cliente = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            direccion_servidor = ("localhost", 14001)
-            cliente.connect(direccion_servidor)
-
-            cliente.send(bytes(("ambiente: " + str(temperatura_ambiente)).encode()))
-            cliente.close()
-        except ConnectionError:
-            print("Intentar de vuelta")
+        if not self._conexion.enviar("ambiente: " + str(temperatura_ambiente)):
+            self.errores += 1
 
     def mostrar_temperatura_deseada(self, temperatura_deseada):
         """
@@ -76,15 +92,8 @@ class VisualizadorTemperaturaSocket(AbsVisualizadorTemperatura):
         Args:
             temperatura_deseada: Valor de temperatura deseada.
         """
-        try:
-            cliente = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            direccion_servidor = ("localhost", 14001)
-            cliente.connect(direccion_servidor)
-
-            cliente.send(bytes(("deseada: " + str(temperatura_deseada)).encode()))
-            cliente.close()
-        except ConnectionError:
-            print("Intentar de vuelta")
+        if not self._conexion.enviar("deseada: " + str(temperatura_deseada)):
+            self.errores += 1
 
 
 class VisualizadorTemperaturaApi(AbsVisualizadorTemperatura):
@@ -102,6 +111,9 @@ class VisualizadorTemperaturaApi(AbsVisualizadorTemperatura):
         api_url: URL base de la API REST.
     """
 
+    # Envios fallidos: los errores de red se informan y no se propagan
+    errores = 0
+
     def __init__(self, api_url):
         """
         Inicializa el visualizador con la URL de la API.
@@ -123,7 +135,8 @@ class VisualizadorTemperaturaApi(AbsVisualizadorTemperatura):
                          json={"ambiente": int(temperatura_ambiente)},
                          timeout=5)
         except requests.RequestException as e:
-            print("Error al enviar temperatura ambiente: {}".format(e))
+            self.errores += 1
+            _bitacora.warning("error al enviar temperatura ambiente: %s", e)
 
     def mostrar_temperatura_deseada(self, temperatura_deseada):
         """
@@ -137,4 +150,5 @@ class VisualizadorTemperaturaApi(AbsVisualizadorTemperatura):
                          json={"deseada": int(temperatura_deseada)},
                          timeout=5)
         except requests.RequestException as e:
-            print("Error al enviar temperatura deseada: {}".format(e))
+            self.errores += 1
+            _bitacora.warning("error al enviar temperatura deseada: %s", e)
@@ -7,5 +7,7 @@ o simulados via socket TCP:
     - proxy_sensor_temperatura: Proxy del sensor de temperatura
     - proxy_selector_temperatura: Proxy del selector de modo
     - proxy_seteo_temperatura: Proxy del seteo de temperatura
+    - servidor_socket: Servidor TCP no bloqueante (selectors) para entradas
+    - filtros_senal: Filtros de senal vectorizados (NumPy) para lecturas
 """
 # pylint: disable=consider-using-f-string,duplicate-code
@@ -0,0 +1,340 @@
+"""
+Filtros de senal para lecturas de sensores.
+
+Este modulo contiene los filtros que se intercalan entre un proxy de
+sensor y su gestor para suavizar la senal antes de que llegue al
+dominio: media movil, suavizado exponencial, mediana de N y rechazo de
+valores atipicos. Cada filtro guarda su historia en un BufferCircular
+de NumPy y procesa bloques completos de lecturas de forma vectorizada,
+de modo que varias lecturas recibidas juntas se filtran en una sola
+pasada.
+
+Patron de Diseno:
+    - Strategy: Cada filtro es intercambiable detras de AbsFiltro
+    - Composite: CadenaFiltros aplica varios filtros en secuencia
+
+Dependencias:
+    Requiere NumPy (dependencia opcional, extra "filtros"). Si no esta
+    instalado el modulo se puede importar, pero crear un filtro lanza
+    ImportError.
+"""
+from abc import ABCMeta, abstractmethod
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+
+def _verificar_numpy():
+    """Lanza ImportError si NumPy no esta disponible."""
+    if np is None:
+        raise ImportError("Los filtros de senal requieren NumPy: pip install numpy")
+
+
+def _validar_ventana(ventana):
+    """Lanza ValueError si la ventana no es un entero >= 1."""
+    if ventana < 1:
+        raise ValueError("ventana debe ser >= 1, recibido: {}".format(ventana))
+
+
+def _como_arreglo(valores):
+    """Convierte una lectura o secuencia de lecturas en un arreglo float64."""
+    return np.atleast_1d(np.asarray(valores, dtype=np.float64))
+
+
+class BufferCircular:
+    """
+    Buffer circular de capacidad fija sobre un arreglo NumPy preasignado.
+
+    Las escrituras de bloques se hacen con indexacion vectorizada; nunca
+    se realoca memoria despues de la construccion.
+
+    Args:
+        capacidad (int): Cantidad maxima de valores retenidos.
+    """
+
+    @property
+    def capacidad(self):
+        """int: Cantidad maxima de valores retenidos."""
+        return self._datos.shape[0]
+
+    def __init__(self, capacidad):
+        """
+        Preasigna el arreglo del buffer.
+
+        Args:
+            capacidad (int): Cantidad maxima de valores retenidos (>= 1).
+
+        Raises:
+            ValueError: Si capacidad < 1.
+        """
+        _verificar_numpy()
+        if capacidad < 1:
+            raise ValueError("capacidad debe ser >= 1, recibido: {}".format(capacidad))
+        self._datos = np.empty(capacidad, dtype=np.float64)
+        self._siguiente = 0
+        self._cantidad = 0
+
+    def __len__(self):
+        """Retorna la cantidad de valores almacenados."""
+        return self._cantidad
+
+    def agregar(self, valores):
+        """
+        Agrega un bloque de valores, descartando los mas antiguos si no entran.
+
+        Args:
+            valores: Valor o secuencia de valores a agregar.
+        """
+        valores = _como_arreglo(valores)[-self.capacidad:]
+        cantidad = valores.shape[0]
+        indices = (self._siguiente + np.arange(cantidad)) % self.capacidad
+        self._datos[indices] = valores
+        self._siguiente = (self._siguiente + cantidad) % self.capacidad
+        self._cantidad = min(self._cantidad + cantidad, self.capacidad)
+
+    def valores(self):
+        """
+        Retorna los valores almacenados del mas antiguo al mas reciente.
+
+        Returns:
+            numpy.ndarray: Copia ordenada de los valores.
+        """
+        inicio = (self._siguiente - self._cantidad) % self.capacidad
+        indices = (inicio + np.arange(self._cantidad)) % self.capacidad
+        return self._datos[indices]
+
+
+class AbsFiltro(metaclass=ABCMeta):
+    """
+    Interfaz abstracta para filtros de senal.
+
+    Las subclases implementan filtrar_bloque(); filtrar() es el caso
+    particular de un bloque de una sola lectura.
+    """
+
+    @abstractmethod
+    def filtrar_bloque(self, valores):
+        """
+        Filtra un bloque de lecturas consecutivas.
+
+        Args:
+            valores: Secuencia de lecturas en orden de llegada.
+
+        Returns:
+            numpy.ndarray: Valores filtrados, uno por lectura.
+        """
+
+    def filtrar(self, valor):
+        """
+        Filtra una unica lectura.
+
+        Args:
+            valor (float): Lectura del sensor.
+
+        Returns:
+            float: Valor filtrado.
+        """
+        return float(self.filtrar_bloque([valor])[-1])
+
+
+class FiltroMediaMovil(AbsFiltro):
+    """
+    Media movil de las ultimas N lecturas.
+
+    Args:
+        ventana (int): Cantidad de lecturas promediadas.
+    """
+
+    def __init__(self, ventana=5):
+        """
+        Inicializa el filtro con su historia.
+
+        Args:
+            ventana (int): Cantidad de lecturas promediadas (>= 1).
+
+        Raises:
+            ValueError: Si ventana < 1.
+        """
+        _validar_ventana(ventana)
+        self._ventana = ventana
+        self._historia = BufferCircular(max(ventana - 1, 1))
+
+    def filtrar_bloque(self, valores):
+        """Promedia cada lectura con las ventana-1 anteriores (suma acumulada)."""
+        valores = _como_arreglo(valores)
+        previos = self._historia.valores()[-(self._ventana - 1):] if self._ventana > 1 else []
+        serie = np.concatenate((previos, valores))
+        acumulada = np.concatenate(([0.0], np.cumsum(serie)))
+        fines = np.arange(len(previos) + 1, serie.shape[0] + 1)
+        inicios = np.maximum(fines - self._ventana, 0)
+        self._historia.agregar(valores)
+        return (acumulada[fines] - acumulada[inicios]) / (fines - inicios)
+
+
+class FiltroExponencial(AbsFiltro):
+    """
+    Suavizado exponencial: y[k] = alfa * x[k] + (1 - alfa) * y[k-1].
+
+    Args:
+        alfa (float): Peso de la lectura nueva, en (0, 1].
+    """
+
+    # Largo maximo de tramo para la forma cerrada (evita desbordes de (1-alfa)^-n)
+    TRAMO = 32
+
+    def __init__(self, alfa=0.5):
+        """
+        Inicializa el filtro sin valor previo.
+
+        Args:
+            alfa (float): Peso de la lectura nueva, en (0, 1].
+
+        Raises:
+            ValueError: Si alfa no esta en (0, 1].
+        """
+        _verificar_numpy()
+        if not 0 < alfa <= 1:
+            raise ValueError("alfa debe estar en (0, 1], recibido: {}".format(alfa))
+        self._alfa = alfa
+        self._anterior = None
+
+    def filtrar_bloque(self, valores):
+        """Aplica la recurrencia en forma cerrada, por tramos vectorizados."""
+        valores = _como_arreglo(valores)
+        if self._anterior is None:
+            self._anterior = valores[0]
+        if self._alfa == 1:
+            self._anterior = valores[-1]
+            return valores.copy()
+
+        resultado = np.empty_like(valores)
+        beta = 1.0 - self._alfa
+        for inicio in range(0, valores.shape[0], self.TRAMO):
+            tramo = valores[inicio:inicio + self.TRAMO]
+            exponentes = np.arange(tramo.shape[0])
+            # y[k] = beta^(k+1) * y_prev + alfa * beta^k * sum_j (x[j] / beta^j)
+            suma = np.cumsum(tramo / beta ** exponentes)
+            salida = beta ** (exponentes + 1) * self._anterior + self._alfa * beta ** exponentes * suma
+            resultado[inicio:inicio + tramo.shape[0]] = salida
+            self._anterior = salida[-1]
+        return resultado
+
+
+class FiltroMediana(AbsFiltro):
+    """
+    Mediana de las ultimas N lecturas.
+
+    Args:
+        ventana (int): Cantidad de lecturas consideradas.
+    """
+
+    def __init__(self, ventana=5):
+        """
+        Inicializa el filtro con su historia.
+
+        Args:
+            ventana (int): Cantidad de lecturas consideradas (>= 1).
+
+        Raises:
+            ValueError: Si ventana < 1.
+        """
+        _validar_ventana(ventana)
+        self._ventana = ventana
+        self._historia = BufferCircular(max(ventana - 1, 1))
+
+    def filtrar_bloque(self, valores):
+        """Calcula la mediana de cada ventana deslizante del bloque."""
+        valores = _como_arreglo(valores)
+        previos = self._historia.valores()[-(self._ventana - 1):] if self._ventana > 1 else []
+        serie = np.concatenate((previos, valores))
+        self._historia.agregar(valores)
+        if len(previos) + 1 < self._ventana:
+            # Arranque: las primeras ventanas estan incompletas
+            fines = range(len(previos) + 1, serie.shape[0] + 1)
+            return np.array([np.median(serie[max(fin - self._ventana, 0):fin])
+                             for fin in fines])
+        ventanas = np.lib.stride_tricks.sliding_window_view(serie, self._ventana)
+        return np.median(ventanas, axis=1)
+
+
+class FiltroRechazoAtipicos(AbsFiltro):
+    """
+    Reemplaza lecturas atipicas por la mediana de las lecturas previas.
+
+    Una lectura es atipica si se aleja mas de umbral de la mediana de
+    las N lecturas anteriores ya filtradas. El bloque se procesa lectura
+    por lectura: cada reemplazo pasa a ser referencia de las siguientes,
+    de modo que una rafaga de atipicos consecutivos no se convierte en
+    referencia y el resultado es el mismo que filtrando de a una.
+
+    Args:
+        umbral (float): Desvio maximo aceptado respecto de la mediana.
+        ventana (int): Cantidad de lecturas de referencia.
+    """
+
+    def __init__(self, umbral=5.0, ventana=5):
+        """
+        Inicializa el filtro con su historia.
+
+        Args:
+            umbral (float): Desvio maximo aceptado (> 0).
+            ventana (int): Cantidad de lecturas de referencia (>= 1).
+
+        Raises:
+            ValueError: Si umbral <= 0 o ventana < 1.
+        """
+        if umbral <= 0:
+            raise ValueError("umbral debe ser > 0, recibido: {}".format(umbral))
+        _validar_ventana(ventana)
+        self._umbral = umbral
+        self._ventana = ventana
+        self._historia = BufferCircular(ventana)
+
+    def filtrar_bloque(self, valores):
+        """Compara cada lectura contra la mediana de las salidas previas."""
+        valores = _como_arreglo(valores)
+        resultado = self._filtrar_en_orden(self._historia.valores(), valores)
+        self._historia.agregar(resultado)
+        return resultado
+
+    def _filtrar_en_orden(self, previos, valores):
+        """Filtra lectura por lectura; los reemplazos quedan en la serie de referencia."""
+        serie = np.concatenate((previos, valores))
+        resultado = valores.copy()
+        for i in range(valores.shape[0]):
+            fin = len(previos) + i
+            referencia = serie[max(fin - self._ventana, 0):fin]
+            if referencia.shape[0] == 0:
+                continue
+            mediana = np.median(referencia)
+            if abs(valores[i] - mediana) > self._umbral:
+                resultado[i] = mediana
+                serie[fin] = mediana
+        return resultado
+
+
+class CadenaFiltros(AbsFiltro):
+    """
+    Aplica una secuencia de filtros, la salida de uno es la entrada del siguiente.
+
+    Args:
+        filtros (list): Filtros a aplicar en orden.
+    """
+
+    def __init__(self, filtros):
+        """
+        Inicializa la cadena.
+
+        Args:
+            filtros (list): Filtros (AbsFiltro) a aplicar en orden.
+        """
+        self._filtros = list(filtros)
+
+    def filtrar_bloque(self, valores):
+        """Pasa el bloque por cada filtro de la cadena."""
+        valores = _como_arreglo(valores)
+        for filtro in self._filtros:
+            valores = filtro.filtrar_bloque(valores)
+        return valores
@@ -10,8 +10,15 @@ Patron de Diseno:
 # pylint: disable=duplicate-code
 # El codigo de socket es similar entre proxies (patron comun aceptable)
 
+import logging
+import select
 import socket
+import threading
+import time
 from entidades.abs_bateria import AbsProxyBateria
+from hal.calibracion import TablaCalibracion
+
+_bitacora = logging.getLogger(__name__)
 
 
 # pylint: disable=too-few-public-methods
@@ -23,10 +30,13 @@ class ProxyBateriaArchivo(AbsProxyBateria):
     desde un archivo local llamado 'bateria'.
     """
 
+    # Archivo que escribe el simulador de bateria
+    ARCHIVO = "bateria"
+
     def leer_carga(self):
         """Lee el nivel de carga desde el archivo 'bateria'."""
         try:
-            with open("bateria", "r", encoding="utf-8") as archivo:
+            with open(self.ARCHIVO, "r", encoding="utf-8") as archivo:
                 carga = float(archivo.read())
         except IOError:
             carga = None
@@ -41,47 +51,176 @@ class ProxyBateriaSocket(AbsProxyBateria):
     Implementa la interfaz AbsProxyBateria escuchando conexiones
     TCP para recibir el nivel de carga de un cliente remoto.
 
+    El socket de escucha queda siempre no bloqueante y cada espera se
+    hace con select, de modo que varios hilos pueden leer el mismo proxy
+    (por ejemplo, una verificacion de arranque vencida y el operador).
+
     Patron de Diseno:
         - DIP: Recibe host y puerto via inyeccion de dependencias
 
     Args:
         host: Direccion IP para escuchar conexiones.
         puerto: Puerto TCP para escuchar conexiones.
+        espera: Segundos maximos de espera por lectura (None = sin limite).
     """
 
-    def __init__(self, host, puerto):
+    # Conexiones pendientes de aceptar (rafagas de sensores concurrentes).
+    # Cada lectura vacia la cola y se queda con la mas reciente; una cola
+    # chica acota cuantas lecturas viejas se atienden por lectura.
+    PENDIENTES = 16
+
+    @property
+    def direccion(self):
+        """tuple: (host, puerto) efectivo de escucha; abre el socket si hace falta."""
+        return self._escuchar().getsockname()
+
+    def __init__(self, host, puerto, espera=None):
         """
         Inicializa el proxy con la configuracion de red.
 
+        El socket de escucha se abre en la primera lectura (o al consultar
+        direccion) y se reutiliza en las siguientes.
+
         Args:
             host: Direccion IP para escuchar conexiones.
-            puerto: Puerto TCP para escuchar conexiones.
+            puerto: Puerto TCP para escuchar conexiones (0 = efimero).
+            espera: Segundos maximos de espera por lectura (None = sin limite).
         """
         self._host = host
         self._puerto = puerto
+        self._espera = espera
+        self._servidor = None
+        self._apertura = threading.Lock()
 
     def leer_carga(self):
-        """Lee el nivel de carga via socket TCP."""
-        carga = None
-        servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        servidor.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Permite reusar puerto
+        """
+        Lee el nivel de carga via socket TCP (espera la proxima conexion).
 
-        direccion_servidor = (self._host, self._puerto)
-        servidor.bind(direccion_servidor)
+        Si mientras tanto se encolaron otras conexiones, se atienden todas
+        y se entrega la carga de la ultima: las lecturas viejas se descartan.
 
-        servidor.listen(1)
-        conexion, _ = servidor.accept()
+        Returns:
+            float: Carga recibida, o None si no llego ninguna (o vencio
+                la espera).
+        """
+        servidor = self._escuchar()
+        conexion = self._aceptar(servidor)
+        if conexion is None:
+            return None
+        carga = self._recibir(conexion)
+        for conexion in self._pendientes(servidor):
+            reciente = self._recibir(conexion)
+            if reciente is not None:
+                carga = reciente
+        return carga
 
+    def cerrar(self):
+        """Cierra el socket de escucha."""
+        if self._servidor is not None:
+            self._servidor.close()
+            self._servidor = None
+
+    def _aceptar(self, servidor):
+        """
+        Espera la proxima conexion, a lo sumo espera segundos.
+
+        Si otro hilo toma la conexion anunciada por select, sigue esperando.
+
+        Returns:
+            socket.socket: Conexion con la misma espera por dato, o None si
+                vencio la espera.
+        """
+        limite = None if self._espera is None else time.monotonic() + self._espera
+        while True:
+            restante = None if limite is None else max(limite - time.monotonic(), 0)
+            listos, _, _ = select.select([servidor], [], [], restante)
+            if not listos:
+                return None
+            try:
+                conexion, _ = servidor.accept()
+            except BlockingIOError:
+                continue
+            conexion.settimeout(self._espera)
+            return conexion
+
+    def _pendientes(self, servidor):
+        """Acepta sin bloquear las conexiones ya encoladas (a lo sumo PENDIENTES)."""
+        for _ in range(self.PENDIENTES):
+            try:
+                conexion, _ = servidor.accept()
+            except BlockingIOError:
+                return
+            conexion.settimeout(self._espera)
+            yield conexion
+
+    @staticmethod
+    def _recibir(conexion):
+        """Lee la carga de la conexion hasta que el cliente la cierra y la cierra."""
+        carga = None
         try:
             while True:
                 datos = conexion.recv(4096)
                 if not datos:
                     break
                 carga = float(datos.decode("utf-8"))
-        except ConnectionError as e:  # FIX: sintaxis correcta
-            print("Error de conexión: {}".format(e))
+        except (ConnectionError, socket.timeout) as e:  # FIX: sintaxis correcta
+            _bitacora.warning("error de conexion: %s", e)
         finally:  # FIX: asegurar cierre
             conexion.close()
-            servidor.close()
-
         return carga
+
+    def _escuchar(self):
+        """Retorna el socket de escucha, creandolo en el primer uso (thread-safe)."""
+        with self._apertura:
+            if self._servidor is None:
+                servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                servidor.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Permite reusar puerto
+                servidor.bind((self._host, self._puerto))
+                servidor.listen(self.PENDIENTES)
+                servidor.setblocking(False)
+                self._servidor = servidor
+            return self._servidor
+
+
+# pylint: disable=too-few-public-methods
+class ProxyBateriaHAL(AbsProxyBateria):
+    """
+    Proxy para lectura de bateria desde el ADC (HAL).
+
+    Cada lectura promedia sobremuestreo muestras adquiridas en bloque y
+    convierte las cuentas a la tension de la bateria con la tabla de
+    calibracion del canal.
+
+    Patron de Diseno:
+        - DIP: Recibe el HAL ADC ya inicializado via inyeccion
+
+    Args:
+        hal (AbsHAL_ADC): ADC del que se leen las cuentas.
+        canal (int): Canal de la bateria.
+        sobremuestreo (int): Muestras promediadas por lectura.
+        tabla (TablaCalibracion): Conversion de cuentas a voltios.
+    """
+
+    def __init__(self, hal, canal=1, sobremuestreo=16, tabla=None):
+        """
+        Inicializa el proxy con el ADC y los parametros de adquisicion.
+
+        Args:
+            hal (AbsHAL_ADC): ADC del que se leen las cuentas.
+            canal (int): Canal de la bateria.
+            sobremuestreo (int): Muestras promediadas por lectura.
+            tabla (TablaCalibracion): Conversion de cuentas a voltios. Por
+                defecto la del divisor resistivo de entrada.
+        """
+        self._hal = hal
+        self._canal = canal
+        self._sobremuestreo = sobremuestreo
+        self._tabla = tabla if tabla is not None else TablaCalibracion.lineal_bateria()
+
+    def leer_carga(self):
+        """Lee la tension de la bateria desde el ADC; None si el ADC falla."""
+        try:
+            cuentas = self._hal.leer_sobremuestreado(self._canal, self._sobremuestreo)
+        except IOError:
+            return None
+        return float(self._tabla.convertir(cuentas))
@@ -0,0 +1,194 @@
+"""
+Decoradores que cachean las lecturas de los proxies de entrada.
+
+Los proxies de archivo abren y parsean su archivo en cada lectura aunque
+no haya cambiado. Un proxy cacheado entrega el ultimo valor leido
+mientras no venza su TTL; vencido el TTL, si la fuente es un archivo,
+compara la firma os.stat (mtime, tamano, inodo) con la de la ultima
+lectura y solo reabre el archivo si cambio. Asi la mayoria de las
+lecturas cuestan un stat o nada.
+
+Las lecturas que fallan con excepcion no se cachean: la excepcion se
+propaga y la proxima lectura vuelve a la fuente.
+
+Patron de Diseno:
+    - Decorator: Agrega el cache sin modificar los proxies
+    - Proxy (Cache Proxy): Evita accesos repetidos a la fuente
+"""
+import os
+import threading
+import time
+
+from entidades.abs_bateria import AbsProxyBateria
+from entidades.abs_sensor_temperatura import AbsProxySensorTemperatura
+from servicios_aplicacion.abs_selector_temperatura import AbsSelectorTemperatura
+from servicios_aplicacion.reloj import RelojReal
+
+
+class CacheLectura:
+    """
+    Cache de una lectura con TTL y revalidacion opcional por os.stat.
+
+    Un archivo modificado hace menos de MARGEN_MTIME segundos no se
+    revalida por su firma: con la resolucion gruesa de algunos sistemas
+    de archivos, dos escrituras seguidas del mismo tamano pueden dejar
+    el mismo mtime.
+
+    Args:
+        ttl (float): Segundos en que el valor se entrega sin consultar la fuente.
+        ruta (str): Archivo fuente a revalidar por os.stat (None = solo TTL).
+        reloj (AbsReloj): Reloj del TTL (por defecto RelojReal).
+
+    Attributes:
+        lecturas (int): Lecturas que llegaron a la fuente.
+        aciertos (int): Lecturas entregadas desde el cache.
+    """
+
+    # Segundos desde la modificacion en que la firma no es confiable (FAT: 2 s)
+    MARGEN_MTIME = 2.0
+
+    def __init__(self, ttl=0, ruta=None, reloj=None):
+        self._ttl = ttl
+        self._ruta = ruta
+        self._reloj = reloj if reloj is not None else RelojReal()
+        self._lock = threading.Lock()
+        self._valor = None
+        self._firma = None
+        self._vence = None
+        self.lecturas = 0
+        self.aciertos = 0
+
+    def obtener(self, leer):
+        """
+        Entrega el valor cacheado o lo lee de la fuente.
+
+        Args:
+            leer: Callable sin argumentos que lee la fuente.
+
+        Returns:
+            Valor cacheado o recien leido.
+        """
+        with self._lock:
+            ahora = self._reloj.monotonic()
+            if self._vence is not None and ahora < self._vence:
+                self.aciertos += 1
+                return self._valor
+            firma = self._firmar()
+            if self._vence is not None and firma is not None and firma == self._firma:
+                self._vence = ahora + self._ttl
+                self.aciertos += 1
+                return self._valor
+            # La firma se toma antes de leer: si el archivo cambia durante
+            # la lectura, la proxima firma difiere y se vuelve a leer
+            self._vence = None
+            self.lecturas += 1
+            self._valor = leer()
+            self._firma = firma
+            self._vence = ahora + self._ttl
+            return self._valor
+
+    def invalidar(self):
+        """Descarta el valor cacheado: la proxima lectura va a la fuente."""
+        with self._lock:
+            self._vence = None
+
+    def _firmar(self):
+        """Firma os.stat del archivo, o None si no hay ruta, no existe o es reciente."""
+        if self._ruta is None:
+            return None
+        try:
+            estado = os.stat(self._ruta)
+        except OSError:
+            return None
+        if time.time() - estado.st_mtime < self.MARGEN_MTIME:
+            return None
+        return (estado.st_mtime_ns, estado.st_size, estado.st_ino)
+
+
+# pylint: disable=too-few-public-methods
+class ProxyBateriaCache(AbsProxyBateria):
+    """
+    Cachea las lecturas de carga del proxy envuelto.
+
+    Args:
+        proxy (AbsProxyBateria): Proxy real.
+        ttl (float): Segundos de validez de una lectura.
+        ruta (str): Archivo fuente a revalidar por os.stat (None = solo TTL).
+        reloj (AbsReloj): Reloj del TTL.
+    """
+
+    def __init__(self, proxy, ttl=0, ruta=None, reloj=None):
+        self._proxy = proxy
+        self.cache = CacheLectura(ttl, ruta, reloj)
+
+    def leer_carga(self):
+        """
+        Lee la carga desde el cache o, si vencio, desde el proxy envuelto.
+
+        Returns:
+            float: Carga cacheada o recien leida.
+
+        Raises:
+            OSError, ValueError: Si falla la lectura del proxy (no se cachea).
+        """
+        return self.cache.obtener(self._proxy.leer_carga)
+
+
+class ProxySensorTemperaturaCache(AbsProxySensorTemperatura):
+    """
+    Cachea las lecturas de temperatura del proxy envuelto.
+
+    leer_temperaturas() entrega la lectura cacheada como un bloque de
+    un valor: una fuente cacheada no acumula lecturas.
+
+    Args:
+        proxy (AbsProxySensorTemperatura): Proxy real.
+        ttl (float): Segundos de validez de una lectura.
+        ruta (str): Archivo fuente a revalidar por os.stat (None = solo TTL).
+        reloj (AbsReloj): Reloj del TTL.
+    """
+
+    def __init__(self, proxy, ttl=0, ruta=None, reloj=None):
+        self._proxy = proxy
+        self.cache = CacheLectura(ttl, ruta, reloj)
+
+    def leer_temperatura(self):
+        """
+        Lee la temperatura desde el cache o, si vencio, desde el proxy envuelto.
+
+        Returns:
+            float: Temperatura cacheada o recien leida.
+
+        Raises:
+            OSError, ValueError: Si falla la lectura del proxy (no se cachea).
+        """
+        return self.cache.obtener(self._proxy.leer_temperatura)
+
+
+class SelectorTemperaturaCache(AbsSelectorTemperatura):
+    """
+    Cachea el modo del selector envuelto.
+
+    Args:
+        selector (AbsSelectorTemperatura): Selector real.
+        ttl (float): Segundos de validez de una lectura.
+        ruta (str): Archivo fuente a revalidar por os.stat (None = solo TTL).
+        reloj (AbsReloj): Reloj del TTL.
+    """
+
+    def __init__(self, selector, ttl=0, ruta=None, reloj=None):
+        self._selector = selector
+        self.cache = CacheLectura(ttl, ruta, reloj)
+
+    # pylint: disable=arguments-differ
+    def obtener_selector(self):
+        """
+        Obtiene el modo desde el cache o, si vencio, desde el selector envuelto.
+
+        Returns:
+            str: Modo cacheado o recien leido ('ambiente' o 'deseada').
+
+        Raises:
+            OSError: Si falla la lectura del selector (no se cachea).
+        """
+        return self.cache.obtener(self._selector.obtener_selector)
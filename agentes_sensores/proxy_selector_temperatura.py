@@ -11,11 +11,15 @@ Patron de Diseno:
 # pylint: disable=duplicate-code
 # El codigo de socket y registro es similar entre proxies (patron comun aceptable)
 
-import datetime
+import logging
 import socket
 
+from agentes_sensores.servidor_socket import ServidorSocketNoBloqueante
 from registrador.registrador import AbsRegistrador
 from servicios_aplicacion.abs_selector_temperatura import AbsSelectorTemperatura
+from servicios_aplicacion.reloj import RelojReal
+
+_bitacora = logging.getLogger(__name__)
 
 
 class SelectorTemperaturaArchivo(AbsSelectorTemperatura, AbsRegistrador):
@@ -24,20 +28,35 @@ class SelectorTemperaturaArchivo(AbsSelectorTemperatura, AbsRegistrador):
 
     Lee el modo de temperatura ('ambiente' o 'deseada') desde un archivo
     local llamado 'tipo_temperatura'. Incluye registro de errores.
+
+    Args:
+        reloj (AbsReloj): Reloj de las marcas de error (por defecto RelojReal).
     """
 
-    @staticmethod
-    def obtener_selector():
+    # Archivo que escribe el simulador del selector
+    ARCHIVO = "tipo_temperatura"
+
+    def __init__(self, reloj=None):
+        """
+        Inicializa el selector con el reloj de sus registros.
+
+        Args:
+            reloj (AbsReloj): Reloj de las marcas de fecha y hora.
+        """
+        self._reloj = reloj if reloj is not None else RelojReal()
+
+    # pylint: disable=arguments-differ
+    def obtener_selector(self):
         """Obtiene el modo de temperatura desde archivo."""
         try:
-            with open("tipo_temperatura", "r", encoding="utf-8") as archivo:
+            with open(self.ARCHIVO, "r", encoding="utf-8") as archivo:
                 tipo_temperatura = archivo.read().strip()
         except IOError as exc:
             mensaje_error = "Error al leer el tipo de temperatura"
             registro_error = SelectorTemperaturaArchivo._armar_registro_error(
                 SelectorTemperaturaArchivo.__name__,
                 SelectorTemperaturaArchivo.obtener_selector.__name__,
-                str(datetime.datetime.now()),
+                str(self._reloj.ahora()),
                 str(IOError),
                 mensaje_error)
 
@@ -68,10 +87,11 @@ class SelectorTemperaturaArchivo(AbsSelectorTemperatura, AbsRegistrador):
 
 class SelectorTemperaturaSocket(AbsSelectorTemperatura):
     """
-    Selector de modo de temperatura via socket TCP.
+    Selector de modo de temperatura via socket TCP no bloqueante.
 
     Escucha conexiones TCP para recibir cambios de modo de temperatura.
-    Mantiene el estado actual y responde de forma no-bloqueante.
+    Mantiene el estado actual y lo actualiza con el ultimo modo valido
+    recibido, consultando un ServidorSocketNoBloqueante con timeout cero.
 
     Patron de Diseno:
         - DIP: Recibe host y puerto via inyeccion de dependencias
@@ -81,24 +101,18 @@ class SelectorTemperaturaSocket(AbsSelectorTemperatura):
         puerto: Puerto TCP para escuchar conexiones.
     """
 
+    MODOS_VALIDOS = ("ambiente", "deseada")
+
     def __init__(self, host, puerto):
         """
-        Inicializa el socket persistente y el estado.
+        Inicializa el servidor no bloqueante y el estado.
 
         Args:
             host: Direccion IP para escuchar conexiones.
             puerto: Puerto TCP para escuchar conexiones.
         """
         self._estado_actual = "ambiente"  # Estado inicial
-        self._servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._servidor.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-
-        direccion_servidor = (host, puerto)
-        self._servidor.bind(direccion_servidor)
-        self._servidor.listen(1)
-
-        self._conexion = None
-        self._servidor.settimeout(1.0)  # Timeout para accept
+        self._servidor = ServidorSocketNoBloqueante(host, puerto)
 
     # pylint: disable=arguments-differ
     def obtener_selector(self):
@@ -106,44 +120,45 @@ class SelectorTemperaturaSocket(AbsSelectorTemperatura):
         Consulta no-bloqueante del selector.
         Retorna el estado actual sin bloquearse si no hay cambios.
         """
-        try:
-            # Si no hay conexión activa, intentar aceptar una (con timeout)
-            if self._conexion is None:
-                try:
-                    self._conexion, _ = self._servidor.accept()
-                    self._conexion.settimeout(0.1)  # Timeout corto para recv
-                except socket.timeout:
-                    # No hay cliente intentando conectar, devolver estado actual
-                    return self._estado_actual
-
-            # Intentar leer datos (no bloqueante)
-            try:
-                datos = self._conexion.recv(4096)
-                if datos:
-                    nuevo_estado = str(datos.decode("utf-8"))
-                    self._estado_actual = nuevo_estado
-                    print("[Selector] Cambio a modo: {}".format(self._estado_actual.upper()))
-                else:
-                    # Cliente cerró conexión
-                    self._conexion.close()
-                    self._conexion = None
-            except socket.timeout:
-                # No hay datos nuevos, mantener estado actual
-                pass
-            except ConnectionError as e:
-                print("[Selector] Error de conexión: {}".format(e))
-                if self._conexion:
-                    self._conexion.close()
-                self._conexion = None
+        self._recibir_modos(timeout=0)
+        return self._estado_actual
+
+    def escuchar(self, destino, timeout=0.05):
+        """
+        Espera cambios de modo en el selector y los publica en destino.
+
+        Bloquea en el selector (epoll) hasta timeout segundos y solo
+        publica cuando el modo efectivamente cambia.
+
+        Args:
+            destino: Callable que recibe el nuevo modo.
+            timeout (float): Espera maxima en segundos.
+        """
+        if self._recibir_modos(timeout):
+            destino(self._estado_actual)
+
+    def _recibir_modos(self, timeout):
+        """
+        Actualiza el estado con los modos recibidos.
 
+        Returns:
+            bool: True si el modo cambio.
+        """
+        try:
+            mensajes = self._servidor.sondear(timeout=timeout)
         except (socket.error, OSError) as e:
-            print("[Selector] Error: {}".format(e))
+            _bitacora.warning("error en el selector: %s", e)
+            return False
 
-        return self._estado_actual
+        cambio = False
+        for modo in mensajes:
+            if modo in self.MODOS_VALIDOS and modo != self._estado_actual:
+                self._estado_actual = modo
+                cambio = True
+                _bitacora.info("cambio a modo %s", self._estado_actual)
+        return cambio
 
     def __del__(self):
         """Limpieza al destruir el objeto"""
-        if self._conexion:
-            self._conexion.close()
-        if self._servidor:
-            self._servidor.close()
+        if getattr(self, "_servidor", None) is not None:
+            self._servidor.cerrar()
@@ -6,12 +6,20 @@ permitiendo leer la temperatura ambiente desde archivo o via socket TCP.
 
 Patron de Diseno:
     - Proxy: Representa el sensor de temperatura real/remoto
+    - Decorator: ProxySensorTemperaturaFiltrado filtra la senal de otro proxy
 """
 # pylint: disable=duplicate-code
 # El codigo de socket es similar entre proxies (patron comun aceptable)
 
+import logging
+import select
 import socket
+import threading
+import time
 from entidades.abs_sensor_temperatura import AbsProxySensorTemperatura
+from hal.calibracion import TablaCalibracion
+
+_bitacora = logging.getLogger(__name__)
 
 
 # pylint: disable=too-few-public-methods
@@ -23,10 +31,13 @@ class ProxySensorTemperaturaArchivo(AbsProxySensorTemperatura):
     desde un archivo local llamado 'temperatura'.
     """
 
+    # Archivo que escribe el simulador de temperatura
+    ARCHIVO = "temperatura"
+
     def leer_temperatura(self):
         """Lee la temperatura desde el archivo 'temperatura'."""
         try:
-            with open("temperatura", "r", encoding="utf-8") as archivo:
+            with open(self.ARCHIVO, "r", encoding="utf-8") as archivo:
                 temperatura = int(archivo.read())
         except IOError as exc:
             raise IOError("Error de Lectura de Sensor") from exc
@@ -41,47 +52,248 @@ class ProxySensorTemperaturaSocket(AbsProxySensorTemperatura):
     Implementa la interfaz AbsProxySensorTemperatura escuchando conexiones
     TCP para recibir la temperatura de un cliente remoto.
 
+    El socket de escucha queda siempre no bloqueante y cada espera se
+    hace con select, de modo que varios hilos pueden leer el mismo proxy
+    (por ejemplo, una verificacion de arranque vencida y el operador).
+
     Patron de Diseno:
         - DIP: Recibe host y puerto via inyeccion de dependencias
 
     Args:
         host: Direccion IP para escuchar conexiones.
         puerto: Puerto TCP para escuchar conexiones.
+        espera: Segundos maximos de espera por lectura (None = sin limite).
     """
 
-    def __init__(self, host, puerto):
+    # Conexiones pendientes de aceptar (rafagas de sensores concurrentes).
+    # Cada lectura vacia la cola y se queda con la mas reciente; una cola
+    # chica acota cuantas lecturas viejas se atienden por lectura.
+    PENDIENTES = 16
+
+    @property
+    def direccion(self):
+        """tuple: (host, puerto) efectivo de escucha; abre el socket si hace falta."""
+        return self._escuchar().getsockname()
+
+    def __init__(self, host, puerto, espera=None):
         """
         Inicializa el proxy con la configuracion de red.
 
+        El socket de escucha se abre en la primera lectura (o al consultar
+        direccion) y se reutiliza en las siguientes.
+
         Args:
             host: Direccion IP para escuchar conexiones.
-            puerto: Puerto TCP para escuchar conexiones.
+            puerto: Puerto TCP para escuchar conexiones (0 = efimero).
+            espera: Segundos maximos de espera por lectura (None = sin limite).
         """
         self._host = host
         self._puerto = puerto
+        self._espera = espera
+        self._servidor = None
+        self._apertura = threading.Lock()
 
     def leer_temperatura(self):
-        """Lee la temperatura via socket TCP."""
-        temperatura = None
-        servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        servidor.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Permite reusar puerto
+        """Lee la temperatura via socket TCP (la ultima recibida en la conexion)."""
+        temperaturas = self.leer_temperaturas()
+        return temperaturas[-1] if temperaturas else None
+
+    def leer_temperaturas(self):
+        """
+        Lee las temperaturas de la conexion TCP mas reciente.
+
+        Espera la proxima conexion de un cliente, que puede enviar uno o
+        varios valores separados por espacios o saltos de linea antes de
+        cerrarla. Si mientras tanto se encolaron otras conexiones (el
+        sensor envia mas rapido de lo que se lee), se atienden todas y
+        se entregan los valores de la ultima: las lecturas viejas se
+        descartan.
+
+        Returns:
+            list: Temperaturas recibidas en orden (vacia si no llego ninguna
+                o vencio la espera).
+        """
+        servidor = self._escuchar()
+        conexion = self._aceptar(servidor)
+        if conexion is None:
+            return []
+        datos = self._recibir(conexion)
+        for conexion in self._pendientes(servidor):
+            recientes = self._recibir(conexion)
+            if recientes.split():
+                datos = recientes
+        return [float(valor) for valor in datos.decode("utf-8").split()]
+
+    def cerrar(self):
+        """Cierra el socket de escucha."""
+        if self._servidor is not None:
+            self._servidor.close()
+            self._servidor = None
+
+    def _aceptar(self, servidor):
+        """
+        Espera la proxima conexion, a lo sumo espera segundos.
+
+        Si otro hilo toma la conexion anunciada por select, sigue esperando.
 
-        direccion_servidor = (self._host, self._puerto)
-        servidor.bind(direccion_servidor)
+        Returns:
+            socket.socket: Conexion con la misma espera por dato, o None si
+                vencio la espera.
+        """
+        limite = None if self._espera is None else time.monotonic() + self._espera
+        while True:
+            restante = None if limite is None else max(limite - time.monotonic(), 0)
+            listos, _, _ = select.select([servidor], [], [], restante)
+            if not listos:
+                return None
+            try:
+                conexion, _ = servidor.accept()
+            except BlockingIOError:
+                continue
+            conexion.settimeout(self._espera)
+            return conexion
 
-        servidor.listen(1)
-        conexion, _ = servidor.accept()
+    def _pendientes(self, servidor):
+        """Acepta sin bloquear las conexiones ya encoladas (a lo sumo PENDIENTES)."""
+        for _ in range(self.PENDIENTES):
+            try:
+                conexion, _ = servidor.accept()
+            except BlockingIOError:
+                return
+            conexion.settimeout(self._espera)
+            yield conexion
 
+    @staticmethod
+    def _recibir(conexion):
+        """Lee la conexion hasta que el cliente la cierra y la cierra."""
+        datos = bytearray()
         try:
             while True:
-                datos = conexion.recv(4096)
-                if not datos:
+                bloque = conexion.recv(4096)
+                if not bloque:
                     break
-                temperatura = float(datos.decode("utf-8"))
-        except ConnectionError as e:  # FIX: sintaxis correcta
-            print("Error de conexión: {}".format(e))
+                datos.extend(bloque)
+        except (ConnectionError, socket.timeout) as e:  # FIX: sintaxis correcta
+            _bitacora.warning("error de conexion: %s", e)
         finally:  # FIX: asegurar cierre
             conexion.close()
-            servidor.close()
+        return bytes(datos)
 
-        return temperatura
+    def _escuchar(self):
+        """Retorna el socket de escucha, creandolo en el primer uso (thread-safe)."""
+        with self._apertura:
+            if self._servidor is None:
+                servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                servidor.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Permite reusar puerto
+                servidor.bind((self._host, self._puerto))
+                servidor.listen(self.PENDIENTES)
+                servidor.setblocking(False)
+                self._servidor = servidor
+            return self._servidor
+
+
+# pylint: disable=too-few-public-methods
+class ProxySensorTemperaturaHAL(AbsProxySensorTemperatura):
+    """
+    Proxy para lectura de temperatura desde el ADC (HAL).
+
+    Cada lectura adquiere un bloque de lecturas * sobremuestreo muestras,
+    lo decima promediando y convierte todas las cuentas a grados de una
+    sola vez con la tabla de calibracion del canal. leer_temperaturas()
+    entrega el bloque completo, de modo que un
+    ProxySensorTemperaturaFiltrado lo filtra en lote.
+
+    Patron de Diseno:
+        - DIP: Recibe el HAL ADC ya inicializado via inyeccion
+
+    Args:
+        hal (AbsHAL_ADC): ADC del que se leen las cuentas.
+        canal (int): Canal del sensor de temperatura.
+        lecturas (int): Valores decimados entregados por leer_temperaturas().
+        sobremuestreo (int): Muestras promediadas por valor.
+        tabla (TablaCalibracion): Conversion de cuentas a grados.
+    """
+
+    def __init__(self, hal, canal=0, lecturas=4, sobremuestreo=16, tabla=None):
+        """
+        Inicializa el proxy con el ADC y los parametros de adquisicion.
+
+        Args:
+            hal (AbsHAL_ADC): ADC del que se leen las cuentas.
+            canal (int): Canal del sensor de temperatura.
+            lecturas (int): Valores decimados por bloque.
+            sobremuestreo (int): Muestras promediadas por valor.
+            tabla (TablaCalibracion): Conversion de cuentas a grados. Por
+                defecto la del sensor lineal (TMP36).
+        """
+        self._hal = hal
+        self._canal = canal
+        self._lecturas = lecturas
+        self._sobremuestreo = sobremuestreo
+        self._tabla = tabla if tabla is not None else TablaCalibracion.lineal_temperatura()
+        self._cuentas = None
+
+    def leer_temperatura(self):
+        """Lee la temperatura desde el ADC (el ultimo valor del bloque)."""
+        return self.leer_temperaturas()[-1]
+
+    def leer_temperaturas(self):
+        """
+        Lee un bloque de temperaturas desde el ADC.
+
+        Returns:
+            list: Temperaturas en grados Celsius, de la mas antigua a la mas nueva.
+
+        Raises:
+            IOError: Si el ADC no esta inicializado.
+        """
+        self._cuentas = self._hal.leer_decimado(self._canal, self._lecturas,
+                                                self._sobremuestreo, self._cuentas)
+        return self._tabla.convertir(self._cuentas).tolist()
+
+
+class ProxySensorTemperaturaFiltrado(AbsProxySensorTemperatura):
+    """
+    Proxy que filtra la senal de otro proxy de temperatura.
+
+    Se intercala entre el proxy del sensor y el GestorAmbiente: lee en
+    bloque todas las lecturas disponibles del proxy decorado, las pasa
+    por el filtro de una sola vez y entrega el ultimo valor filtrado.
+
+    Patron de Diseno:
+        - Decorator: Agrega filtrado sin modificar el proxy original
+
+    Args:
+        proxy (AbsProxySensorTemperatura): Proxy con las lecturas crudas.
+        filtro (AbsFiltro): Filtro o cadena de filtros a aplicar.
+    """
+
+    def __init__(self, proxy, filtro):
+        """
+        Inicializa el proxy filtrado.
+
+        Args:
+            proxy (AbsProxySensorTemperatura): Proxy con las lecturas crudas.
+            filtro (AbsFiltro): Filtro o cadena de filtros a aplicar.
+        """
+        self._proxy = proxy
+        self._filtro = filtro
+
+    def leer_temperatura(self):
+        """Lee y filtra las temperaturas disponibles; retorna la ultima filtrada."""
+        temperaturas = self.leer_temperaturas()
+        return temperaturas[-1] if temperaturas else None
+
+    def leer_temperaturas(self):
+        """
+        Lee en bloque las temperaturas del proxy decorado y las filtra.
+
+        Las lecturas None (sensor sin dato) se descartan antes de filtrar.
+
+        Returns:
+            list: Temperaturas filtradas en orden de llegada.
+        """
+        crudas = [valor for valor in self._proxy.leer_temperaturas() if valor is not None]
+        if not crudas:
+            return []
+        return [float(valor) for valor in self._filtro.filtrar_bloque(crudas)]
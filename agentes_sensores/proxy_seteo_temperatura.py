@@ -8,9 +8,15 @@ o via socket TCP.
 Patron de Diseno:
     - Proxy: Representa el control de seteo real/remoto
 """
+import logging
 import socket
+from collections import deque
+
+from agentes_sensores.servidor_socket import ServidorSocketNoBloqueante
 from servicios_aplicacion.abs_seteo_temperatura import AbsSeteoTemperatura
 
+_bitacora = logging.getLogger(__name__)
+
 
 # pylint: disable=too-few-public-methods
 class SeteoTemperatura(AbsSeteoTemperatura):
@@ -31,10 +37,12 @@ class SeteoTemperatura(AbsSeteoTemperatura):
 
 class SeteoTemperaturaSocket(AbsSeteoTemperatura):
     """
-    Seteo de temperatura via socket TCP.
+    Seteo de temperatura via socket TCP no bloqueante.
 
-    Escucha conexiones TCP para recibir comandos de ajuste
-    de temperatura ('aumentar' o 'disminuir').
+    Escucha conexiones TCP para recibir comandos de ajuste de temperatura
+    ('aumentar' o 'disminuir'). Usa un ServidorSocketNoBloqueante
+    consultado con timeout cero, admite varios clientes simultaneos y
+    encola todos los comandos recibidos en un mismo paquete.
 
     Patron de Diseno:
         - DIP: Recibe host y puerto via inyeccion de dependencias
@@ -44,70 +52,67 @@ class SeteoTemperaturaSocket(AbsSeteoTemperatura):
         puerto: Puerto TCP para escuchar conexiones.
     """
 
+    COMANDOS_VALIDOS = ("aumentar", "disminuir")
+
+    @property
+    def pendientes(self):
+        """int: Comandos recibidos que todavia no se entregaron."""
+        return len(self._pendientes)
+
     def __init__(self, host, puerto):
         """
-        Inicializa el socket persistente.
+        Inicializa el servidor no bloqueante y la cola de comandos.
 
         Args:
             host: Direccion IP para escuchar conexiones.
             puerto: Puerto TCP para escuchar conexiones.
         """
-        self._servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._servidor.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._servidor = ServidorSocketNoBloqueante(host, puerto)
+        self._pendientes = deque()
 
-        direccion_servidor = (host, puerto)
-        self._servidor.bind(direccion_servidor)
-        self._servidor.listen(1)
+    def obtener_seteo(self):
+        """
+        Consulta no bloqueante del proximo comando de seteo.
 
-        self._conexion = None
-        self._servidor.settimeout(2.0)  # Timeout para accept
+        Returns:
+            str: 'aumentar', 'disminuir' o None si no hay comandos pendientes.
+        """
+        if not self._pendientes:
+            self._recibir_comandos()
+        if self._pendientes:
+            return self._pendientes.popleft()
+        return None
 
-    def obtener_seteo(self):
+    def escuchar(self, destino, timeout=0.05):
         """
-        Espera comando de seteo (aumentar/disminuir).
-        Mantiene socket abierto para recibir múltiples comandos.
+        Espera comandos en el selector y los publica en destino.
+
+        Bloquea en el selector (epoll) hasta timeout segundos, sin sondear.
+
+        Args:
+            destino: Callable que recibe cada comando valido.
+            timeout (float): Espera maxima en segundos.
         """
-        diferencia = None
+        if not self._pendientes:
+            self._recibir_comandos(timeout)
+        while self._pendientes:
+            destino(self._pendientes.popleft())
 
+    def _recibir_comandos(self, timeout=0):
+        """Encola los comandos validos recibidos desde la ultima consulta."""
         try:
-            # Si no hay conexión activa, aceptar una (con timeout)
-            if self._conexion is None:
-                try:
-                    self._conexion, direccion_cliente = self._servidor.accept()
-                    self._conexion.settimeout(5.0)  # Timeout para recv
-                    print("[Seteo] Cliente conectado: {}".format(direccion_cliente))
-                except socket.timeout:
-                    # No hay cliente, retornar None
-                    return None
-
-            # Leer comando (bloqueante con timeout)
-            try:
-                datos = self._conexion.recv(4096)
-                if datos:
-                    diferencia = str(datos.decode("utf-8"))
-                    print("[Seteo] Comando recibido: {}".format(diferencia))
-                else:
-                    # Cliente cerró conexión
-                    print("[Seteo] Cliente desconectado")
-                    self._conexion.close()
-                    self._conexion = None
-            except socket.timeout:
-                # Timeout esperando comando, retornar None
-                return None
-            except ConnectionError as e:
-                print("[Seteo] Error de conexión: {}".format(e))
-                if self._conexion:
-                    self._conexion.close()
-                self._conexion = None
-
+            mensajes = self._servidor.sondear(timeout=timeout)
         except (socket.error, OSError) as e:
-            print("[Seteo] Error: {}".format(e))
-
-        return diferencia
+            _bitacora.warning("error en el seteo: %s", e)
+            return
+        for comando in mensajes:
+            if comando in self.COMANDOS_VALIDOS:
+                _bitacora.debug("comando recibido: %s", comando)
+                self._pendientes.append(comando)
+            else:
+                _bitacora.warning("comando ignorado: %s", comando)
 
     def __del__(self):
         """Limpieza al destruir el objeto"""
-        if self._conexion:
-            self._conexion.close()
-        if self._servidor:
-            self._servidor.close()
+        if getattr(self, "_servidor", None) is not None:
+            self._servidor.cerrar()
@@ -0,0 +1,126 @@
+"""
+Decoradores que leen los archivos de sensor solo cuando se escriben.
+
+Los proxies de archivo se consultan con el periodo de cada hilo del
+operador, aunque el archivo no haya cambiado. Un proxy vigilado bloquea
+la lectura hasta que un vigia (inotify, o sondeo de os.stat donde no
+hay inotify) informa que el archivo se escribio, y recien entonces lo
+lee. Con periodo 0 en el operador, el gestor recibe cada valor apenas
+se escribe y el hilo no consume CPU mientras espera.
+
+Patron de Diseno:
+    - Decorator: Agrega la espera por cambios sin modificar los proxies
+"""
+from entidades.abs_bateria import AbsProxyBateria
+from entidades.abs_sensor_temperatura import AbsProxySensorTemperatura
+
+
+class LecturaVigilada:
+    """
+    Lectura que espera la escritura del archivo antes de consultarlo.
+
+    La primera lectura es inmediata (la necesita el Inicializador). Si
+    vence la espera sin escrituras se entrega el ultimo valor sin abrir
+    el archivo; si la lectura anterior fallo, se reintenta para que el
+    error siga visible. Pensada para un unico lector por archivo.
+
+    Args:
+        vigia (AbsVigiaArchivo): Vigia del archivo fuente.
+        espera (float): Segundos maximos de espera por lectura (None = sin limite).
+
+    Attributes:
+        lecturas (int): Lecturas que abrieron el archivo.
+        vencidas (int): Esperas que vencieron sin escrituras.
+    """
+
+    def __init__(self, vigia, espera=None):
+        self._vigia = vigia
+        self._espera = espera
+        self._primera = True
+        self._vigente = False
+        self._valor = None
+        self.lecturas = 0
+        self.vencidas = 0
+
+    def obtener(self, leer):
+        """
+        Espera una escritura del archivo y lo lee.
+
+        Args:
+            leer: Callable sin argumentos que lee el archivo.
+
+        Returns:
+            Valor recien leido, o el ultimo si no hubo escrituras.
+        """
+        if self._primera:
+            self._primera = False
+        elif not self._vigia.esperar(self._espera):
+            self.vencidas += 1
+            if self._vigente:
+                return self._valor
+        self._vigente = False
+        self.lecturas += 1
+        self._valor = leer()
+        self._vigente = True
+        return self._valor
+
+    def cerrar(self):
+        """Libera el vigia."""
+        self._vigia.cerrar()
+
+
+# pylint: disable=too-few-public-methods
+class ProxyBateriaVigilado(AbsProxyBateria):
+    """
+    Lee la carga del proxy envuelto cada vez que se escribe su archivo.
+
+    Args:
+        proxy (AbsProxyBateria): Proxy de archivo.
+        vigia (AbsVigiaArchivo): Vigia del archivo del proxy.
+        espera (float): Segundos maximos de espera por lectura (None = sin limite).
+    """
+
+    def __init__(self, proxy, vigia, espera=None):
+        self._proxy = proxy
+        self.lectura = LecturaVigilada(vigia, espera)
+
+    def leer_carga(self):
+        """
+        Espera la escritura del archivo de bateria y lee la carga.
+
+        Returns:
+            float: Carga recien leida, o la ultima si vencio la espera.
+        """
+        return self.lectura.obtener(self._proxy.leer_carga)
+
+    def cerrar(self):
+        """Libera el vigia."""
+        self.lectura.cerrar()
+
+
+class ProxySensorTemperaturaVigilado(AbsProxySensorTemperatura):
+    """
+    Lee la temperatura del proxy envuelto cada vez que se escribe su archivo.
+
+    Args:
+        proxy (AbsProxySensorTemperatura): Proxy de archivo.
+        vigia (AbsVigiaArchivo): Vigia del archivo del proxy.
+        espera (float): Segundos maximos de espera por lectura (None = sin limite).
+    """
+
+    def __init__(self, proxy, vigia, espera=None):
+        self._proxy = proxy
+        self.lectura = LecturaVigilada(vigia, espera)
+
+    def leer_temperatura(self):
+        """
+        Espera la escritura del archivo de temperatura y la lee.
+
+        Returns:
+            int: Temperatura recien leida, o la ultima si vencio la espera.
+        """
+        return self.lectura.obtener(self._proxy.leer_temperatura)
+
+    def cerrar(self):
+        """Libera el vigia."""
+        self.lectura.cerrar()
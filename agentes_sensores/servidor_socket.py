@@ -0,0 +1,192 @@
+"""
+Servidor TCP no bloqueante basado en el modulo selectors.
+
+Este modulo contiene el servidor comun usado por los proxies de entrada
+del usuario (selector de modo y seteo de temperatura). Multiplexa el
+socket de escucha y todas las conexiones de clientes en un unico
+selector (epoll en Linux) y se consulta con timeout cero, por lo que
+nunca bloquea al hilo que lo invoca.
+
+Patron de Diseno:
+    - Reactor: Un selector despacha eventos de multiples sockets
+    - DIP: Recibe host y puerto via inyeccion de dependencias
+
+Protocolo:
+    Los mensajes son palabras separadas por espacios o saltos de linea
+    ("aumentar\\naumentar\\n"). Un mensaje sin separador final queda en
+    el buffer hasta que llegue el resto o el cliente cierre la conexion,
+    lo que mantiene compatibilidad con los simuladores que envian un
+    unico comando por conexion sin terminador.
+
+    Con por_lineas=True cada linea es un mensaje (puede contener
+    espacios, como "ambiente: 25"); lo usan los carteles, que reciben
+    los valores de los visualizadores socket por una conexion persistente.
+"""
+import logging
+import selectors
+import socket
+
+_bitacora = logging.getLogger(__name__)
+
+
+class ServidorSocketNoBloqueante:
+    """
+    Servidor TCP no bloqueante con multiples clientes concurrentes.
+
+    Cada conexion aceptada tiene su propio buffer de recepcion, de modo
+    que los mensajes fragmentados entre paquetes se reensamblan y varios
+    mensajes en un mismo paquete se entregan todos, en orden.
+
+    Args:
+        host: Direccion IP para escuchar conexiones.
+        puerto: Puerto TCP para escuchar conexiones (0 = efimero).
+        max_clientes: Tamano de la cola de conexiones pendientes.
+        por_lineas (bool): Separa los mensajes por saltos de linea en
+            lugar de por espacios.
+    """
+
+    TAMANO_LECTURA = 4096
+
+    @property
+    def direccion(self):
+        """tuple: Direccion (host, puerto) efectiva del socket de escucha."""
+        return self._servidor.getsockname()
+
+    @property
+    def cantidad_clientes(self):
+        """int: Cantidad de clientes conectados actualmente."""
+        return len(self._selector.get_map()) - 1
+
+    def __init__(self, host, puerto, max_clientes=5, por_lineas=False):
+        """
+        Crea el socket de escucha y lo registra en el selector.
+
+        Args:
+            host: Direccion IP para escuchar conexiones.
+            puerto: Puerto TCP para escuchar conexiones.
+            max_clientes: Tamano de la cola de conexiones pendientes.
+            por_lineas (bool): Separa los mensajes por saltos de linea.
+        """
+        self._por_lineas = por_lineas
+        self._selector = selectors.DefaultSelector()
+        self._servidor = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._servidor.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._servidor.bind((host, puerto))
+        self._servidor.listen(max_clientes)
+        self._servidor.setblocking(False)
+        self._selector.register(self._servidor, selectors.EVENT_READ, data=None)
+
+    def sondear(self, timeout=0):
+        """
+        Procesa los eventos pendientes y retorna los mensajes completos.
+
+        Args:
+            timeout: Segundos maximos de espera. 0 retorna inmediatamente.
+
+        Returns:
+            list: Mensajes (str) recibidos de todos los clientes, en orden.
+        """
+        mensajes = []
+        for clave, _ in self._selector.select(timeout):
+            if clave.data is None:
+                self._aceptar()
+            else:
+                mensajes.extend(self._leer(clave.fileobj, clave.data))
+        return mensajes
+
+    def cerrar(self):
+        """Cierra todas las conexiones y el socket de escucha."""
+        if self._selector is None:
+            return
+        for clave in list(self._selector.get_map().values()):
+            self._selector.unregister(clave.fileobj)
+            clave.fileobj.close()
+        self._selector.close()
+        self._selector = None
+
+    def _aceptar(self):
+        """Acepta un cliente nuevo y lo registra con un buffer vacio."""
+        try:
+            conexion, direccion_cliente = self._servidor.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        conexion.setblocking(False)
+        self._selector.register(conexion, selectors.EVENT_READ, data=bytearray())
+        _bitacora.debug("cliente conectado: %s", direccion_cliente)
+
+    def _leer(self, conexion, buffer):
+        """
+        Lee los datos disponibles de un cliente y extrae sus mensajes.
+
+        Args:
+            conexion: Socket del cliente con datos disponibles.
+            buffer (bytearray): Buffer de recepcion del cliente.
+
+        Returns:
+            list: Mensajes completos extraidos del buffer.
+        """
+        try:
+            datos = conexion.recv(self.TAMANO_LECTURA)
+        except (BlockingIOError, InterruptedError):
+            return []
+        except ConnectionError as e:
+            _bitacora.warning("error de conexion: %s", e)
+            datos = b""
+
+        if datos:
+            buffer.extend(datos)
+            return self._extraer_mensajes(buffer, fin_de_flujo=False)
+
+        # El cliente cerro la conexion: lo pendiente es un mensaje completo
+        self._selector.unregister(conexion)
+        conexion.close()
+        return self._extraer_mensajes(buffer, fin_de_flujo=True)
+
+    def _extraer_mensajes(self, buffer, fin_de_flujo):
+        """
+        Separa los mensajes completos del buffer, dejando el resto.
+
+        Args:
+            buffer (bytearray): Buffer de recepcion (se modifica in-place).
+            fin_de_flujo (bool): True si no llegaran mas datos.
+
+        Returns:
+            list: Mensajes completos decodificados.
+        """
+        if self._por_lineas:
+            return self._extraer_lineas(buffer, fin_de_flujo)
+        texto = buffer.decode("utf-8", errors="replace")
+        if fin_de_flujo or texto[-1:].isspace():
+            del buffer[:]
+            return texto.split()
+
+        partes = texto.split()
+        pendiente = partes.pop() if partes else ""
+        del buffer[:]
+        buffer.extend(pendiente.encode("utf-8"))
+        return partes
+
+    @staticmethod
+    def _extraer_lineas(buffer, fin_de_flujo):
+        """
+        Separa las lineas completas del buffer, dejando la ultima incompleta.
+
+        Se corta en bytes antes de decodificar, para no partir un caracter
+        UTF-8 que llego repartido en dos paquetes.
+
+        Args:
+            buffer (bytearray): Buffer de recepcion (se modifica in-place).
+            fin_de_flujo (bool): True si no llegaran mas datos.
+
+        Returns:
+            list: Lineas no vacias, sin espacios en los extremos.
+        """
+        fin = len(buffer) if fin_de_flujo else buffer.rfind(b"\n") + 1
+        completas = bytes(buffer[:fin]).decode("utf-8", errors="replace")
+        del buffer[:fin]
+        return [linea.strip() for linea in completas.splitlines() if linea.strip()]
+
+    def __del__(self):
+        """Limpieza al destruir el objeto"""
+        if getattr(self, "_selector", None) is not None:
+            self.cerrar()
@@ -0,0 +1,235 @@
+"""
+Vigias que esperan la escritura de un archivo de sensor.
+
+Los simuladores de archivo escriben el valor del sensor con open/write/
+close (o reemplazando el archivo). Un vigia bloquea al lector hasta que
+el archivo se vuelve a escribir:
+    - VigiaInotify: inotify de Linux sobre el directorio del archivo;
+      despierta con IN_CLOSE_WRITE o IN_MOVED_TO y no consume CPU
+      mientras espera
+    - VigiaSondeo: alternativa portable que compara la firma os.stat
+      (mtime, tamano, inodo) cada cierto periodo
+
+crear_vigia() elige inotify si esta disponible y, si no, el sondeo.
+Los plazos se miden con el reloj inyectado (AbsReloj), de modo que con
+un RelojVirtual el sondeo avanza en tiempo simulado.
+
+Patron de Diseno:
+    - Strategy: Mecanismo de espera intercambiable
+"""
+import logging
+import os
+import select
+import struct
+from abc import ABCMeta, abstractmethod
+
+from servicios_aplicacion.reloj import RelojReal
+
+try:
+    import ctypes
+    import ctypes.util
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    _inotify_init1 = _libc.inotify_init1
+    _inotify_add_watch = _libc.inotify_add_watch
+except (ImportError, OSError, AttributeError):  # pragma: no cover - depende del entorno
+    _inotify_init1 = _inotify_add_watch = None
+
+_bitacora = logging.getLogger(__name__)
+
+# Mascaras de inotify (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+
+# Encabezado de un evento: wd, mask, cookie, len
+_EVENTO = struct.Struct("iIII")
+
+
+def inotify_disponible():
+    """bool: True si la plataforma ofrece inotify (Linux)."""
+    return _inotify_init1 is not None
+
+
+class AbsVigiaArchivo(metaclass=ABCMeta):
+    """
+    Espera a que un archivo se vuelva a escribir.
+
+    Args:
+        ruta (str): Archivo vigilado.
+        reloj (AbsReloj): Reloj de los plazos (por defecto RelojReal).
+    """
+
+    def __init__(self, ruta, reloj=None):
+        self.ruta = ruta
+        self._reloj = reloj if reloj is not None else RelojReal()
+
+    @abstractmethod
+    def esperar(self, timeout=None):
+        """
+        Bloquea hasta que el archivo se escribe o vence el timeout.
+
+        Las escrituras ocurridas desde la espera anterior cuentan: no se
+        pierden cambios entre una espera y la siguiente.
+
+        Args:
+            timeout (float): Segundos maximos de espera (None = sin limite).
+
+        Returns:
+            bool: True si el archivo se escribio, False si vencio el timeout.
+        """
+
+    def cerrar(self):
+        """Libera los recursos del vigia."""
+
+
+class VigiaInotify(AbsVigiaArchivo):
+    """
+    Vigia basado en inotify.
+
+    Vigila el directorio del archivo (no el archivo) para detectar
+    tambien el reemplazo atomico por rename y la creacion del archivo.
+    La espera la hace el kernel (select); el reloj mide el plazo.
+
+    Args:
+        ruta (str): Archivo vigilado.
+        reloj (AbsReloj): Reloj de los plazos (por defecto RelojReal).
+
+    Raises:
+        OSError: Si inotify no esta disponible o no se pudo crear la vigilancia.
+    """
+
+    def __init__(self, ruta, reloj=None):
+        super().__init__(ruta, reloj)
+        if not inotify_disponible():
+            raise OSError("inotify no disponible en esta plataforma")
+        self._nombre = os.fsencode(os.path.basename(ruta))
+        directorio = os.path.dirname(ruta) or "."
+        self._fd = _inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            codigo = ctypes.get_errno()
+            raise OSError(codigo, "inotify_init1: {}".format(os.strerror(codigo)))
+        if _inotify_add_watch(self._fd, os.fsencode(directorio),
+                              IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            codigo = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(codigo, "inotify_add_watch {}: {}".format(directorio,
+                                                                    os.strerror(codigo)))
+
+    def esperar(self, timeout=None):
+        """
+        Bloquea en select hasta un evento del archivo o el fin del plazo.
+
+        Los eventos de otros archivos del directorio se descartan y la
+        espera sigue por el plazo restante.
+
+        Args:
+            timeout (float): Segundos maximos de espera (None = sin limite).
+
+        Returns:
+            bool: True si el archivo se escribio, False si vencio el timeout.
+        """
+        fin = None if timeout is None else self._reloj.monotonic() + timeout
+        while True:
+            restante = None if fin is None else max(fin - self._reloj.monotonic(), 0)
+            listos, _, _ = select.select([self._fd], [], [], restante)
+            if not listos:
+                return False
+            if self._escrito():
+                return True
+
+    def cerrar(self):
+        """Cierra el descriptor de inotify (se puede llamar mas de una vez)."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _escrito(self):
+        """Consume los eventos pendientes; True si alguno es del archivo vigilado."""
+        escrito = False
+        while True:
+            try:
+                datos = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return escrito
+            desplazamiento = 0
+            while desplazamiento < len(datos):
+                _, mascara, _, largo = _EVENTO.unpack_from(datos, desplazamiento)
+                desplazamiento += _EVENTO.size
+                nombre = datos[desplazamiento:desplazamiento + largo].rstrip(b"\0")
+                desplazamiento += largo
+                if mascara & IN_Q_OVERFLOW or nombre == self._nombre:
+                    escrito = True
+
+
+class VigiaSondeo(AbsVigiaArchivo):
+    """
+    Vigia portable que sondea la firma os.stat del archivo.
+
+    Dos escrituras del mismo tamano dentro del mismo tic de mtime del
+    sistema de archivos no se distinguen; la siguiente escritura si.
+
+    Args:
+        ruta (str): Archivo vigilado.
+        periodo (float): Segundos entre sondeos.
+        reloj (AbsReloj): Reloj de los sondeos y plazos (por defecto RelojReal).
+    """
+
+    def __init__(self, ruta, periodo=0.5, reloj=None):
+        super().__init__(ruta, reloj)
+        self._periodo = periodo
+        self._firma = self._firmar()
+
+    def esperar(self, timeout=None):
+        """
+        Sondea la firma del archivo cada periodo hasta que cambia o vence el plazo.
+
+        Durante el sondeo duerme con el reloj inyectado.
+
+        Args:
+            timeout (float): Segundos maximos de espera (None = sin limite).
+
+        Returns:
+            bool: True si el archivo se escribio, False si vencio el timeout.
+        """
+        fin = None if timeout is None else self._reloj.monotonic() + timeout
+        while True:
+            firma = self._firmar()
+            if firma != self._firma:
+                # Un archivo borrado no cuenta como escrito: se espera que vuelva
+                self._firma = firma
+                if firma is not None:
+                    return True
+            if fin is not None and self._reloj.monotonic() >= fin:
+                return False
+            espera = self._periodo if fin is None else min(
+                self._periodo, max(fin - self._reloj.monotonic(), 0))
+            self._reloj.sleep(espera)
+
+    def _firmar(self):
+        """Firma os.stat del archivo, o None si no existe."""
+        try:
+            estado = os.stat(self.ruta)
+        except OSError:
+            return None
+        return (estado.st_mtime_ns, estado.st_size, estado.st_ino)
+
+
+def crear_vigia(ruta, periodo_sondeo=0.5, reloj=None):
+    """
+    Crea el vigia de un archivo: inotify si se puede, sondeo si no.
+
+    Args:
+        ruta (str): Archivo vigilado.
+        periodo_sondeo (float): Periodo del sondeo alternativo.
+        reloj (AbsReloj): Reloj de los plazos (por defecto RelojReal).
+
+    Returns:
+        AbsVigiaArchivo: Vigia del archivo.
+    """
+    if inotify_disponible():
+        try:
+            return VigiaInotify(ruta, reloj)
+        except OSError as exc:
+            _bitacora.warning("inotify no disponible para %s (%s), se sondea cada %s s",
+                              ruta, exc, periodo_sondeo)
+    return VigiaSondeo(ruta, periodo_sondeo, reloj)
@@ -9,7 +9,9 @@ Patron de Diseno:
     - Abstract Factory: Crea familias de objetos relacionados
     - Singleton (configuracion): Una sola configuracion global
 """
+import atexit
 import json
+import logging
 import os
 from configurador.factory_proxy_bateria import FactoryProxyBateria
 from configurador.factory_sensor_temperatura import FactoryProxySensorTemperatura
@@ -20,6 +22,37 @@ from configurador.factory_climatizador import FactoryClimatizador
 from configurador.factory_visualizador_temperatura import FactoryVisualizadorTemperatura
 from configurador.factory_selector_temperatura import FactorySelectorTemperatura
 from configurador.factory_seteo_temperatura import FactorySeteoTemperatura
+from configurador.factory_filtro_senal import FactoryFiltroSenal
+from configurador.factory_hal_adc import FactoryHAL_ADC
+from configurador.factory_tabla_calibracion import FactoryTablaCalibracion
+from configurador.factory_reloj import FactoryReloj
+from configurador.factory_publicador_zonas import FactoryPublicadorZonas
+from configurador.factory_politica_entrega import FactoryPoliticaEntrega
+from agentes_sensores.filtros_senal import CadenaFiltros
+from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaFiltrado
+from agentes_sensores.proxy_cache import (
+    ProxyBateriaCache, ProxySensorTemperaturaCache, SelectorTemperaturaCache
+)
+from trazas.traza import GrabadorTraza
+from metricas.registro import RegistroMetricas
+from metricas.servidor import ServidorMetricas
+from metricas.perfilador import PerfiladorTareas
+from estado_compartido.tabla import TablaEstado
+from eventos.bus import BusEventos
+from servicios_aplicacion.inicializador import Inicializador, ParametrosSensor
+from gestores_entidades.guarda_actuador import GuardaActuador
+from metricas.instrumentos import (
+    ActuadorClimatizadorMedido, ProxyBateriaMedido, ProxySensorTemperaturaMedido,
+    SeteoTemperaturaMedido, VisualizadorBateriaMedido, VisualizadorClimatizadorMedido,
+    VisualizadorTemperaturaMedido, registrar_guarda
+)
+from trazas.grabadores import (
+    ProxyBateriaGrabador, ProxySensorTemperaturaGrabador,
+    SelectorTemperaturaGrabador, SeteoTemperaturaGrabador
+)
+from registrador.bitacora import configurar_bitacora
+
+_bitacora = logging.getLogger(__name__)
 
 
 # pylint: disable=unsubscriptable-object,unsupported-membership-test
@@ -40,6 +73,18 @@ class Configurador:
     """
 
     configuracion_termostato = None
+    hal_adc = None
+    grabador_traza = None
+    reloj = None
+    metricas = None
+
+    # Entradas que pueden escuchar en un socket: (clave del tipo, puerto en red.puertos)
+    ENTRADAS_SOCKET = (
+        ("proxy_bateria", "bateria"),
+        ("proxy_sensor_temperatura", "temperatura"),
+        ("selector_temperatura", "selector_temperatura"),
+        ("seteo_temperatura", "seteo_temperatura"),
+    )
 
     @staticmethod
     def cargar_configuracion():
@@ -85,50 +130,197 @@ class Configurador:
 
     @staticmethod
     def configurar_proxy_bateria():
-        """Crea y retorna el proxy de bateria segun configuracion."""
+        """
+        Crea y retorna el proxy de bateria segun configuracion.
+
+        Con seccion "cache" las lecturas de archivo se cachean (ver
+        _cachear). Si hay seccion "metricas" se miden las lecturas
+        y, si la seccion "traza" define un archivo, el proxy se envuelve
+        en un ProxyBateriaGrabador.
+        """
         tipo = Configurador.configuracion_termostato["proxy_bateria"]
         if tipo == "socket":
             host = Configurador.obtener_host_escucha()
             puerto = Configurador.obtener_puerto("bateria")
-            return FactoryProxyBateria.crear(tipo, host, puerto)
-        return FactoryProxyBateria.crear(tipo)
+            proxy = FactoryProxyBateria.crear(tipo, host, puerto,
+                                              espera=Configurador.obtener_espera_socket())
+        elif tipo == "hal":
+            proxy = FactoryProxyBateria.crear(
+                tipo, hal=Configurador.configurar_hal_adc(),
+                canal=Configurador.obtener_canal_adc("bateria"),
+                tabla=Configurador.configurar_tabla_calibracion("bateria"))
+        elif tipo == "inotify":
+            proxy = FactoryProxyBateria.crear(tipo, reloj=Configurador.configurar_reloj(),
+                                              **Configurador.obtener_parametros_inotify())
+        else:
+            proxy = FactoryProxyBateria.crear(tipo)
+        proxy = Configurador._cachear(proxy, tipo, ProxyBateriaCache)
+        proxy = Configurador._medir(proxy, ProxyBateriaMedido)
+        return Configurador._grabar(proxy, ProxyBateriaGrabador)
 
     @staticmethod
     def configurar_proxy_temperatura():
-        """Crea y retorna el proxy de sensor de temperatura segun configuracion."""
+        """
+        Crea y retorna el proxy de sensor de temperatura segun configuracion.
+
+        Si la seccion "ambiente" define "filtros", el proxy se envuelve en
+        un ProxySensorTemperaturaFiltrado con la cadena de filtros. Si la
+        seccion "traza" define un archivo, se graban las lecturas crudas
+        (antes de filtrar); si hay seccion "metricas" se mide el proxy
+        real, cacheado si hay seccion "cache".
+        """
         tipo = Configurador.configuracion_termostato["proxy_sensor_temperatura"]
         if tipo == "socket":
             host = Configurador.obtener_host_escucha()
             puerto = Configurador.obtener_puerto("temperatura")
-            return FactoryProxySensorTemperatura.crear(tipo, host, puerto)
-        return FactoryProxySensorTemperatura.crear(tipo)
+            proxy = FactoryProxySensorTemperatura.crear(
+                tipo, host, puerto, espera=Configurador.obtener_espera_socket())
+        elif tipo == "hal":
+            proxy = FactoryProxySensorTemperatura.crear(
+                tipo, hal=Configurador.configurar_hal_adc(),
+                canal=Configurador.obtener_canal_adc("temperatura"),
+                tabla=Configurador.configurar_tabla_calibracion("temperatura"))
+        elif tipo == "inotify":
+            proxy = FactoryProxySensorTemperatura.crear(
+                tipo, reloj=Configurador.configurar_reloj(),
+                **Configurador.obtener_parametros_inotify())
+        else:
+            proxy = FactoryProxySensorTemperatura.crear(tipo)
+        proxy = Configurador._cachear(proxy, tipo, ProxySensorTemperaturaCache)
+        proxy = Configurador._medir(proxy, ProxySensorTemperaturaMedido)
+        proxy = Configurador._grabar(proxy, ProxySensorTemperaturaGrabador)
+        filtro = Configurador.configurar_filtro_temperatura()
+        if proxy is None or filtro is None:
+            return proxy
+        return ProxySensorTemperaturaFiltrado(proxy, filtro)
+
+    @staticmethod
+    def configurar_filtro_temperatura():
+        """
+        Crea la cadena de filtros de temperatura segun configuracion.
+
+        Cada elemento de ambiente.filtros es un dict con "tipo" y los
+        parametros del filtro, por ejemplo {"tipo": "mediana", "ventana": 5}.
+
+        Returns:
+            CadenaFiltros: Filtros en el orden configurado, o None si no hay.
+
+        Raises:
+            ValueError: Si algun filtro tiene un tipo desconocido.
+        """
+        config = Configurador.configuracion_termostato
+        filtros = []
+        for definicion in config.get("ambiente", {}).get("filtros", []):
+            parametros = dict(definicion)
+            tipo = parametros.pop("tipo", None)
+            filtro = FactoryFiltroSenal.crear(tipo, **parametros)
+            if filtro is None:
+                raise ValueError(f"ERROR: Tipo de filtro desconocido '{tipo}' en termostato.json")
+            filtros.append(filtro)
+        return CadenaFiltros(filtros) if filtros else None
+
+    @staticmethod
+    def configurar_hal_adc():
+        """
+        Crea, inicializa y retorna el HAL ADC segun la seccion "hal".
+
+        El ADC es unico para todo el sistema: la primera llamada lo crea
+        y las siguientes retornan la misma instancia, de modo que los
+        proxies de temperatura y bateria comparten el dispositivo. El ADC
+        simulado recibe el canal de cada sensor y las tablas de calibracion
+        de esos canales para generar cuentas coherentes con ellas.
+
+        Returns:
+            AbsHAL_ADC: ADC inicializado.
+
+        Raises:
+            ValueError: Si el tipo de ADC es desconocido.
+        """
+        if Configurador.hal_adc is None:
+            parametros = dict(Configurador.configuracion_termostato.get("hal", {}))
+            parametros.pop("canales", None)
+            parametros.pop("calibracion", None)
+            tipo = parametros.pop("tipo", "simulado")
+            if tipo == "simulado":
+                canales = {sensor: Configurador.obtener_canal_adc(sensor)
+                           for sensor in ("temperatura", "bateria")}
+                parametros["canales"] = canales
+                parametros["calibracion"] = {
+                    canal: Configurador.configurar_tabla_calibracion(sensor)
+                    for sensor, canal in canales.items()
+                }
+            hal = FactoryHAL_ADC.crear(tipo, **parametros)
+            if hal is None:
+                raise ValueError(f"ERROR: Tipo de HAL ADC desconocido '{tipo}' en termostato.json")
+            hal.inicializar()
+            Configurador.hal_adc = hal
+        return Configurador.hal_adc
+
+    @staticmethod
+    def configurar_tabla_calibracion(nombre_sensor):
+        """
+        Crea la tabla de calibracion del canal de un sensor.
+
+        Se configura en hal.calibracion.<sensor> con "modelo" y sus
+        parametros, por ejemplo {"modelo": "termistor", "beta": 3950} o
+        {"modelo": "puntos", "puntos": [[100, 0.0], [900, 40.0]]}. Sin
+        configuracion se usa "tmp36" para temperatura y "divisor" para
+        bateria.
+
+        Args:
+            nombre_sensor (str): "temperatura" o "bateria".
+
+        Returns:
+            TablaCalibracion: Tabla de 1024 entradas del canal.
+
+        Raises:
+            ValueError: Si el modelo es desconocido.
+        """
+        modelos_default = {"temperatura": "tmp36", "bateria": "divisor"}
+        config = Configurador.configuracion_termostato
+        calibracion = config.get("hal", {}).get("calibracion", {})
+        parametros = dict(calibracion.get(nombre_sensor, {}))
+        modelo = parametros.pop("modelo", modelos_default.get(nombre_sensor))
+        tabla = FactoryTablaCalibracion.crear(modelo, **parametros)
+        if tabla is None:
+            raise ValueError(f"ERROR: Modelo de calibracion desconocido '{modelo}' en termostato.json")
+        return tabla
 
     @staticmethod
     def configurar_actuador_climatizador():
         """Crea y retorna el actuador de climatizador segun configuracion."""
         tipo = Configurador.configuracion_termostato["actuador_climatizador"]
-        return FactoryActuadorClimatizador.crear(tipo)
+        parametros = Configurador.obtener_parametros_actuador() if tipo == "mmap" else {}
+        actuador = FactoryActuadorClimatizador.crear(tipo, reloj=Configurador.configurar_reloj(),
+                                                     **parametros)
+        return Configurador._medir(actuador, ActuadorClimatizadorMedido)
 
     @staticmethod
     def configurar_visualizador_temperatura():
         """Crea y retorna el visualizador de temperatura segun configuracion."""
         tipo = Configurador.configuracion_termostato["visualizador_temperatura"]
         api_url = Configurador.obtener_api_url() if tipo == "api" else None
-        return FactoryVisualizadorTemperatura.crear(tipo, api_url)
+        reloj = Configurador.configurar_reloj()
+        visualizador = FactoryVisualizadorTemperatura.crear(tipo, api_url, reloj=reloj)
+        return Configurador._medir(visualizador, VisualizadorTemperaturaMedido)
 
     @staticmethod
     def configurar_visualizador_bateria():
         """Crea y retorna el visualizador de bateria segun configuracion."""
         tipo = Configurador.configuracion_termostato["visualizador_bateria"]
         api_url = Configurador.obtener_api_url() if tipo == "api" else None
-        return FactoryVisualizadorBateria.crear(tipo, api_url)
+        reloj = Configurador.configurar_reloj()
+        visualizador = FactoryVisualizadorBateria.crear(tipo, api_url, reloj=reloj)
+        return Configurador._medir(visualizador, VisualizadorBateriaMedido)
 
     @staticmethod
     def configurar_visualizador_climatizador():
         """Crea y retorna el visualizador de climatizador segun configuracion."""
         tipo = Configurador.configuracion_termostato["visualizador_climatizador"]
         api_url = Configurador.obtener_api_url() if tipo == "api" else None
-        return FactoryVisualizadorClimatizador.crear(tipo, api_url)
+        reloj = Configurador.configurar_reloj()
+        visualizador = FactoryVisualizadorClimatizador.crear(tipo, api_url, reloj=reloj)
+        return Configurador._medir(visualizador, VisualizadorClimatizadorMedido)
 
     @staticmethod
     def configurar_climatizador():
@@ -144,8 +336,11 @@ class Configurador:
         if tipo == "socket":
             host = Configurador.obtener_host_escucha()
             puerto = Configurador.obtener_puerto("selector_temperatura")
-            return FactorySelectorTemperatura.crear(tipo, host, puerto)
-        return FactorySelectorTemperatura.crear(tipo)
+            selector = FactorySelectorTemperatura.crear(tipo, host, puerto)
+        else:
+            selector = FactorySelectorTemperatura.crear(tipo, reloj=Configurador.configurar_reloj())
+        selector = Configurador._cachear(selector, tipo, SelectorTemperaturaCache)
+        return Configurador._grabar(selector, SelectorTemperaturaGrabador)
 
     @staticmethod
     def configurar_seteo_temperatura():
@@ -154,8 +349,325 @@ class Configurador:
         if tipo == "socket":
             host = Configurador.obtener_host_escucha()
             puerto = Configurador.obtener_puerto("seteo_temperatura")
-            return FactorySeteoTemperatura.crear(tipo, host, puerto)
-        return FactorySeteoTemperatura.crear(tipo)
+            seteo = FactorySeteoTemperatura.crear(tipo, host, puerto)
+        else:
+            seteo = FactorySeteoTemperatura.crear(tipo)
+        seteo = Configurador._medir(seteo, SeteoTemperaturaMedido)
+        return Configurador._grabar(seteo, SeteoTemperaturaGrabador)
+
+    @staticmethod
+    def configurar_grabador_traza():
+        """
+        Crea (una sola vez) el grabador de trazas segun configuracion.
+
+        La seccion "traza" indica el archivo de destino, por ejemplo
+        {"archivo": "entradas.trz.gz"}. Todas las entradas comparten el
+        mismo grabador, que se cierra al terminar el proceso (tambien con
+        Ctrl-C) para que el .gz quede completo.
+
+        Returns:
+            GrabadorTraza: Grabador compartido, o None si no hay seccion "traza".
+        """
+        if Configurador.grabador_traza is None:
+            config = Configurador.configuracion_termostato
+            archivo = config.get("traza", {}).get("archivo")
+            if archivo is None:
+                return None
+            Configurador.grabador_traza = GrabadorTraza(archivo)
+            atexit.register(Configurador.grabador_traza.cerrar)
+        return Configurador.grabador_traza
+
+    @staticmethod
+    def configurar_reloj():
+        """
+        Crea (una sola vez) el reloj del sistema segun configuracion.
+
+        La seccion "reloj" indica el tipo y, para el virtual, la velocidad,
+        por ejemplo {"tipo": "virtual", "velocidad": 60}. Sin seccion se
+        usa el reloj real. Operadores, gestores y agentes comparten el
+        mismo reloj.
+
+        Returns:
+            AbsReloj: Reloj compartido.
+
+        Raises:
+            ValueError: Si el tipo de reloj es desconocido.
+        """
+        if Configurador.reloj is None:
+            config = Configurador.configuracion_termostato
+            tipo = config.get("reloj", {}).get("tipo", "real")
+            velocidad = config.get("reloj", {}).get("velocidad")
+            reloj = FactoryReloj.crear(tipo, velocidad=velocidad)
+            if reloj is None:
+                raise ValueError(f"ERROR: Tipo de reloj desconocido '{tipo}' en termostato.json")
+            Configurador.reloj = reloj
+        return Configurador.reloj
+
+    @staticmethod
+    def configurar_metricas():
+        """
+        Crea (una sola vez) el registro de metricas segun configuracion.
+
+        Con seccion "metricas", por ejemplo {"host": "localhost",
+        "puerto": 9100}, proxies, visualizadores, actuador y operador se
+        miden sobre un mismo registro. Sin seccion no se mide nada.
+
+        Returns:
+            RegistroMetricas: Registro compartido, o None si no hay seccion "metricas".
+        """
+        if Configurador.metricas is None:
+            if "metricas" not in Configurador.configuracion_termostato:
+                return None
+            Configurador.metricas = RegistroMetricas()
+        return Configurador.metricas
+
+    @staticmethod
+    def configurar_servidor_metricas():
+        """
+        Crea el endpoint HTTP que expone el registro de metricas.
+
+        El servidor se crea detenido: lo inicia el Lanzador.
+
+        Returns:
+            ServidorMetricas: Servidor sobre el registro compartido, o
+                None si no hay seccion "metricas".
+        """
+        registro = Configurador.configurar_metricas()
+        if registro is None:
+            return None
+        return ServidorMetricas(registro, Configurador.obtener_host_metricas(),
+                                Configurador.obtener_puerto_metricas())
+
+    @staticmethod
+    def configurar_perfilador():
+        """
+        Crea el perfilador de las tareas del operador.
+
+        Usa el registro de metricas y la subseccion "metricas.perfil",
+        por ejemplo {"directorio": "/tmp", "duracion": 10}, para las
+        capturas cProfile que se piden por senal.
+
+        Returns:
+            PerfiladorTareas: Perfilador, o None si no hay seccion "metricas".
+        """
+        registro = Configurador.configurar_metricas()
+        if registro is None:
+            return None
+        perfil = Configurador.configuracion_termostato["metricas"].get("perfil", {})
+        return PerfiladorTareas(registro, perfil.get("directorio", "."),
+                                perfil.get("duracion", 10.0))
+
+    @staticmethod
+    def configurar_bitacora():
+        """
+        Configura la bitacora del proceso segun la seccion "bitacora".
+
+        Por ejemplo {"nivel": "DEBUG", "capacidad": 10000}. Sin seccion
+        se registra desde INFO. Los registros se escriben en stderr desde
+        un hilo de fondo.
+
+        Returns:
+            ManejadorCola: Manejador instalado (con el contador descartados).
+        """
+        config = Configurador.configuracion_termostato
+        nivel = config.get("bitacora", {}).get("nivel", "INFO")
+        capacidad = config.get("bitacora", {}).get("capacidad", 10000)
+        return configurar_bitacora(nivel, capacidad=capacidad)
+
+    @staticmethod
+    def configurar_estado_compartido():
+        """
+        Crea la tabla de estado en memoria compartida del termostato.
+
+        Con seccion "estado_compartido", por ejemplo {"nombre":
+        "termostato"}, el operador publica temperaturas, bateria y
+        climatizador en una fila "termostato" que otros procesos leen
+        con estado_compartido.lector.LectorEstado.
+
+        Returns:
+            TablaEstado: Tabla de una fila, o None si no hay seccion
+                "estado_compartido".
+        """
+        nombre = Configurador.obtener_nombre_estado_compartido()
+        if nombre is None:
+            return None
+        return TablaEstado(["termostato"], nombre)
+
+    @staticmethod
+    def configurar_bus_eventos():
+        """
+        Crea el bus de eventos de cambio de los gestores.
+
+        Con seccion "eventos" los gestores publican sus cambios y las
+        salidas se suscriben, cada una con su politica (ver
+        configurar_politica_eventos); sin seccion, el presentador sondea
+        a los gestores en cada periodo.
+
+        Returns:
+            BusEventos: Bus sobre el reloj del sistema, o None si no hay
+                seccion "eventos".
+        """
+        if "eventos" not in Configurador.configuracion_termostato:
+            return None
+        return BusEventos(Configurador.configurar_reloj())
+
+    @staticmethod
+    def configurar_politica_eventos(suscriptor, tipo_defecto="inmediata"):
+        """
+        Crea la politica de entrega de un suscriptor del bus de eventos.
+
+        La clave "eventos.<suscriptor>" indica la politica, por ejemplo
+        {"politica": "limitada", "intervalo": 5} o {"politica": "lotes",
+        "lote": 20, "intervalo": 30}.
+
+        Args:
+            suscriptor (str): Nombre del suscriptor ("presentacion", "bitacora").
+            tipo_defecto (str): Politica si la clave no la indica.
+
+        Returns:
+            PoliticaEntrega: Politica de entrega del suscriptor.
+
+        Raises:
+            ValueError: Si el tipo de politica es desconocido.
+        """
+        config = Configurador.configuracion_termostato
+        seccion = config.get("eventos", {}).get(suscriptor, {})
+        tipo = seccion.get("politica", tipo_defecto)
+        politica = FactoryPoliticaEntrega.crear(tipo, seccion.get("intervalo", 5),
+                                                seccion.get("lote", 10))
+        if politica is None:
+            raise ValueError(f"ERROR: Politica de entrega desconocida '{tipo}' para "
+                             f"'{suscriptor}' en termostato.json")
+        return politica
+
+    @staticmethod
+    def obtener_bitacora_eventos():
+        """Retorna True si los cambios de estado se registran en la bitacora ("eventos.bitacora")."""
+        return "bitacora" in Configurador.configuracion_termostato.get("eventos", {})
+
+    @staticmethod
+    def configurar_inicializador():
+        """
+        Crea el inicializador que verifica los sensores al arrancar.
+
+        La seccion "inicio" acota el arranque, por ejemplo {"plazo": 60,
+        "espera": 1, "sensores": {"bateria": {"timeout": 20,
+        "reintentos": 3, "requerido": false}}}. Un sensor con
+        "requerido": false no demora el arranque (inicio degradado). Sin
+        seccion se espera cada sensor sin plazo, como antes.
+
+        Returns:
+            Inicializador: Inicializador con los plazos configurados.
+
+        Raises:
+            ValueError: Si la seccion nombra un sensor desconocido.
+        """
+        config = Configurador.configuracion_termostato
+        seccion = config.get("inicio", {})
+        sensores = {}
+        for nombre, parametros in seccion.get("sensores", {}).items():
+            if nombre not in Inicializador.SENSORES:
+                raise ValueError(f"ERROR: Sensor de inicio desconocido '{nombre}' en termostato.json")
+            defecto = Inicializador.PARAMETROS_DEFECTO
+            sensores[nombre] = ParametrosSensor(
+                timeout=parametros.get("timeout", defecto.timeout),
+                reintentos=parametros.get("reintentos", defecto.reintentos),
+                requerido=parametros.get("requerido", defecto.requerido))
+        return Inicializador(plazo=seccion.get("plazo"), sensores=sensores,
+                             espera=seccion.get("espera", 1.0),
+                             reloj=Configurador.configurar_reloj())
+
+    @staticmethod
+    def configurar_guarda_actuador():
+        """
+        Crea la guarda de accionamiento del climatizador.
+
+        La seccion "guarda" fija los tiempos minimos y el limite de tasa,
+        por ejemplo {"minimo_encendido": 180, "minimo_apagado": 300,
+        "capacidad": 3, "tasa": 0.01}. Sin "tasa" no se limita la tasa.
+        Con metricas se publican las ordenes suprimidas por motivo.
+
+        Returns:
+            GuardaActuador: Guarda configurada, o None si no hay seccion "guarda".
+        """
+        config = Configurador.configuracion_termostato
+        if "guarda" not in config:
+            return None
+        seccion = config["guarda"]
+        guarda = GuardaActuador(minimo_encendido=seccion.get("minimo_encendido", 0),
+                                minimo_apagado=seccion.get("minimo_apagado", 0),
+                                capacidad=seccion.get("capacidad", 1),
+                                tasa=seccion.get("tasa"),
+                                reloj=Configurador.configurar_reloj())
+        registro = Configurador.configurar_metricas()
+        if registro is not None:
+            registrar_guarda(registro, guarda)
+        return guarda
+
+    @staticmethod
+    def configurar_publicador_zonas():
+        """
+        Crea el publicador agregado del supervisor multi-zona.
+
+        La clave "zonas.publicador" indica el destino: "bitacora" (por
+        defecto) o "api" (un POST por publicacion a red.api_url).
+
+        Returns:
+            Publicador del estado de todas las zonas.
+
+        Raises:
+            ValueError: Si el tipo de publicador es desconocido.
+        """
+        config = Configurador.configuracion_termostato
+        tipo = config.get("zonas", {}).get("publicador", "bitacora")
+        api_url = Configurador.obtener_api_url() if tipo == "api" else None
+        publicador = FactoryPublicadorZonas.crear(tipo, api_url)
+        if publicador is None:
+            raise ValueError(f"ERROR: Tipo de publicador de zonas desconocido '{tipo}' "
+                             f"en termostato.json")
+        return publicador
+
+    @staticmethod
+    def _medir(componente, instrumento):
+        """Envuelve el componente en su instrumento si hay metricas configuradas."""
+        registro = Configurador.configurar_metricas()
+        if componente is None or registro is None:
+            return componente
+        return instrumento(componente, registro)
+
+    @staticmethod
+    def _cachear(entrada, tipo, cache_entrada):
+        """
+        Envuelve la entrada en su cache si hay seccion "cache".
+
+        La seccion indica el TTL, por ejemplo {"ttl": 0.5}. Solo se
+        cachean las entradas de archivo, que se revalidan ademas por
+        os.stat: con TTL 0 cada lectura cuesta un stat y el archivo solo
+        se reabre si cambio. Las entradas socket no se cachean (cada
+        lectura consume una conexion) ni las HAL (entregan bloques de
+        muestras nuevas a los filtros).
+
+        Args:
+            entrada: Proxy o selector real.
+            tipo (str): Tipo de la entrada en termostato.json.
+            cache_entrada: Decorador de cache de la interfaz de la entrada.
+
+        Returns:
+            La entrada cacheada, o la misma entrada si no corresponde.
+        """
+        config = Configurador.configuracion_termostato
+        if entrada is None or tipo != "archivo" or "cache" not in config:
+            return entrada
+        return cache_entrada(entrada, config["cache"].get("ttl", 0), entrada.ARCHIVO,
+                             Configurador.configurar_reloj())
+
+    @staticmethod
+    def _grabar(entrada, grabador_entrada):
+        """Envuelve la entrada en su grabador si hay traza configurada."""
+        grabador = Configurador.configurar_grabador_traza()
+        if entrada is None or grabador is None:
+            return entrada
+        return grabador_entrada(entrada, grabador)
 
     @staticmethod
     def obtener_host_escucha():
@@ -175,6 +687,48 @@ class Configurador:
         puertos = config.get("red", {}).get("puertos", puertos_default)
         return puertos.get(nombre_sensor, puertos_default.get(nombre_sensor))
 
+    @staticmethod
+    def obtener_espera_socket():
+        """
+        Retorna la espera maxima (s) de cada lectura de los proxies socket.
+
+        Se configura en red.espera; sin valor cada lectura espera la
+        proxima conexion sin limite.
+
+        Returns:
+            float: Segundos, o None si no hay limite.
+        """
+        config = Configurador.configuracion_termostato
+        return config.get("red", {}).get("espera")
+
+    @staticmethod
+    def obtener_host_metricas():
+        """Retorna el host donde escucha el endpoint de metricas."""
+        config = Configurador.configuracion_termostato
+        return config.get("metricas", {}).get("host", "localhost")
+
+    @staticmethod
+    def obtener_puerto_metricas():
+        """Retorna el puerto del endpoint de metricas."""
+        config = Configurador.configuracion_termostato
+        return config.get("metricas", {}).get("puerto", 9100)
+
+    @staticmethod
+    def obtener_canal_adc(nombre_sensor):
+        """
+        Retorna el canal del ADC asignado a un sensor.
+
+        Args:
+            nombre_sensor (str): "temperatura" o "bateria".
+
+        Returns:
+            int: Canal del ADC, o None si el sensor no existe.
+        """
+        canales_default = {"temperatura": 0, "bateria": 1}
+        config = Configurador.configuracion_termostato
+        canales = config.get("hal", {}).get("canales", canales_default)
+        return canales.get(nombre_sensor, canales_default.get(nombre_sensor))
+
     @staticmethod
     def obtener_api_url():
         """Retorna la URL base de la API REST."""
@@ -193,6 +747,12 @@ class Configurador:
         config = Configurador.configuracion_termostato
         return config.get("bateria", {}).get("umbral_carga_baja", 0.95)
 
+    @staticmethod
+    def obtener_antiguedad_maxima_bateria():
+        """Retorna la edad maxima (s) de una lectura de bateria vigente, o None."""
+        config = Configurador.configuracion_termostato
+        return config.get("bateria", {}).get("antiguedad_maxima_lectura")
+
     @staticmethod
     def obtener_histeresis():
         """Retorna el valor de histeresis para control de temperatura."""
@@ -211,6 +771,193 @@ class Configurador:
         config = Configurador.configuracion_termostato
         return config.get("ambiente", {}).get("incremento_ajuste", 1.0)
 
+    @staticmethod
+    def obtener_antiguedad_maxima_temperatura():
+        """Retorna la edad maxima (s) de una lectura de temperatura vigente, o None."""
+        config = Configurador.configuracion_termostato
+        return config.get("ambiente", {}).get("antiguedad_maxima_lectura")
+
+    @staticmethod
+    def obtener_modo_seteo():
+        """Retorna el modo de seteo de temperatura: "sondeo" o "cola"."""
+        config = Configurador.configuracion_termostato
+        return config.get("ambiente", {}).get("modo_seteo", "sondeo")
+
+    @staticmethod
+    def obtener_periodos_operador():
+        """
+        Retorna los periodos (segundos) de los hilos del operador; {} usa los defaults.
+
+        Los sensores "inotify" bloquean hasta que se escribe su archivo,
+        por lo que su hilo no duerme (periodo 0) salvo que se configure.
+        """
+        config = Configurador.configuracion_termostato
+        periodos = dict(config.get("operador", {}).get("periodos", {}))
+        for hilo, clave in (("bateria", "proxy_bateria"),
+                            ("temperatura", "proxy_sensor_temperatura")):
+            if config.get(clave) == "inotify":
+                periodos.setdefault(hilo, 0)
+        return periodos
+
+    @staticmethod
+    def obtener_parametros_inotify():
+        """
+        Retorna los parametros de los proxies "inotify" (seccion "inotify").
+
+        "espera" acota cada espera por una escritura (sin limite por
+        defecto) y "periodo_sondeo" es el periodo del sondeo de os.stat
+        donde no hay inotify (0.5 s por defecto).
+
+        Returns:
+            dict: {"espera": float o None, "periodo_sondeo": float}.
+        """
+        seccion = Configurador.configuracion_termostato.get("inotify", {})
+        return {"espera": seccion.get("espera"),
+                "periodo_sondeo": seccion.get("periodo_sondeo", 0.5)}
+
+    @staticmethod
+    def obtener_parametros_actuador():
+        """
+        Retorna los archivos del actuador "mmap" (seccion "actuador").
+
+        "canal" es el archivo mapeado ("climatizador.map" por defecto) y
+        "texto" el archivo de texto para consumidores simples
+        ("climatizador" por defecto; null para no escribirlo).
+
+        Returns:
+            dict: {"ruta_canal": str, "ruta_texto": str o None}.
+        """
+        seccion = Configurador.configuracion_termostato.get("actuador", {})
+        return {"ruta_canal": seccion.get("canal", "climatizador.map"),
+                "ruta_texto": seccion.get("texto", "climatizador")}
+
+    @staticmethod
+    def obtener_nombre_estado_compartido():
+        """Retorna el nombre del bloque de estado compartido, o None si no hay seccion."""
+        config = Configurador.configuracion_termostato
+        if "estado_compartido" not in config:
+            return None
+        return config["estado_compartido"].get("nombre", "termostato")
+
+    @staticmethod
+    def obtener_zonas():
+        """Retorna las definiciones de zonas de la seccion "zonas" ([] si no hay)."""
+        config = Configurador.configuracion_termostato
+        return config.get("zonas", {}).get("lista", [])
+
+    @staticmethod
+    def obtener_procesos_zonas():
+        """Retorna la cantidad de procesos trabajadores, o None (uno por CPU)."""
+        config = Configurador.configuracion_termostato
+        return config.get("zonas", {}).get("procesos")
+
+    @staticmethod
+    def obtener_periodo_zonas():
+        """Retorna el periodo (s) del ciclo de control de cada trabajador."""
+        config = Configurador.configuracion_termostato
+        return config.get("zonas", {}).get("periodo", 2)
+
+    @staticmethod
+    def obtener_periodo_publicacion_zonas():
+        """Retorna el periodo (s) de la publicacion agregada del supervisor."""
+        config = Configurador.configuracion_termostato
+        return config.get("zonas", {}).get("publicacion", 5)
+
+    @staticmethod
+    def obtener_configuracion_zona(definicion):
+        """
+        Arma la configuracion completa de una zona.
+
+        Parte de la configuracion general (sin la seccion "zonas") y le
+        aplica las secciones de la definicion de la zona. Las secciones
+        anidadas se combinan clave por clave, por ejemplo
+        {"nombre": "cocina", "red": {"puertos": {"temperatura": 12001}}}
+        solo cambia el puerto de temperatura.
+
+        Args:
+            definicion (dict): Definicion de la zona (con su "nombre").
+
+        Returns:
+            dict: Configuracion de la zona.
+        """
+        def combinar(base, cambios):
+            resultado = dict(base)
+            for clave, valor in cambios.items():
+                if isinstance(valor, dict) and isinstance(resultado.get(clave), dict):
+                    resultado[clave] = combinar(resultado[clave], valor)
+                else:
+                    resultado[clave] = valor
+            return resultado
+
+        base = {clave: valor for clave, valor in Configurador.configuracion_termostato.items()
+                if clave != "zonas"}
+        cambios = {clave: valor for clave, valor in definicion.items() if clave != "nombre"}
+        return combinar(base, cambios)
+
+    @staticmethod
+    def validar_zonas(definiciones):
+        """
+        Verifica que las zonas no compartan archivos ni puertos de escucha.
+
+        Los proxies "archivo" e "inotify" leen archivos fijos del
+        directorio de trabajo ("temperatura", "bateria") y el actuador
+        "general" escribe siempre "climatizador": con varias zonas todas
+        leerian el mismo sensor y pisarian la misma salida. El actuador
+        "mmap" se admite si cada zona define sus propios archivos en la
+        seccion "actuador". Las entradas "socket" de cada zona deben
+        escuchar en su propio puerto (red.puertos): dos zonas en el mismo
+        puerto fallarian al abrirlo y el trabajador se relanzaria sin fin.
+
+        Args:
+            definiciones (list): Definiciones de zona (dict con "nombre").
+
+        Raises:
+            ValueError: Si una zona usa un proxy o actuador de archivo fijo
+                o dos zonas comparten un archivo del actuador o un puerto.
+        """
+        archivos = {}
+        puertos = {}
+        for definicion in definiciones:
+            nombre = definicion["nombre"]
+            configuracion = Configurador.obtener_configuracion_zona(definicion)
+            for clave in ("proxy_sensor_temperatura", "proxy_bateria"):
+                if configuracion.get(clave) in ("archivo", "inotify"):
+                    raise ValueError(
+                        f"ERROR: La zona '{nombre}' usa {clave} '{configuracion[clave]}'; "
+                        "en multi-zona use 'hal' o 'socket'")
+            tipo = configuracion.get("actuador_climatizador")
+            if tipo != "mmap":
+                raise ValueError(
+                    f"ERROR: La zona '{nombre}' usa actuador_climatizador '{tipo}'; "
+                    "en multi-zona use 'mmap' con una seccion 'actuador' por zona")
+            general = Configurador.configuracion_termostato
+            Configurador.configuracion_termostato = configuracion
+            try:
+                parametros = Configurador.obtener_parametros_actuador()
+                escuchas = [
+                    (Configurador.obtener_host_escucha(), Configurador.obtener_puerto(sensor))
+                    for clave, sensor in Configurador.ENTRADAS_SOCKET
+                    if configuracion.get(clave) == "socket"
+                ]
+                # El puerto 0 es efimero: cada socket recibe uno distinto
+                escuchas = [escucha for escucha in escuchas if escucha[1]]
+            finally:
+                Configurador.configuracion_termostato = general
+            for escucha in escuchas:
+                if escucha in puertos:
+                    raise ValueError(
+                        f"ERROR: Las zonas '{puertos[escucha]}' y '{nombre}' comparten "
+                        f"el puerto de escucha {escucha[1]}")
+                puertos[escucha] = nombre
+            for ruta in parametros.values():
+                if ruta is None:
+                    continue
+                if ruta in archivos:
+                    raise ValueError(
+                        f"ERROR: Las zonas '{archivos[ruta]}' y '{nombre}' comparten "
+                        f"el archivo del actuador '{ruta}'")
+                archivos[ruta] = nombre
+
     @staticmethod
     def _validar_configuracion():
         """
@@ -235,12 +982,12 @@ class Configurador:
         if "red" in config:
             red = config["red"]
             if "host_escucha" not in red:
-                print("ADVERTENCIA: Falta 'host_escucha', usando 'localhost'")
+                _bitacora.warning("falta 'host_escucha', usando 'localhost'")
             if "puertos" not in red:
-                print("ADVERTENCIA: Falta 'puertos', usando valores por defecto")
+                _bitacora.warning("falta 'puertos', usando valores por defecto")
             if "api_url" not in red:
-                print("ADVERTENCIA: Falta 'api_url', usando default")
+                _bitacora.warning("falta 'api_url', usando default")
         else:
-            print("ADVERTENCIA: No hay seccion 'red' en termostato.json")
-            print("  -> Proxies socket usaran 'localhost' y puertos default")
-            print("  -> Visualizadores API usaran 'http://localhost:5050'")
+            _bitacora.warning("no hay seccion 'red' en termostato.json: proxies socket usaran "
+                              "'localhost' y puertos default, visualizadores API "
+                              "'http://localhost:5050'")
@@ -4,7 +4,9 @@ Factory para crear actuadores de climatizador.
 Patron de Diseno:
     - Factory Method: Crea objetos sin especificar la clase exacta
 """
-from agentes_actuadores.actuador_climatizador import ActuadorClimatizadorGeneral
+from agentes_actuadores.actuador_climatizador import (
+    ActuadorClimatizadorGeneral, ActuadorClimatizadorMapeado,
+)
 from entidades.abs_actuador_climatizador import AbsProxyActuadorClimatizador
 
 
@@ -13,16 +15,23 @@ class FactoryActuadorClimatizador:
     """Factory para crear instancias de actuador de climatizador."""
 
     @staticmethod
-    def crear(tipo: str) -> AbsProxyActuadorClimatizador:
+    def crear(tipo: str, reloj=None, ruta_canal="climatizador.map",
+              ruta_texto="climatizador") -> AbsProxyActuadorClimatizador:
         """
         Crea un actuador de climatizador segun el tipo especificado.
 
         Args:
-            tipo (str): Tipo de actuador ("general").
+            tipo (str): Tipo de actuador ("general" o "mmap").
+            reloj (AbsReloj): Reloj de las marcas de auditoria (None = RelojReal).
+            ruta_canal (str): Archivo del canal mapeado (solo "mmap").
+            ruta_texto (str): Archivo de texto reemplazado al cambiar la accion
+                (solo "mmap"; None = no se escribe).
 
         Returns:
             AbsProxyActuadorClimatizador: Instancia del actuador o None si tipo invalido.
         """
         if tipo == "general":
-            return ActuadorClimatizadorGeneral()
+            return ActuadorClimatizadorGeneral(reloj)
+        if tipo == "mmap":
+            return ActuadorClimatizadorMapeado(reloj, ruta_canal, ruta_texto)
         return None
@@ -0,0 +1,41 @@
+"""
+Factory para crear filtros de senal de sensores.
+
+Patron de Diseno:
+    - Factory Method: Crea objetos sin especificar la clase exacta
+"""
+from agentes_sensores.filtros_senal import (
+    AbsFiltro,
+    FiltroMediaMovil,
+    FiltroExponencial,
+    FiltroMediana,
+    FiltroRechazoAtipicos
+)
+
+
+# pylint: disable=too-few-public-methods
+class FactoryFiltroSenal:
+    """Factory para crear instancias de filtros de senal."""
+
+    @staticmethod
+    def crear(tipo: str, **parametros) -> AbsFiltro:
+        """
+        Crea un filtro de senal segun el tipo especificado.
+
+        Args:
+            tipo (str): Tipo de filtro ("media_movil", "exponencial",
+                "mediana" o "atipicos").
+            **parametros: Parametros del filtro (ventana, alfa, umbral).
+
+        Returns:
+            AbsFiltro: Instancia del filtro o None si tipo invalido.
+        """
+        if tipo == "media_movil":
+            return FiltroMediaMovil(**parametros)
+        if tipo == "exponencial":
+            return FiltroExponencial(**parametros)
+        if tipo == "mediana":
+            return FiltroMediana(**parametros)
+        if tipo == "atipicos":
+            return FiltroRechazoAtipicos(**parametros)
+        return None
@@ -0,0 +1,33 @@
+"""
+Factory para crear el HAL del conversor analogico-digital.
+
+Patron de Diseno:
+    - Factory Method: Crea objetos sin especificar la clase exacta
+"""
+from hal.abs_hal_adc import AbsHAL_ADC
+from hal.hal_adc_simulado import HAL_ADC_Simulado
+from hal.hal_adc_mock import HAL_ADC_Mock
+
+
+# pylint: disable=too-few-public-methods
+class FactoryHAL_ADC:  # pylint: disable=invalid-name
+    """Factory para crear instancias del HAL ADC."""
+
+    @staticmethod
+    def crear(tipo: str, **parametros) -> AbsHAL_ADC:
+        """
+        Crea un HAL ADC segun el tipo especificado.
+
+        Args:
+            tipo (str): Tipo de ADC ("simulado" o "mock").
+            **parametros: Parametros del ADC (temperatura_base, ruido_std,
+                voltaje_bateria, valores_adc, ...).
+
+        Returns:
+            AbsHAL_ADC: Instancia del ADC o None si tipo invalido.
+        """
+        if tipo == "simulado":
+            return HAL_ADC_Simulado(**parametros)
+        if tipo == "mock":
+            return HAL_ADC_Mock(**parametros)
+        return None
@@ -0,0 +1,34 @@
+"""
+Factory para crear politicas de entrega del bus de eventos.
+
+Patron de Diseno:
+    - Factory Method: Crea objetos sin especificar la clase exacta
+"""
+from eventos.bus import EntregaInmediata, EntregaLimitada, EntregaPorLotes
+
+
+# pylint: disable=too-few-public-methods
+class FactoryPoliticaEntrega:
+    """Factory para crear instancias de politica de entrega."""
+
+    @staticmethod
+    def crear(tipo: str, intervalo: float = 5, lote: int = 10):
+        """
+        Crea una politica de entrega segun el tipo especificado.
+
+        Args:
+            tipo (str): Tipo de politica ("inmediata", "limitada" o "lotes").
+            intervalo (float): Segundos entre entregas ("limitada") o espera
+                maxima del evento mas viejo ("lotes").
+            lote (int): Eventos que completan un lote ("lotes").
+
+        Returns:
+            PoliticaEntrega: Instancia de la politica o None si tipo invalido.
+        """
+        if tipo == "inmediata":
+            return EntregaInmediata()
+        if tipo == "limitada":
+            return EntregaLimitada(intervalo)
+        if tipo == "lotes":
+            return EntregaPorLotes(lote, intervalo)
+        return None
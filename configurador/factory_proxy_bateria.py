@@ -7,8 +7,11 @@ Patron de Diseno:
 from agentes_sensores.proxy_bateria import (
     AbsProxyBateria,
     ProxyBateriaArchivo,
-    ProxyBateriaSocket
+    ProxyBateriaSocket,
+    ProxyBateriaHAL
 )
+from agentes_sensores.proxy_vigilado import ProxyBateriaVigilado
+from agentes_sensores.vigia_archivo import crear_vigia
 
 
 # pylint: disable=too-few-public-methods
@@ -16,20 +19,35 @@ class FactoryProxyBateria:
     """Factory para crear instancias de proxy de bateria."""
 
     @staticmethod
-    def crear(tipo: str, host: str = None, puerto: int = None) -> AbsProxyBateria:
+    def crear(tipo: str, host: str = None, puerto: int = None, hal=None,
+              canal: int = None, tabla=None, espera: float = None,
+              periodo_sondeo: float = 0.5, reloj=None) -> AbsProxyBateria:
         """
         Crea un proxy de bateria segun el tipo especificado.
 
         Args:
-            tipo (str): Tipo de proxy ("archivo" o "socket").
+            tipo (str): Tipo de proxy ("archivo", "inotify", "socket" o "hal").
             host (str): Direccion IP (requerido si tipo es "socket").
             puerto (int): Puerto TCP (requerido si tipo es "socket").
+            hal (AbsHAL_ADC): ADC inicializado (requerido si tipo es "hal").
+            canal (int): Canal del ADC de la bateria (si tipo es "hal").
+            tabla (TablaCalibracion): Calibracion del canal (si tipo es "hal").
+            espera (float): Espera maxima por escritura (si tipo es "inotify")
+                o por conexion (si tipo es "socket").
+            periodo_sondeo (float): Sondeo si no hay inotify (si tipo es "inotify").
+            reloj (AbsReloj): Reloj de los plazos del vigia (si tipo es "inotify").
 
         Returns:
             AbsProxyBateria: Instancia del proxy o None si tipo invalido.
         """
         if tipo == "archivo":
             return ProxyBateriaArchivo()
+        if tipo == "inotify":
+            archivo = ProxyBateriaArchivo()
+            vigia = crear_vigia(archivo.ARCHIVO, periodo_sondeo, reloj)
+            return ProxyBateriaVigilado(archivo, vigia, espera)
         if tipo == "socket":
-            return ProxyBateriaSocket(host, puerto)
+            return ProxyBateriaSocket(host, puerto, espera)
+        if tipo == "hal":
+            return ProxyBateriaHAL(hal, canal, tabla=tabla)
         return None
@@ -0,0 +1,30 @@
+"""
+Factory para crear el publicador agregado de las zonas.
+
+Patron de Diseno:
+    - Factory Method: Crea objetos sin especificar la clase exacta
+"""
+from zonas.publicador import PublicadorZonasApi, PublicadorZonasBitacora
+
+
+# pylint: disable=too-few-public-methods
+class FactoryPublicadorZonas:
+    """Factory para crear instancias de publicador de zonas."""
+
+    @staticmethod
+    def crear(tipo: str, api_url: str = None):
+        """
+        Crea un publicador segun el tipo especificado.
+
+        Args:
+            tipo (str): Tipo de publicador ("bitacora" o "api").
+            api_url (str): URL base de la API (solo para "api").
+
+        Returns:
+            Publicador o None si tipo invalido.
+        """
+        if tipo == "bitacora":
+            return PublicadorZonasBitacora()
+        if tipo == "api":
+            return PublicadorZonasApi(api_url)
+        return None
@@ -0,0 +1,33 @@
+"""
+Factory para crear el reloj del sistema.
+
+Patron de Diseno:
+    - Factory Method: Crea objetos sin especificar la clase exacta
+"""
+from servicios_aplicacion.reloj import AbsReloj, RelojReal, RelojMonotono, RelojVirtual
+
+
+# pylint: disable=too-few-public-methods
+class FactoryReloj:
+    """Factory para crear instancias de reloj."""
+
+    @staticmethod
+    def crear(tipo: str, velocidad: float = None) -> AbsReloj:
+        """
+        Crea un reloj segun el tipo especificado.
+
+        Args:
+            tipo (str): Tipo de reloj ("real", "monotono" o "virtual").
+            velocidad (float): Factor respecto del tiempo real del reloj
+                virtual (None = tan rapido como sea posible).
+
+        Returns:
+            AbsReloj: Instancia del reloj o None si tipo invalido.
+        """
+        if tipo == "real":
+            return RelojReal()
+        if tipo == "monotono":
+            return RelojMonotono()
+        if tipo == "virtual":
+            return RelojVirtual(velocidad=velocidad)
+        return None
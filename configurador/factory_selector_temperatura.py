@@ -16,7 +16,8 @@ class FactorySelectorTemperatura:
     """Factory para crear instancias de selector de temperatura."""
 
     @staticmethod
-    def crear(tipo: str, host: str = None, puerto: int = None) -> AbsSelectorTemperatura:
+    def crear(tipo: str, host: str = None, puerto: int = None,
+              reloj=None) -> AbsSelectorTemperatura:
         """
         Crea un selector de temperatura segun el tipo especificado.
 
@@ -24,12 +25,14 @@ class FactorySelectorTemperatura:
             tipo (str): Tipo de selector ("archivo" o "socket").
             host (str): Direccion IP (requerido si tipo es "socket").
             puerto (int): Puerto TCP (requerido si tipo es "socket").
+            reloj (AbsReloj): Reloj de los registros del selector de archivo
+                (None = RelojReal).
 
         Returns:
             AbsSelectorTemperatura: Instancia del selector o None si tipo invalido.
         """
         if tipo == "archivo":
-            return SelectorTemperaturaArchivo()
+            return SelectorTemperaturaArchivo(reloj)
         if tipo == "socket":
             return SelectorTemperaturaSocket(host, puerto)
         return None
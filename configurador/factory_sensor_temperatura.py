@@ -7,8 +7,11 @@ Patron de Diseno:
 from agentes_sensores.proxy_sensor_temperatura import (
     AbsProxySensorTemperatura,
     ProxySensorTemperaturaArchivo,
-    ProxySensorTemperaturaSocket
+    ProxySensorTemperaturaSocket,
+    ProxySensorTemperaturaHAL
 )
+from agentes_sensores.proxy_vigilado import ProxySensorTemperaturaVigilado
+from agentes_sensores.vigia_archivo import crear_vigia
 
 
 # pylint: disable=too-few-public-methods
@@ -16,20 +19,35 @@ class FactoryProxySensorTemperatura:
     """Factory para crear instancias de proxy de sensor de temperatura."""
 
     @staticmethod
-    def crear(tipo: str, host: str = None, puerto: int = None) -> AbsProxySensorTemperatura:
+    def crear(tipo: str, host: str = None, puerto: int = None, hal=None,
+              canal: int = None, tabla=None, espera: float = None,
+              periodo_sondeo: float = 0.5, reloj=None) -> AbsProxySensorTemperatura:
         """
         Crea un proxy de sensor de temperatura segun el tipo especificado.
 
         Args:
-            tipo (str): Tipo de proxy ("archivo" o "socket").
+            tipo (str): Tipo de proxy ("archivo", "inotify", "socket" o "hal").
             host (str): Direccion IP (requerido si tipo es "socket").
             puerto (int): Puerto TCP (requerido si tipo es "socket").
+            hal (AbsHAL_ADC): ADC inicializado (requerido si tipo es "hal").
+            canal (int): Canal del ADC de la temperatura (si tipo es "hal").
+            tabla (TablaCalibracion): Calibracion del canal (si tipo es "hal").
+            espera (float): Espera maxima por escritura (si tipo es "inotify")
+                o por conexion (si tipo es "socket").
+            periodo_sondeo (float): Sondeo si no hay inotify (si tipo es "inotify").
+            reloj (AbsReloj): Reloj de los plazos del vigia (si tipo es "inotify").
 
         Returns:
             AbsProxySensorTemperatura: Instancia del proxy o None si tipo invalido.
         """
         if tipo == "archivo":
             return ProxySensorTemperaturaArchivo()
+        if tipo == "inotify":
+            archivo = ProxySensorTemperaturaArchivo()
+            vigia = crear_vigia(archivo.ARCHIVO, periodo_sondeo, reloj)
+            return ProxySensorTemperaturaVigilado(archivo, vigia, espera)
         if tipo == "socket":
-            return ProxySensorTemperaturaSocket(host, puerto)
+            return ProxySensorTemperaturaSocket(host, puerto, espera)
+        if tipo == "hal":
+            return ProxySensorTemperaturaHAL(hal, canal, tabla=tabla)
         return None
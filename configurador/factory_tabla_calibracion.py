@@ -0,0 +1,36 @@
+"""
+Factory para crear tablas de calibracion del ADC.
+
+Patron de Diseno:
+    - Factory Method: Crea objetos sin especificar la clase exacta
+"""
+from hal.calibracion import TablaCalibracion
+
+
+# pylint: disable=too-few-public-methods
+class FactoryTablaCalibracion:
+    """Factory para crear instancias de tablas de calibracion."""
+
+    @staticmethod
+    def crear(modelo: str, **parametros) -> TablaCalibracion:
+        """
+        Crea una tabla de calibracion segun el modelo especificado.
+
+        Args:
+            modelo (str): Modelo del sensor ("tmp36", "divisor", "termistor"
+                o "puntos").
+            **parametros: Parametros del modelo (beta, r0, t0, r_serie,
+                divisor, tension_referencia, puntos).
+
+        Returns:
+            TablaCalibracion: Tabla de 1024 entradas o None si modelo invalido.
+        """
+        if modelo == "tmp36":
+            return TablaCalibracion.lineal_temperatura(**parametros)
+        if modelo == "divisor":
+            return TablaCalibracion.lineal_bateria(**parametros)
+        if modelo == "termistor":
+            return TablaCalibracion.termistor(**parametros)
+        if modelo == "puntos":
+            return TablaCalibracion.desde_puntos(**parametros)
+        return None
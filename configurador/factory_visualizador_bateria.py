@@ -17,13 +17,14 @@ class FactoryVisualizadorBateria:
     """Factory para crear instancias de visualizador de bateria."""
 
     @staticmethod
-    def crear(tipo: str, api_url: str = None) -> AbsVisualizadorBateria:
+    def crear(tipo: str, api_url: str = None, reloj=None) -> AbsVisualizadorBateria:
         """
         Crea un visualizador de bateria segun el tipo especificado.
 
         Args:
             tipo (str): Tipo de visualizador ("archivo", "socket" o "api").
             api_url (str): URL de la API REST (requerido si tipo es "api").
+            reloj (AbsReloj): Reloj de las reconexiones del tipo "socket" (None = RelojReal).
 
         Returns:
             AbsVisualizadorBateria: Instancia del visualizador o None si tipo invalido.
@@ -31,7 +32,7 @@ class FactoryVisualizadorBateria:
         if tipo == "archivo":
             return VisualizadorBateria()
         if tipo == "socket":
-            return VisualizadorBateriaSocket()
+            return VisualizadorBateriaSocket(reloj=reloj)
         if tipo == "api":
             return VisualizadorBateriaApi(api_url)
         return None
@@ -17,13 +17,14 @@ class FactoryVisualizadorClimatizador:
     """Factory para crear instancias de visualizador de climatizador."""
 
     @staticmethod
-    def crear(tipo: str, api_url: str = None) -> AbsVisualizadorClimatizador:
+    def crear(tipo: str, api_url: str = None, reloj=None) -> AbsVisualizadorClimatizador:
         """
         Crea un visualizador de climatizador segun el tipo especificado.
 
         Args:
             tipo (str): Tipo de visualizador ("archivo", "socket" o "api").
             api_url (str): URL de la API REST (requerido si tipo es "api").
+            reloj (AbsReloj): Reloj de las reconexiones del tipo "socket" (None = RelojReal).
 
         Returns:
             AbsVisualizadorClimatizador: Instancia del visualizador o None si tipo invalido.
@@ -31,7 +32,7 @@ class FactoryVisualizadorClimatizador:
         if tipo == "archivo":
             return VisualizadorClimatizador()
         if tipo == "socket":
-            return VisualizadorClimatizadorSocket()
+            return VisualizadorClimatizadorSocket(reloj=reloj)
         if tipo == "api":
             return VisualizadorClimatizadorApi(api_url)
         return None
@@ -17,13 +17,14 @@ class FactoryVisualizadorTemperatura:
     """Factory para crear instancias de visualizador de temperatura."""
 
     @staticmethod
-    def crear(tipo: str, api_url: str = None) -> AbsVisualizadorTemperatura:
+    def crear(tipo: str, api_url: str = None, reloj=None) -> AbsVisualizadorTemperatura:
         """
         Crea un visualizador de temperatura segun el tipo especificado.
 
         Args:
             tipo (str): Tipo de visualizador ("archivo", "socket" o "api").
             api_url (str): URL de la API REST (requerido si tipo es "api").
+            reloj (AbsReloj): Reloj de las reconexiones del tipo "socket" (None = RelojReal).
 
         Returns:
             AbsVisualizadorTemperatura: Instancia del visualizador o None si tipo invalido.
@@ -31,7 +32,7 @@ class FactoryVisualizadorTemperatura:
         if tipo == "archivo":
             return VisualizadorTemperatura()
         if tipo == "socket":
-            return VisualizadorTemperaturaSocket()
+            return VisualizadorTemperaturaSocket(reloj=reloj)
         if tipo == "api":
             return VisualizadorTemperaturaApi(api_url)
         return None
@@ -0,0 +1,11 @@
+from configurador.configurador import Configurador
+from zonas.supervisor import crear_supervisor
+
+def main():
+    """Punto de entrada del termostato multi-zona (un proceso por fragmento de zonas)"""
+    Configurador().cargar_configuracion()
+    Configurador.configurar_bitacora()
+    crear_supervisor().ejecutar()
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Contiene las entidades de negocio y sus abstracciones:
     - ambiente: Entidad del ambiente (temperatura)
     - bateria: Entidad de la bateria
     - climatizador: Entidad del climatizador
+    - lectura: Lecturas de sensores con marca de tiempo y secuencia
     - abs_actuador_climatizador: Abstraccion del actuador
     - abs_bateria: Abstraccion de la bateria
     - abs_sensor_temperatura: Abstraccion del sensor
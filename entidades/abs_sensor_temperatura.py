@@ -54,3 +54,16 @@ class AbsProxySensorTemperatura(metaclass=ABCMeta):
             apropiadamente y lanzar excepciones descriptivas para
             facilitar el diagnostico de problemas de hardware.
         """
+
+    def leer_temperaturas(self):
+        """
+        Lee todas las temperaturas disponibles en una sola operacion.
+
+        Las fuentes que pueden recibir varias lecturas juntas (por ejemplo
+        un socket con varios valores en la misma conexion) redefinen este
+        metodo para entregarlas en bloque; por defecto es una unica lectura.
+
+        Returns:
+            list: Temperaturas en orden de llegada (puede estar vacia).
+        """
+        return [self.leer_temperatura()]
@@ -14,7 +14,36 @@ Responsabilidades:
 Invariantes:
     - temperatura_a_mostrar debe ser "ambiente" o "deseada"
     - temperatura_deseada tiene valor por defecto de 22C si no se especifica
+
+Concurrencia:
+    El estado se guarda en un EstadoAmbiente inmutable que se reemplaza
+    completo en cada escritura (copy-on-write). Asignar una referencia es
+    atomico, por lo que los lectores obtienen siempre una instantanea
+    consistente sin tomar locks; solo las escrituras se serializan.
 """
+import threading
+import time
+from collections import namedtuple
+
+
+class EstadoAmbiente(namedtuple("EstadoAmbiente", [
+        "temperatura_ambiente",
+        "temperatura_deseada",
+        "temperatura_a_mostrar",
+        "marca_tiempo"])):
+    """
+    Instantanea inmutable del estado de un Ambiente.
+
+    Expone los mismos atributos de temperatura que Ambiente, por lo que
+    puede usarse en su lugar en cualquier lectura (ej: evaluar_accion).
+
+    Attributes:
+        temperatura_ambiente (float): Temperatura medida (C) o None.
+        temperatura_deseada (float): Temperatura objetivo (C).
+        temperatura_a_mostrar (str): Modo de visualizacion.
+        marca_tiempo (float): time.monotonic() de la ultima modificacion.
+    """
+    __slots__ = ()
 
 
 class Ambiente:
@@ -27,6 +56,8 @@ class Ambiente:
 
     Esta entidad es el Value Object central del dominio, encapsulando
     todo el estado necesario para las decisiones de control de clima.
+    Las lecturas que necesiten varios valores coherentes entre si deben
+    usar instantanea() en lugar de leer cada atributo por separado.
 
     Attributes:
         temperatura_ambiente (float): Temperatura actual medida en el ambiente (C).
@@ -42,7 +73,7 @@ class Ambiente:
         Este valor es leido periodicamente desde los sensores de temperatura
         y representa la medicion real del entorno fisico.
         """
-        return self.__temperatura_ambiente
+        return self.__estado.temperatura_ambiente
 
     @temperatura_ambiente.setter
     def temperatura_ambiente(self, valor):
@@ -52,7 +83,7 @@ class Ambiente:
         Args:
             valor (float): Nueva temperatura medida del ambiente en C.
         """
-        self.__temperatura_ambiente = valor
+        self._actualizar(temperatura_ambiente=valor)
 
     @property
     def temperatura_deseada(self):
@@ -62,7 +93,7 @@ class Ambiente:
         Este es el setpoint que el sistema de control intentara alcanzar
         mediante el accionamiento del climatizador.
         """
-        return self.__temperatura_deseada
+        return self.__estado.temperatura_deseada
 
     @temperatura_deseada.setter
     def temperatura_deseada(self, valor):
@@ -72,7 +103,7 @@ class Ambiente:
         Args:
             valor (float): Nueva temperatura objetivo en C.
         """
-        self.__temperatura_deseada = valor
+        self._actualizar(temperatura_deseada=valor)
 
     @property
     def temperatura_a_mostrar(self):
@@ -83,7 +114,7 @@ class Ambiente:
         - "ambiente": Muestra la temperatura actual medida
         - "deseada": Muestra la temperatura objetivo configurada
         """
-        return self.__temperatura_a_mostrar
+        return self.__estado.temperatura_a_mostrar
 
     @temperatura_a_mostrar.setter
     def temperatura_a_mostrar(self, valor):
@@ -93,7 +124,7 @@ class Ambiente:
         Args:
             valor (str): Modo a mostrar ("ambiente" o "deseada").
         """
-        self.__temperatura_a_mostrar = valor
+        self._actualizar(temperatura_a_mostrar=valor)
 
     def __init__(self, temperatura_deseada_inicial=None):
         """
@@ -103,12 +134,49 @@ class Ambiente:
             temperatura_deseada_inicial: Temperatura deseada inicial en °C.
                                         Si es None, se usa 22°C por defecto.
         """
-        self.__temperatura_ambiente = None  # Aun no leida del sensor
-        if temperatura_deseada_inicial is not None:
-            self.__temperatura_deseada = temperatura_deseada_inicial
-        else:
-            self.__temperatura_deseada = 22
-        self.__temperatura_a_mostrar = "ambiente"
+        if temperatura_deseada_inicial is None:
+            temperatura_deseada_inicial = 22
+        self.__lock_escritura = threading.Lock()
+        self.__estado = EstadoAmbiente(
+            temperatura_ambiente=None,  # Aun no leida del sensor
+            temperatura_deseada=temperatura_deseada_inicial,
+            temperatura_a_mostrar="ambiente",
+            marca_tiempo=time.monotonic()
+        )
+
+    def instantanea(self):
+        """
+        Retorna una instantanea consistente del estado, sin bloquear.
+
+        Returns:
+            EstadoAmbiente: Tupla inmutable (ambiente, deseada, modo,
+                            marca_tiempo) tomada en un unico acceso.
+        """
+        return self.__estado
+
+    def ajustar_temperatura_deseada(self, delta):
+        """
+        Suma delta a la temperatura deseada de forma atomica.
+
+        A diferencia de "temperatura_deseada += delta", la lectura y la
+        escritura ocurren bajo el lock de escritura, por lo que dos
+        ajustes concurrentes nunca se pisan.
+
+        Args:
+            delta (float): Grados a sumar (negativo para restar).
+        """
+        with self.__lock_escritura:
+            estado = self.__estado
+            self.__estado = estado._replace(
+                temperatura_deseada=estado.temperatura_deseada + delta,
+                marca_tiempo=time.monotonic()
+            )
+
+    def _actualizar(self, **cambios):
+        """Reemplaza el estado por una copia con los cambios aplicados."""
+        with self.__lock_escritura:
+            self.__estado = self.__estado._replace(marca_tiempo=time.monotonic(),
+                                                   **cambios)
 
     def __repr__(self):
         """
@@ -122,12 +190,13 @@ class Ambiente:
             Util para debugging y logging. Muestra todos los atributos
             relevantes del estado actual del ambiente.
         """
+        estado = self.__estado
         return (
             "Ambiente(temperatura_ambiente={}, "
             "temperatura_deseada={}, "
             "temperatura_a_mostrar='{}')".format(
-                self.__temperatura_ambiente,
-                self.__temperatura_deseada,
-                self.__temperatura_a_mostrar
+                estado.temperatura_ambiente,
+                estado.temperatura_deseada,
+                estado.temperatura_a_mostrar
             )
         )
@@ -0,0 +1,132 @@
+"""
+Lecturas de sensores con marca de tiempo y numero de secuencia.
+
+Este modulo define el Value Object Lectura, que acompana cada valor
+leido de un sensor con el instante monotono en que se obtuvo y un
+numero de secuencia creciente, y SeguimientoLectura, que registra la
+ultima lectura de una fuente y responde por su antiguedad y vigencia.
+
+Responsabilidades:
+    - Asociar a cada valor leido su marca de tiempo y secuencia
+    - Calcular la antiguedad de la ultima lectura
+    - Determinar si la ultima lectura sigue vigente segun una edad maxima
+    - Permitir detectar si hubo lecturas nuevas desde una secuencia dada
+
+Invariantes:
+    - Las marcas de tiempo provienen de reloj.monotonic() (no retroceden);
+      por defecto el reloj es el modulo time
+    - La secuencia crece en 1 con cada lectura registrada, empezando en 1
+"""
+import itertools
+import time
+from collections import namedtuple
+
+
+class Lectura(namedtuple("Lectura", ["valor", "marca_tiempo", "secuencia"])):
+    """
+    Valor leido de un sensor junto con su marca de tiempo y secuencia.
+
+    Attributes:
+        valor (float): Valor medido por el sensor.
+        marca_tiempo (float): reloj.monotonic() al momento de la lectura.
+        secuencia (int): Numero de orden de la lectura (1, 2, 3, ...).
+    """
+    __slots__ = ()
+
+
+class SeguimientoLectura:
+    """
+    Registro de la ultima lectura de una fuente y de su vigencia.
+
+    La ultima lectura se reemplaza completa en cada registro (asignacion
+    atomica) y la secuencia usa un contador de itertools, por lo que un
+    hilo puede registrar mientras otros consultan sin tomar locks.
+
+    Attributes:
+        antiguedad_maxima (float): Edad maxima en segundos para considerar
+            vigente la lectura. None significa sin limite.
+    """
+
+    @property
+    def ultima(self):
+        """Lectura: Ultima lectura registrada, o None si aun no hay."""
+        return self._ultima
+
+    @property
+    def antiguedad_maxima(self):
+        """float: Edad maxima en segundos de una lectura vigente (o None)."""
+        return self._antiguedad_maxima
+
+    def __init__(self, antiguedad_maxima=None, reloj=None):
+        """
+        Inicializa el seguimiento sin lecturas.
+
+        Args:
+            antiguedad_maxima (float): Segundos tras los cuales la lectura
+                deja de estar vigente. None = nunca vence.
+            reloj: Objeto con monotonic() que da las marcas de tiempo
+                (por defecto el modulo time; un RelojVirtual mide la
+                antiguedad en tiempo simulado).
+
+        Raises:
+            ValueError: Si antiguedad_maxima es negativa.
+        """
+        if antiguedad_maxima is not None and antiguedad_maxima < 0:
+            mensaje = "antiguedad_maxima debe ser >= 0, recibido: {}"
+            raise ValueError(mensaje.format(antiguedad_maxima))
+        self._antiguedad_maxima = antiguedad_maxima
+        self._secuencia = itertools.count(1)
+        self._ultima = None
+        self._reloj = reloj if reloj is not None else time
+
+    def registrar(self, valor):
+        """
+        Registra un valor leido como la lectura mas reciente.
+
+        Args:
+            valor (float): Valor medido por el sensor.
+
+        Returns:
+            Lectura: La lectura registrada.
+        """
+        lectura = Lectura(valor, self._reloj.monotonic(), next(self._secuencia))
+        self._ultima = lectura
+        return lectura
+
+    def antiguedad(self):
+        """
+        Retorna los segundos transcurridos desde la ultima lectura.
+
+        Returns:
+            float: Antiguedad en segundos, o None si no hay lecturas.
+        """
+        lectura = self._ultima
+        if lectura is None:
+            return None
+        return self._reloj.monotonic() - lectura.marca_tiempo
+
+    def es_vigente(self):
+        """
+        Indica si la ultima lectura no supera la antiguedad maxima.
+
+        Returns:
+            bool: False si no hay lecturas o si la lectura vencio.
+        """
+        antiguedad = self.antiguedad()
+        if antiguedad is None:
+            return False
+        return self._antiguedad_maxima is None or antiguedad <= self._antiguedad_maxima
+
+    def hay_novedad(self, secuencia):
+        """
+        Indica si hubo lecturas posteriores a la secuencia dada.
+
+        Args:
+            secuencia (int): Ultima secuencia procesada por el consumidor
+                (0 o None si aun no proceso ninguna).
+
+        Returns:
+            bool: True si la ultima lectura es mas nueva que secuencia.
+        """
+        lectura = self._ultima
+        return lectura is not None and lectura.secuencia > (secuencia or 0)
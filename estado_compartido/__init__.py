@@ -0,0 +1,15 @@
+"""
+Paquete de estado compartido del termostato.
+
+Publica el estado del termostato (temperaturas, bateria y climatizador)
+en un bloque de memoria compartida con versionado tipo seqlock, para que
+otros procesos locales lo lean sin sockets, sin llamadas al sistema y
+sin serializar:
+    - tabla: Formato del bloque y TablaEstado (creador y escritor)
+    - lector: LectorEstado, biblioteca de lectura para otros procesos
+    - publicador: Vuelca el estado de los gestores en la tabla
+
+Requiere Python 3.8+ (multiprocessing.shared_memory); en versiones
+anteriores el paquete se importa pero crear o leer una tabla lanza
+ImportError, y el termostato funciona sin la seccion "estado_compartido".
+"""
@@ -0,0 +1,76 @@
+"""
+Biblioteca de lectura del estado compartido del termostato.
+
+Para carteles, diagnosticos y publicadores que corren en otro proceso:
+
+    from estado_compartido.lector import LectorEstado
+
+    lector = LectorEstado("termostato")
+    estado = lector.leer()          # EstadoTermostato o None
+    if estado is not None:
+        print(estado.temperatura_ambiente, estado.climatizador)
+
+Adjuntarse al bloque es la unica llamada al sistema; cada lectura copia
+una fila desde la memoria mapeada y valida su secuencia (seqlock).
+
+Patron de Diseno:
+    - Proxy: Acceso de solo lectura al estado de otro proceso
+"""
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # pragma: no cover - depende del entorno (Python < 3.8)
+    resource_tracker = shared_memory = None
+
+from estado_compartido.tabla import BLOQUES_CREADOS, BloqueEstado, verificar_shared_memory
+
+
+def adjuntar_bloque(nombre):
+    """
+    Adjunta un bloque de memoria compartida existente sin adoptarlo.
+
+    Hasta Python 3.13, adjuntarse registra el bloque en el
+    resource_tracker del proceso, que lo borraria al terminar (aunque
+    lo haya creado otro proceso). Se lo da de baja del registro, salvo
+    que lo haya creado este mismo proceso.
+
+    Args:
+        nombre (str): Nombre del bloque.
+
+    Returns:
+        SharedMemory: Bloque adjuntado.
+
+    Raises:
+        FileNotFoundError: Si no existe un bloque con ese nombre.
+        ImportError: Si Python es anterior a 3.8.
+    """
+    verificar_shared_memory()
+    try:
+        return shared_memory.SharedMemory(nombre, track=False)  # pylint: disable=unexpected-keyword-arg
+    except TypeError:
+        bloque = shared_memory.SharedMemory(nombre)
+        if bloque.name not in BLOQUES_CREADOS:
+            resource_tracker.unregister(bloque._name, "shared_memory")  # pylint: disable=protected-access
+        return bloque
+
+
+class LectorEstado(BloqueEstado):
+    """
+    Lector del estado publicado por otro proceso.
+
+    Args:
+        nombre (str): Nombre del bloque ("estado_compartido.nombre" del
+            termostato, o el que informa el supervisor multi-zona).
+
+    Raises:
+        FileNotFoundError: Si el termostato no esta publicando.
+        ValueError: Si el bloque no es una tabla de estado.
+    """
+
+    def __init__(self, nombre):
+        super().__init__(adjuntar_bloque(nombre))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
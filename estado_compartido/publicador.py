@@ -0,0 +1,70 @@
+"""
+Publicacion del estado de los gestores en la tabla compartida.
+
+Patron de Diseno:
+    - Adapter: Traduce el estado de los gestores a una fila de la tabla
+"""
+from estado_compartido.tabla import EstadoTermostato
+from servicios_aplicacion.reloj import RelojReal
+
+
+def armar_estado(gestor_bateria, gestor_ambiente, gestor_climatizador, reloj):
+    """
+    Arma el estado a publicar a partir de los gestores.
+
+    Args:
+        gestor_bateria: Gestor de bateria.
+        gestor_ambiente: Gestor de ambiente.
+        gestor_climatizador: Gestor de climatizador.
+        reloj (AbsReloj): Reloj de la marca de actualizacion.
+
+    Returns:
+        EstadoTermostato: Estado actual.
+    """
+    indicador = gestor_bateria.obtener_indicador_de_carga()
+    return EstadoTermostato(
+        temperatura_ambiente=gestor_ambiente.obtener_temperatura_ambiente(),
+        temperatura_deseada=gestor_ambiente.obtener_temperatura_deseada(),
+        nivel_de_carga=gestor_bateria.obtener_nivel_de_carga(),
+        carga_baja=None if indicador is None else indicador == "BAJA",
+        climatizador=gestor_climatizador.obtener_estado_climatizador(),
+        actualizacion=reloj.ahora().timestamp(),
+    )
+
+
+# pylint: disable=too-few-public-methods
+class PublicadorEstado:
+    """
+    Publica el estado de un termostato en una fila de la tabla.
+
+    Args:
+        tabla (TablaEstado): Tabla compartida.
+        gestor_bateria: Gestor de bateria.
+        gestor_ambiente: Gestor de ambiente.
+        gestor_climatizador: Gestor de climatizador.
+        reloj (AbsReloj): Reloj de la marca de actualizacion (por
+            defecto RelojReal).
+        fila (int): Fila de la tabla.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, tabla, gestor_bateria, gestor_ambiente, gestor_climatizador,
+                 reloj=None, fila=0):
+        self._tabla = tabla
+        self._gestor_bateria = gestor_bateria
+        self._gestor_ambiente = gestor_ambiente
+        self._gestor_climatizador = gestor_climatizador
+        self._reloj = reloj if reloj is not None else RelojReal()
+        self._fila = fila
+
+    @property
+    def tabla(self):
+        """TablaEstado: Tabla donde se publica."""
+        return self._tabla
+
+    def publicar(self):
+        """Escribe el estado actual de los gestores en la fila."""
+        self._tabla.escribir(self._fila, armar_estado(self._gestor_bateria,
+                                                      self._gestor_ambiente,
+                                                      self._gestor_climatizador,
+                                                      self._reloj))
@@ -0,0 +1,357 @@
+"""
+Tabla de estado en memoria compartida con versionado seqlock.
+
+Formato del bloque (little endian):
+    - Cabecera (16 bytes): magia "TRM1", version, campos, filas
+    - Nombres: filas x 32 bytes UTF-8 (relleno con ceros)
+    - Filas: filas x (secuencia uint64 + 6 float64)
+
+Cada fila tiene un unico escritor. Para escribir incrementa la secuencia
+(queda impar), escribe los valores y la vuelve a incrementar (queda par).
+Un lector copia la fila y relee la secuencia: si era impar o cambio, la
+copia puede estar a medio escribir y reintenta (cediendo la CPU, por si
+el escritor fue desalojado a mitad de la escritura). Los lectores no
+toman locks, por lo que un escritor que muere no puede bloquearlos.
+
+Codificacion de los valores:
+    - Valores ausentes (sin lectura) se guardan como NaN
+    - carga_baja se guarda como 1.0 / 0.0
+    - climatizador se guarda como indice en ESTADOS_CLIMATIZADOR
+    - actualizacion es el instante (epoch) de la ultima escritura
+    - Secuencia 0 indica una fila todavia no escrita
+
+CPython no emite barreras de memoria: en CPUs de orden debil (ARM) el
+seqlock reduce pero no elimina la posibilidad de una lectura mezclada.
+
+Patron de Diseno:
+    - Shared Memory: Estado compartido entre procesos sin serializar
+    - Seqlock: Lectores sin bloqueo validados por numero de secuencia
+"""
+import math
+import struct
+import threading
+import time
+from collections import namedtuple
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - depende del entorno (Python < 3.8)
+    shared_memory = None
+
+
+EstadoTermostato = namedtuple("EstadoTermostato", [
+    "temperatura_ambiente",
+    "temperatura_deseada",
+    "nivel_de_carga",
+    "carga_baja",
+    "climatizador",
+    "actualizacion",
+])
+
+ESTADOS_CLIMATIZADOR = ("apagado", "calentando", "enfriando")
+
+MAGIA = b"TRM1"
+VERSION = 1
+LARGO_NOMBRE = 32
+CABECERA = struct.Struct("<4sHHI4x")
+SECUENCIA = struct.Struct("<Q")
+VALORES = struct.Struct("<{}d".format(len(EstadoTermostato._fields)))
+FILA = struct.Struct("<Q{}d".format(len(EstadoTermostato._fields)))
+
+# Bloques creados por este proceso (registrados en su resource_tracker)
+BLOQUES_CREADOS = set()
+
+
+def _codificar(valor):
+    """Convierte un valor opcional a float (None -> NaN)."""
+    return math.nan if valor is None else float(valor)
+
+
+def _decodificar(valor):
+    """Convierte un float de la tabla a valor opcional (NaN -> None)."""
+    return None if math.isnan(valor) else valor
+
+
+def verificar_shared_memory():
+    """Lanza ImportError si multiprocessing.shared_memory no esta disponible."""
+    if shared_memory is None:
+        raise ImportError("El estado compartido requiere Python 3.8+ (multiprocessing.shared_memory)")
+
+
+def tamano_bloque(filas):
+    """
+    Calcula el tamano en bytes del bloque de una tabla.
+
+    Args:
+        filas (int): Cantidad de filas.
+
+    Returns:
+        int: Bytes de cabecera, nombres y filas.
+    """
+    return CABECERA.size + filas * (LARGO_NOMBRE + FILA.size)
+
+
+class BloqueEstado:
+    """
+    Lectura de una tabla de estado mapeada en memoria.
+
+    Base de TablaEstado (proceso que publica) y LectorEstado (procesos
+    que leen). Una vez mapeado el bloque, leer es copiar bytes: no hay
+    llamadas al sistema ni serializacion.
+
+    Args:
+        bloque (SharedMemory): Bloque ya creado o adjuntado.
+    """
+
+    # Segundos de reintentos antes de desistir de una lectura
+    ESPERA_MAXIMA = 0.5
+
+    def __init__(self, bloque):
+        self._bloque = bloque
+        magia, version, campos, filas = CABECERA.unpack_from(bloque.buf, 0)
+        if magia != MAGIA or version != VERSION or campos != len(EstadoTermostato._fields):
+            mensaje = "El bloque {} no es una tabla de estado (magia={}, version={})"
+            raise ValueError(mensaje.format(bloque.name, magia, version))
+        self._filas = filas
+        self._inicio_filas = CABECERA.size + filas * LARGO_NOMBRE
+        self._nombres = [self._leer_nombre(fila) for fila in range(filas)]
+
+    @property
+    def nombre(self):
+        """str: Nombre del bloque de memoria compartida."""
+        return self._bloque.name
+
+    @property
+    def nombres(self):
+        """list: Nombre de cada fila."""
+        return list(self._nombres)
+
+    @property
+    def filas(self):
+        """int: Cantidad de filas de la tabla."""
+        return self._filas
+
+    def indice(self, nombre):
+        """
+        Retorna la fila de un nombre.
+
+        Raises:
+            ValueError: Si no hay fila con ese nombre.
+        """
+        return self._nombres.index(nombre)
+
+    def version(self, fila=0):
+        """
+        Retorna la secuencia de una fila (cambia con cada escritura).
+
+        Permite a un lector detectar si hay estado nuevo sin copiar la fila.
+
+        Args:
+            fila (int): Indice de la fila.
+
+        Returns:
+            int: Secuencia (0 = fila sin escribir; impar = en escritura).
+        """
+        return SECUENCIA.unpack_from(self._bloque.buf, self._desplazamiento(fila))[0]
+
+    def leer(self, fila=0):
+        """
+        Lee el estado de una fila sin tomar locks.
+
+        Args:
+            fila (int): Indice de la fila.
+
+        Returns:
+            EstadoTermostato: Estado publicado, o None si la fila no se escribio.
+
+        Raises:
+            TimeoutError: Si la fila sigue en escritura tras ESPERA_MAXIMA
+                segundos (escritor detenido a mitad de una escritura).
+        """
+        desplazamiento = self._desplazamiento(fila)
+        buf = self._bloque.buf
+        limite = None
+        while True:
+            secuencia, *valores = FILA.unpack_from(buf, desplazamiento)
+            if secuencia % 2 == 0 and SECUENCIA.unpack_from(buf, desplazamiento)[0] == secuencia:
+                return None if secuencia == 0 else self._armar(valores)
+            if limite is None:
+                limite = time.monotonic() + self.ESPERA_MAXIMA
+            elif time.monotonic() > limite:
+                mensaje = "La fila {} del bloque {} sigue en escritura"
+                raise TimeoutError(mensaje.format(fila, self.nombre))
+            time.sleep(0)
+
+    def leer_todas(self):
+        """
+        Lee el estado de todas las filas.
+
+        Cada fila es consistente por si misma; filas distintas pueden
+        corresponder a instantes levemente distintos.
+
+        Returns:
+            list: Pares (nombre, EstadoTermostato o None) en orden de fila.
+        """
+        return [(nombre, self.leer(fila)) for fila, nombre in enumerate(self._nombres)]
+
+    def cerrar(self):
+        """Desmapea el bloque en este proceso (no lo borra)."""
+        self._bloque.close()
+
+    def _desplazamiento(self, fila):
+        """Retorna el byte donde empieza una fila."""
+        if not 0 <= fila < self._filas:
+            raise IndexError("Fila {} fuera de rango (0 a {})".format(fila, self._filas - 1))
+        return self._inicio_filas + fila * FILA.size
+
+    def _leer_nombre(self, fila):
+        """Lee el nombre de una fila."""
+        inicio = CABECERA.size + fila * LARGO_NOMBRE
+        return bytes(self._bloque.buf[inicio:inicio + LARGO_NOMBRE]).rstrip(b"\0").decode("utf-8")
+
+    @staticmethod
+    def _armar(valores):
+        """Decodifica los valores de una fila."""
+        carga_baja = _decodificar(valores[3])
+        climatizador = _decodificar(valores[4])
+        return EstadoTermostato(
+            temperatura_ambiente=_decodificar(valores[0]),
+            temperatura_deseada=_decodificar(valores[1]),
+            nivel_de_carga=_decodificar(valores[2]),
+            carga_baja=None if carga_baja is None else carga_baja == 1.0,
+            climatizador=None if climatizador is None else ESTADOS_CLIMATIZADOR[int(climatizador)],
+            actualizacion=valores[5],
+        )
+
+
+class TablaEstado(BloqueEstado):
+    """
+    Tabla de estado creada y escrita por el proceso que publica.
+
+    Los procesos hijos heredan (fork) o reciben (spawn) la tabla y
+    pueden escribir sus propias filas. El bloque se borra con liberar();
+    si el proceso creador termina sin liberarlo lo borra el
+    resource_tracker de multiprocessing.
+
+    Args:
+        nombres (list): Nombre de cada fila (a lo sumo 32 bytes UTF-8).
+        nombre (str): Nombre del bloque (None = nombre aleatorio). Si
+            quedo un bloque con ese nombre de una ejecucion anterior se
+            reemplaza, solo si es una tabla vencida (ver VIGENCIA).
+
+    Raises:
+        ImportError: Si Python es anterior a 3.8.
+        ValueError: Si un nombre de fila es demasiado largo.
+        FileExistsError: Si ya existe un bloque con ese nombre que no es
+            una tabla vencida (otro proceso la esta publicando).
+    """
+
+    # Segundos sin escrituras tras los que una tabla existente se
+    # considera abandonada y puede reemplazarse
+    VIGENCIA = 60
+
+    def __init__(self, nombres, nombre=None):
+        verificar_shared_memory()
+        codificados = [fila.encode("utf-8") for fila in nombres]
+        for codificado in codificados:
+            if len(codificado) > LARGO_NOMBRE:
+                mensaje = "Nombre de fila de mas de {} bytes: {}"
+                raise ValueError(mensaje.format(LARGO_NOMBRE, codificado))
+        bloque = self._crear_bloque(nombre, tamano_bloque(len(nombres)))
+        CABECERA.pack_into(bloque.buf, 0, MAGIA, VERSION, len(EstadoTermostato._fields),
+                           len(nombres))
+        for fila, codificado in enumerate(codificados):
+            bloque.buf[CABECERA.size + fila * LARGO_NOMBRE:
+                       CABECERA.size + fila * LARGO_NOMBRE + len(codificado)] = codificado
+        super().__init__(bloque)
+        self._escritura = threading.Lock()
+        BLOQUES_CREADOS.add(bloque.name)
+
+    @classmethod
+    def _crear_bloque(cls, nombre, tamano):
+        """
+        Crea el bloque (inicializado en ceros).
+
+        Un bloque viejo del mismo nombre se reemplaza solo si es una tabla
+        vencida: ninguna de sus filas se escribio en los ultimos VIGENCIA
+        segundos (o nunca se escribio), como la que deja un publicador que
+        murio sin liberarla.
+
+        Raises:
+            FileExistsError: Si el bloque existente no es una tabla vencida.
+        """
+        try:
+            return shared_memory.SharedMemory(nombre, create=True, size=tamano)
+        except FileExistsError:
+            viejo = shared_memory.SharedMemory(nombre)
+            try:
+                vencido = cls._vencido(viejo)
+            finally:
+                viejo.close()
+            if not vencido:
+                mensaje = ("El bloque {} esta en uso por otro proceso (no es una tabla "
+                           "o se escribio hace menos de {} s)")
+                raise FileExistsError(mensaje.format(nombre, cls.VIGENCIA)) from None
+            viejo.unlink()
+            return shared_memory.SharedMemory(nombre, create=True, size=tamano)
+
+    @classmethod
+    def _vencido(cls, bloque):
+        """Indica si el bloque es una tabla sin escrituras en los ultimos VIGENCIA segundos."""
+        try:
+            vieja = BloqueEstado(bloque)
+        except (ValueError, struct.error):
+            return False
+        ultima = 0.0
+        for fila in range(vieja.filas):
+            # pylint: disable=protected-access
+            secuencia, *valores = FILA.unpack_from(bloque.buf, vieja._desplazamiento(fila))
+            if secuencia != 0:
+                ultima = max(ultima, valores[-1])
+        return time.time() - ultima > cls.VIGENCIA
+
+    def escribir(self, fila, estado):
+        """
+        Publica el estado de una fila.
+
+        Los hilos de este proceso se serializan con un lock; cada fila
+        debe tener un solo proceso escritor.
+
+        Args:
+            fila (int): Indice de la fila.
+            estado (EstadoTermostato): Estado a publicar.
+        """
+        valores = (
+            _codificar(estado.temperatura_ambiente),
+            _codificar(estado.temperatura_deseada),
+            _codificar(estado.nivel_de_carga),
+            _codificar(None if estado.carga_baja is None else bool(estado.carga_baja)),
+            _codificar(ESTADOS_CLIMATIZADOR.index(estado.climatizador)
+                       if estado.climatizador in ESTADOS_CLIMATIZADOR else None),
+            float(estado.actualizacion),
+        )
+        desplazamiento = self._desplazamiento(fila)
+        buf = self._bloque.buf
+        with self._escritura:
+            secuencia = SECUENCIA.unpack_from(buf, desplazamiento)[0]
+            # Una secuencia impar quedo de un escritor que murio escribiendo
+            secuencia += 1 if secuencia % 2 == 0 else 2
+            SECUENCIA.pack_into(buf, desplazamiento, secuencia)
+            VALORES.pack_into(buf, desplazamiento + SECUENCIA.size, *valores)
+            SECUENCIA.pack_into(buf, desplazamiento, secuencia + 1)
+
+    def liberar(self):
+        """Desmapea y borra el bloque (los lectores deben reabrirlo)."""
+        self._bloque.close()
+        self._bloque.unlink()
+        BLOQUES_CREADOS.discard(self._bloque.name)
+
+    def __getstate__(self):
+        """Al pasar la tabla a un proceso (spawn) viaja solo el nombre del bloque."""
+        return self._bloque.name
+
+    def __setstate__(self, nombre):
+        # El hijo comparte el resource_tracker del creador: adjuntarse no
+        # agrega un borrado al terminar
+        BloqueEstado.__init__(self, shared_memory.SharedMemory(nombre))
+        self._escritura = threading.Lock()
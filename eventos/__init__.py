@@ -0,0 +1,10 @@
+"""
+Paquete de eventos de cambio de estado del termostato.
+
+Los gestores publican un evento tipado cada vez que cambia el estado
+que administran, y las salidas (presentador, bitacora, metricas) se
+suscriben con su propia politica de entrega:
+    - tipos: Eventos de cambio (bateria, temperaturas, climatizador)
+    - bus: BusEventos, politicas de entrega y EmisorCambios
+    - suscriptores: Suscriptores genericos (registro en la bitacora)
+"""
@@ -0,0 +1,295 @@
+"""
+Bus de eventos en proceso con politicas de entrega por suscriptor.
+
+Los gestores publican eventos de cambio; cada suscriptor indica que
+tipos le interesan y como quiere recibirlos:
+    - EntregaInmediata: cada evento, en el hilo que lo publica
+    - EntregaLimitada: a lo sumo una entrega por intervalo, con el
+      ultimo evento de cada tipo (los intermedios se descartan)
+    - EntregaPorLotes: todos los eventos, agrupados hasta completar un
+      lote o hasta que el mas viejo cumple el intervalo
+
+El manejador de un suscriptor siempre recibe una lista de eventos. Las
+entregas limitadas y por lotes solo las hace despachar(), que el
+operador invoca periodicamente desde el hilo de presentacion: publicar()
+apenas retiene el evento, de modo que la E/S de esas salidas nunca corre
+en los hilos de lectura o de control que publican. Asi el trabajo de
+las salidas depende de la frecuencia de los cambios y no de la cantidad
+de salidas por la frecuencia de sondeo.
+
+Patron de Diseno:
+    - Observer (Publish/Subscribe): Los gestores no conocen a las salidas
+    - Strategy: Politica de entrega intercambiable por suscriptor
+"""
+import logging
+import threading
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+
+from servicios_aplicacion.reloj import RelojReal
+
+_bitacora = logging.getLogger(__name__)
+
+
+class PoliticaEntrega(metaclass=ABCMeta):
+    """
+    Decide cuando se entregan los eventos a un suscriptor.
+
+    Cada suscripcion tiene su propia instancia; el bus la invoca con el
+    lock de la suscripcion tomado, por lo que no necesita sincronizarse.
+    """
+
+    @abstractmethod
+    def recibir(self, evento, ahora):
+        """
+        Registra un evento publicado.
+
+        Args:
+            evento: Evento publicado.
+            ahora (float): Instante monotono de la publicacion.
+
+        Returns:
+            list: Eventos a entregar ya en el hilo que publica (solo las
+                politicas inmediatas), o None si el evento queda retenido.
+        """
+
+    @abstractmethod
+    def vencidos(self, ahora):
+        """
+        Retorna los eventos retenidos cuya entrega ya corresponde.
+
+        Args:
+            ahora (float): Instante monotono actual.
+
+        Returns:
+            list: Eventos a entregar ya, o None.
+        """
+
+
+class EntregaInmediata(PoliticaEntrega):
+    """Entrega cada evento apenas se publica."""
+
+    def recibir(self, evento, ahora):
+        """Entrega el evento sin retenerlo."""
+        return [evento]
+
+    def vencidos(self, ahora):
+        """No retiene eventos."""
+        return None
+
+
+class EntregaLimitada(PoliticaEntrega):
+    """
+    Entrega a lo sumo una vez por intervalo.
+
+    Entre entregas conserva solo el ultimo evento de cada tipo: a una
+    pantalla le alcanza el valor vigente.
+
+    Args:
+        intervalo (float): Segundos minimos entre entregas.
+    """
+
+    def __init__(self, intervalo):
+        self._intervalo = intervalo
+        self._pendientes = OrderedDict()
+        self._ultima_entrega = None
+
+    def recibir(self, evento, ahora):
+        """Reemplaza el pendiente del mismo tipo (lo entrega despachar())."""
+        self._pendientes[type(evento)] = evento
+        return None
+
+    def vencidos(self, ahora):
+        """Entrega los pendientes si paso el intervalo desde la ultima entrega."""
+        if not self._pendientes:
+            return None
+        if self._ultima_entrega is not None and ahora - self._ultima_entrega < self._intervalo:
+            return None
+        eventos = list(self._pendientes.values())
+        self._pendientes.clear()
+        self._ultima_entrega = ahora
+        return eventos
+
+
+class EntregaPorLotes(PoliticaEntrega):
+    """
+    Entrega todos los eventos agrupados en lotes.
+
+    Un lote se entrega en el primer despacho tras completarse o tras
+    cumplir el intervalo su evento mas viejo, con todos los eventos
+    retenidos hasta ese momento.
+
+    Args:
+        tamano (int): Eventos que completan un lote.
+        intervalo (float): Segundos maximos que espera el evento mas viejo.
+    """
+
+    def __init__(self, tamano, intervalo):
+        self._tamano = tamano
+        self._intervalo = intervalo
+        self._pendientes = []
+        self._primero = None
+
+    def recibir(self, evento, ahora):
+        """Agrega el evento al lote (lo entrega despachar())."""
+        if not self._pendientes:
+            self._primero = ahora
+        self._pendientes.append(evento)
+        return None
+
+    def vencidos(self, ahora):
+        """Entrega el lote si se completo o si el evento mas viejo cumplio el intervalo."""
+        if not self._pendientes:
+            return None
+        if len(self._pendientes) >= self._tamano or ahora - self._primero >= self._intervalo:
+            return self._entregar()
+        return None
+
+    def _entregar(self):
+        """Retorna el lote y empieza uno nuevo."""
+        eventos, self._pendientes = self._pendientes, []
+        return eventos
+
+
+class Suscripcion:
+    """
+    Suscripcion de un manejador al bus.
+
+    El lock serializa politica y manejador: un suscriptor nunca recibe
+    dos entregas a la vez, y las recibe en orden.
+
+    Args:
+        manejador: Callable que recibe una lista de eventos.
+        tipos (tuple): Tipos de evento aceptados (None = todos).
+        politica (PoliticaEntrega): Cuando se entregan los eventos.
+    """
+
+    def __init__(self, manejador, tipos, politica):
+        self.manejador = manejador
+        self.tipos = tuple(tipos) if tipos is not None else None
+        self.politica = politica
+        self.lock = threading.Lock()
+
+    def acepta(self, evento):
+        """bool: True si el evento es de un tipo suscripto."""
+        return self.tipos is None or isinstance(evento, self.tipos)
+
+
+class BusEventos:
+    """
+    Bus de publicacion/suscripcion en proceso.
+
+    publicar() es seguro para hilos y no toma locks globales: recorre
+    una tupla de suscripciones que solo se reemplaza al suscribir o
+    cancelar. Un manejador que lanza una excepcion se informa en la
+    bitacora y no afecta al publicador ni a los demas suscriptores.
+
+    Args:
+        reloj (AbsReloj): Reloj de los intervalos de entrega (None = RelojReal).
+    """
+
+    # Entregas cuyo manejador lanzo una excepcion
+    errores = 0
+
+    def __init__(self, reloj=None):
+        self._reloj = reloj if reloj is not None else RelojReal()
+        self._suscripciones = ()
+        self._lock = threading.Lock()
+
+    @property
+    def suscripciones(self):
+        """int: Cantidad de suscripciones activas."""
+        return len(self._suscripciones)
+
+    def suscribir(self, manejador, tipos=None, politica=None):
+        """
+        Suscribe un manejador a los eventos de ciertos tipos.
+
+        Args:
+            manejador: Callable que recibe una lista de eventos.
+            tipos (tuple): Tipos de evento aceptados (None = todos).
+            politica (PoliticaEntrega): Politica de entrega (None = inmediata).
+
+        Returns:
+            Suscripcion: Permite cancelar la suscripcion.
+        """
+        suscripcion = Suscripcion(manejador, tipos,
+                                  politica if politica is not None else EntregaInmediata())
+        with self._lock:
+            self._suscripciones = self._suscripciones + (suscripcion,)
+        return suscripcion
+
+    def cancelar(self, suscripcion):
+        """
+        Da de baja una suscripcion (los eventos retenidos se descartan).
+
+        Args:
+            suscripcion (Suscripcion): Retornada por suscribir().
+        """
+        with self._lock:
+            self._suscripciones = tuple(s for s in self._suscripciones if s is not suscripcion)
+
+    def publicar(self, evento):
+        """
+        Publica un evento a los suscriptores de su tipo.
+
+        Solo las entregas inmediatas corren en el hilo que publica; las
+        demas politicas retienen el evento hasta el proximo despachar().
+
+        Args:
+            evento: Evento a publicar.
+        """
+        ahora = self._reloj.monotonic()
+        for suscripcion in self._suscripciones:
+            if suscripcion.acepta(evento):
+                with suscripcion.lock:
+                    self._invocar(suscripcion, suscripcion.politica.recibir(evento, ahora))
+
+    def despachar(self):
+        """Entrega los eventos retenidos cuya entrega ya corresponde (en el hilo que llama)."""
+        ahora = self._reloj.monotonic()
+        for suscripcion in self._suscripciones:
+            with suscripcion.lock:
+                self._invocar(suscripcion, suscripcion.politica.vencidos(ahora))
+
+    def _invocar(self, suscripcion, eventos):
+        """Invoca al manejador si hay eventos (con el lock de la suscripcion tomado)."""
+        if not eventos:
+            return
+        try:
+            suscripcion.manejador(eventos)
+        except Exception:  # pylint: disable=broad-except
+            self.errores += 1
+            _bitacora.exception("error en un suscriptor de eventos")
+
+
+class EmisorCambios:
+    """
+    Publica un evento solo si difiere del ultimo publicado de su tipo.
+
+    Lo usan los gestores para emitir sus cambios de estado; sin bus no
+    hace nada, de modo que los gestores funcionan igual sin suscriptores.
+
+    Args:
+        bus (BusEventos): Bus destino, o None.
+    """
+
+    def __init__(self, bus=None):
+        self._bus = bus
+        self._ultimos = {}
+        self._lock = threading.Lock()
+
+    def emitir(self, evento):
+        """
+        Publica el evento si cambio respecto del ultimo de su tipo.
+
+        Args:
+            evento: Evento de cambio.
+        """
+        if self._bus is None:
+            return
+        with self._lock:
+            if self._ultimos.get(type(evento)) == evento:
+                return
+            self._ultimos[type(evento)] = evento
+        self._bus.publicar(evento)
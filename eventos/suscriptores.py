@@ -0,0 +1,30 @@
+"""
+Suscriptores genericos del bus de eventos.
+
+Patron de Diseno:
+    - Observer: Reaccionan a los cambios publicados por los gestores
+"""
+import logging
+
+_bitacora = logging.getLogger(__name__)
+
+
+# pylint: disable=too-few-public-methods
+class RegistradorEventos:
+    """
+    Registra cada cambio de estado como una linea de la bitacora.
+
+    La bitacora escribe cada evento como una linea logfmt con sus
+    campos como pares clave=valor, apta para analisis posterior.
+    """
+
+    def registrar(self, eventos):
+        """
+        Registra los eventos recibidos.
+
+        Args:
+            eventos (list): Eventos de cambio (ver eventos.tipos).
+        """
+        for evento in eventos:
+            _bitacora.info("cambio de estado",
+                           extra={"campos": dict(evento._asdict(), evento=type(evento).__name__)})
@@ -0,0 +1,26 @@
+"""
+Eventos de cambio de estado del termostato.
+
+Cada evento lleva el valor nuevo. Se publican solo cuando el valor
+cambia respecto del ultimo publicado del mismo tipo (ver EmisorCambios).
+
+Patron de Diseno:
+    - Value Object: Los eventos son inmutables
+"""
+from collections import namedtuple
+
+
+CambioBateria = namedtuple("CambioBateria", ["nivel_de_carga", "indicador"])
+CambioTemperaturaAmbiente = namedtuple("CambioTemperaturaAmbiente", ["temperatura"])
+CambioTemperaturaDeseada = namedtuple("CambioTemperaturaDeseada", ["temperatura"])
+CambioTemperaturaAMostrar = namedtuple("CambioTemperaturaAMostrar", ["tipo"])
+CambioClimatizador = namedtuple("CambioClimatizador", ["estado"])
+
+# Todos los tipos de evento, en el orden de las secciones del presentador
+TIPOS = (
+    CambioBateria,
+    CambioTemperaturaAmbiente,
+    CambioTemperaturaDeseada,
+    CambioTemperaturaAMostrar,
+    CambioClimatizador,
+)
@@ -14,7 +14,14 @@ Responsabilidades:
     - Gestionar temperatura deseada (aumentar/disminuir)
     - Coordinar visualizacion de temperaturas
     - Controlar que temperatura se muestra (ambiente vs deseada)
+    - Registrar marca de tiempo y secuencia de cada lectura del sensor
+    - Publicar los cambios de temperaturas y de modo de visualizacion
 """
+from entidades.lectura import SeguimientoLectura
+from eventos.bus import EmisorCambios
+from eventos.tipos import (
+    CambioTemperaturaAMostrar, CambioTemperaturaAmbiente, CambioTemperaturaDeseada,
+)
 
 # Las dependencias se inyectan en el constructor (Dependency Injection)
 
@@ -31,6 +38,9 @@ class GestorAmbiente:
         _ambiente (Ambiente): Entidad de dominio con estado del ambiente.
         _proxy_sensor_temperatura: Proxy para lectura de temperatura.
         _visualizador_temperatura: Componente de visualizacion.
+        _lecturas_temperatura (SeguimientoLectura): Ultima lectura valida
+            del sensor con su marca de tiempo y secuencia.
+        _cambios (EmisorCambios): Publica los cambios de estado en el bus.
     """
 
     @property
@@ -38,7 +48,8 @@ class GestorAmbiente:
         """Ambiente: Entidad de dominio que representa el ambiente."""
         return self._ambiente
 
-    def __init__(self, ambiente, proxy_sensor, visualizador, incremento_temperatura=1):
+    def __init__(self, ambiente, proxy_sensor, visualizador, incremento_temperatura=1,
+                 antiguedad_maxima=None, reloj=None, bus=None):
         """
         Inicializa el gestor de ambiente.
 
@@ -48,11 +59,19 @@ class GestorAmbiente:
             visualizador (AbsVisualizadorTemperatura): Visualizador de temperatura.
             incremento_temperatura (float): Incremento para ajustar temperatura
                                            deseada. Por defecto 1 grado.
+            antiguedad_maxima (float): Segundos tras los cuales la ultima
+                                      lectura deja de estar vigente.
+                                      None (por defecto) = sin limite.
+            reloj: Objeto con monotonic() para las marcas de las lecturas
+                   (por defecto el modulo time).
+            bus (BusEventos): Bus donde publicar los cambios (None = no publica).
         """
         self._ambiente = ambiente
         self._proxy_sensor_temperatura = proxy_sensor
         self._visualizador_temperatura = visualizador
         self._incremento_temperatura = incremento_temperatura
+        self._lecturas_temperatura = SeguimientoLectura(antiguedad_maxima, reloj)
+        self._cambios = EmisorCambios(bus)
 
     def leer_temperatura_ambiente(self):
         """
@@ -63,6 +82,10 @@ class GestorAmbiente:
         desconectado, timeout, valor invalido), establece la temperatura
         como None para indicar lectura no disponible.
 
+        Cada lectura valida se registra con marca de tiempo monotona y
+        numero de secuencia; las lecturas fallidas no se registran, por
+        lo que la antiguedad de la ultima lectura valida sigue creciendo.
+
         Excepciones manejadas:
             - OSError: Error de comunicacion con el sensor (I/O, conexion)
             - ValueError: Valor de temperatura invalido o fuera de rango
@@ -73,6 +96,50 @@ class GestorAmbiente:
             self._ambiente.temperatura_ambiente = temperatura
         except (OSError, ValueError, TimeoutError):
             self._ambiente.temperatura_ambiente = None
+            self._cambios.emitir(CambioTemperaturaAmbiente(None))
+            return
+        if temperatura is not None:
+            self._lecturas_temperatura.registrar(temperatura)
+        self._cambios.emitir(CambioTemperaturaAmbiente(temperatura))
+
+    def obtener_lectura_temperatura(self):
+        """
+        Obtiene la ultima lectura valida del sensor de temperatura.
+
+        Returns:
+            Lectura: (valor, marca_tiempo, secuencia), o None si no hubo lecturas.
+        """
+        return self._lecturas_temperatura.ultima
+
+    def obtener_antiguedad_temperatura(self):
+        """
+        Obtiene la antiguedad de la ultima lectura valida de temperatura.
+
+        Returns:
+            float: Segundos desde la ultima lectura, o None si no hubo lecturas.
+        """
+        return self._lecturas_temperatura.antiguedad()
+
+    def temperatura_vigente(self):
+        """
+        Indica si la ultima lectura de temperatura sigue vigente.
+
+        Returns:
+            bool: True si hay lectura y no supera la antiguedad maxima.
+        """
+        return self._lecturas_temperatura.es_vigente()
+
+    def hay_temperatura_nueva(self, secuencia):
+        """
+        Indica si hubo lecturas de temperatura posteriores a secuencia.
+
+        Args:
+            secuencia (int): Ultima secuencia procesada por el consumidor.
+
+        Returns:
+            bool: True si hay una lectura mas nueva.
+        """
+        return self._lecturas_temperatura.hay_novedad(secuencia)
 
     def obtener_temperatura_ambiente(self):
         """
@@ -94,7 +161,8 @@ class GestorAmbiente:
 
         Suma el valor de incremento a la temperatura deseada actual.
         """
-        self._ambiente.temperatura_deseada += self._incremento_temperatura
+        self._ambiente.ajustar_temperatura_deseada(self._incremento_temperatura)
+        self._emitir_temperatura_deseada()
 
     def disminuir_temperatura_deseada(self):
         """
@@ -102,7 +170,26 @@ class GestorAmbiente:
 
         Resta el valor de incremento de la temperatura deseada actual.
         """
-        self._ambiente.temperatura_deseada -= self._incremento_temperatura
+        self._ambiente.ajustar_temperatura_deseada(-self._incremento_temperatura)
+        self._emitir_temperatura_deseada()
+
+    def ajustar_temperatura_deseada(self, pasos):
+        """
+        Ajusta la temperatura deseada en varios incrementos de una vez.
+
+        Equivale a llamar pasos veces a aumentar_temperatura_deseada()
+        (o a disminuir si pasos es negativo), con una sola escritura.
+
+        Args:
+            pasos (int): Cantidad neta de incrementos (negativo para bajar).
+        """
+        if pasos:
+            self._ambiente.ajustar_temperatura_deseada(pasos * self._incremento_temperatura)
+            self._emitir_temperatura_deseada()
+
+    def _emitir_temperatura_deseada(self):
+        """Publica la temperatura deseada vigente (si cambio)."""
+        self._cambios.emitir(CambioTemperaturaDeseada(self._ambiente.temperatura_deseada))
 
     def obtener_temperatura_deseada(self):
         """
@@ -118,6 +205,16 @@ class GestorAmbiente:
         temperatura = self._ambiente.temperatura_deseada
         self._visualizador_temperatura.mostrar_temperatura_deseada(temperatura)
 
+    def obtener_instantanea(self):
+        """
+        Obtiene una instantanea consistente del estado del ambiente.
+
+        Returns:
+            EstadoAmbiente: Temperaturas, modo y marca de tiempo leidos
+                            atomicamente, sin locks.
+        """
+        return self._ambiente.instantanea()
+
     def mostrar_temperatura(self):
         """
         Muestra la temperatura segun el modo de visualizacion configurado.
@@ -125,12 +222,13 @@ class GestorAmbiente:
         Si el modo es "ambiente", muestra la temperatura ambiente.
         Si el modo es "deseada", muestra la temperatura deseada.
         """
-        if self._ambiente.temperatura_a_mostrar == "ambiente":
-            temperatura = self._ambiente.temperatura_ambiente
-            self._visualizador_temperatura.mostrar_temperatura_ambiente(temperatura)
-        elif self._ambiente.temperatura_a_mostrar == "deseada":
-            temperatura = self._ambiente.temperatura_deseada
-            self._visualizador_temperatura.mostrar_temperatura_deseada(temperatura)
+        estado = self._ambiente.instantanea()
+        if estado.temperatura_a_mostrar == "ambiente":
+            self._visualizador_temperatura.mostrar_temperatura_ambiente(
+                estado.temperatura_ambiente)
+        elif estado.temperatura_a_mostrar == "deseada":
+            self._visualizador_temperatura.mostrar_temperatura_deseada(
+                estado.temperatura_deseada)
 
     def indicar_temperatura_a_mostrar(self, tipo_temperatura):
         """
@@ -141,3 +239,4 @@ class GestorAmbiente:
                                    Valores validos: "ambiente", "deseada".
         """
         self.ambiente.temperatura_a_mostrar = tipo_temperatura
+        self._cambios.emitir(CambioTemperaturaAMostrar(tipo_temperatura))
@@ -13,7 +13,12 @@ Responsabilidades:
     - Leer nivel de carga desde proxy de bateria
     - Gestionar el estado de la entidad Bateria
     - Coordinar visualizacion del nivel e indicador de bateria
+    - Registrar marca de tiempo y secuencia de cada lectura de carga
+    - Publicar CambioBateria cuando cambian nivel o indicador
 """
+from entidades.lectura import SeguimientoLectura
+from eventos.bus import EmisorCambios
+from eventos.tipos import CambioBateria
 
 # Las dependencias se inyectan en el constructor (Dependency Injection)
 
@@ -30,9 +35,13 @@ class GestorBateria:
         _bateria (Bateria): Entidad de dominio con estado de la bateria.
         _proxy_bateria: Proxy para lectura de carga de bateria.
         _visualizador_bateria: Componente de visualizacion de bateria.
+        _lecturas_carga (SeguimientoLectura): Ultima lectura valida de carga
+            con su marca de tiempo y secuencia.
+        _cambios (EmisorCambios): Publica los cambios de estado en el bus.
     """
 
-    def __init__(self, bateria, proxy_bateria, visualizador_bateria):
+    def __init__(self, bateria, proxy_bateria, visualizador_bateria, antiguedad_maxima=None,
+                 reloj=None, bus=None):
         """
         Inicializa el gestor de bateria.
 
@@ -40,10 +49,18 @@ class GestorBateria:
             bateria (Bateria): Entidad de dominio que representa la bateria.
             proxy_bateria (AbsProxyBateria): Proxy para leer carga de bateria.
             visualizador_bateria (AbsVisualizadorBateria): Visualizador de bateria.
+            antiguedad_maxima (float): Segundos tras los cuales la ultima
+                                      lectura deja de estar vigente.
+                                      None (por defecto) = sin limite.
+            reloj: Objeto con monotonic() para las marcas de las lecturas
+                   (por defecto el modulo time).
+            bus (BusEventos): Bus donde publicar los cambios (None = no publica).
         """
         self._bateria = bateria
         self._proxy_bateria = proxy_bateria
         self._visualizador_bateria = visualizador_bateria
+        self._lecturas_carga = SeguimientoLectura(antiguedad_maxima, reloj)
+        self._cambios = EmisorCambios(bus)
 
     def verificar_nivel_de_carga(self):
         """
@@ -51,8 +68,53 @@ class GestorBateria:
 
         Obtiene la carga desde el proxy de bateria y la almacena
         en la entidad, lo que automaticamente actualiza el indicador.
+        Cada lectura valida se registra con marca de tiempo y secuencia.
+        Si cambio el nivel o el indicador se publica CambioBateria.
         """
-        self._bateria.nivel_de_carga = self._proxy_bateria.leer_carga()
+        carga = self._proxy_bateria.leer_carga()
+        self._bateria.nivel_de_carga = carga
+        if carga is not None:
+            self._lecturas_carga.registrar(carga)
+        self._cambios.emitir(CambioBateria(self._bateria.nivel_de_carga, self._bateria.indicador))
+
+    def obtener_lectura_carga(self):
+        """
+        Obtiene la ultima lectura valida de carga.
+
+        Returns:
+            Lectura: (valor, marca_tiempo, secuencia), o None si no hubo lecturas.
+        """
+        return self._lecturas_carga.ultima
+
+    def obtener_antiguedad_carga(self):
+        """
+        Obtiene la antiguedad de la ultima lectura valida de carga.
+
+        Returns:
+            float: Segundos desde la ultima lectura, o None si no hubo lecturas.
+        """
+        return self._lecturas_carga.antiguedad()
+
+    def carga_vigente(self):
+        """
+        Indica si la ultima lectura de carga sigue vigente.
+
+        Returns:
+            bool: True si hay lectura y no supera la antiguedad maxima.
+        """
+        return self._lecturas_carga.es_vigente()
+
+    def hay_carga_nueva(self, secuencia):
+        """
+        Indica si hubo lecturas de carga posteriores a secuencia.
+
+        Args:
+            secuencia (int): Ultima secuencia procesada por el consumidor.
+
+        Returns:
+            bool: True si hay una lectura mas nueva.
+        """
+        return self._lecturas_carga.hay_novedad(secuencia)
 
     def obtener_nivel_de_carga(self):
         """
@@ -14,7 +14,13 @@ Responsabilidades:
     - Accionar el climatizador fisico mediante el actuador
     - Gestionar transiciones de estado del climatizador
     - Coordinar visualizacion del estado del climatizador
+    - Publicar CambioClimatizador cuando cambia el estado
+    - Consultar la guarda de accionamiento antes de cada orden al actuador
 """
+from eventos.bus import EmisorCambios
+from eventos.tipos import CambioClimatizador
+from gestores_entidades.guarda_actuador import DUPLICADA
+
 
 class GestorClimatizador:
     """
@@ -28,9 +34,12 @@ class GestorClimatizador:
         _climatizador (AbsClimatizador): Entidad climatizador o calefactor.
         _actuador: Proxy para accionar el climatizador fisico.
         _visualizador: Componente de visualizacion de estado.
+        _cambios (EmisorCambios): Publica los cambios de estado en el bus.
+        _guarda (GuardaActuador): Filtra las ordenes al actuador (o None).
     """
 
-    def __init__(self, climatizador, actuador, visualizador):
+    # pylint: disable=too-many-arguments
+    def __init__(self, climatizador, actuador, visualizador, bus=None, guarda=None):
         """
         Inicializa el gestor de climatizador.
 
@@ -39,10 +48,15 @@ class GestorClimatizador:
             actuador (AbsProxyActuadorClimatizador): Actuador para accionar
                                                      el climatizador fisico.
             visualizador (AbsVisualizadorClimatizador): Visualizador de estado.
+            bus (BusEventos): Bus donde publicar los cambios (None = no publica).
+            guarda (GuardaActuador): Guarda de accionamiento (None = toda
+                                     accion se envia al actuador).
         """
         self._climatizador = climatizador
         self._actuador = actuador
         self._visualizador = visualizador
+        self._cambios = EmisorCambios(bus)
+        self._guarda = guarda
 
     def accionar_climatizador(self, ambiente):
         """
@@ -52,13 +66,33 @@ class GestorClimatizador:
         se requiere alguna accion (calentar, enfriar, apagar), y si es
         necesario, acciona el dispositivo fisico y actualiza el estado.
 
+        La evaluacion se hace sobre una instantanea del ambiente, de modo
+        que ambas temperaturas provienen del mismo estado aunque otro hilo
+        las modifique en paralelo.
+
+        Con guarda, una orden duplicada cambia el estado sin accionar el
+        dispositivo (ya esta en ese estado) y una orden retenida por
+        tiempos minimos o tasa no cambia el estado: se reevalua en el
+        proximo ciclo.
+
         Args:
             ambiente (Ambiente): Entidad con temperaturas ambiente y deseada.
+
+        Returns:
+            bool: False si la guarda retuvo la orden (hay que reevaluar
+                aunque el ambiente no cambie), True en otro caso.
         """
-        accion = self._climatizador.evaluar_accion(ambiente)
-        if accion is not None:
+        accion = self._climatizador.evaluar_accion(ambiente.instantanea())
+        if accion is None:
+            return True
+        motivo = self._guarda.autorizar(accion) if self._guarda is not None else None
+        if motivo is None:
             self._actuador.accionar_climatizador(accion)
-            self._climatizador.proximo_estado(accion)
+        elif motivo != DUPLICADA:
+            return False
+        self._climatizador.proximo_estado(accion)
+        self._cambios.emitir(CambioClimatizador(self._climatizador.estado))
+        return True
 
     def obtener_estado_climatizador(self):
         """
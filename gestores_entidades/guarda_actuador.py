@@ -0,0 +1,129 @@
+"""
+Guarda de accionamiento - Protege al actuador de ordenes repetidas o en rafaga.
+
+Con lecturas ruidosas alrededor de los bordes de la histeresis el
+climatizador puede alternar acciones en ciclos consecutivos. La guarda
+decide, antes de cada accionamiento, si la orden se envia:
+    - Duplicada: la orden es igual a la ultima enviada; el dispositivo
+      ya esta en ese estado y no se repite la E/S
+    - Minimo encendido: no se apaga ni se cambia de modo un equipo que
+      lleva encendido menos de minimo_encendido segundos
+    - Minimo apagado: no se enciende un equipo que lleva apagado menos
+      de minimo_apagado segundos
+    - Tasa: balde de fichas por actuador (capacidad ordenes de rafaga,
+      repuestas a razon de tasa fichas por segundo)
+
+Las ordenes retenidas no se pierden: el climatizador no cambia de estado
+y la misma accion se vuelve a evaluar en el proximo ciclo.
+
+Patron de Diseno:
+    - Guard: Condiciones que habilitan el accionamiento
+    - Token Bucket: Limita la tasa de ordenes al actuador
+"""
+import logging
+import time
+
+_bitacora = logging.getLogger(__name__)
+
+# Motivos de supresion
+DUPLICADA = "duplicada"
+MINIMO_ENCENDIDO = "minimo_encendido"
+MINIMO_APAGADO = "minimo_apagado"
+TASA = "tasa"
+
+MOTIVOS = (DUPLICADA, MINIMO_ENCENDIDO, MINIMO_APAGADO, TASA)
+
+APAGAR = "apagar"
+
+
+class GuardaActuador:
+    """
+    Decide si una orden del climatizador llega al actuador.
+
+    Los tiempos minimos se cuentan desde la ultima orden enviada. La
+    primera orden siempre se envia.
+
+    Args:
+        minimo_encendido (float): Segundos minimos encendido antes de apagar
+            o cambiar de modo (0 = sin minimo).
+        minimo_apagado (float): Segundos minimos apagado antes de encender
+            (0 = sin minimo).
+        capacidad (int): Ordenes que se pueden enviar en rafaga.
+        tasa (float): Fichas repuestas por segundo (None = sin limite de tasa).
+        reloj: Objeto con monotonic() (por defecto el modulo time).
+
+    Attributes:
+        enviadas (int): Ordenes autorizadas.
+        suprimidas (dict): Ordenes suprimidas por motivo.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, minimo_encendido=0, minimo_apagado=0, capacidad=1, tasa=None,
+                 reloj=None):
+        self._reloj = reloj if reloj is not None else time
+        self._minimo_encendido = minimo_encendido
+        self._minimo_apagado = minimo_apagado
+        self._capacidad = capacidad
+        self._tasa = tasa
+        self._fichas = capacidad
+        self._reposicion = self._reloj.monotonic()
+        self._ultima = None
+        self._desde = None
+        self.enviadas = 0
+        self.suprimidas = dict.fromkeys(MOTIVOS, 0)
+        self._manejadores = []
+
+    def suscribir(self, manejador):
+        """
+        Registra una funcion que se llama con el motivo de cada supresion.
+
+        Args:
+            manejador: Callable que recibe el motivo (str).
+        """
+        self._manejadores.append(manejador)
+
+    def autorizar(self, accion):
+        """
+        Evalua la orden y, si se envia, la registra como ultima orden.
+
+        Args:
+            accion (str): Accion a enviar ("calentar", "enfriar", "apagar").
+
+        Returns:
+            str: None si la orden debe enviarse; si no, el motivo de la
+                supresion (DUPLICADA, MINIMO_ENCENDIDO, MINIMO_APAGADO o TASA).
+        """
+        ahora = self._reloj.monotonic()
+        motivo = self._motivo(accion, ahora)
+        if motivo is not None:
+            self.suprimidas[motivo] += 1
+            _bitacora.debug("Orden '%s' suprimida: %s", accion, motivo)
+            for manejador in self._manejadores:
+                manejador(motivo)
+            return motivo
+        # Encender, apagar o cambiar de modo reinicia los tiempos minimos
+        self._fichas -= 1
+        self._desde = ahora
+        self._ultima = accion
+        self.enviadas += 1
+        return None
+
+    def _motivo(self, accion, ahora):
+        """Motivo por el que la orden no se envia, o None."""
+        if accion == self._ultima:
+            return DUPLICADA
+        if self._ultima is not None:
+            transcurrido = ahora - self._desde
+            if self._ultima != APAGAR and transcurrido < self._minimo_encendido:
+                return MINIMO_ENCENDIDO
+            if self._ultima == APAGAR and transcurrido < self._minimo_apagado:
+                return MINIMO_APAGADO
+        if self._tasa is not None:
+            self._fichas = min(self._capacidad,
+                               self._fichas + (ahora - self._reposicion) * self._tasa)
+            self._reposicion = ahora
+            if self._fichas < 1:
+                return TASA
+        else:
+            self._fichas = self._capacidad
+        return None
@@ -0,0 +1,11 @@
+"""
+Paquete de la capa de abstraccion de hardware (HAL) del termostato.
+
+Contiene el acceso al conversor analogico-digital (ADC) de 10 bits
+del que leen los sensores de temperatura y bateria:
+    - abs_hal_adc: Interfaz del ADC con lectura por bloques y decimacion
+    - hal_adc_simulado: ADC simulado con ruido gaussiano
+    - hal_adc_mock: ADC con valores predefinidos para tests
+    - conversion: Conversion vectorizada de cuentas a grados y voltios
+    - calibracion: Tablas de calibracion de 1024 entradas por canal
+"""
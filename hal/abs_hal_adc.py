@@ -0,0 +1,185 @@
+"""
+Interfaz abstracta del conversor analogico-digital (ADC).
+
+Este modulo define el contrato del HAL ADC: lectura de una muestra por
+canal, lectura de bloques de muestras en un buffer preasignado y
+sobremuestreo con decimacion para reducir ruido. Leer una muestra por
+llamada en Python es lento para las frecuencias de muestreo que requiere
+el promediado, por eso las implementaciones redefinen _llenar_bloque()
+para adquirir el bloque completo de una vez.
+
+Patron de Diseno:
+    - Template Method: leer_adc/leer_bloque validan y delegan en las
+      operaciones primitivas de cada implementacion
+
+Dependencias:
+    leer_decimado() y leer_sobremuestreado() requieren NumPy (extra
+    "filtros"). leer_adc() y leer_bloque() sobre array('H') no.
+"""
+from abc import ABCMeta, abstractmethod
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+
+class AbsHAL_ADC(metaclass=ABCMeta):  # pylint: disable=invalid-name
+    """
+    Interfaz abstracta para un ADC de 10 bits y 8 canales.
+
+    Attributes:
+        BITS (int): Resolucion del conversor.
+        VALOR_MAXIMO (int): Cuenta maxima (2^BITS - 1).
+        CANALES (int): Cantidad de canales de entrada.
+    """
+
+    BITS = 10
+    VALOR_MAXIMO = 1023
+    CANALES = 8
+
+    @property
+    def inicializado(self):
+        """bool: True entre inicializar() y finalizar()."""
+        return self._inicializado
+
+    def __init__(self):
+        """Inicializa el HAL sin abrir el dispositivo."""
+        self._inicializado = False
+        self._muestras = None
+
+    @abstractmethod
+    def inicializar(self):
+        """Abre el dispositivo y deja el ADC listo para leer."""
+
+    @abstractmethod
+    def finalizar(self):
+        """Libera el dispositivo."""
+
+    @abstractmethod
+    def _leer_muestra(self, canal):
+        """
+        Lee una muestra cruda del canal (operacion primitiva).
+
+        Args:
+            canal (int): Canal ya validado.
+
+        Returns:
+            int: Cuenta entre 0 y VALOR_MAXIMO.
+        """
+
+    def leer_adc(self, canal):
+        """
+        Lee una muestra del canal.
+
+        Args:
+            canal (int): Canal del ADC (0 a CANALES - 1).
+
+        Returns:
+            int: Cuenta entre 0 y VALOR_MAXIMO.
+
+        Raises:
+            IOError: Si el ADC no fue inicializado.
+            ValueError: Si el canal esta fuera de rango.
+        """
+        self._verificar_lectura(canal)
+        return self._leer_muestra(canal)
+
+    def leer_bloque(self, canal, cantidad, destino=None):
+        """
+        Lee un bloque de muestras consecutivas del canal.
+
+        Args:
+            canal (int): Canal del ADC.
+            cantidad (int): Cantidad de muestras a leer.
+            destino: Buffer preasignado (numpy.ndarray o array('H')) de
+                al menos cantidad elementos. Si es None se crea uno.
+
+        Returns:
+            Buffer con las muestras en sus primeras cantidad posiciones.
+
+        Raises:
+            IOError: Si el ADC no fue inicializado.
+            ValueError: Si el canal esta fuera de rango o el buffer es chico.
+        """
+        self._verificar_lectura(canal)
+        if destino is None:
+            destino = self._crear_buffer(cantidad)
+        if len(destino) < cantidad:
+            mensaje = "Buffer de {} elementos insuficiente para {} muestras"
+            raise ValueError(mensaje.format(len(destino), cantidad))
+        self._llenar_bloque(canal, destino, cantidad)
+        return destino
+
+    def leer_decimado(self, canal, cantidad, factor, destino=None):
+        """
+        Lee cantidad valores sobremuestreados, cada uno promedio de factor muestras.
+
+        Adquiere cantidad * factor muestras en un buffer interno que se
+        reutiliza entre llamadas y las decima promediando de a factor.
+        Promediar 4^k muestras agrega k bits efectivos de resolucion.
+
+        Args:
+            canal (int): Canal del ADC.
+            cantidad (int): Cantidad de valores decimados a producir.
+            factor (int): Muestras promediadas por valor (>= 1).
+            destino (numpy.ndarray): Buffer float preasignado opcional.
+
+        Returns:
+            numpy.ndarray: Valores decimados en cuentas (con fraccion).
+
+        Raises:
+            ImportError: Si NumPy no esta instalado.
+            ValueError: Si factor < 1.
+        """
+        if np is None:
+            raise ImportError("La decimacion del HAL ADC requiere NumPy: pip install numpy")
+        if factor < 1:
+            raise ValueError("factor debe ser >= 1, recibido: {}".format(factor))
+        total = cantidad * factor
+        if self._muestras is None or self._muestras.shape[0] < total:
+            self._muestras = np.empty(total, dtype=np.uint16)
+        muestras = self.leer_bloque(canal, total, self._muestras)[:total]
+        if destino is None:
+            destino = np.empty(cantidad, dtype=np.float64)
+        np.mean(muestras.reshape(cantidad, factor), axis=1, out=destino[:cantidad])
+        return destino
+
+    def leer_sobremuestreado(self, canal, factor):
+        """
+        Lee un unico valor promediando factor muestras.
+
+        Args:
+            canal (int): Canal del ADC.
+            factor (int): Muestras promediadas (>= 1).
+
+        Returns:
+            float: Valor promedio en cuentas.
+        """
+        return float(self.leer_decimado(canal, 1, factor)[0])
+
+    def _llenar_bloque(self, canal, destino, cantidad):
+        """
+        Escribe cantidad muestras en destino (operacion primitiva).
+
+        La implementacion por defecto lee de a una muestra; las subclases
+        la redefinen para adquirir el bloque completo de una vez.
+        """
+        for indice in range(cantidad):
+            destino[indice] = self._leer_muestra(canal)
+
+    def _verificar_lectura(self, canal):
+        """Valida que el ADC este inicializado y el canal exista."""
+        if not self._inicializado:
+            raise IOError("HAL ADC no inicializado: llamar a inicializar() antes de leer")
+        if not 0 <= canal < self.CANALES:
+            mensaje = "Canal {} fuera de rango (0-{})"
+            raise ValueError(mensaje.format(canal, self.CANALES - 1))
+
+    @staticmethod
+    def _crear_buffer(cantidad):
+        """Crea un buffer de muestras de 16 bits (NumPy si esta disponible)."""
+        if np is not None:
+            return np.empty(cantidad, dtype=np.uint16)
+        return array("H", bytes(2 * cantidad))
@@ -0,0 +1,191 @@
+"""
+Tablas de calibracion de cuentas del ADC a magnitudes fisicas.
+
+Un ADC de 10 bits solo puede producir 1024 cuentas distintas, por lo que
+la conversion de cada canal se precalcula una vez en una tabla de 1024
+entradas. Convertir un bloque de muestras es entonces una indexacion
+vectorizada (o una interpolacion lineal entre entradas vecinas para los
+valores decimados, que tienen fraccion), sin evaluar formulas por
+muestra. La tabla admite sensores no lineales, como un termistor NTC, sin
+costo adicional en tiempo de ejecucion.
+
+Modelos para construir tablas:
+    - lineal: funcion de conversion arbitraria (TMP36, divisor de bateria)
+    - termistor: NTC con ecuacion beta en un divisor resistivo
+    - puntos: interpolacion lineal entre puntos de calibracion medidos
+
+Dependencias:
+    Requiere NumPy (extra "filtros").
+"""
+from hal.conversion import (
+    DIVISOR_BATERIA,
+    TENSION_REFERENCIA,
+    VALOR_MAXIMO_ADC,
+    cuentas_a_celsius,
+    cuentas_a_voltios_bateria
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+CERO_ABSOLUTO = 273.15
+
+
+class TablaCalibracion:
+    """
+    Tabla de conversion de las 1024 cuentas del ADC a un valor fisico.
+
+    Args:
+        valores: Secuencia de 1024 valores, uno por cuenta.
+    """
+
+    ENTRADAS = VALOR_MAXIMO_ADC + 1
+
+    @property
+    def valores(self):
+        """numpy.ndarray: Valor fisico de cada cuenta (solo lectura)."""
+        return self._tabla
+
+    def __init__(self, valores):
+        """
+        Inicializa la tabla y precalcula las pendientes entre entradas.
+
+        Args:
+            valores: Secuencia de 1024 valores, uno por cuenta.
+
+        Raises:
+            ImportError: Si NumPy no esta instalado.
+            ValueError: Si la cantidad de valores no es 1024.
+        """
+        if np is None:
+            raise ImportError("Las tablas de calibracion requieren NumPy: pip install numpy")
+        tabla = np.array(valores, dtype=np.float64)
+        if tabla.shape != (self.ENTRADAS,):
+            mensaje = "La tabla debe tener {} entradas, recibido: {}"
+            raise ValueError(mensaje.format(self.ENTRADAS, tabla.shape))
+        tabla.setflags(write=False)
+        self._tabla = tabla
+        self._pendientes = np.diff(tabla)
+
+    def convertir(self, cuentas):
+        """
+        Convierte cuentas a valores fisicos.
+
+        Las cuentas enteras se resuelven por indexacion directa; las
+        cuentas con fraccion (promedios decimados) se interpolan entre
+        las dos entradas vecinas.
+
+        Args:
+            cuentas: Cuenta o arreglo de cuentas (enteras o decimales).
+
+        Returns:
+            numpy.ndarray: Valores convertidos (0-d para un escalar).
+        """
+        cuentas = np.asarray(cuentas)
+        if cuentas.dtype.kind in "iu":
+            return self._tabla[np.clip(cuentas, 0, VALOR_MAXIMO_ADC)]
+        posicion = np.clip(cuentas, 0, VALOR_MAXIMO_ADC)
+        indice = np.minimum(posicion.astype(np.intp), VALOR_MAXIMO_ADC - 1)
+        return self._tabla[indice] + (posicion - indice) * self._pendientes[indice]
+
+    def cuentas_para(self, valor):
+        """
+        Retorna la cuenta (con fraccion) que corresponde a un valor fisico.
+
+        Es la conversion inversa, valida para tablas monotonas; la usa el
+        ADC simulado para generar cuentas coherentes con la calibracion.
+
+        Args:
+            valor (float): Valor fisico.
+
+        Returns:
+            float: Cuenta equivalente entre 0 y 1023.
+        """
+        indices = np.arange(self.ENTRADAS, dtype=np.float64)
+        if self._tabla[0] > self._tabla[-1]:
+            return float(np.interp(valor, self._tabla[::-1], indices[::-1]))
+        return float(np.interp(valor, self._tabla, indices))
+
+    @classmethod
+    def desde_funcion(cls, conversion):
+        """
+        Construye la tabla evaluando una funcion vectorizada en cada cuenta.
+
+        Args:
+            conversion: Funcion que recibe un arreglo de cuentas y retorna
+                el arreglo de valores fisicos.
+
+        Returns:
+            TablaCalibracion: Tabla construida.
+        """
+        if np is None:
+            raise ImportError("Las tablas de calibracion requieren NumPy: pip install numpy")
+        return cls(conversion(np.arange(cls.ENTRADAS, dtype=np.float64)))
+
+    @classmethod
+    def lineal_temperatura(cls, tension_referencia=TENSION_REFERENCIA):
+        """Tabla del sensor lineal de temperatura (tipo TMP36)."""
+        return cls.desde_funcion(lambda cuentas: cuentas_a_celsius(cuentas, tension_referencia))
+
+    @classmethod
+    def lineal_bateria(cls, divisor=DIVISOR_BATERIA, tension_referencia=TENSION_REFERENCIA):
+        """Tabla de la bateria medida a traves de un divisor resistivo."""
+        return cls.desde_funcion(
+            lambda cuentas: cuentas_a_voltios_bateria(cuentas, divisor, tension_referencia))
+
+    @classmethod
+    def termistor(cls, beta=3950.0, r0=10000.0, t0=25.0, r_serie=10000.0):
+        """
+        Tabla de un termistor NTC con la ecuacion beta.
+
+        El termistor va entre la entrada del ADC y masa, con r_serie hacia
+        la tension de referencia: R = r_serie * c / (1023 - c). Las cuentas
+        extremas (0 y 1023) se evaluan a media cuenta del borde para evitar
+        resistencias nulas o infinitas.
+
+        Args:
+            beta (float): Coeficiente beta del termistor en Kelvin.
+            r0 (float): Resistencia del termistor a t0, en ohm.
+            t0 (float): Temperatura de referencia en grados Celsius.
+            r_serie (float): Resistencia serie del divisor, en ohm.
+
+        Returns:
+            TablaCalibracion: Tabla en grados Celsius.
+
+        Raises:
+            ValueError: Si beta, r0 o r_serie no son positivos.
+        """
+        if beta <= 0 or r0 <= 0 or r_serie <= 0:
+            raise ValueError("beta, r0 y r_serie deben ser > 0")
+
+        def conversion(cuentas):
+            cuentas = np.clip(cuentas, 0.5, VALOR_MAXIMO_ADC - 0.5)
+            resistencia = r_serie * cuentas / (VALOR_MAXIMO_ADC - cuentas)
+            inversa = 1.0 / (t0 + CERO_ABSOLUTO) + np.log(resistencia / r0) / beta
+            return 1.0 / inversa - CERO_ABSOLUTO
+
+        return cls.desde_funcion(conversion)
+
+    @classmethod
+    def desde_puntos(cls, puntos):
+        """
+        Tabla por interpolacion lineal entre puntos de calibracion.
+
+        Fuera del rango de los puntos la tabla se mantiene en el valor
+        del punto extremo.
+
+        Args:
+            puntos (list): Pares [cuenta, valor] medidos (al menos dos).
+
+        Returns:
+            TablaCalibracion: Tabla construida.
+
+        Raises:
+            ValueError: Si hay menos de dos puntos.
+        """
+        if len(puntos) < 2:
+            raise ValueError("Se requieren al menos dos puntos de calibracion")
+        cuentas, valores = zip(*sorted(puntos))
+        return cls.desde_funcion(lambda indices: np.interp(indices, cuentas, valores))
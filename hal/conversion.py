@@ -0,0 +1,78 @@
+"""
+Conversion de cuentas del ADC a magnitudes fisicas.
+
+Las funciones usan solo aritmetica, por lo que aceptan tanto un valor
+escalar como un numpy.ndarray y convierten bloques completos de una vez.
+
+Modelos:
+    - Temperatura: sensor lineal tipo TMP36 (500 mV a 0 C, 10 mV/C)
+    - Bateria: divisor resistivo que reduce la tension a la mitad
+"""
+
+VALOR_MAXIMO_ADC = 1023
+TENSION_REFERENCIA = 3.3
+TENSION_CERO_GRADOS = 0.5
+VOLTIOS_POR_GRADO = 0.01
+DIVISOR_BATERIA = 2.0
+
+
+def cuentas_a_voltios(cuentas, tension_referencia=TENSION_REFERENCIA):
+    """
+    Convierte cuentas del ADC a la tension medida en la entrada.
+
+    Args:
+        cuentas: Cuenta o arreglo de cuentas (0 a 1023).
+        tension_referencia (float): Tension de referencia del ADC en voltios.
+
+    Returns:
+        Tension en voltios (mismo tipo que la entrada).
+    """
+    return cuentas * (tension_referencia / VALOR_MAXIMO_ADC)
+
+
+def voltios_a_cuentas(voltios, tension_referencia=TENSION_REFERENCIA):
+    """Convierte una tension de entrada a cuentas del ADC (sin redondear)."""
+    return voltios * (VALOR_MAXIMO_ADC / tension_referencia)
+
+
+def cuentas_a_celsius(cuentas, tension_referencia=TENSION_REFERENCIA):
+    """
+    Convierte cuentas del canal de temperatura a grados Celsius.
+
+    Args:
+        cuentas: Cuenta o arreglo de cuentas.
+        tension_referencia (float): Tension de referencia del ADC en voltios.
+
+    Returns:
+        Temperatura en grados Celsius.
+    """
+    voltios = cuentas_a_voltios(cuentas, tension_referencia)
+    return (voltios - TENSION_CERO_GRADOS) / VOLTIOS_POR_GRADO
+
+
+def celsius_a_cuentas(temperatura, tension_referencia=TENSION_REFERENCIA):
+    """Convierte grados Celsius a cuentas del canal de temperatura."""
+    voltios = TENSION_CERO_GRADOS + temperatura * VOLTIOS_POR_GRADO
+    return voltios_a_cuentas(voltios, tension_referencia)
+
+
+def cuentas_a_voltios_bateria(cuentas, divisor=DIVISOR_BATERIA,
+                              tension_referencia=TENSION_REFERENCIA):
+    """
+    Convierte cuentas del canal de bateria a la tension de la bateria.
+
+    Args:
+        cuentas: Cuenta o arreglo de cuentas.
+        divisor (float): Relacion del divisor resistivo de entrada.
+        tension_referencia (float): Tension de referencia del ADC en voltios.
+
+    Returns:
+        Tension de la bateria en voltios.
+    """
+    return cuentas_a_voltios(cuentas, tension_referencia) * divisor
+
+
+def voltios_bateria_a_cuentas(voltios, divisor=DIVISOR_BATERIA,
+                              tension_referencia=TENSION_REFERENCIA):
+    """Convierte la tension de la bateria a cuentas del canal de bateria."""
+    return voltios_a_cuentas(voltios / divisor, tension_referencia)
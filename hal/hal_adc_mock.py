@@ -0,0 +1,73 @@
+"""
+ADC mock con valores predefinidos para tests.
+
+Retorna en forma circular una secuencia fija de cuentas y registra la
+cantidad de lecturas realizadas para verificar interacciones.
+"""
+from hal.abs_hal_adc import AbsHAL_ADC
+
+
+class HAL_ADC_Mock(AbsHAL_ADC):  # pylint: disable=invalid-name
+    """
+    ADC que retorna cuentas predefinidas en forma circular.
+
+    La misma secuencia se usa para todos los canales.
+
+    Args:
+        valores_adc (list): Cuentas a retornar. Por defecto [512].
+    """
+
+    def __init__(self, valores_adc=None):
+        """
+        Inicializa el mock.
+
+        Args:
+            valores_adc (list): Cuentas a retornar en orden circular.
+        """
+        super().__init__()
+        self._valores_adc = list(valores_adc) if valores_adc else [512]
+        self._indice = 0
+        self._llamadas_leer = 0
+        self._llamadas_bloque = 0
+
+    def inicializar(self):
+        """Marca el mock como inicializado."""
+        self._inicializado = True
+
+    def finalizar(self):
+        """Marca el mock como finalizado."""
+        self._inicializado = False
+
+    def leer_adc(self, canal):
+        """Lee el proximo valor predefinido y cuenta la llamada."""
+        self._llamadas_leer += 1
+        return super().leer_adc(canal)
+
+    def leer_bloque(self, canal, cantidad, destino=None):
+        """Lee cantidad valores predefinidos y cuenta la llamada."""
+        self._llamadas_bloque += 1
+        return super().leer_bloque(canal, cantidad, destino)
+
+    def obtener_llamadas_leer(self):
+        """
+        Retorna la cantidad de llamadas a leer_adc().
+
+        Returns:
+            int: Llamadas realizadas.
+        """
+        return self._llamadas_leer
+
+    def obtener_llamadas_bloque(self):
+        """
+        Retorna la cantidad de llamadas a leer_bloque().
+
+        Returns:
+            int: Llamadas realizadas.
+        """
+        return self._llamadas_bloque
+
+    def _leer_muestra(self, canal):
+        """Retorna el siguiente valor de la secuencia circular."""
+        valor = self._valores_adc[self._indice]
+        self._indice = (self._indice + 1) % len(self._valores_adc)
+        return valor
@@ -0,0 +1,124 @@
+"""
+ADC simulado con ruido gaussiano.
+
+Genera cuentas a partir de una temperatura y una tension de bateria
+configurables, sumando ruido gaussiano como el de un sensor real.
+
+Canales (por defecto; se reasignan con el argumento canales):
+    - CANAL_TEMPERATURA (0): sensor lineal tipo TMP36
+    - CANAL_BATERIA (1): bateria a traves de un divisor resistivo
+    - Resto de canales: entrada a masa (solo ruido)
+
+Si se indican tablas de calibracion por canal, las cuentas se generan
+con la conversion inversa de la tabla (por ejemplo, un termistor NTC).
+"""
+import random
+
+from hal.abs_hal_adc import AbsHAL_ADC, np
+from hal.conversion import celsius_a_cuentas, voltios_bateria_a_cuentas
+
+
+class HAL_ADC_Simulado(AbsHAL_ADC):  # pylint: disable=invalid-name
+    """
+    ADC simulado para ejecutar el termostato sin hardware.
+
+    Las lecturas de bloque se generan de una vez con el generador
+    aleatorio de NumPy; sin NumPy se generan muestra a muestra.
+
+    Args:
+        temperatura_base (float): Temperatura simulada en grados Celsius.
+        ruido_std (float): Desvio estandar del ruido de temperatura en grados.
+        voltaje_bateria (float): Tension simulada de la bateria en voltios.
+        ruido_bateria_std (float): Desvio estandar del ruido de bateria en voltios.
+        semilla (int): Semilla para reproducir las lecturas. None = aleatoria.
+        calibracion (dict): TablaCalibracion por canal (opcional).
+        canales (dict): Canal de cada sensor ("temperatura", "bateria").
+    """
+
+    CANAL_TEMPERATURA = 0
+    CANAL_BATERIA = 1
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, temperatura_base=22.0, ruido_std=0.5, voltaje_bateria=4.5,
+                 ruido_bateria_std=0.02, semilla=None, calibracion=None, canales=None):
+        """
+        Inicializa el ADC simulado.
+
+        Args:
+            temperatura_base (float): Temperatura simulada en grados Celsius.
+            ruido_std (float): Desvio del ruido de temperatura en grados.
+            voltaje_bateria (float): Tension simulada de la bateria en voltios.
+            ruido_bateria_std (float): Desvio del ruido de bateria en voltios.
+            semilla (int): Semilla de los generadores aleatorios.
+            calibracion (dict): TablaCalibracion por canal; los canales sin
+                tabla usan los modelos lineales.
+            canales (dict): Canal de cada sensor, por ejemplo
+                {"temperatura": 2, "bateria": 3} (por defecto CANAL_TEMPERATURA
+                y CANAL_BATERIA).
+        """
+        super().__init__()
+        self.temperatura_base = temperatura_base
+        self.ruido_std = ruido_std
+        self.voltaje_bateria = voltaje_bateria
+        self.ruido_bateria_std = ruido_bateria_std
+        self._aleatorio = random.Random(semilla)
+        self._generador = np.random.default_rng(semilla) if np is not None else None
+        self._calibracion = dict(calibracion or {})
+        canales = dict({"temperatura": self.CANAL_TEMPERATURA,
+                        "bateria": self.CANAL_BATERIA}, **(canales or {}))
+        self._sensores = {canal: sensor for sensor, canal in canales.items()}
+
+    def inicializar(self):
+        """Marca el ADC simulado como listo para leer."""
+        self._inicializado = True
+
+    def finalizar(self):
+        """Marca el ADC simulado como cerrado."""
+        self._inicializado = False
+
+    def _leer_muestra(self, canal):
+        """Genera una muestra con ruido para el canal."""
+        media, desvio = self._parametros_canal(canal)
+        cuenta = round(self._aleatorio.gauss(media, desvio))
+        return min(max(cuenta, 0), self.VALOR_MAXIMO)
+
+    def _llenar_bloque(self, canal, destino, cantidad):
+        """Genera el bloque completo de una vez con NumPy."""
+        if self._generador is None:
+            super()._llenar_bloque(canal, destino, cantidad)
+            return
+        media, desvio = self._parametros_canal(canal)
+        muestras = self._generador.normal(media, desvio, cantidad)
+        np.clip(np.rint(muestras), 0, self.VALOR_MAXIMO, out=muestras)
+        destino[:cantidad] = muestras.astype(np.uint16)
+
+    def _parametros_canal(self, canal):
+        """
+        Retorna (media, desvio) en cuentas de la senal del canal.
+
+        Returns:
+            tuple: Cuenta media y desvio estandar en cuentas.
+        """
+        sensor = self._sensores.get(canal)
+        if sensor is not None and canal in self._calibracion:
+            return self._parametros_calibrados(canal, sensor)
+        if sensor == "temperatura":
+            media = celsius_a_cuentas(self.temperatura_base)
+            desvio = celsius_a_cuentas(self.ruido_std) - celsius_a_cuentas(0)
+        elif sensor == "bateria":
+            media = voltios_bateria_a_cuentas(self.voltaje_bateria)
+            desvio = voltios_bateria_a_cuentas(self.ruido_bateria_std)
+        else:
+            media, desvio = 0.0, 1.0
+        return media, desvio
+
+    def _parametros_calibrados(self, canal, sensor):
+        """Retorna (media, desvio) en cuentas usando la tabla del canal del sensor."""
+        tabla = self._calibracion[canal]
+        if sensor == "temperatura":
+            valor, ruido = self.temperatura_base, self.ruido_std
+        else:
+            valor, ruido = self.voltaje_bateria, self.ruido_bateria_std
+        media = tabla.cuentas_para(valor)
+        desvio = abs(tabla.cuentas_para(valor + ruido) - media)
+        return media, max(desvio, 1e-9)
@@ -0,0 +1,12 @@
+"""
+Paquete de metricas de ejecucion del termostato.
+
+Permite observar el sistema en ejecucion sin depender de los print():
+    - registro: Contadores, indicadores e histogramas con etiquetas y
+      exposicion en formato de texto de Prometheus
+    - instrumentos: Decoradores de proxies, visualizadores y actuador
+      que miden duraciones, errores y profundidad de colas
+    - perfilador: Tiempo de pared, CPU, bloqueo y vencimientos por tarea
+      del operador y capturas cProfile bajo demanda
+    - servidor: Endpoint HTTP local GET /metrics
+"""
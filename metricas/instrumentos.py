@@ -0,0 +1,357 @@
+"""
+Decoradores que miden a los agentes del termostato.
+
+Cada instrumento envuelve a un proxy, visualizador o actuador real con
+su misma interfaz y registra en un RegistroMetricas la duracion de cada
+operacion, los errores y el ultimo valor, etiquetados por dispositivo,
+de modo que el Configurador puede medir todas las entradas y salidas
+sin que los gestores lo noten.
+
+Metricas:
+    termostato_lectura_segundos{dispositivo}         histograma
+    termostato_lecturas_total{dispositivo}           contador
+    termostato_lectura_errores_total{dispositivo}    contador
+    termostato_ultima_lectura{dispositivo}           indicador
+    termostato_visualizacion_segundos{visualizador}  histograma
+    termostato_visualizacion_errores_total{visualizador} contador
+    termostato_acciones_total{accion}                contador
+    termostato_acciones_suprimidas_total{motivo}     contador
+    termostato_comandos_total{fuente}                contador
+    termostato_cola_profundidad{cola}                indicador
+    termostato_eventos_total{evento}                 contador
+
+Patron de Diseno:
+    - Decorator: Agrega la medicion sin modificar los agentes
+"""
+import time
+
+from entidades.abs_actuador_climatizador import AbsProxyActuadorClimatizador
+from entidades.abs_bateria import AbsProxyBateria
+from entidades.abs_sensor_temperatura import AbsProxySensorTemperatura
+from entidades.abs_visualizador_bateria import AbsVisualizadorBateria
+from entidades.abs_visualizador_climatizador import AbsVisualizadorClimatizador
+from entidades.abs_visualizador_temperatura import AbsVisualizadorTemperatura
+from servicios_aplicacion.abs_seteo_temperatura import AbsSeteoTemperatura
+
+
+def registrar_cola(registro, cola, profundidad):
+    """
+    Publica la profundidad de una cola como indicador.
+
+    El valor se lee al exponer las metricas, sin costo en el camino
+    de los productores y consumidores.
+
+    Args:
+        registro (RegistroMetricas): Registro destino.
+        cola (str): Nombre de la cola (etiqueta "cola").
+        profundidad: Callable sin argumentos que retorna la profundidad.
+    """
+    registro.indicador("termostato_cola_profundidad",
+                       "Elementos pendientes en cada cola",
+                       ("cola",)).etiquetas(cola).fijar_funcion(profundidad)
+
+
+def registrar_eventos(registro, bus):
+    """
+    Cuenta los eventos de cambio publicados en un bus, por tipo.
+
+    Args:
+        registro (RegistroMetricas): Registro destino.
+        bus (BusEventos): Bus de eventos de los gestores.
+
+    Returns:
+        Suscripcion: Suscripcion inmediata del contador al bus.
+    """
+    eventos_total = registro.contador("termostato_eventos_total",
+                                      "Cambios de estado publicados por los gestores",
+                                      ("evento",))
+
+    def contar(eventos):
+        """Incrementa el contador del tipo de cada evento recibido."""
+        for evento in eventos:
+            eventos_total.etiquetas(type(evento).__name__).incrementar()
+
+    return bus.suscribir(contar)
+
+
+def registrar_guarda(registro, guarda):
+    """
+    Cuenta las ordenes suprimidas por la guarda del actuador, por motivo.
+
+    Cada motivo se expone desde cero aunque no haya supresiones.
+
+    Args:
+        registro (RegistroMetricas): Registro destino.
+        guarda (GuardaActuador): Guarda de accionamiento.
+    """
+    suprimidas = registro.contador("termostato_acciones_suprimidas_total",
+                                   "Ordenes al climatizador suprimidas por la guarda",
+                                   ("motivo",))
+    for motivo in guarda.suprimidas:
+        suprimidas.etiquetas(motivo)
+
+    def contar(motivo):
+        """Incrementa el contador del motivo de la orden suprimida."""
+        suprimidas.etiquetas(motivo).incrementar()
+
+    guarda.suscribir(contar)
+
+
+class _MedidorLectura:
+    """
+    Series de metricas de lectura de un dispositivo.
+
+    Args:
+        registro (RegistroMetricas): Registro destino.
+        dispositivo (str): Valor de la etiqueta "dispositivo".
+    """
+
+    def __init__(self, registro, dispositivo):
+        self.duracion = registro.histograma(
+            "termostato_lectura_segundos", "Duracion de cada lectura de un dispositivo",
+            ("dispositivo",)).etiquetas(dispositivo)
+        self.lecturas = registro.contador(
+            "termostato_lecturas_total", "Lecturas realizadas por dispositivo",
+            ("dispositivo",)).etiquetas(dispositivo)
+        self.errores = registro.contador(
+            "termostato_lectura_errores_total", "Lecturas fallidas por dispositivo",
+            ("dispositivo",)).etiquetas(dispositivo)
+        self.ultima = registro.indicador(
+            "termostato_ultima_lectura", "Ultimo valor leido por dispositivo",
+            ("dispositivo",)).etiquetas(dispositivo)
+
+    def medir(self, leer):
+        """
+        Ejecuta leer() registrando duracion, resultado y ultimo valor.
+
+        Args:
+            leer: Callable de lectura del proxy real.
+
+        Returns:
+            Valor leido (se propaga la excepcion si la lectura falla).
+        """
+        inicio = time.perf_counter()
+        try:
+            valor = leer()
+        except Exception:
+            self.errores.incrementar()
+            raise
+        finally:
+            self.duracion.observar(time.perf_counter() - inicio)
+            self.lecturas.incrementar()
+        if isinstance(valor, (int, float)):
+            self.ultima.fijar(valor)
+        elif valor:
+            self.ultima.fijar(valor[-1])
+        return valor
+
+
+class ProxySensorTemperaturaMedido(AbsProxySensorTemperatura):
+    """
+    Mide las lecturas de temperatura del proxy envuelto.
+
+    Args:
+        proxy (AbsProxySensorTemperatura): Proxy real.
+        registro (RegistroMetricas): Registro destino.
+        dispositivo (str): Etiqueta del dispositivo.
+    """
+
+    def __init__(self, proxy, registro, dispositivo="temperatura"):
+        self._proxy = proxy
+        self._medidor = _MedidorLectura(registro, dispositivo)
+
+    def leer_temperatura(self):
+        """Lee la temperatura del proxy envuelto y mide la lectura."""
+        return self._medidor.medir(self._proxy.leer_temperatura)
+
+    def leer_temperaturas(self):
+        """Lee el bloque de temperaturas del proxy envuelto y mide la lectura."""
+        return self._medidor.medir(self._proxy.leer_temperaturas)
+
+
+# pylint: disable=too-few-public-methods
+class ProxyBateriaMedido(AbsProxyBateria):
+    """
+    Mide las lecturas de carga del proxy envuelto.
+
+    Args:
+        proxy (AbsProxyBateria): Proxy real.
+        registro (RegistroMetricas): Registro destino.
+        dispositivo (str): Etiqueta del dispositivo.
+    """
+
+    def __init__(self, proxy, registro, dispositivo="bateria"):
+        self._proxy = proxy
+        self._medidor = _MedidorLectura(registro, dispositivo)
+
+    def leer_carga(self):
+        """Lee la carga del proxy envuelto y mide la lectura."""
+        return self._medidor.medir(self._proxy.leer_carga)
+
+
+class SeteoTemperaturaMedido(AbsSeteoTemperatura):
+    """
+    Cuenta los comandos de seteo y publica los pendientes de la fuente.
+
+    Si la fuente envuelta tiene la propiedad pendientes (seteo socket)
+    se publica como termostato_cola_profundidad{cola="seteo"}.
+
+    Args:
+        seteo (AbsSeteoTemperatura): Componente de seteo real.
+        registro (RegistroMetricas): Registro destino.
+    """
+
+    def __init__(self, seteo, registro):
+        self._seteo = seteo
+        self._comandos = registro.contador(
+            "termostato_comandos_total", "Comandos de usuario recibidos por fuente",
+            ("fuente",)).etiquetas("seteo")
+        if hasattr(seteo, "pendientes"):
+            registrar_cola(registro, "seteo", lambda: seteo.pendientes)
+
+    def obtener_seteo(self):
+        """Obtiene el proximo comando de la fuente y lo cuenta si hay uno."""
+        comando = self._seteo.obtener_seteo()
+        if comando is not None:
+            self._comandos.incrementar()
+        return comando
+
+    def escuchar(self, destino, timeout=0.05):
+        """Escucha la fuente envuelta contando cada comando antes de publicarlo."""
+        def contar_y_publicar(comando):
+            """Cuenta el comando y lo entrega al destino."""
+            self._comandos.incrementar()
+            destino(comando)
+        self._seteo.escuchar(contar_y_publicar, timeout)
+
+
+class _MedidorVisualizacion:
+    """
+    Series de metricas de un visualizador.
+
+    Los visualizadores socket y API informan los errores de red sin
+    propagarlos y los cuentan en su atributo errores; el medidor suma
+    los que aparecen durante cada envio y tambien las excepciones.
+
+    Args:
+        visualizador: Visualizador real.
+        registro (RegistroMetricas): Registro destino.
+        nombre (str): Valor de la etiqueta "visualizador".
+    """
+
+    def __init__(self, visualizador, registro, nombre):
+        self._visualizador = visualizador
+        self._duracion = registro.histograma(
+            "termostato_visualizacion_segundos", "Duracion de cada envio a un visualizador",
+            ("visualizador",)).etiquetas(nombre)
+        self._errores = registro.contador(
+            "termostato_visualizacion_errores_total", "Envios fallidos por visualizador",
+            ("visualizador",)).etiquetas(nombre)
+
+    def medir(self, mostrar, valor):
+        """
+        Ejecuta mostrar(valor) registrando duracion y errores.
+
+        Args:
+            mostrar: Metodo del visualizador real.
+            valor: Valor a mostrar.
+        """
+        errores_previos = getattr(self._visualizador, "errores", 0)
+        inicio = time.perf_counter()
+        try:
+            mostrar(valor)
+        except Exception:
+            self._errores.incrementar()
+            raise
+        finally:
+            self._duracion.observar(time.perf_counter() - inicio)
+        nuevos = getattr(self._visualizador, "errores", 0) - errores_previos
+        if nuevos > 0:
+            self._errores.incrementar(nuevos)
+
+
+class VisualizadorTemperaturaMedido(AbsVisualizadorTemperatura):
+    """
+    Mide los envios del visualizador de temperatura envuelto.
+
+    Args:
+        visualizador (AbsVisualizadorTemperatura): Visualizador real.
+        registro (RegistroMetricas): Registro destino.
+    """
+
+    def __init__(self, visualizador, registro):
+        self._visualizador = visualizador
+        self._medidor = _MedidorVisualizacion(visualizador, registro, "temperatura")
+
+    def mostrar_temperatura_ambiente(self, temperatura_ambiente):
+        """Muestra la temperatura ambiente y mide el envio."""
+        self._medidor.medir(self._visualizador.mostrar_temperatura_ambiente,
+                            temperatura_ambiente)
+
+    def mostrar_temperatura_deseada(self, temperatura_deseada):
+        """Muestra la temperatura deseada y mide el envio."""
+        self._medidor.medir(self._visualizador.mostrar_temperatura_deseada,
+                            temperatura_deseada)
+
+
+class VisualizadorBateriaMedido(AbsVisualizadorBateria):
+    """
+    Mide los envios del visualizador de bateria envuelto.
+
+    Args:
+        visualizador (AbsVisualizadorBateria): Visualizador real.
+        registro (RegistroMetricas): Registro destino.
+    """
+
+    def __init__(self, visualizador, registro):
+        self._visualizador = visualizador
+        self._medidor = _MedidorVisualizacion(visualizador, registro, "bateria")
+
+    def mostrar_tension(self, tension_bateria):
+        """Muestra la tension de la bateria y mide el envio."""
+        self._medidor.medir(self._visualizador.mostrar_tension, tension_bateria)
+
+    def mostrar_indicador(self, indicador_bateria):
+        """Muestra el indicador de carga y mide el envio."""
+        self._medidor.medir(self._visualizador.mostrar_indicador, indicador_bateria)
+
+
+# pylint: disable=too-few-public-methods
+class VisualizadorClimatizadorMedido(AbsVisualizadorClimatizador):
+    """
+    Mide los envios del visualizador de climatizador envuelto.
+
+    Args:
+        visualizador (AbsVisualizadorClimatizador): Visualizador real.
+        registro (RegistroMetricas): Registro destino.
+    """
+
+    def __init__(self, visualizador, registro):
+        self._visualizador = visualizador
+        self._medidor = _MedidorVisualizacion(visualizador, registro, "climatizador")
+
+    def mostrar_estado_climatizador(self, estado_climatizador):
+        """Muestra el estado del climatizador y mide el envio."""
+        self._medidor.medir(self._visualizador.mostrar_estado_climatizador,
+                            estado_climatizador)
+
+
+# pylint: disable=too-few-public-methods
+class ActuadorClimatizadorMedido(AbsProxyActuadorClimatizador):
+    """
+    Cuenta las acciones enviadas al actuador envuelto.
+
+    Args:
+        actuador (AbsProxyActuadorClimatizador): Actuador real.
+        registro (RegistroMetricas): Registro destino.
+    """
+
+    def __init__(self, actuador, registro):
+        self._actuador = actuador
+        self._acciones = registro.contador(
+            "termostato_acciones_total", "Acciones enviadas al climatizador", ("accion",))
+
+    def accionar_climatizador(self, accion):
+        """Envia la accion al actuador envuelto y la cuenta por accion."""
+        self._actuador.accionar_climatizador(accion)
+        self._acciones.etiquetas(accion).incrementar()
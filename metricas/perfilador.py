@@ -0,0 +1,202 @@
+"""
+Perfilador de las tareas periodicas del operador.
+
+Mide cada iteracion de cada tarea (cuerpo del bucle, sin la espera) y
+la compara con su periodo:
+
+    termostato_tarea_segundos{tarea}          histograma  tiempo de pared
+    termostato_tarea_cpu_segundos{tarea}      histograma  CPU del hilo
+    termostato_tarea_bloqueo_segundos{tarea}  histograma  pared - CPU (E/S,
+                                                          locks, GIL)
+    termostato_tarea_vencimientos_total{tarea} contador   iteraciones mas
+                                                          largas que el periodo
+    termostato_tarea_uso{tarea}               indicador   fraccion del periodo
+                                                          usada en la ultima
+                                                          iteracion
+
+Ademas puede capturar un perfil cProfile bajo demanda (por senal o
+llamando a solicitar_perfil()): durante una ventana de segundos cada
+iteracion corre bajo su propio profiler (cProfile solo observa el hilo
+que lo activa), sus estadisticas se acumulan al terminar y al cerrarse
+la ventana se escribe un archivo .prof que se analiza con pstats o
+snakeviz.
+
+Uso:
+    perfilador = PerfiladorTareas(registro)
+    perfilador.instalar_senal()          # kill -USR1 <pid>
+    with perfilador.medir("bateria", periodo=1):
+        gestor_bateria.verificar_nivel_de_carga()
+
+Patron de Diseno:
+    - Observer: Cada iteracion notifica su duracion al perfilador
+"""
+import cProfile
+import os
+import pstats
+import signal
+import threading
+import time
+from contextlib import contextmanager
+
+
+class PerfiladorTareas:
+    """
+    Tiempo de pared, CPU, bloqueo y vencimientos por tarea.
+
+    Args:
+        registro (RegistroMetricas): Registro donde publicar las metricas.
+        directorio (str): Carpeta de los archivos .prof.
+        duracion_perfil (float): Segundos que dura cada captura cProfile.
+    """
+
+    def __init__(self, registro, directorio=".", duracion_perfil=10.0):
+        self._pared = registro.histograma(
+            "termostato_tarea_segundos",
+            "Duracion de cada iteracion de las tareas del operador", ("tarea",))
+        self._cpu = registro.histograma(
+            "termostato_tarea_cpu_segundos",
+            "Tiempo de CPU del hilo en cada iteracion", ("tarea",))
+        self._bloqueo = registro.histograma(
+            "termostato_tarea_bloqueo_segundos",
+            "Tiempo de cada iteracion fuera de CPU (E/S, locks, GIL)", ("tarea",))
+        self._vencimientos = registro.contador(
+            "termostato_tarea_vencimientos_total",
+            "Iteraciones que duraron mas que el periodo de la tarea", ("tarea",))
+        self._uso = registro.indicador(
+            "termostato_tarea_uso",
+            "Fraccion del periodo usada en la ultima iteracion", ("tarea",))
+        self._directorio = directorio
+        self._duracion_perfil = duracion_perfil
+        self._cerrojo = threading.Lock()
+        self._fin_perfil = None
+        self._estadisticas = None
+        self._archivos = []
+
+    @property
+    def archivos(self):
+        """list: Rutas de los perfiles .prof escritos."""
+        return list(self._archivos)
+
+    @property
+    def capturando(self):
+        """bool: True mientras hay una captura cProfile abierta."""
+        return self._fin_perfil is not None
+
+    @contextmanager
+    def medir(self, tarea, periodo=None):
+        """
+        Mide una iteracion de la tarea (el bloque with).
+
+        Args:
+            tarea (str): Nombre de la tarea (etiqueta "tarea").
+            periodo (float): Segundos entre iteraciones; None no evalua
+                vencimientos ni uso.
+        """
+        perfil = self._perfil()
+        inicio_cpu = time.thread_time()
+        inicio = time.perf_counter()
+        if perfil is not None:
+            try:
+                perfil.enable()
+            except ValueError:
+                # Desde Python 3.12 solo un profiler puede estar activo a la vez
+                perfil = None
+        try:
+            yield
+        finally:
+            if perfil is not None:
+                perfil.disable()
+            pared = time.perf_counter() - inicio
+            cpu = time.thread_time() - inicio_cpu
+            self._registrar(tarea, periodo, pared, cpu)
+            if perfil is not None:
+                self._acumular(perfil)
+            if self._fin_perfil is not None:
+                self._cerrar_perfil_si_vencio()
+
+    def _registrar(self, tarea, periodo, pared, cpu):
+        """Publica las metricas de una iteracion."""
+        self._pared.etiquetas(tarea).observar(pared)
+        self._cpu.etiquetas(tarea).observar(cpu)
+        self._bloqueo.etiquetas(tarea).observar(max(pared - cpu, 0.0))
+        if periodo:
+            self._uso.etiquetas(tarea).fijar(pared / periodo)
+            if pared > periodo:
+                self._vencimientos.etiquetas(tarea).incrementar()
+
+    def solicitar_perfil(self, duracion=None):
+        """
+        Abre una captura cProfile de duracion segundos.
+
+        Las iteraciones que empiezan dentro de la ventana se perfilan; la
+        primera que termina despues de cerrada escribe el archivo. Si ya
+        hay una captura abierta no hace nada.
+
+        Args:
+            duracion (float): Segundos de captura (None = duracion_perfil).
+        """
+        with self._cerrojo:
+            if self._fin_perfil is None:
+                self._estadisticas = None
+                self._fin_perfil = time.monotonic() + (duracion or self._duracion_perfil)
+
+    def instalar_senal(self, senal=None):
+        """
+        Abre una captura cada vez que el proceso recibe la senal.
+
+        Debe llamarse desde el hilo principal.
+
+        Args:
+            senal (int): Numero de senal (por defecto SIGUSR1).
+
+        Returns:
+            bool: False si la plataforma no tiene la senal (Windows).
+        """
+        senal = senal if senal is not None else getattr(signal, "SIGUSR1", None)
+        if senal is None:
+            return False
+        signal.signal(senal, lambda *_: self.solicitar_perfil())
+        return True
+
+    def volcar_perfil(self):
+        """
+        Cierra la captura abierta y escribe el perfil acumulado.
+
+        Returns:
+            str: Ruta del archivo .prof, o None si no habia iteraciones
+                perfiladas.
+        """
+        with self._cerrojo:
+            estadisticas, self._estadisticas = self._estadisticas, None
+            self._fin_perfil = None
+        if estadisticas is None:
+            return None
+        ruta = os.path.join(self._directorio, "perfil-{}-{}.prof".format(
+            time.strftime("%Y%m%d-%H%M%S"), len(self._archivos)))
+        estadisticas.dump_stats(ruta)
+        self._archivos.append(ruta)
+        return ruta
+
+    def _perfil(self):
+        """Profiler nuevo para la iteracion si la captura esta abierta, o None."""
+        fin = self._fin_perfil
+        if fin is None or time.monotonic() >= fin:
+            return None
+        return cProfile.Profile()
+
+    def _acumular(self, perfil):
+        """Suma las estadisticas de una iteracion a las de la captura."""
+        perfil.create_stats()
+        with self._cerrojo:
+            if self._fin_perfil is None or not perfil.stats:
+                return
+            if self._estadisticas is None:
+                self._estadisticas = pstats.Stats(perfil)
+            else:
+                self._estadisticas.add(perfil)
+
+    def _cerrar_perfil_si_vencio(self):
+        """Vuelca el perfil si la ventana de captura ya termino."""
+        fin = self._fin_perfil
+        if fin is not None and time.monotonic() >= fin:
+            self.volcar_perfil()
@@ -0,0 +1,414 @@
+"""
+Registro de metricas de ejecucion del termostato.
+
+Contadores, indicadores (gauges) e histogramas con etiquetas, al estilo
+de Prometheus, que se exponen en el formato de texto de Prometheus
+(version 0.0.4) para que cualquier scraper compatible los recolecte.
+
+Uso:
+    registro = RegistroMetricas()
+    lecturas = registro.histograma("termostato_lectura_segundos",
+                                   "Duracion de cada lectura", ("dispositivo",))
+    with lecturas.etiquetas("temperatura").cronometrar():
+        proxy.leer_temperatura()
+    print(registro.exponer())
+
+Patron de Diseno:
+    - Registry: Un unico punto de alta y consulta de metricas por nombre
+    - Flyweight: Cada combinacion de etiquetas se crea una sola vez
+"""
+import math
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
+
+
+# Limites por defecto de los histogramas de duracion, en segundos
+LIMITES_DURACION = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _formatear_valor(valor):
+    """Formatea un numero como lo espera el formato de exposicion."""
+    if math.isinf(valor):
+        return "+Inf" if valor > 0 else "-Inf"
+    if math.isnan(valor):
+        return "NaN"
+    return repr(float(valor)) if not float(valor).is_integer() else str(int(valor))
+
+
+def _escapar(valor):
+    """Escapa un valor de etiqueta (barra invertida, comillas y saltos de linea)."""
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _etiquetas_texto(nombres, valores, extra=None):
+    """Arma '{a="x",b="y"}' o '' si no hay etiquetas."""
+    pares = ['{}="{}"'.format(nombre, _escapar(valor)) for nombre, valor in zip(nombres, valores)]
+    if extra is not None:
+        pares.append('{}="{}"'.format(*extra))
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+class _Metrica(metaclass=ABCMeta):
+    """
+    Base de las metricas: nombre, ayuda, etiquetas y series por etiqueta.
+
+    Args:
+        nombre (str): Nombre de la metrica.
+        ayuda (str): Descripcion (linea # HELP).
+        etiquetas (tuple): Nombres de las etiquetas.
+    """
+
+    TIPO = None
+
+    def __init__(self, nombre, ayuda, etiquetas=()):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.nombres_etiquetas = tuple(etiquetas)
+        self._cerrojo = threading.Lock()
+        self._series = {}
+
+    def etiquetas(self, *valores):
+        """
+        Retorna la serie de esta combinacion de valores de etiqueta.
+
+        Args:
+            *valores: Un valor por cada nombre de etiqueta, en orden.
+
+        Returns:
+            Serie de la metrica (se crea la primera vez).
+
+        Raises:
+            ValueError: Si la cantidad de valores no coincide.
+        """
+        if len(valores) != len(self.nombres_etiquetas):
+            raise ValueError("{} espera las etiquetas {}, recibido: {}".format(
+                self.nombre, self.nombres_etiquetas, valores))
+        clave = tuple(str(valor) for valor in valores)
+        serie = self._series.get(clave)
+        if serie is None:
+            with self._cerrojo:
+                serie = self._series.setdefault(clave, self._crear_serie())
+        return serie
+
+    def _sin_etiquetas(self):
+        """Serie unica de una metrica sin etiquetas."""
+        if self.nombres_etiquetas:
+            raise ValueError("{} requiere etiquetas {}".format(self.nombre,
+                                                                self.nombres_etiquetas))
+        return self.etiquetas()
+
+    @abstractmethod
+    def _crear_serie(self):
+        """Crea la serie de una combinacion de etiquetas."""
+
+    def exponer(self):
+        """
+        Retorna las lineas de exposicion de la metrica.
+
+        Returns:
+            list: Lineas # HELP, # TYPE y una por serie.
+        """
+        lineas = ["# HELP {} {}".format(self.nombre, self.ayuda.replace("\n", " ")),
+                  "# TYPE {} {}".format(self.nombre, self.TIPO)]
+        for clave, serie in sorted(self._series.items()):
+            lineas.extend(self._exponer_serie(clave, serie))
+        return lineas
+
+    def _exponer_serie(self, clave, serie):
+        """
+        Lineas de una serie.
+
+        Args:
+            clave (tuple): Valores de etiqueta de la serie.
+            serie: Serie de la metrica.
+
+        Returns:
+            list: Lineas de exposicion (una para contadores e indicadores).
+        """
+        return ["{}{} {}".format(self.nombre, _etiquetas_texto(self.nombres_etiquetas, clave),
+                                 _formatear_valor(serie.valor))]
+
+
+class _SerieContador:
+    """Valor acumulado de un contador."""
+
+    def __init__(self):
+        self._cerrojo = threading.Lock()
+        self.valor = 0.0
+
+    def incrementar(self, cantidad=1):
+        """
+        Suma cantidad al contador.
+
+        Raises:
+            ValueError: Si cantidad es negativa.
+        """
+        if cantidad < 0:
+            raise ValueError("Un contador no puede decrementarse")
+        with self._cerrojo:
+            self.valor += cantidad
+
+
+class Contador(_Metrica):
+    """Valor que solo crece (eventos, errores, bytes)."""
+
+    TIPO = "counter"
+
+    def _crear_serie(self):
+        """Crea la serie de un contador (en cero)."""
+        return _SerieContador()
+
+    def incrementar(self, cantidad=1):
+        """Incrementa la serie sin etiquetas."""
+        self._sin_etiquetas().incrementar(cantidad)
+
+
+class _SerieIndicador:
+    """Valor instantaneo de un indicador, fijo o leido de una funcion."""
+
+    def __init__(self):
+        self._cerrojo = threading.Lock()
+        self._valor = 0.0
+        self._funcion = None
+
+    @property
+    def valor(self):
+        """float: Valor actual (llama a la funcion si se fijo una)."""
+        if self._funcion is not None:
+            return float(self._funcion())
+        return self._valor
+
+    def fijar(self, valor):
+        """Fija el valor."""
+        self._valor = float(valor)
+
+    def incrementar(self, cantidad=1):
+        """Suma cantidad (negativa para restar)."""
+        with self._cerrojo:
+            self._valor += cantidad
+
+    def decrementar(self, cantidad=1):
+        """Resta cantidad."""
+        self.incrementar(-cantidad)
+
+    def fijar_funcion(self, funcion):
+        """
+        Toma el valor de funcion() en cada exposicion.
+
+        Sirve para profundidades de cola y conexiones abiertas: no hay
+        que actualizar el indicador en el camino critico.
+
+        Args:
+            funcion: Callable sin argumentos que retorna un numero.
+        """
+        self._funcion = funcion
+
+
+class Indicador(_Metrica):
+    """Valor que sube y baja (profundidad de cola, conexiones, temperatura)."""
+
+    TIPO = "gauge"
+
+    def _crear_serie(self):
+        """Crea la serie de un indicador (en cero, sin funcion)."""
+        return _SerieIndicador()
+
+    def fijar(self, valor):
+        """Fija la serie sin etiquetas."""
+        self._sin_etiquetas().fijar(valor)
+
+    def fijar_funcion(self, funcion):
+        """Toma el valor de la serie sin etiquetas de funcion()."""
+        self._sin_etiquetas().fijar_funcion(funcion)
+
+
+class _SerieHistograma:
+    """Cubetas acumulativas, suma y cantidad de observaciones."""
+
+    def __init__(self, limites):
+        self._cerrojo = threading.Lock()
+        self.limites = limites
+        self.cubetas = [0] * len(limites)
+        self.suma = 0.0
+        self.cantidad = 0
+
+    def observar(self, valor):
+        """Registra una observacion."""
+        with self._cerrojo:
+            for indice, limite in enumerate(self.limites):
+                if valor <= limite:
+                    self.cubetas[indice] += 1
+                    break
+            self.suma += valor
+            self.cantidad += 1
+
+    @contextmanager
+    def cronometrar(self):
+        """Observa los segundos que tarda el bloque with (aunque lance)."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observar(time.perf_counter() - inicio)
+
+
+class Histograma(_Metrica):
+    """
+    Distribucion de valores en cubetas (duraciones, tamanos de lote).
+
+    Args:
+        nombre (str): Nombre de la metrica.
+        ayuda (str): Descripcion.
+        etiquetas (tuple): Nombres de las etiquetas.
+        limites (tuple): Limites superiores de las cubetas, crecientes
+            (por defecto LIMITES_DURACION); +Inf se agrega solo.
+    """
+
+    TIPO = "histogram"
+
+    def __init__(self, nombre, ayuda, etiquetas=(), limites=None):
+        super().__init__(nombre, ayuda, etiquetas)
+        limites = tuple(limites or LIMITES_DURACION)
+        if list(limites) != sorted(limites):
+            raise ValueError("Los limites de {} deben ser crecientes".format(nombre))
+        self.limites = limites if math.isinf(limites[-1]) else limites + (math.inf,)
+
+    def _crear_serie(self):
+        """Crea la serie de un histograma con los limites de la metrica."""
+        return _SerieHistograma(self.limites)
+
+    def observar(self, valor):
+        """Observa en la serie sin etiquetas."""
+        self._sin_etiquetas().observar(valor)
+
+    def cronometrar(self):
+        """Cronometra en la serie sin etiquetas."""
+        return self._sin_etiquetas().cronometrar()
+
+    def _exponer_serie(self, clave, serie):
+        """
+        Lineas de una serie: cubetas acumuladas (_bucket), _sum y _count.
+
+        Las cubetas, la suma y la cantidad se copian bajo el cerrojo de la
+        serie, de modo que las lineas son consistentes entre si.
+        """
+        with serie._cerrojo:  # pylint: disable=protected-access
+            cubetas, suma, cantidad = list(serie.cubetas), serie.suma, serie.cantidad
+        lineas = []
+        acumulado = 0
+        for limite, cuenta in zip(self.limites, cubetas):
+            acumulado += cuenta
+            etiquetas = _etiquetas_texto(self.nombres_etiquetas, clave,
+                                         ("le", _formatear_valor(limite)))
+            lineas.append("{}_bucket{} {}".format(self.nombre, etiquetas, acumulado))
+        etiquetas = _etiquetas_texto(self.nombres_etiquetas, clave)
+        lineas.append("{}_sum{} {}".format(self.nombre, etiquetas, _formatear_valor(suma)))
+        lineas.append("{}_count{} {}".format(self.nombre, etiquetas, cantidad))
+        return lineas
+
+
+class RegistroMetricas:
+    """
+    Conjunto de metricas del proceso.
+
+    Las metricas se dan de alta por nombre: pedir dos veces la misma
+    retorna la misma instancia, de modo que cada componente declara las
+    metricas que usa sin coordinarse con los demas.
+    """
+
+    def __init__(self):
+        """Inicializa el registro vacio."""
+        self._cerrojo = threading.Lock()
+        self._metricas = {}
+
+    def _alta(self, clase, nombre, ayuda, etiquetas, **parametros):
+        """Retorna la metrica existente o la crea."""
+        with self._cerrojo:
+            metrica = self._metricas.get(nombre)
+            if metrica is None:
+                metrica = clase(nombre, ayuda, etiquetas, **parametros)
+                self._metricas[nombre] = metrica
+            elif not isinstance(metrica, clase) or metrica.nombres_etiquetas != tuple(etiquetas):
+                raise ValueError("La metrica {} ya existe con otro tipo o etiquetas".format(nombre))
+            return metrica
+
+    def contador(self, nombre, ayuda, etiquetas=()):
+        """
+        Da de alta (o retorna) un contador.
+
+        Args:
+            nombre (str): Nombre (por convencion terminado en _total).
+            ayuda (str): Descripcion.
+            etiquetas (tuple): Nombres de las etiquetas.
+
+        Returns:
+            Contador: Metrica registrada.
+
+        Raises:
+            ValueError: Si el nombre ya existe con otro tipo o etiquetas.
+        """
+        return self._alta(Contador, nombre, ayuda, etiquetas)
+
+    def indicador(self, nombre, ayuda, etiquetas=()):
+        """
+        Da de alta (o retorna) un indicador.
+
+        Args:
+            nombre (str): Nombre.
+            ayuda (str): Descripcion.
+            etiquetas (tuple): Nombres de las etiquetas.
+
+        Returns:
+            Indicador: Metrica registrada.
+
+        Raises:
+            ValueError: Si el nombre ya existe con otro tipo o etiquetas.
+        """
+        return self._alta(Indicador, nombre, ayuda, etiquetas)
+
+    def histograma(self, nombre, ayuda, etiquetas=(), limites=None):
+        """
+        Da de alta (o retorna) un histograma.
+
+        Args:
+            nombre (str): Nombre (por convencion con la unidad, _segundos).
+            ayuda (str): Descripcion.
+            etiquetas (tuple): Nombres de las etiquetas.
+            limites (tuple): Limites de las cubetas (None = LIMITES_DURACION).
+
+        Returns:
+            Histograma: Metrica registrada.
+
+        Raises:
+            ValueError: Si el nombre ya existe con otro tipo o etiquetas.
+        """
+        return self._alta(Histograma, nombre, ayuda, etiquetas, limites=limites)
+
+    def obtener(self, nombre):
+        """
+        Retorna una metrica registrada.
+
+        Args:
+            nombre (str): Nombre de la metrica.
+
+        Returns:
+            Metrica registrada, o None si no existe.
+        """
+        return self._metricas.get(nombre)
+
+    def exponer(self):
+        """
+        Retorna todas las metricas en formato de texto de Prometheus.
+
+        Returns:
+            str: Exposicion terminada en salto de linea.
+        """
+        with self._cerrojo:
+            metricas = sorted(self._metricas.values(), key=lambda metrica: metrica.nombre)
+        lineas = []
+        for metrica in metricas:
+            lineas.extend(metrica.exponer())
+        return "\n".join(lineas) + "\n"
@@ -0,0 +1,93 @@
+"""
+Servidor HTTP de metricas.
+
+Expone el RegistroMetricas en GET /metrics con el formato de texto de
+Prometheus, en un hilo daemon para no interferir con los hilos del
+operador. Cualquier otra ruta responde 404.
+
+Uso:
+    servidor = ServidorMetricas(registro, "localhost", 9100)
+    servidor.iniciar()
+    # curl http://localhost:9100/metrics
+
+Patron de Diseno:
+    - Facade: Oculta http.server detras de iniciar()/detener()
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+TIPO_CONTENIDO = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _ManejadorMetricas(BaseHTTPRequestHandler):
+    """Responde GET /metrics con la exposicion del registro del servidor."""
+
+    # pylint: disable=invalid-name
+    def do_GET(self):
+        """Atiende un pedido GET."""
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        cuerpo = self.server.registro.exponer().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", TIPO_CONTENIDO)
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    # pylint: disable=redefined-builtin
+    def log_message(self, format, *args):
+        """Silencia el log por pedido (un scrape cada pocos segundos)."""
+
+
+class ServidorMetricas:
+    """
+    Endpoint HTTP local de metricas.
+
+    Args:
+        registro (RegistroMetricas): Registro a exponer.
+        host (str): Direccion de escucha.
+        puerto (int): Puerto de escucha (0 = efimero).
+    """
+
+    def __init__(self, registro, host="localhost", puerto=9100):
+        self._registro = registro
+        self._host = host
+        self._puerto = puerto
+        self._servidor = None
+        self._hilo = None
+
+    @property
+    def direccion(self):
+        """tuple: (host, puerto) efectivo de escucha, o None si no inicio."""
+        if self._servidor is None:
+            return None
+        return self._servidor.server_address[:2]
+
+    def iniciar(self):
+        """
+        Abre el socket y atiende pedidos en un hilo daemon.
+
+        Raises:
+            OSError: Si el puerto no esta disponible.
+        """
+        if self._servidor is not None:
+            return
+        servidor = ThreadingHTTPServer((self._host, self._puerto), _ManejadorMetricas)
+        servidor.daemon_threads = True
+        servidor.registro = self._registro
+        self._servidor = servidor
+        self._hilo = threading.Thread(target=servidor.serve_forever, name="metricas",
+                                      daemon=True)
+        self._hilo.start()
+
+    def detener(self):
+        """Detiene el servidor y cierra el socket."""
+        if self._servidor is None:
+            return
+        self._servidor.shutdown()
+        self._servidor.server_close()
+        self._hilo.join()
+        self._servidor = None
+        self._hilo = None
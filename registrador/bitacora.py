@@ -0,0 +1,131 @@
+"""
+Bitacora estructurada del termostato.
+
+Reemplaza los print() de diagnostico del lazo de control por logging
+con niveles. Los modulos obtienen su logger con logging.getLogger(__name__)
+y registran con formato diferido:
+
+    _bitacora.debug("iteracion %s", tarea)
+
+El mensaje solo se arma si el nivel esta habilitado, y ni siquiera en
+el hilo que registra: ManejadorCola encola el registro sin formatear
+(sin bloquear; si la cola esta llena lo descarta y lo cuenta) y un
+unico hilo de fondo lo formatea y lo escribe. Los hilos del operador no
+pagan la escritura en stdout.
+
+Formato (logfmt, una linea por evento):
+    ts=2024-01-01T12:00:00.123 nivel=INFO hilo=Thread-1 origen=... msg="..." clave=valor
+
+Los campos extra se pasan con extra={"campos": {"tarea": "bateria"}}.
+
+Patron de Diseno:
+    - Producer/Consumer: Los hilos encolan registros, un hilo los escribe
+    - Singleton (listener): Una sola bitacora configurada por proceso
+"""
+import logging
+import logging.handlers
+import queue
+import sys
+
+
+# Raiz de los loggers del sistema (los modulos del repo no tienen paquete comun)
+NOMBRE_RAIZ = ""
+
+_listener = None
+_manejador = None
+
+
+class FormateadorEstructurado(logging.Formatter):
+    """
+    Formatea cada registro como una linea logfmt.
+
+    Los valores con espacios, comillas o '=' se encierran entre comillas.
+    """
+
+    @staticmethod
+    def _valor(valor):
+        """Formatea un valor logfmt (entre comillas si hace falta)."""
+        texto = str(valor)
+        if not texto or any(caracter in texto for caracter in ' "=\n'):
+            return '"{}"'.format(texto.replace("\\", "\\\\").replace('"', '\\"')
+                                 .replace("\n", "\\n"))
+        return texto
+
+    def format(self, record):
+        pares = [
+            ("ts", "{}.{:03d}".format(self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+                                      int(record.msecs))),
+            ("nivel", record.levelname),
+            ("hilo", record.threadName),
+            ("origen", record.name),
+            ("msg", record.getMessage()),
+        ]
+        pares.extend(sorted(getattr(record, "campos", {}).items()))
+        if record.exc_info:
+            pares.append(("error", self.formatException(record.exc_info)))
+        return " ".join("{}={}".format(clave, self._valor(valor)) for clave, valor in pares)
+
+
+class ManejadorCola(logging.handlers.QueueHandler):
+    """
+    Encola registros sin formatear y sin bloquear.
+
+    A diferencia de QueueHandler, no arma el mensaje en el hilo que
+    registra (lo hace el listener al escribir). Los argumentos deben
+    ser inmutables o no modificarse despues de registrar.
+
+    Args:
+        cola (queue.Queue): Cola acotada entre los hilos y el listener.
+    """
+
+    def __init__(self, cola):
+        super().__init__(cola)
+        self.descartados = 0
+
+    def prepare(self, record):
+        """Retorna el registro tal cual (formato diferido al listener)."""
+        return record
+
+    def enqueue(self, record):
+        """Encola sin esperar; con la cola llena descarta y cuenta."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.descartados += 1
+
+
+def configurar_bitacora(nivel="INFO", salida=None, capacidad=10000):
+    """
+    Configura la bitacora del proceso (una sola vez).
+
+    Args:
+        nivel (str): Nivel minimo ("DEBUG", "INFO", "WARNING", ...).
+        salida: Flujo de texto destino (por defecto sys.stderr).
+        capacidad (int): Registros pendientes antes de descartar.
+
+    Returns:
+        ManejadorCola: Manejador instalado en el logger raiz.
+    """
+    global _listener, _manejador  # pylint: disable=global-statement
+    if _manejador is not None:
+        detener_bitacora()
+    escritor = logging.StreamHandler(salida if salida is not None else sys.stderr)
+    escritor.setFormatter(FormateadorEstructurado())
+    _manejador = ManejadorCola(queue.Queue(capacidad))
+    _listener = logging.handlers.QueueListener(_manejador.queue, escritor)
+    raiz = logging.getLogger(NOMBRE_RAIZ)
+    raiz.addHandler(_manejador)
+    raiz.setLevel(nivel)
+    _listener.start()
+    return _manejador
+
+
+def detener_bitacora():
+    """Escribe los registros pendientes y quita el manejador."""
+    global _listener, _manejador  # pylint: disable=global-statement
+    if _manejador is None:
+        return
+    logging.getLogger(NOMBRE_RAIZ).removeHandler(_manejador)
+    _listener.stop()
+    _listener = None
+    _manejador = None
@@ -10,5 +10,6 @@ Contiene los casos de uso y la logica de orquestacion del sistema:
     - selector_entrada: Seleccion de modo de temperatura
     - abs_selector_temperatura: Abstraccion del selector
     - abs_seteo_temperatura: Abstraccion del seteo
+    - reloj: Relojes real, monotono y virtual para esperas y marcas de tiempo
 """
 # pylint: disable=consider-using-f-string
@@ -4,6 +4,7 @@ Abstraccion para selector de modo de temperatura.
 Define la interfaz para componentes que determinan si mostrar
 la temperatura ambiente o la deseada.
 """
+import time
 from abc import ABCMeta, abstractmethod
 
 
@@ -15,3 +16,19 @@ class AbsSelectorTemperatura(metaclass=ABCMeta):
     @abstractmethod
     def obtener_selector():
         """Obtiene el modo actual: 'ambiente' o 'deseada'."""
+
+    def escuchar(self, destino, timeout=0.05):
+        """
+        Publica el modo actual en destino (modo push).
+
+        Implementacion por defecto basada en sondeo: consulta una vez
+        obtener_selector(), publica el modo y duerme timeout segundos.
+        Las implementaciones capaces de esperar eventos (sockets) la
+        redefinen para publicar solo cuando llega un cambio.
+
+        Args:
+            destino: Callable que recibe el modo ('ambiente'/'deseada').
+            timeout (float): Espera en segundos entre consultas.
+        """
+        destino(self.obtener_selector())
+        time.sleep(timeout)
@@ -4,6 +4,7 @@ Abstraccion para seteo de temperatura.
 Define la interfaz para componentes que obtienen comandos del usuario
 para ajustar la temperatura deseada.
 """
+import time
 from abc import ABCMeta, abstractmethod
 
 
@@ -14,3 +15,22 @@ class AbsSeteoTemperatura(metaclass=ABCMeta):
     @abstractmethod
     def obtener_seteo(self):
         """Obtiene comando: 'aumentar', 'disminuir' o None."""
+
+    def escuchar(self, destino, timeout=0.05):
+        """
+        Espera comandos y los publica en destino (modo push).
+
+        Implementacion por defecto basada en sondeo: consulta una vez
+        obtener_seteo() y, si no hay comando, duerme timeout segundos.
+        Las implementaciones capaces de esperar eventos (sockets) la
+        redefinen para no sondear.
+
+        Args:
+            destino: Callable que recibe cada comando ('aumentar'/'disminuir').
+            timeout (float): Espera maxima en segundos si no hay comandos.
+        """
+        comando = self.obtener_seteo()
+        if comando is None:
+            time.sleep(timeout)
+        else:
+            destino(comando)
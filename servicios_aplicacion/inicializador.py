@@ -3,21 +3,84 @@ Inicializador del sistema de termostato.
 
 Este modulo contiene la clase responsable de inicializar el sistema,
 verificando que los sensores esten operativos antes de comenzar.
+
+Cada sensor se verifica en su propio hilo, de modo que un sensor lento
+no demora a los demas. El arranque queda acotado por un plazo global y
+un timeout por sensor; las lecturas fallidas se reintentan. Los
+sensores no requeridos no demoran el arranque: el control empieza en
+modo degradado apenas llegan las lecturas requeridas.
+
+Patron de Diseno:
+    - Fork/Join: Una verificacion concurrente por sensor con plazo comun
 """
-from os import system
+import logging
+import threading
+from collections import namedtuple
+
+from servicios_aplicacion.reloj import RelojReal
+
+_bitacora = logging.getLogger(__name__)
+
+# Parametros de verificacion de un sensor
+ParametrosSensor = namedtuple("ParametrosSensor", ["timeout", "reintentos", "requerido"])
+
+# Estados de la verificacion de un sensor
+OK = "ok"
+FALLO = "fallo"
+VENCIDO = "vencido"
+PENDIENTE = "pendiente"
 
 
-# pylint: disable=too-few-public-methods
 class Inicializador:
     """
     Inicializador del sistema de termostato.
 
     Verifica que la bateria y el sensor de temperatura esten operativos
     antes de permitir que el sistema entre en operacion normal.
+
+    Una lectura bloqueante (p. ej. un proxy socket esperando conexion)
+    no se puede interrumpir: al vencer su plazo el sensor se da por
+    vencido y su hilo (daemon) queda esperando hasta que llegue la
+    lectura o venza la espera del proxy (red.espera). Mientras tanto el
+    operador lee el mismo proxy: los proxies socket admiten lecturas
+    concurrentes, y si la lectura vencida llega despues actualiza el
+    gestor igual que una lectura del operador.
+
+    Args:
+        plazo (float): Segundos maximos de toda la verificacion (None = sin plazo).
+        sensores (dict): ParametrosSensor por nombre ("bateria", "temperatura");
+            los ausentes usan PARAMETROS_DEFECTO.
+        espera (float): Segundos entre reintentos de un sensor.
+        reloj (AbsReloj): Reloj de los plazos y las esperas (por defecto
+            RelojReal).
     """
 
-    @staticmethod
-    def iniciar(gestor_bateria, gestor_ambiente, presentador):
+    SENSORES = ("bateria", "temperatura")
+
+    # Sin timeout propio, sin reintentos y requerido (comportamiento original)
+    PARAMETROS_DEFECTO = ParametrosSensor(timeout=None, reintentos=0, requerido=True)
+
+    # Segundos entre revisiones de los resultados mientras corre un plazo
+    PASO = 0.01
+
+    def __init__(self, plazo=None, sensores=None, espera=1.0, reloj=None):
+        """
+        Inicializa el verificador con sus plazos.
+
+        Args:
+            plazo (float): Segundos maximos de toda la verificacion.
+            sensores (dict): ParametrosSensor por nombre de sensor.
+            espera (float): Segundos entre reintentos de un sensor.
+            reloj (AbsReloj): Reloj de los plazos y las esperas.
+        """
+        sensores = sensores if sensores is not None else {}
+        self._plazo = plazo
+        self._espera = espera
+        self._reloj = reloj if reloj is not None else RelojReal()
+        self._sensores = {nombre: sensores.get(nombre, self.PARAMETROS_DEFECTO)
+                          for nombre in self.SENSORES}
+
+    def iniciar(self, gestor_bateria, gestor_ambiente, presentador):
         """
         Inicializa el sistema verificando sensores.
 
@@ -29,21 +92,141 @@ class Inicializador:
         Returns:
             bool: True si la inicializacion fue exitosa, False si fallo.
         """
-        print("INICIO")
+        _bitacora.info("inicializando")
         gestor_ambiente.ambiente.temperatura_deseada = 24
 
-        print("lee_bateria")
-        gestor_bateria.verificar_nivel_de_carga()
-        if gestor_bateria.obtener_indicador_de_carga() != "NORMAL":
-            return False
+        inicio = self._reloj.monotonic()
+        estados = self.verificar({
+            "bateria": lambda: Inicializador._verificar_bateria(gestor_bateria),
+            "temperatura": lambda: Inicializador._verificar_temperatura(gestor_ambiente),
+        })
+        _bitacora.info("sensores verificados en %.2f s: %s", self._reloj.monotonic() - inicio,
+                       ", ".join("{}={}".format(n, e) for n, e in sorted(estados.items())))
 
-        print("lee temperatura")
-        gestor_ambiente.leer_temperatura_ambiente()
-        if gestor_ambiente.obtener_temperatura_ambiente() is None:
+        faltantes = [nombre for nombre, estado in sorted(estados.items())
+                     if estado != OK and self._sensores[nombre].requerido]
+        if faltantes:
+            _bitacora.error("sensores requeridos sin lectura valida: %s", ", ".join(faltantes))
             return False
+        degradados = [nombre for nombre, estado in sorted(estados.items()) if estado != OK]
+        if degradados:
+            _bitacora.warning("inicio degradado, sin lectura de: %s", ", ".join(degradados))
 
-        print("Muestra estado Termostato")
+        _bitacora.debug("muestra estado del termostato")
         presentador.ejecutar()
 
-        system("clear")
+        presentador.terminal.limpiar()
         return True
+
+    def verificar(self, verificaciones):
+        """
+        Verifica los sensores en paralelo.
+
+        Retorna cuando todos los sensores requeridos tienen lectura
+        valida, cuando alguno fallo o vencio, o cuando se resolvieron
+        todos; los no requeridos pendientes siguen en segundo plano sin
+        reintentar.
+
+        Los plazos se miden con el reloj: mientras corre alguno se
+        revisan los resultados cada PASO segundos de ese reloj; sin
+        plazos se espera el aviso de cada verificacion.
+
+        Args:
+            verificaciones (dict): Callable por nombre de sensor que lee
+                el sensor y retorna True si la lectura es valida.
+
+        Returns:
+            dict: Estado por sensor (OK, FALLO, VENCIDO o PENDIENTE).
+        """
+        resultados = {}
+        condicion = threading.Condition()
+        fin = threading.Event()
+        inicio = self._reloj.monotonic()
+        limites = {nombre: self._limite(nombre) for nombre in verificaciones}
+        requeridos = [nombre for nombre in verificaciones if self._sensores[nombre].requerido]
+        for nombre, verificacion in verificaciones.items():
+            threading.Thread(target=self._verificar_sensor,
+                             args=(nombre, verificacion, resultados, condicion, fin),
+                             name="inicio-{}".format(nombre), daemon=True).start()
+
+        while True:
+            with condicion:
+                transcurrido = self._reloj.monotonic() - inicio
+                estados = {nombre: Inicializador._estado(resultados.get(nombre),
+                                                         limites[nombre], transcurrido)
+                           for nombre in verificaciones}
+                if any(estados[nombre] in (FALLO, VENCIDO) for nombre in requeridos):
+                    break
+                if all(estados[nombre] == OK for nombre in requeridos):
+                    break
+                restante = Inicializador._restante(
+                    [limites[nombre] for nombre in requeridos if estados[nombre] == PENDIENTE],
+                    transcurrido)
+                if restante is None:
+                    condicion.wait()
+                    continue
+            self._reloj.sleep(min(restante, self.PASO))
+        fin.set()
+        return estados
+
+    def _verificar_sensor(self, nombre, verificacion, resultados, condicion, fin):
+        """Intenta leer un sensor hasta obtener una lectura valida o agotar los reintentos."""
+        intentos = self._sensores[nombre].reintentos + 1
+        for intento in range(1, intentos + 1):
+            try:
+                valida = verificacion()
+            except Exception:  # pylint: disable=broad-except
+                _bitacora.warning("error leyendo %s (intento %s de %s)", nombre, intento,
+                                  intentos, exc_info=True)
+                valida = False
+            if valida:
+                with condicion:
+                    resultados[nombre] = OK
+                    condicion.notify_all()
+                return
+            _bitacora.debug("lectura invalida de %s (intento %s de %s)", nombre, intento,
+                            intentos)
+            if intento < intentos:
+                self._reloj.sleep(self._espera)
+                if fin.is_set():
+                    return
+        with condicion:
+            resultados[nombre] = FALLO
+            condicion.notify_all()
+
+    def _limite(self, nombre):
+        """Segundos maximos para el sensor: su timeout acotado por el plazo global."""
+        limites = [limite for limite in (self._plazo, self._sensores[nombre].timeout)
+                   if limite is not None]
+        return min(limites) if limites else None
+
+    @staticmethod
+    def _estado(resultado, limite, transcurrido):
+        """Estado de un sensor segun su resultado y su limite."""
+        if resultado is not None:
+            return resultado
+        if limite is not None and transcurrido >= limite:
+            return VENCIDO
+        return PENDIENTE
+
+    @staticmethod
+    def _restante(limites, transcurrido):
+        """Segundos hasta el proximo limite (None = esperar sin limite)."""
+        limites = [limite for limite in limites if limite is not None]
+        if not limites:
+            return None
+        return max(min(limites) - transcurrido, 0)
+
+    @staticmethod
+    def _verificar_bateria(gestor_bateria):
+        """Lee la bateria; la lectura es valida si el indicador es NORMAL."""
+        _bitacora.debug("lee bateria")
+        gestor_bateria.verificar_nivel_de_carga()
+        return gestor_bateria.obtener_indicador_de_carga() == "NORMAL"
+
+    @staticmethod
+    def _verificar_temperatura(gestor_ambiente):
+        """Lee la temperatura ambiente; la lectura es valida si no es None."""
+        _bitacora.debug("lee temperatura")
+        gestor_ambiente.leer_temperatura_ambiente()
+        return gestor_ambiente.obtener_temperatura_ambiente() is not None
@@ -9,16 +9,22 @@ Patron de Diseno:
     - Composition Root: Punto unico donde se ensamblan las dependencias
     - Dependency Injection: Las dependencias se inyectan en los constructores
 """
+import logging
+
 from gestores_entidades.gestor_bateria import GestorBateria
 from gestores_entidades.gestor_ambiente import GestorAmbiente
 from gestores_entidades.gestor_climatizador import GestorClimatizador
 from servicios_aplicacion.operador_paralelo import OperadorParalelo
-from servicios_aplicacion.inicializador import Inicializador
 from servicios_aplicacion.presentador import Presentador
 from configurador.configurador import Configurador
+from estado_compartido.publicador import PublicadorEstado
+from eventos.suscriptores import RegistradorEventos
+from metricas.instrumentos import registrar_eventos
 from entidades.ambiente import Ambiente
 from entidades.bateria import Bateria
 
+_bitacora = logging.getLogger(__name__)
+
 
 # pylint: disable=too-few-public-methods
 class Lanzador:
@@ -38,6 +44,60 @@ class Lanzador:
         de dominio, los proxies y visualizadores, y los inyecta en los
         gestores correspondientes.
         """
+        Configurador.configurar_bitacora()
+
+        # Reloj compartido por gestores, operador y agentes
+        reloj = Configurador.configurar_reloj()
+        # Bus de los cambios de estado (None = presentacion por sondeo)
+        bus = Configurador.configurar_bus_eventos()
+        (self._gestor_bateria,
+         self._gestor_ambiente,
+         self._gestor_climatizador) = Lanzador.crear_gestores(reloj, bus)
+
+        # Estado compartido con otros procesos (carteles, diagnosticos)
+        tabla_estado = Configurador.configurar_estado_compartido()
+        publicador_estado = None
+        if tabla_estado is not None:
+            publicador_estado = PublicadorEstado(tabla_estado, self._gestor_bateria,
+                                                 self._gestor_ambiente,
+                                                 self._gestor_climatizador, reloj)
+
+        # Crear presentador, perfilador y operador
+        self._presentador = Presentador(self._gestor_bateria,
+                                        self._gestor_ambiente,
+                                        self._gestor_climatizador)
+        if bus is not None:
+            Lanzador.suscribir_salidas(bus, self._presentador)
+        self._operador = OperadorParalelo(self._gestor_bateria,
+                                          self._gestor_ambiente,
+                                          self._gestor_climatizador,
+                                          Configurador.obtener_modo_seteo(),
+                                          Configurador.obtener_periodos_operador(),
+                                          reloj,
+                                          Configurador.configurar_metricas(),
+                                          Configurador.configurar_perfilador(),
+                                          publicador_estado,
+                                          bus)
+        self._servidor_metricas = Configurador.configurar_servidor_metricas()
+        # Verificacion concurrente de sensores con plazos (seccion "inicio")
+        self._inicializador = Configurador.configurar_inicializador()
+
+    @staticmethod
+    def crear_gestores(reloj, bus=None):
+        """
+        Crea los gestores de un ambiente segun la configuracion vigente.
+
+        Cada llamada crea entidades, proxies y visualizadores nuevos, de
+        modo que tambien sirve para armar cada zona de un trabajador
+        multi-zona (ver zonas.trabajador).
+
+        Args:
+            reloj (AbsReloj): Reloj de las marcas de las lecturas.
+            bus (BusEventos): Bus donde los gestores publican sus cambios.
+
+        Returns:
+            tuple: (GestorBateria, GestorAmbiente, GestorClimatizador).
+        """
         # Crear dependencias para GestorBateria
         carga_maxima = Configurador.obtener_carga_maxima_bateria()
         umbral = Configurador.obtener_umbral_bateria()
@@ -45,10 +105,13 @@ class Lanzador:
         proxy_bateria = Configurador().configurar_proxy_bateria()
         visualizador_bateria = Configurador.configurar_visualizador_bateria()
 
-        self._gestor_bateria = GestorBateria(
+        gestor_bateria = GestorBateria(
             bateria=bateria,
             proxy_bateria=proxy_bateria,
-            visualizador_bateria=visualizador_bateria
+            visualizador_bateria=visualizador_bateria,
+            antiguedad_maxima=Configurador.obtener_antiguedad_maxima_bateria(),
+            reloj=reloj,
+            bus=bus
         )
 
         # Crear dependencias para GestorAmbiente
@@ -58,11 +121,14 @@ class Lanzador:
         visualizador_temperatura = Configurador().configurar_visualizador_temperatura()
         incremento = Configurador.obtener_incremento_temperatura()
 
-        self._gestor_ambiente = GestorAmbiente(
+        gestor_ambiente = GestorAmbiente(
             ambiente=ambiente,
             proxy_sensor=proxy_sensor,
             visualizador=visualizador_temperatura,
-            incremento_temperatura=incremento
+            incremento_temperatura=incremento,
+            antiguedad_maxima=Configurador.obtener_antiguedad_maxima_temperatura(),
+            reloj=reloj,
+            bus=bus
         )
 
         # Crear dependencias para GestorClimatizador
@@ -70,31 +136,57 @@ class Lanzador:
         actuador = Configurador.configurar_actuador_climatizador()
         visualizador_climatizador = Configurador.configurar_visualizador_climatizador()
 
-        self._gestor_climatizador = GestorClimatizador(
+        gestor_climatizador = GestorClimatizador(
             climatizador=climatizador,
             actuador=actuador,
-            visualizador=visualizador_climatizador
+            visualizador=visualizador_climatizador,
+            bus=bus,
+            guarda=Configurador.configurar_guarda_actuador()
         )
+        return gestor_bateria, gestor_ambiente, gestor_climatizador
 
-        # Crear presentador y operador
-        self._presentador = Presentador(self._gestor_bateria,
-                                        self._gestor_ambiente,
-                                        self._gestor_climatizador)
-        self._operador = OperadorParalelo(self._gestor_bateria,
-                                          self._gestor_ambiente,
-                                          self._gestor_climatizador)
+    @staticmethod
+    def suscribir_salidas(bus, presentador):
+        """
+        Suscribe las salidas a los cambios de estado de los gestores.
+
+        El presentador redibuja las secciones que cambiaron (por defecto
+        a lo sumo una vez cada 5 segundos); con "eventos.bitacora" cada
+        cambio se registra en la bitacora y, con metricas, se cuentan
+        los eventos por tipo.
+
+        Args:
+            bus (BusEventos): Bus de eventos de los gestores.
+            presentador (Presentador): Presentador del estado.
+        """
+        bus.suscribir(presentador.presentar_cambios,
+                      politica=Configurador.configurar_politica_eventos("presentacion",
+                                                                        "limitada"))
+        if Configurador.obtener_bitacora_eventos():
+            bus.suscribir(RegistradorEventos().registrar,
+                          politica=Configurador.configurar_politica_eventos("bitacora"))
+        registro = Configurador.configurar_metricas()
+        if registro is not None:
+            registrar_eventos(registro, bus)
 
     def ejecutar(self):
         """
         Ejecuta el sistema de termostato.
 
-        Primero inicializa el sistema verificando los sensores.
-        Si la inicializacion es exitosa, entra en modo operacion.
+        Primero inicializa el sistema verificando los sensores en paralelo,
+        dentro de los plazos de la seccion "inicio".
+        Si la inicializacion es exitosa, entra en modo operacion. Si hay
+        metricas configuradas, el endpoint HTTP se inicia antes y SIGUSR1
+        captura un perfil cProfile de las tareas del operador.
         """
-        todo_ok = Inicializador.iniciar(self._gestor_bateria,
-                                        self._gestor_ambiente,
-                                        self._presentador)
+        if self._servidor_metricas is not None:
+            self._servidor_metricas.iniciar()
+        if self._operador.perfilador is not None:
+            self._operador.perfilador.instalar_senal()
+        todo_ok = self._inicializador.iniciar(self._gestor_bateria,
+                                              self._gestor_ambiente,
+                                              self._presentador)
 
         if todo_ok:
-            print("Entra en operacion")
+            _bitacora.info("entra en operacion")
             self._operador.ejecutar()
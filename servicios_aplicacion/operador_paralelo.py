@@ -11,11 +11,17 @@ Patron de Diseno:
 # pylint: disable=duplicate-code
 # La inicializacion es similar a operador_secuencial (patron comun aceptable)
 
-import time
+import logging
 import threading
+from contextlib import nullcontext
 
+from metricas.instrumentos import registrar_cola
+from metricas.perfilador import PerfiladorTareas
 from servicios_aplicacion.selector_entrada import SelectorEntradaTemperatura
 from servicios_aplicacion.presentador import Presentador
+from servicios_aplicacion.reloj import RelojReal
+
+_bitacora = logging.getLogger(__name__)
 
 
 class OperadorParalelo:
@@ -30,9 +36,29 @@ class OperadorParalelo:
         _gestor_bateria: Gestor de operaciones de bateria.
         _gestor_ambiente: Gestor de operaciones de ambiente.
         _gestor_climatizador: Gestor de operaciones de climatizador.
+        _modo_seteo: "sondeo" (consulta periodica) o "cola" (push por lotes).
+        _periodos (dict): Segundos de espera entre iteraciones de cada hilo.
+        _reloj (AbsReloj): Reloj sobre el que duermen los hilos.
+        _perfilador (PerfiladorTareas): Mide cada iteracion de cada tarea
+            contra su periodo, o None si no se miden metricas.
+        _estado (PublicadorEstado): Publica el estado en memoria compartida
+            tras cada iteracion que lo modifica, o None.
+        _bus (BusEventos): Bus de eventos de los gestores, o None si el
+            estado se presenta por sondeo.
     """
 
-    def __init__(self, gestor_bateria, gestor_ambiente, gestor_climatizador):
+    # Periodos por defecto de cada hilo, en segundos
+    PERIODOS = {
+        "bateria": 1,
+        "temperatura": 2,
+        "climatizador": 5,
+        "presentacion": 5,
+        "seteo": 5,
+    }
+
+    def __init__(self, gestor_bateria, gestor_ambiente, gestor_climatizador,
+                 modo_seteo="sondeo", periodos=None, reloj=None, metricas=None,
+                 perfilador=None, estado=None, bus=None):
         """
         Inicializa el operador con los gestores necesarios.
 
@@ -40,50 +66,149 @@ class OperadorParalelo:
             gestor_bateria: Gestor de bateria.
             gestor_ambiente: Gestor de ambiente.
             gestor_climatizador: Gestor de climatizador.
+            modo_seteo (str): "sondeo" consulta las entradas cada 5 segundos;
+                "cola" procesa los comandos por lotes apenas se publican.
+            periodos (dict): Periodos en segundos que reemplazan a los de
+                PERIODOS ("bateria", "temperatura", "climatizador",
+                "presentacion", "seteo"). Las claves ausentes conservan
+                su valor por defecto.
+            reloj (AbsReloj): Reloj de las esperas (por defecto RelojReal).
+                Con un RelojVirtual los hilos se intercalan en tiempo
+                simulado.
+            metricas (RegistroMetricas): Registro donde publicar la
+                profundidad de la cola de comandos y, si no se indica
+                perfilador, donde crear uno. None no mide.
+            perfilador (PerfiladorTareas): Perfilador de las iteraciones
+                (tiempo de pared, CPU, bloqueo y vencimientos por tarea).
+            estado (PublicadorEstado): Publicador del estado compartido
+                con otros procesos. None no publica.
+            bus (BusEventos): Bus donde los gestores publican sus cambios.
+                Con bus, el hilo de presentacion solo despacha las
+                entregas limitadas y por lotes vencidas; sin bus, muestra
+                todo el estado en cada periodo.
         """
         self._gestor_bateria = gestor_bateria
         self._gestor_ambiente = gestor_ambiente
         self._gestor_climatizador = gestor_climatizador
-        self._selector = SelectorEntradaTemperatura(self._gestor_ambiente)
+        self._modo_seteo = modo_seteo
+        self._periodos = dict(self.PERIODOS, **(periodos or {}))
+        self._reloj = reloj if reloj is not None else RelojReal()
+        self._selector = SelectorEntradaTemperatura(
+            self._gestor_ambiente,
+            gestor_climatizador=self._gestor_climatizador,
+            reloj=self._reloj
+        )
         self._presentador = Presentador(self._gestor_bateria,
                                         self._gestor_ambiente,
                                         self._gestor_climatizador)
+        self._perfilador = perfilador
+        self._estado = estado
+        self._bus = bus
+        if metricas is not None:
+            if perfilador is None:
+                self._perfilador = PerfiladorTareas(metricas)
+            registrar_cola(metricas, "comandos", lambda: self._selector.pendientes)
+
+    @property
+    def perfilador(self):
+        """PerfiladorTareas: Perfilador de las tareas, o None si no se mide."""
+        return self._perfilador
+
+    def _medir(self, tarea):
+        """Contexto que perfila una iteracion de la tarea (si hay perfilador)."""
+        if self._perfilador is None:
+            return nullcontext()
+        return self._perfilador.medir(tarea, self._periodos[tarea])
+
+    def _publicar_estado(self):
+        """Publica el estado en memoria compartida (si hay publicador)."""
+        if self._estado is not None:
+            self._estado.publicar()
 
     def lee_carga_bateria(self):
-        """Lee periodicamente la carga de bateria (cada 1 segundo)."""
+        """Lee periodicamente la carga de bateria (por defecto cada 1 segundo)."""
         while True:
-            print("lee_bateria")
-            self._gestor_bateria.verificar_nivel_de_carga()
-            time.sleep(1)
+            _bitacora.debug("lee bateria")
+            with self._medir("bateria"):
+                self._gestor_bateria.verificar_nivel_de_carga()
+                self._publicar_estado()
+            self._reloj.sleep(self._periodos["bateria"])
 
     def lee_temperatura_ambiente(self):
-        """Lee periodicamente la temperatura ambiente (cada 2 segundos)."""
+        """Lee periodicamente la temperatura ambiente (por defecto cada 2 segundos)."""
         while True:
-            print("lee temperatura")
-            self._gestor_ambiente.leer_temperatura_ambiente()
-            time.sleep(2)
+            _bitacora.debug("lee temperatura")
+            with self._medir("temperatura"):
+                self._gestor_ambiente.leer_temperatura_ambiente()
+                self._publicar_estado()
+            self._reloj.sleep(self._periodos["temperatura"])
 
     def acciona_climatizador(self):
-        """Acciona periodicamente el climatizador (cada 5 segundos)."""
+        """
+        Acciona periodicamente el climatizador (por defecto cada 5 segundos).
+
+        Omite la evaluacion si la lectura de temperatura no esta vigente
+        (sin lecturas o mas antigua que la antiguedad maxima) o si las
+        temperaturas ambiente y deseada no cambiaron desde la ultima
+        evaluacion resuelta (una orden retenida por la guarda se reevalua).
+        """
+        ultimas_temperaturas = None
         while True:
-            print("acciona climatizador")
-            self._gestor_climatizador.accionar_climatizador(
-                self._gestor_ambiente.ambiente
-            )
-            time.sleep(5)
+            _bitacora.debug("acciona climatizador")
+            with self._medir("climatizador"):
+                estado = self._gestor_ambiente.obtener_instantanea()
+                temperaturas = (estado.temperatura_ambiente, estado.temperatura_deseada)
+                if (self._gestor_ambiente.temperatura_vigente()
+                        and temperaturas != ultimas_temperaturas):
+                    if self._gestor_climatizador.accionar_climatizador(
+                            self._gestor_ambiente.ambiente):
+                        ultimas_temperaturas = temperaturas
+                    self._publicar_estado()
+            self._reloj.sleep(self._periodos["climatizador"])
 
     def muestra_parametros(self):
-        """Muestra periodicamente los parametros del sistema (cada 5 segundos)."""
+        """
+        Muestra periodicamente los parametros del sistema (por defecto cada 5 segundos).
+
+        Con bus de eventos no sondea a los gestores: entrega a los
+        suscriptores los cambios retenidos cuyo intervalo vencio.
+        """
         while True:
-            self._presentador.ejecutar()
-            time.sleep(5)
+            with self._medir("presentacion"):
+                if self._bus is not None:
+                    self._bus.despachar()
+                else:
+                    self._presentador.ejecutar()
+            self._reloj.sleep(self._periodos["presentacion"])
 
     def setea_temperatura(self):
-        """Procesa periodicamente el seteo de temperatura (cada 5 segundos)."""
+        """
+        Procesa el seteo de temperatura.
+
+        En modo "cola" procesa los comandos por lotes a medida que llegan;
+        si no, sondea periodicamente (por defecto cada 5 segundos).
+        """
+        if self._modo_seteo == "cola":
+            self._setea_temperatura_por_lotes()
+        else:
+            self._setea_temperatura_periodica()
+
+    def _setea_temperatura_periodica(self):
+        """Sondea el selector y el seteo de temperatura cada periodo de seteo."""
+        while True:
+            _bitacora.debug("ve si setea temperatura")
+            with self._medir("seteo"):
+                self._selector.ejecutar()
+                self._publicar_estado()
+            self._reloj.sleep(self._periodos["seteo"])
+
+    def _setea_temperatura_por_lotes(self):
+        """Procesa los comandos de seteo por lotes a medida que llegan."""
+        self._selector.iniciar_fuentes()
         while True:
-            print("ve si setea temperatura")
-            self._selector.ejecutar()
-            time.sleep(5)
+            # No se cronometra: cada lote incluye la espera del primer comando
+            self._selector.ejecutar_cola()
+            self._publicar_estado()
 
     def ejecutar(self):
         """
@@ -91,17 +216,33 @@ class OperadorParalelo:
 
         Crea e inicia 5 hilos para: lectura de bateria, lectura de
         temperatura, accionamiento de climatizador, visualizacion
-        y seteo de temperatura.
+        y seteo de temperatura. Los hilos periodicos se registran en el
+        reloj antes de arrancar, para que un RelojVirtual los espere.
         """
-        print("inicio")
-
-        hilos = [
-            threading.Thread(target=self.lee_carga_bateria),
-            threading.Thread(target=self.lee_temperatura_ambiente),
-            threading.Thread(target=self.acciona_climatizador),
-            threading.Thread(target=self.muestra_parametros),
-            threading.Thread(target=self.setea_temperatura),
-        ]
+        _bitacora.info("inicio de la operacion paralela (seteo por %s)", self._modo_seteo)
 
+        periodicas = [
+            self.lee_carga_bateria,
+            self.lee_temperatura_ambiente,
+            self.acciona_climatizador,
+            self.muestra_parametros,
+        ]
+        if self._modo_seteo != "cola":
+            periodicas.append(self.setea_temperatura)
+        hilos = [threading.Thread(target=self._en_reloj, args=(operacion,))
+                 for operacion in periodicas]
+        if self._modo_seteo == "cola":
+            # Procesa los comandos apenas llegan: no duerme sobre el reloj
+            hilos.append(threading.Thread(target=self.setea_temperatura))
+
+        for _ in periodicas:
+            self._reloj.unir()
         for hilo in hilos:
             hilo.start()
+
+    def _en_reloj(self, operacion):
+        """Ejecuta una operacion periodica y la da de baja del reloj al terminar."""
+        try:
+            operacion()
+        finally:
+            self._reloj.abandonar()
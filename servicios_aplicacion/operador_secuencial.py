@@ -10,10 +10,13 @@ Patron de Diseno:
 # pylint: disable=duplicate-code
 # La inicializacion es similar a operador_paralelo (patron comun aceptable)
 
-import time
-from os import system
+import logging
+
 from servicios_aplicacion.selector_entrada import SelectorEntradaTemperatura
 from servicios_aplicacion.presentador import Presentador
+from servicios_aplicacion.reloj import RelojReal
+
+_bitacora = logging.getLogger(__name__)
 
 
 # pylint: disable=too-few-public-methods
@@ -28,9 +31,10 @@ class OperadorSecuencial:
         _gestor_bateria: Gestor de operaciones de bateria.
         _gestor_ambiente: Gestor de operaciones de ambiente.
         _gestor_climatizador: Gestor de operaciones de climatizador.
+        _reloj (AbsReloj): Reloj de las esperas entre operaciones.
     """
 
-    def __init__(self, gestor_bateria, gestor_ambiente, gestor_climatizador):
+    def __init__(self, gestor_bateria, gestor_ambiente, gestor_climatizador, reloj=None):
         """
         Inicializa el operador con los gestores necesarios.
 
@@ -38,11 +42,13 @@ class OperadorSecuencial:
             gestor_bateria: Gestor de bateria.
             gestor_ambiente: Gestor de ambiente.
             gestor_climatizador: Gestor de climatizador.
+            reloj (AbsReloj): Reloj de las esperas (por defecto RelojReal).
         """
         self._gestor_bateria = gestor_bateria
         self._gestor_ambiente = gestor_ambiente
         self._gestor_climatizador = gestor_climatizador
-        self._selector = SelectorEntradaTemperatura(self._gestor_ambiente)
+        self._reloj = reloj if reloj is not None else RelojReal()
+        self._selector = SelectorEntradaTemperatura(self._gestor_ambiente, reloj=self._reloj)
         self._presentador = Presentador(self._gestor_bateria,
                                         self._gestor_ambiente,
                                         self._gestor_climatizador)
@@ -54,31 +60,31 @@ class OperadorSecuencial:
         Ciclo infinito que lee sensores, procesa entradas del usuario,
         acciona el climatizador y muestra el estado del sistema.
         """
-        print("Inicio")
+        _bitacora.info("inicio de la operacion secuencial")
         self._gestor_ambiente.ambiente.temperatura_deseada = 24
 
         # Ciclo infinito de operaciones del termostato
         while True:
-            print("lee_bateria")
+            _bitacora.debug("lee bateria")
 
             self._gestor_bateria.verificar_nivel_de_carga()
-            time.sleep(1)
+            self._reloj.sleep(1)
 
-            print("lee temperatura")
+            _bitacora.debug("lee temperatura")
             self._gestor_ambiente.leer_temperatura_ambiente()
-            time.sleep(1)
+            self._reloj.sleep(1)
 
-            print("revisa selector de temperatura")
+            _bitacora.debug("revisa selector de temperatura")
             self._selector.ejecutar()
-            time.sleep(1)
+            self._reloj.sleep(1)
 
-            print("acciona climatizador")
+            _bitacora.debug("acciona climatizador")
             self._gestor_climatizador.accionar_climatizador(self._gestor_ambiente.ambiente)
-            time.sleep(1)
+            self._reloj.sleep(1)
 
-            print("Muestra estado del termostato")
+            _bitacora.debug("muestra estado del termostato")
             self._presentador.ejecutar()
-            time.sleep(5)
+            self._reloj.sleep(5)
 
-            system("clear")
+            self._presentador.terminal.limpiar()
         # FIN DEL BUCLE
@@ -4,9 +4,18 @@ Presentador del sistema de termostato.
 Este modulo contiene la clase responsable de mostrar los parametros
 del sistema al usuario (bateria, temperatura, climatizador).
 
+Con un bus de eventos, el presentador se suscribe con
+presentar_cambios() y solo redibuja las secciones que cambiaron.
+
 Patron de Diseno:
     - Facade: Simplifica la visualizacion de multiples componentes
+    - Observer: presentar_cambios() reacciona a los eventos de los gestores
 """
+from eventos.tipos import (
+    CambioBateria, CambioClimatizador, CambioTemperaturaAMostrar, CambioTemperaturaAmbiente,
+    CambioTemperaturaDeseada,
+)
+from servicios_aplicacion.terminal import TerminalAnsi
 
 
 # pylint: disable=too-few-public-methods
@@ -21,9 +30,26 @@ class Presentador:
         _gestor_bateria: Gestor de bateria para mostrar nivel e indicador.
         _gestor_ambiente: Gestor de ambiente para mostrar temperatura.
         _gestor_climatizador: Gestor de climatizador para mostrar estado.
+        _terminal (TerminalAnsi): Consola donde se escriben los encabezados.
+        _mostrar (dict): Metodo que muestra los valores de cada seccion.
     """
 
-    def __init__(self, gestor_bateria, gestor_ambiente, gestor_climatizador):
+    # Titulos de las secciones, en orden
+    SECCIONES = ("BATERIA", "TEMPERATURA", "CLIMATIZADOR")
+
+    # Separador al pie de cada seccion
+    SEPARADOR = "-" * 36
+
+    # Seccion que redibuja cada tipo de evento
+    SECCION_EVENTO = {
+        CambioBateria: "BATERIA",
+        CambioTemperaturaAmbiente: "TEMPERATURA",
+        CambioTemperaturaDeseada: "TEMPERATURA",
+        CambioTemperaturaAMostrar: "TEMPERATURA",
+        CambioClimatizador: "CLIMATIZADOR",
+    }
+
+    def __init__(self, gestor_bateria, gestor_ambiente, gestor_climatizador, terminal=None):
         """
         Inicializa el presentador con los gestores necesarios.
 
@@ -31,23 +57,57 @@ class Presentador:
             gestor_bateria: Gestor de bateria.
             gestor_ambiente: Gestor de ambiente.
             gestor_climatizador: Gestor de climatizador.
+            terminal (TerminalAnsi): Consola de los encabezados (por
+                defecto sobre sys.stdout).
         """
         self._gestor_bateria = gestor_bateria
         self._gestor_ambiente = gestor_ambiente
         self._gestor_climatizador = gestor_climatizador
+        self._terminal = terminal if terminal is not None else TerminalAnsi()
+        self._mostrar = {
+            "BATERIA": self._mostrar_bateria,
+            "TEMPERATURA": gestor_ambiente.mostrar_temperatura,
+            "CLIMATIZADOR": gestor_climatizador.mostrar_estado_climatizador,
+        }
+
+    @property
+    def terminal(self):
+        """TerminalAnsi: Consola donde se presenta el estado."""
+        return self._terminal
 
     def ejecutar(self):
-        """Muestra todos los parametros del sistema en consola."""
-        print("-------------- BATERIA -------------")
+        """
+        Muestra todos los parametros del sistema en consola.
+
+        Los valores los escriben los visualizadores; los encabezados se
+        vuelcan antes de cada seccion para que queden intercalados.
+        """
+        self._mostrar_secciones(self.SECCIONES)
+
+    def presentar_cambios(self, eventos):
+        """
+        Muestra solo las secciones afectadas por los eventos recibidos.
+
+        Manejador para BusEventos.suscribir(): los valores se toman de
+        los gestores, por lo que siempre se muestra el estado vigente.
+
+        Args:
+            eventos (list): Eventos de cambio (ver eventos.tipos).
+        """
+        cambiadas = {self.SECCION_EVENTO.get(type(evento)) for evento in eventos}
+        self._mostrar_secciones([titulo for titulo in self.SECCIONES if titulo in cambiadas])
+
+    def _mostrar_secciones(self, titulos):
+        """Muestra las secciones indicadas, en orden."""
+        for titulo in titulos:
+            self._terminal.titulo(titulo)
+            self._terminal.volcar()
+            self._mostrar[titulo]()
+            self._terminal.escribir(self.SEPARADOR)
+            self._terminal.escribir()
+        self._terminal.volcar()
+
+    def _mostrar_bateria(self):
+        """Muestra nivel e indicador de carga."""
         self._gestor_bateria.mostrar_nivel_de_carga()
         self._gestor_bateria.mostrar_indicador_de_carga()
-        print("------------------------------------")
-        print("\n")
-        print("------------ TEMPERATURA ----------")
-        self._gestor_ambiente.mostrar_temperatura()
-        print("------------------------------------")
-        print("\n")
-        print("------------ CLIMATIZADOR ----------")
-        self._gestor_climatizador.mostrar_estado_climatizador()
-        print("------------------------------------")
-        print("\n")
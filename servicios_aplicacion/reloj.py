@@ -0,0 +1,255 @@
+"""
+Relojes para las esperas y marcas de tiempo del termostato.
+
+Los operadores, el selector de entrada y los agentes no llaman
+directamente a time.sleep() ni a datetime.datetime.now(): reciben un
+reloj por constructor. Este modulo contiene las implementaciones:
+
+    - RelojReal: tiempo del sistema (time.sleep, datetime.now).
+    - RelojMonotono: esperas reales, pero las fechas se derivan de
+      time.monotonic() desde la creacion, por lo que no saltan si se
+      ajusta la hora del sistema (NTP, cambio manual).
+    - RelojVirtual: tiempo simulado que solo avanza cuando alguien
+      "duerme" sobre el, tan rapido como sea posible o a una velocidad
+      fija respecto del tiempo real.
+
+Patron de Diseno:
+    - Strategy: Los componentes dependen de AbsReloj, no de time
+    - Test Double (Fake): RelojVirtual reemplaza al tiempo real
+"""
+import datetime
+import heapq
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+
+
+class AbsReloj(metaclass=ABCMeta):
+    """
+    Interfaz de reloj: instante monotono, espera y fecha/hora actual.
+
+    Los relojes que coordinan varios hilos (RelojVirtual) necesitan
+    saber cuantos hilos duermen sobre ellos; unir() y abandonar() se
+    lo indican y en los relojes reales no hacen nada.
+    """
+
+    @abstractmethod
+    def monotonic(self):
+        """Retorna segundos monotonos (solo sirven para medir intervalos)."""
+
+    @abstractmethod
+    def sleep(self, segundos):
+        """Espera segundos (negativo o cero no espera)."""
+
+    @abstractmethod
+    def ahora(self):
+        """Retorna la fecha y hora actual (datetime.datetime)."""
+
+    def unir(self):
+        """Registra un hilo que dormira periodicamente sobre el reloj."""
+
+    def abandonar(self):
+        """Da de baja un hilo registrado con unir()."""
+
+
+class RelojReal(AbsReloj):
+    """Reloj del sistema: time.monotonic(), time.sleep() y datetime.now()."""
+
+    def monotonic(self):
+        """Retorna time.monotonic()."""
+        return time.monotonic()
+
+    def sleep(self, segundos):
+        """Duerme segundos de tiempo real (negativo o cero no espera)."""
+        if segundos > 0:
+            time.sleep(segundos)
+
+    def ahora(self):
+        """Retorna datetime.datetime.now()."""
+        return datetime.datetime.now()
+
+
+class RelojMonotono(RelojReal):
+    """
+    Reloj real cuyas fechas no saltan con los ajustes de hora del sistema.
+
+    Toma la fecha del sistema una sola vez, al crearse, y a partir de
+    ahi la avanza con time.monotonic().
+    """
+
+    def __init__(self):
+        """Fija la fecha de referencia con la hora actual del sistema."""
+        self._fecha_referencia = datetime.datetime.now()
+        self._monotonic_referencia = time.monotonic()
+
+    def ahora(self):
+        """Retorna la fecha de referencia mas el tiempo monotono transcurrido."""
+        transcurrido = time.monotonic() - self._monotonic_referencia
+        return self._fecha_referencia + datetime.timedelta(seconds=transcurrido)
+
+
+class RelojVirtual(AbsReloj):
+    """
+    Reloj monotono de tiempo simulado.
+
+    Sin hilos registrados, sleep(segundos) adelanta la hora virtual de
+    inmediato. Con hilos registrados (unir), el reloj avanza por
+    eventos discretos: cada sleep() bloquea hasta que la hora virtual
+    alcanza su despertar, y la hora solo salta al despertar mas proximo
+    cuando todos los hilos registrados estan dormidos. Asi varios hilos
+    periodicos (por ejemplo los del OperadorParalelo) se intercalan
+    igual que en tiempo real, sin esperar. Un sleep(0) de un hilo
+    registrado cede el turno: el hilo duerme hasta el proximo salto del
+    reloj, de modo que un hilo de periodo cero no detiene a los demas.
+
+    Con velocidad None el avance es instantaneo; con velocidad v ademas
+    espera (salto / v) de tiempo real (1 = tiempo real, 60 = un minuto
+    virtual por segundo).
+
+    Args:
+        inicio (float): Hora virtual inicial en segundos.
+        velocidad (float): Factor respecto del tiempo real, o None para
+            avanzar tan rapido como sea posible.
+        fecha_inicio (datetime.datetime): Fecha que corresponde a la hora
+            virtual inicio (por defecto, la fecha actual del sistema).
+
+    Raises:
+        ValueError: Si velocidad no es None ni > 0.
+    """
+
+    def __init__(self, inicio=0.0, velocidad=None, fecha_inicio=None):
+        """
+        Inicializa el reloj en la hora virtual inicio.
+
+        Args:
+            inicio (float): Hora virtual inicial en segundos.
+            velocidad (float): Factor respecto del tiempo real, o None.
+            fecha_inicio (datetime.datetime): Fecha de la hora virtual inicio.
+
+        Raises:
+            ValueError: Si velocidad no es None ni > 0.
+        """
+        if velocidad is not None and velocidad <= 0:
+            raise ValueError("velocidad debe ser > 0, recibido: {}".format(velocidad))
+        self._inicio = inicio
+        self._ahora = inicio
+        self._velocidad = velocidad
+        self._fecha_inicio = fecha_inicio or datetime.datetime.now()
+        self._condicion = threading.Condition()
+        self._participantes = 0
+        self._despertares = []
+        self._saltos = 0
+        self._avanzando = False
+
+    @property
+    def velocidad(self):
+        """float: Factor respecto del tiempo real (None = sin esperas reales)."""
+        return self._velocidad
+
+    @property
+    def participantes(self):
+        """int: Hilos registrados con unir()."""
+        return self._participantes
+
+    def monotonic(self):
+        """
+        Retorna la hora virtual actual.
+
+        Returns:
+            float: Segundos virtuales.
+        """
+        return self._ahora
+
+    def ahora(self):
+        """
+        Retorna la fecha virtual actual.
+
+        Returns:
+            datetime.datetime: fecha_inicio mas los segundos virtuales transcurridos.
+        """
+        return self._fecha_inicio + datetime.timedelta(seconds=self._ahora - self._inicio)
+
+    def sleep(self, segundos):
+        """
+        Duerme segundos virtuales.
+
+        Sin hilos registrados, negativo o cero no hace nada; con hilos
+        registrados, cede el turno hasta el proximo salto del reloj.
+
+        Args:
+            segundos (float): Segundos virtuales a dormir.
+        """
+        if not self._participantes:
+            if segundos <= 0:
+                return
+            if self._velocidad is not None:
+                time.sleep(segundos / self._velocidad)
+            with self._condicion:
+                self._ahora += segundos
+            return
+        with self._condicion:
+            saltos = self._saltos
+            despertar = self._ahora + max(segundos, 0)
+            heapq.heappush(self._despertares, despertar)
+            self._avanzar_si_todos_duermen()
+            while self._ahora < despertar or self._saltos == saltos:
+                self._condicion.wait()
+
+    def avanzar_hasta(self, instante):
+        """
+        Duerme hasta la hora virtual instante (si ya paso, no hace nada).
+
+        Args:
+            instante (float): Hora virtual de destino.
+        """
+        self.sleep(instante - self._ahora)
+
+    def unir(self):
+        """Registra un hilo; desde ahora el reloj espera a que duerma para avanzar."""
+        with self._condicion:
+            self._participantes += 1
+
+    def abandonar(self):
+        """Da de baja un hilo registrado (por ejemplo al terminar su bucle)."""
+        with self._condicion:
+            self._participantes = max(self._participantes - 1, 0)
+            self._avanzar_si_todos_duermen()
+
+    def _avanzar_si_todos_duermen(self):
+        """
+        Salta al despertar mas proximo si todos los hilos duermen.
+
+        Mientras haya hilos registrados, todo hilo que duerma sobre el
+        reloj debe estar registrado. Los hilos que ceden el turno
+        (despertar igual a la hora actual) se despiertan en el salto al
+        proximo despertar posterior, o sin avanzar si todos ceden.
+
+        Se llama con la condicion tomada. Con velocidad, la espera real
+        se hace con la condicion, que libera el lock; mientras tanto un
+        solo hilo avanza el reloj y, al volver, revisa si sigue
+        correspondiendo saltar.
+        """
+        if self._avanzando:
+            return
+        self._avanzando = True
+        objetivo = limite = None
+        try:
+            while self._despertares and len(self._despertares) >= self._participantes:
+                proximo = min((despertar for despertar in self._despertares
+                               if despertar > self._ahora), default=self._ahora)
+                if self._velocidad is not None:
+                    if proximo != objetivo:
+                        objetivo = proximo
+                        limite = time.monotonic() + (proximo - self._ahora) / self._velocidad
+                    restante = limite - time.monotonic()
+                    if restante > 0:
+                        self._condicion.wait(restante)
+                        continue
+                while self._despertares and self._despertares[0] <= proximo:
+                    heapq.heappop(self._despertares)
+                self._ahora = proximo
+                self._saltos += 1
+                objetivo = None
+                self._condicion.notify_all()
+        finally:
+            self._avanzando = False
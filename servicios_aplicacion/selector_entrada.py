@@ -6,11 +6,20 @@ del usuario para establecer la temperatura deseada.
 
 Patron de Diseno:
     - Controller (GRASP): Coordina la interaccion de seteo de temperatura
+    - Producer/Consumer: En modo cola las fuentes publican comandos en una
+      cola thread-safe que el selector drena y agrupa por lotes
 """
+import logging
+import queue
+import threading
+import time
+
 from configurador.configurador import Configurador
+from servicios_aplicacion.reloj import RelojReal
+
+_bitacora = logging.getLogger(__name__)
 
 
-# pylint: disable=too-few-public-methods
 class SelectorEntradaTemperatura:
     """
     Selector para establecer la temperatura deseada.
@@ -22,29 +31,60 @@ class SelectorEntradaTemperatura:
         _seteo_temperatura: Componente para obtener comandos de seteo.
         _selector_temperatura: Selector de modo de visualizacion.
         _gestor_ambiente: Gestor de ambiente para aplicar cambios.
+        _intervalo_sondeo: Espera entre consultas cuando no hay comandos.
+        _gestor_climatizador: Gestor a reevaluar tras cada lote (modo cola).
+        _cola_comandos (queue.Queue): Comandos publicados por las fuentes.
+        _reloj (AbsReloj): Reloj de la espera entre consultas.
     """
 
-    def __init__(self, gestor_ambiente):
+    MODOS = ("ambiente", "deseada")
+
+    @property
+    def pendientes(self):
+        """int: Comandos publicados en la cola que todavia no se procesaron."""
+        return self._cola_comandos.qsize()
+
+    def __init__(self, gestor_ambiente, intervalo_sondeo=0.05, gestor_climatizador=None,
+                 reloj=None):
         """
         Inicializa el selector con el gestor de ambiente.
 
         Args:
             gestor_ambiente: Gestor de ambiente para aplicar cambios.
+            intervalo_sondeo (float): Segundos de espera entre consultas
+                cuando las fuentes no bloqueantes no tienen comandos.
+                Por defecto 50 ms.
+            gestor_climatizador: Gestor de climatizador opcional. En modo
+                cola se reevalua una vez por lote si cambio el setpoint.
+            reloj (AbsReloj): Reloj de la espera entre consultas (por
+                defecto RelojReal).
         """
         self._seteo_temperatura = Configurador.configurar_seteo_temperatura()
         self._selector_temperatura = Configurador.configurar_selector_temperatura()
         self._gestor_ambiente = gestor_ambiente
+        self._intervalo_sondeo = intervalo_sondeo
+        self._gestor_climatizador = gestor_climatizador
+        self._cola_comandos = queue.Queue()
+        self._ultimo_modo_publicado = None
+        self._reloj = reloj if reloj is not None else RelojReal()
 
     def ejecutar(self):
         """
         Ejecuta el ciclo de seteo de temperatura.
 
-        Mientras el selector este en modo "deseada", muestra la temperatura
-        deseada y procesa los comandos del usuario para ajustarla.
+        Mientras el selector este en modo "deseada", procesa los comandos
+        del usuario y muestra la temperatura deseada solo al entrar en el
+        modo o cuando cambia. Si no hay comandos pendientes espera
+        intervalo_sondeo para no consumir CPU en vacio; si los hay, los
+        procesa uno tras otro sin esperar.
         """
+        mostrar = True
         while self._selector_temperatura.obtener_selector() == "deseada":
-            self._mostrar_temperatura_deseada()
-            self._obtener_seteo_temperatura_deseada()
+            if mostrar:
+                self._mostrar_temperatura_deseada()
+            mostrar = self._obtener_seteo_temperatura_deseada()
+            if not mostrar:
+                self._reloj.sleep(self._intervalo_sondeo)
         self._gestor_ambiente.indicar_temperatura_a_mostrar("ambiente")
 
     def _mostrar_temperatura_deseada(self):
@@ -53,13 +93,129 @@ class SelectorEntradaTemperatura:
         self._gestor_ambiente.mostrar_temperatura()
 
     def _obtener_seteo_temperatura_deseada(self):
-        """Obtiene y procesa el comando de seteo del usuario."""
-        opcion = self._seteo_temperatura.obtener_seteo()
+        """
+        Obtiene y procesa el comando de seteo del usuario.
 
-        if opcion is None:
-            return
+        Returns:
+            bool: True si se aplico un comando, False si no habia ninguno.
+        """
+        opcion = self._seteo_temperatura.obtener_seteo()
 
         if opcion == "aumentar":
             self._gestor_ambiente.aumentar_temperatura_deseada()
-        elif opcion == "disminuir":
+            return True
+        if opcion == "disminuir":
             self._gestor_ambiente.disminuir_temperatura_deseada()
+            return True
+        return False
+
+    def encolar_comando(self, comando):
+        """
+        Publica un comando en la cola (thread-safe).
+
+        Args:
+            comando (str): 'aumentar', 'disminuir', 'ambiente' o 'deseada'.
+        """
+        self._cola_comandos.put(comando)
+
+    def iniciar_fuentes(self):
+        """
+        Inicia los hilos productores que publican en la cola de comandos.
+
+        Cada fuente (seteo y selector) corre en su propio hilo daemon
+        llamando a su metodo escuchar(), que en las fuentes socket espera
+        eventos sin sondear.
+        """
+        productores = [
+            (self._seteo_temperatura, self.encolar_comando),
+            (self._selector_temperatura, self._encolar_modo),
+        ]
+        for fuente, destino in productores:
+            hilo = threading.Thread(target=self._alimentar_cola,
+                                    args=(fuente, destino),
+                                    daemon=True)
+            hilo.start()
+
+    def ejecutar_cola(self, timeout=None):
+        """
+        Procesa un lote de comandos de la cola (modo push).
+
+        Espera hasta timeout segundos el primer comando, drena el resto
+        de la cola y los agrupa: los cambios de modo se aplican en orden
+        y los ajustes solo cuentan mientras el modo es "deseada", de modo
+        que cinco "aumentar" resultan en un unico ajuste de +5 pasos. Si
+        el setpoint cambia, el climatizador se reevalua una sola vez.
+
+        Args:
+            timeout (float): Espera maxima en segundos; None espera sin limite.
+
+        Returns:
+            int: Cantidad de comandos procesados en el lote (0 si timeout).
+        """
+        comandos = self._drenar_cola(timeout)
+        if not comandos:
+            return 0
+
+        modo_inicial = self._gestor_ambiente.ambiente.temperatura_a_mostrar
+        modo, pasos = self._agrupar_comandos(comandos, modo_inicial)
+
+        if modo != modo_inicial:
+            self._gestor_ambiente.indicar_temperatura_a_mostrar(modo)
+        self._gestor_ambiente.ajustar_temperatura_deseada(pasos)
+
+        if modo == "deseada" and (pasos or modo != modo_inicial):
+            self._gestor_ambiente.mostrar_temperatura()
+        if pasos and self._gestor_climatizador is not None:
+            self._gestor_climatizador.accionar_climatizador(self._gestor_ambiente.ambiente)
+        return len(comandos)
+
+    def _drenar_cola(self, timeout):
+        """Retorna todos los comandos disponibles, esperando por el primero."""
+        try:
+            comandos = [self._cola_comandos.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                comandos.append(self._cola_comandos.get_nowait())
+            except queue.Empty:
+                return comandos
+
+    def _agrupar_comandos(self, comandos, modo):
+        """
+        Agrupa una secuencia de comandos en (modo final, pasos netos).
+
+        Args:
+            comandos (list): Comandos en orden de llegada.
+            modo (str): Modo vigente antes del lote.
+
+        Returns:
+            tuple: (modo final, pasos netos de ajuste del setpoint).
+        """
+        pasos = 0
+        for comando in comandos:
+            if comando in self.MODOS:
+                modo = comando
+            elif modo == "deseada":
+                if comando == "aumentar":
+                    pasos += 1
+                elif comando == "disminuir":
+                    pasos -= 1
+        return modo, pasos
+
+    def _encolar_modo(self, modo):
+        """Publica el modo solo si difiere del ultimo publicado."""
+        if modo != self._ultimo_modo_publicado:
+            self._ultimo_modo_publicado = modo
+            self.encolar_comando(modo)
+
+    def _alimentar_cola(self, fuente, destino):
+        """Bucle de un hilo productor: escucha la fuente indefinidamente."""
+        while True:
+            try:
+                fuente.escuchar(destino, timeout=self._intervalo_sondeo)
+            except (OSError, ValueError) as e:
+                _bitacora.warning("error en fuente de comandos: %s", e)
+                # Reintento ante un error de E/S real: no duerme sobre el reloj,
+                # cuyo tiempo simulado solo avanzan los hilos del operador
+                time.sleep(self._intervalo_sondeo)
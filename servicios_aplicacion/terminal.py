@@ -0,0 +1,80 @@
+"""
+Terminal de texto del termostato.
+
+Redibuja la pantalla con secuencias de escape ANSI en lugar de ejecutar
+el comando "clear" (que lanza un shell en cada ciclo). Las lineas se
+escriben directo sobre el flujo (con su propio buffer) y volcar() las
+envia de una vez; los encabezados se arman una sola vez y se reutilizan.
+
+Patron de Diseno:
+    - Adapter: Expone la consola como cuadros que se redibujan
+"""
+import sys
+
+
+class TerminalAnsi:
+    """
+    Consola que se redibuja con secuencias ANSI.
+
+    Si la salida no es una terminal (archivo, tuberia) no escribe
+    secuencias de escape: cada cuadro se agrega al final.
+
+    Args:
+        salida: Flujo de texto destino (por defecto sys.stdout).
+    """
+
+    # Cursor al inicio y borrado de la pantalla
+    LIMPIAR = "\x1b[H\x1b[2J"
+
+    def __init__(self, salida=None):
+        self._salida = salida
+        # Encabezados ya armados: titulo -> (ancho, encabezado)
+        self._titulos = {}
+
+    @property
+    def salida(self):
+        """Flujo destino (sys.stdout se resuelve en cada uso)."""
+        return self._salida if self._salida is not None else sys.stdout
+
+    @property
+    def es_terminal(self):
+        """bool: True si la salida es una terminal interactiva."""
+        return getattr(self.salida, "isatty", lambda: False)()
+
+    def limpiar(self):
+        """Borra la pantalla y deja el cursor arriba (reemplaza a "clear")."""
+        if self.es_terminal:
+            self.salida.write(self.LIMPIAR)
+            self.salida.flush()
+
+    def escribir(self, linea=""):
+        """
+        Agrega una linea al cuadro en curso.
+
+        Args:
+            linea (str): Texto sin salto de linea final.
+        """
+        salida = self.salida
+        if linea:
+            salida.write(linea)
+        salida.write("\n")
+
+    def titulo(self, texto, ancho=36):
+        """
+        Agrega un encabezado de seccion centrado entre guiones.
+
+        El encabezado se arma la primera vez y luego se reutiliza.
+
+        Args:
+            texto (str): Titulo de la seccion.
+            ancho (int): Ancho total del encabezado.
+        """
+        armado = self._titulos.get(texto)
+        if armado is None or armado[0] != ancho:
+            encabezado = " {} ".format(texto).center(ancho, "-") + "\n"
+            armado = self._titulos[texto] = (ancho, encabezado)
+        self.salida.write(armado[1])
+
+    def volcar(self):
+        """Envia las lineas escritas (vacia el buffer del flujo)."""
+        self.salida.flush()
@@ -34,13 +34,19 @@ setup(
             'agentes_sensores*',
             'agentes_actuadores*',
             'configurador*',
-            'registrador*'
+            'registrador*',
+            'hal*',
+            'trazas*',
+            'metricas*',
+            'estado_compartido*',
+            'eventos*',
+            'zonas*'
         ],
         exclude=['Test*', 'actores_externos*', 'docs*']
     ),
 
     # Módulos Python individuales (no en paquetes)
-    py_modules=['ejecutar'],
+    py_modules=['ejecutar', 'ejecutar_zonas'],
 
     # Archivos de datos
     package_data={
@@ -51,6 +57,7 @@ setup(
     entry_points={
         'console_scripts': [
             'termostato=ejecutar:main',
+            'termostato-zonas=ejecutar_zonas:main',
         ],
     },
 
@@ -0,0 +1,9 @@
+"""
+Paquete de grabacion y reproduccion de trazas de entradas.
+
+Permite grabar todas las entradas del termostato en ejecucion y
+reproducirlas despues de forma determinista:
+    - traza: Formato binario compacto, GrabadorTraza y leer_traza
+    - grabadores: Decoradores de proxies que graban lo que leen
+    - reproductor: ReproductorTraza sobre un RelojVirtual
+"""
@@ -0,0 +1,243 @@
+"""
+Decoradores que graban en una traza las entradas que leen.
+
+Cada grabador envuelve al proxy real (socket, archivo, HAL) con su
+misma interfaz y registra en un GrabadorTraza cada valor que entrega,
+de modo que el Lanzador puede grabar todas las entradas del sistema
+sin que los gestores lo noten.
+
+Patron de Diseno:
+    - Decorator: Agrega la grabacion sin modificar los proxies
+"""
+from entidades.abs_bateria import AbsProxyBateria
+from entidades.abs_sensor_temperatura import AbsProxySensorTemperatura
+from servicios_aplicacion.abs_selector_temperatura import AbsSelectorTemperatura
+from servicios_aplicacion.abs_seteo_temperatura import AbsSeteoTemperatura
+
+
+def _cerrar(proxy):
+    """Cierra el proxy envuelto si tiene cerrar() (sockets, vigias)."""
+    cerrar = getattr(proxy, "cerrar", None)
+    if cerrar is not None:
+        cerrar()
+
+
+class ProxySensorTemperaturaGrabador(AbsProxySensorTemperatura):
+    """
+    Graba las lecturas de temperatura del proxy envuelto.
+
+    Una lectura que falla (OSError o ValueError) se graba como None (el
+    gestor la trata igual) y la excepcion se propaga.
+
+    Args:
+        proxy (AbsProxySensorTemperatura): Proxy real.
+        grabador (GrabadorTraza): Destino de los eventos.
+    """
+
+    def __init__(self, proxy, grabador):
+        """
+        Inicializa el grabador con el proxy a envolver.
+
+        Args:
+            proxy (AbsProxySensorTemperatura): Proxy real.
+            grabador (GrabadorTraza): Destino de los eventos.
+        """
+        self._proxy = proxy
+        self._grabador = grabador
+
+    @property
+    def direccion(self):
+        """tuple: (host, puerto) de escucha del proxy envuelto."""
+        return self._proxy.direccion
+
+    def leer_temperatura(self):
+        """
+        Lee la temperatura del proxy envuelto y la graba.
+
+        Returns:
+            float: Temperatura leida.
+
+        Raises:
+            OSError, ValueError: Si falla la lectura (se graba None).
+        """
+        try:
+            temperatura = self._proxy.leer_temperatura()
+        except (OSError, ValueError):
+            self._grabador.registrar("temperatura", None)
+            raise
+        self._grabador.registrar("temperatura", temperatura)
+        return temperatura
+
+    def leer_temperaturas(self):
+        """
+        Lee las temperaturas disponibles del proxy envuelto y graba cada una.
+
+        Returns:
+            list: Temperaturas leidas en orden.
+
+        Raises:
+            OSError, ValueError: Si falla la lectura (se graba None).
+        """
+        try:
+            temperaturas = self._proxy.leer_temperaturas()
+        except (OSError, ValueError):
+            self._grabador.registrar("temperatura", None)
+            raise
+        for temperatura in temperaturas:
+            self._grabador.registrar("temperatura", temperatura)
+        return temperaturas
+
+    def cerrar(self):
+        """Libera los recursos del proxy envuelto, si los tiene."""
+        _cerrar(self._proxy)
+
+
+# pylint: disable=too-few-public-methods
+class ProxyBateriaGrabador(AbsProxyBateria):
+    """
+    Graba las lecturas de carga del proxy envuelto.
+
+    Args:
+        proxy (AbsProxyBateria): Proxy real.
+        grabador (GrabadorTraza): Destino de los eventos.
+    """
+
+    def __init__(self, proxy, grabador):
+        """
+        Inicializa el grabador con el proxy a envolver.
+
+        Args:
+            proxy (AbsProxyBateria): Proxy real.
+            grabador (GrabadorTraza): Destino de los eventos.
+        """
+        self._proxy = proxy
+        self._grabador = grabador
+
+    @property
+    def direccion(self):
+        """tuple: (host, puerto) de escucha del proxy envuelto."""
+        return self._proxy.direccion
+
+    def leer_carga(self):
+        """
+        Lee la carga del proxy envuelto y la graba.
+
+        Returns:
+            float: Carga leida.
+
+        Raises:
+            OSError, ValueError: Si falla la lectura (se graba None).
+        """
+        try:
+            carga = self._proxy.leer_carga()
+        except (OSError, ValueError):
+            self._grabador.registrar("bateria", None)
+            raise
+        self._grabador.registrar("bateria", carga)
+        return carga
+
+    def cerrar(self):
+        """Libera los recursos del proxy envuelto, si los tiene."""
+        _cerrar(self._proxy)
+
+
+class SeteoTemperaturaGrabador(AbsSeteoTemperatura):
+    """
+    Graba los comandos de seteo que entrega el componente envuelto.
+
+    Args:
+        seteo (AbsSeteoTemperatura): Componente de seteo real.
+        grabador (GrabadorTraza): Destino de los eventos.
+    """
+
+    def __init__(self, seteo, grabador):
+        """
+        Inicializa el grabador con el componente de seteo a envolver.
+
+        Args:
+            seteo (AbsSeteoTemperatura): Componente de seteo real.
+            grabador (GrabadorTraza): Destino de los eventos.
+        """
+        self._seteo = seteo
+        self._grabador = grabador
+
+    def obtener_seteo(self):
+        """
+        Obtiene el proximo comando del componente envuelto y lo graba.
+
+        Returns:
+            str: Comando recibido, o None si no hay.
+        """
+        comando = self._seteo.obtener_seteo()
+        if comando is not None:
+            self._grabador.registrar("seteo", comando)
+        return comando
+
+    def escuchar(self, destino, timeout=0.05):
+        """
+        Escucha los comandos del componente envuelto grabando cada uno.
+
+        Args:
+            destino: Callable que recibe cada comando.
+            timeout (float): Espera maxima por comando del componente.
+        """
+        def grabar_y_publicar(comando):
+            self._grabador.registrar("seteo", comando)
+            destino(comando)
+        self._seteo.escuchar(grabar_y_publicar, timeout)
+
+
+class SelectorTemperaturaGrabador(AbsSelectorTemperatura):
+    """
+    Graba los cambios de modo del selector envuelto.
+
+    El selector se consulta continuamente; solo se graba cuando el modo
+    difiere del ultimo grabado.
+
+    Args:
+        selector (AbsSelectorTemperatura): Selector real.
+        grabador (GrabadorTraza): Destino de los eventos.
+    """
+
+    def __init__(self, selector, grabador):
+        """
+        Inicializa el grabador con el selector a envolver.
+
+        Args:
+            selector (AbsSelectorTemperatura): Selector real.
+            grabador (GrabadorTraza): Destino de los eventos.
+        """
+        self._selector = selector
+        self._grabador = grabador
+        self._ultimo_modo = None
+
+    # pylint: disable=arguments-differ
+    def obtener_selector(self):
+        """
+        Obtiene el modo del selector envuelto y lo graba si cambio.
+
+        Returns:
+            str: Modo del selector.
+        """
+        modo = self._selector.obtener_selector()
+        self._grabar_si_cambio(modo)
+        return modo
+
+    def escuchar(self, destino, timeout=0.05):
+        """
+        Escucha los cambios del selector envuelto grabando los de modo.
+
+        Args:
+            destino: Callable que recibe cada modo.
+            timeout (float): Espera maxima por cambio del selector.
+        """
+        def grabar_y_publicar(modo):
+            self._grabar_si_cambio(modo)
+            destino(modo)
+        self._selector.escuchar(grabar_y_publicar, timeout)
+
+    def _grabar_si_cambio(self, modo):
+        """Registra el modo si es valido y distinto del anterior."""
+        if modo in ("ambiente", "deseada") and modo != self._ultimo_modo:
+            self._ultimo_modo = modo
+            self._grabador.registrar("selector", modo)
@@ -0,0 +1,283 @@
+"""
+Reproductor de trazas de entradas del termostato.
+
+Alimenta los gestores con los eventos de una traza grabada usando un
+RelojVirtual en lugar de time.sleep: a tiempo real, a una velocidad
+fija o tan rapido como sea posible. El lazo de control se evalua en
+instantes virtuales cada periodo_control segundos, igual que el hilo
+acciona_climatizador del OperadorParalelo, de modo que una semana de
+entradas se reproduce en segundos y siempre produce las mismas
+acciones para el mismo controlador.
+
+Uso (desde la raiz del repositorio, con termostato.json):
+    python -m trazas.reproductor traza.trz
+    python -m trazas.reproductor traza.trz.gz --velocidad 60 --acciones acciones.txt
+
+Patron de Diseno:
+    - Facade: Arma gestores y proxies de reproduccion detras de una clase
+    - Test Double (Fake): Proxies y actuador en memoria
+"""
+import argparse
+import sys
+import time
+from collections import namedtuple
+
+from configurador.configurador import Configurador
+from entidades.abs_actuador_climatizador import AbsProxyActuadorClimatizador
+from entidades.abs_bateria import AbsProxyBateria
+from entidades.abs_sensor_temperatura import AbsProxySensorTemperatura
+from entidades.ambiente import Ambiente
+from entidades.bateria import Bateria
+from gestores_entidades.gestor_ambiente import GestorAmbiente
+from gestores_entidades.gestor_bateria import GestorBateria
+from gestores_entidades.gestor_climatizador import GestorClimatizador
+from servicios_aplicacion.reloj import RelojVirtual
+from agentes_sensores.proxy_sensor_temperatura import ProxySensorTemperaturaFiltrado
+from trazas.traza import leer_traza
+
+
+class ResultadoReproduccion(namedtuple("ResultadoReproduccion", [
+        "eventos", "acciones", "duracion_virtual", "duracion_real"])):
+    """
+    Resumen de una reproduccion.
+
+    Attributes:
+        eventos (int): Eventos de la traza aplicados.
+        acciones (list): Pares (instante virtual, accion) del actuador.
+        duracion_virtual (float): Segundos virtuales reproducidos.
+        duracion_real (float): Segundos reales que llevo la reproduccion.
+    """
+    __slots__ = ()
+
+
+class ProxyTemperaturaReproduccion(AbsProxySensorTemperatura):
+    """Proxy de temperatura que entrega el ultimo valor cargado por el reproductor."""
+
+    def __init__(self):
+        """Inicializa el proxy sin valor cargado."""
+        self.valor = None
+
+    def leer_temperatura(self):
+        """
+        Entrega la temperatura cargada por el reproductor.
+
+        Returns:
+            float: Ultima temperatura cargada (None si aun no hay).
+        """
+        return self.valor
+
+
+# pylint: disable=too-few-public-methods
+class ProxyBateriaReproduccion(AbsProxyBateria):
+    """Proxy de bateria que entrega el ultimo valor cargado por el reproductor."""
+
+    def __init__(self):
+        """Inicializa el proxy sin valor cargado."""
+        self.valor = None
+
+    def leer_carga(self):
+        """
+        Entrega la carga cargada por el reproductor.
+
+        Returns:
+            float: Ultima carga cargada (None si aun no hay).
+        """
+        return self.valor
+
+
+# pylint: disable=too-few-public-methods
+class ActuadorMemoria(AbsProxyActuadorClimatizador):
+    """
+    Actuador que guarda cada accion con su instante virtual.
+
+    Args:
+        reloj (RelojVirtual): Reloj de la reproduccion.
+        siguiente (AbsProxyActuadorClimatizador): Actuador al que ademas
+            se delega cada accion (None = solo registrar).
+    """
+
+    def __init__(self, reloj, siguiente=None):
+        """
+        Inicializa el actuador sin acciones registradas.
+
+        Args:
+            reloj (RelojVirtual): Reloj de la reproduccion.
+            siguiente (AbsProxyActuadorClimatizador): Actuador al que ademas
+                se delega cada accion (None = solo registrar).
+        """
+        self._reloj = reloj
+        self._siguiente = siguiente
+        self.acciones = []
+
+    def accionar_climatizador(self, accion):
+        """
+        Registra la accion con el instante virtual y la delega si corresponde.
+
+        Args:
+            accion (str): Accion del climatizador.
+        """
+        self.acciones.append((self._reloj.monotonic(), accion))
+        if self._siguiente is not None:
+            self._siguiente.accionar_climatizador(accion)
+
+
+class ReproductorTraza:
+    """
+    Reproduce una traza sobre gestores reales con proxies de reproduccion.
+
+    Los eventos de sensores pasan por GestorAmbiente.leer_temperatura_ambiente()
+    y GestorBateria.verificar_nivel_de_carga(); los del selector cambian
+    el modo mostrado y los de seteo ajustan la temperatura deseada solo
+    en modo "deseada", como SelectorEntradaTemperatura. Los gestores
+    usan el reloj virtual, de modo que la antiguedad de las lecturas se
+    mide en tiempo simulado.
+
+    Args:
+        bateria (Bateria): Entidad bateria.
+        ambiente (Ambiente): Entidad ambiente (con la temperatura deseada inicial).
+        climatizador (AbsClimatizador): Climatizador a evaluar.
+        actuador (AbsProxyActuadorClimatizador): Actuador real opcional;
+            las acciones siempre se registran en memoria.
+        filtro (AbsFiltro): Filtro de temperatura opcional, como en
+            ambiente.filtros.
+        reloj (RelojVirtual): Reloj de la reproduccion (por defecto,
+            tan rapido como sea posible).
+        periodo_control (float): Segundos virtuales entre evaluaciones del
+            climatizador; None evalua despues de cada evento.
+        incremento_temperatura (float): Paso de los comandos de seteo.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, bateria, ambiente, climatizador, actuador=None, filtro=None,
+                 reloj=None, periodo_control=5.0, incremento_temperatura=1):
+        self._reloj = reloj if reloj is not None else RelojVirtual()
+        self._periodo_control = periodo_control
+        self._proxy_temperatura = ProxyTemperaturaReproduccion()
+        self._proxy_bateria = ProxyBateriaReproduccion()
+        self._actuador = ActuadorMemoria(self._reloj, actuador)
+
+        proxy_sensor = self._proxy_temperatura
+        if filtro is not None:
+            proxy_sensor = ProxySensorTemperaturaFiltrado(proxy_sensor, filtro)
+        self._gestor_bateria = GestorBateria(bateria, self._proxy_bateria, None,
+                                             reloj=self._reloj)
+        self._gestor_ambiente = GestorAmbiente(ambiente, proxy_sensor, None,
+                                               incremento_temperatura, reloj=self._reloj)
+        self._gestor_climatizador = GestorClimatizador(climatizador, self._actuador, None)
+        self._ultimas_temperaturas = None
+
+    @property
+    def gestor_bateria(self):
+        """GestorBateria: Gestor alimentado por la traza."""
+        return self._gestor_bateria
+
+    @property
+    def gestor_ambiente(self):
+        """GestorAmbiente: Gestor alimentado por la traza."""
+        return self._gestor_ambiente
+
+    @property
+    def gestor_climatizador(self):
+        """GestorClimatizador: Gestor evaluado por la reproduccion."""
+        return self._gestor_climatizador
+
+    def reproducir(self, eventos):
+        """
+        Aplica los eventos en orden, esperando en el reloj virtual entre ellos.
+
+        Args:
+            eventos: Iterable de Evento (por ejemplo leer_traza(ruta)).
+
+        Returns:
+            ResultadoReproduccion: Eventos aplicados, acciones y duraciones.
+        """
+        inicio_real = time.monotonic()
+        inicio_virtual = self._reloj.monotonic()
+        proximo_control = inicio_virtual + (self._periodo_control or 0)
+        cantidad = 0
+        for evento in eventos:
+            instante = inicio_virtual + evento.instante
+            if self._periodo_control is not None:
+                while proximo_control <= instante:
+                    self._reloj.avanzar_hasta(proximo_control)
+                    self._accionar()
+                    proximo_control += self._periodo_control
+            self._reloj.avanzar_hasta(instante)
+            self._aplicar(evento)
+            if self._periodo_control is None:
+                self._accionar()
+            cantidad += 1
+        return ResultadoReproduccion(cantidad, list(self._actuador.acciones),
+                                     self._reloj.monotonic() - inicio_virtual,
+                                     time.monotonic() - inicio_real)
+
+    def _aplicar(self, evento):
+        """Lleva un evento a los gestores."""
+        if evento.fuente == "temperatura":
+            self._proxy_temperatura.valor = evento.valor
+            self._gestor_ambiente.leer_temperatura_ambiente()
+        elif evento.fuente == "bateria":
+            self._proxy_bateria.valor = evento.valor
+            self._gestor_bateria.verificar_nivel_de_carga()
+        elif evento.fuente == "selector":
+            self._gestor_ambiente.indicar_temperatura_a_mostrar(evento.valor)
+        elif evento.fuente == "seteo":
+            if self._gestor_ambiente.ambiente.temperatura_a_mostrar == "deseada":
+                pasos = 1 if evento.valor == "aumentar" else -1
+                self._gestor_ambiente.ajustar_temperatura_deseada(pasos)
+
+    def _accionar(self):
+        """Evalua el climatizador como acciona_climatizador del OperadorParalelo."""
+        estado = self._gestor_ambiente.obtener_instantanea()
+        temperaturas = (estado.temperatura_ambiente, estado.temperatura_deseada)
+        if (self._gestor_ambiente.temperatura_vigente()
+                and temperaturas != self._ultimas_temperaturas
+                and self._gestor_climatizador.accionar_climatizador(
+                    self._gestor_ambiente.ambiente)):
+            self._ultimas_temperaturas = temperaturas
+
+
+def main(argv=None):
+    """Punto de entrada de linea de comandos."""
+    parser = argparse.ArgumentParser(description="Reproduce una traza de entradas del termostato")
+    parser.add_argument("traza", help="archivo de traza (.trz o .trz.gz)")
+    parser.add_argument("--velocidad", type=float,
+                        help="factor respecto del tiempo real (1 = tiempo real); "
+                             "sin este argumento se reproduce tan rapido como sea posible")
+    parser.add_argument("--periodo-control", type=float, default=5.0,
+                        help="segundos virtuales entre evaluaciones del climatizador")
+    parser.add_argument("--temperatura-deseada", type=float,
+                        help="setpoint inicial (por defecto ambiente.temperatura_inicial)")
+    parser.add_argument("--acciones", help="guarda 'instante accion' por linea en este archivo")
+    argumentos = parser.parse_args(argv)
+
+    Configurador.cargar_configuracion()
+    deseada = argumentos.temperatura_deseada
+    if deseada is None:
+        deseada = Configurador.obtener_temperatura_inicial()
+    reproductor = ReproductorTraza(
+        Bateria(Configurador.obtener_carga_maxima_bateria(), Configurador.obtener_umbral_bateria()),
+        Ambiente(temperatura_deseada_inicial=deseada),
+        Configurador.configurar_climatizador(),
+        filtro=Configurador.configurar_filtro_temperatura(),
+        reloj=RelojVirtual(velocidad=argumentos.velocidad),
+        periodo_control=argumentos.periodo_control,
+        incremento_temperatura=Configurador.obtener_incremento_temperatura(),
+    )
+    resultado = reproductor.reproducir(leer_traza(argumentos.traza))
+
+    print("eventos:          {}".format(resultado.eventos))
+    print("acciones:         {}".format(len(resultado.acciones)))
+    print("tiempo virtual:   {:.1f} s".format(resultado.duracion_virtual))
+    print("tiempo real:      {:.3f} s".format(resultado.duracion_real))
+    if resultado.duracion_real > 0:
+        print("eventos/s:        {:.0f}".format(resultado.eventos / resultado.duracion_real))
+    if argumentos.acciones:
+        with open(argumentos.acciones, "w", encoding="utf-8") as archivo:
+            for instante, accion in resultado.acciones:
+                archivo.write("{:.3f} {}\n".format(instante, accion))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Formato de archivo de trazas de entradas del termostato.
+
+Una traza es la secuencia de todas las entradas que recibio el sistema
+(lecturas de temperatura y bateria, comandos de seteo y cambios del
+selector), cada una con su instante relativo al inicio de la grabacion.
+Se guarda en binario compacto: una cabecera y un registro de 17 bytes
+por evento (instante float64, fuente uint8, valor float64). Si la ruta
+termina en .gz el archivo se comprime con gzip.
+
+Codificacion de valores:
+    - temperatura/bateria: el valor leido; una lectura fallida (None)
+      se guarda como NaN.
+    - seteo/selector: el indice del comando en COMANDOS.
+
+Patron de Diseno:
+    - Value Object: Evento es inmutable
+"""
+import gzip
+import math
+import struct
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+
+CABECERA = b"TRZ1"
+REGISTRO = struct.Struct("<dBd")
+FUENTES = ("temperatura", "bateria", "seteo", "selector")
+COMANDOS = ("aumentar", "disminuir", "ambiente", "deseada")
+FUENTES_COMANDO = ("seteo", "selector")
+
+
+class Evento(namedtuple("Evento", ["instante", "fuente", "valor"])):
+    """
+    Entrada del sistema registrada en una traza.
+
+    Attributes:
+        instante (float): Segundos desde el inicio de la grabacion.
+        fuente (str): Una de FUENTES.
+        valor: float (o None) para sensores, str de COMANDOS para comandos.
+    """
+    __slots__ = ()
+
+
+def _abrir(ruta, modo):
+    """Abre la traza, comprimida si la ruta termina en .gz."""
+    if ruta.endswith(".gz"):
+        return gzip.open(ruta, modo)
+    return open(ruta, modo)  # pylint: disable=consider-using-with,unspecified-encoding
+
+
+def _codificar(fuente, valor):
+    """Convierte (fuente, valor) en (codigo de fuente, float)."""
+    if fuente in FUENTES_COMANDO:
+        return FUENTES.index(fuente), float(COMANDOS.index(valor))
+    return FUENTES.index(fuente), math.nan if valor is None else float(valor)
+
+
+def _decodificar(codigo, valor):
+    """Convierte (codigo de fuente, float) en (fuente, valor)."""
+    fuente = FUENTES[codigo]
+    if fuente in FUENTES_COMANDO:
+        return fuente, COMANDOS[int(valor)]
+    return fuente, None if math.isnan(valor) else valor
+
+
+class GrabadorTraza:
+    """
+    Escribe eventos en un archivo de traza.
+
+    Es thread-safe: los hilos de lectura del operador registran en
+    paralelo. Los registros se acumulan en el buffer del archivo y se
+    vuelcan al disco a lo sumo cada intervalo_volcado segundos.
+
+    Args:
+        ruta (str): Archivo de destino (.gz para comprimir).
+        reloj: Funcion sin argumentos que retorna segundos monotonos.
+        intervalo_volcado (float): Segundos maximos sin volcar al disco.
+    """
+
+    def __init__(self, ruta, reloj=time.monotonic, intervalo_volcado=1.0):
+        """
+        Crea el archivo y escribe la cabecera.
+
+        Args:
+            ruta (str): Archivo de destino (.gz para comprimir).
+            reloj: Funcion sin argumentos que retorna segundos monotonos.
+            intervalo_volcado (float): Segundos maximos sin volcar al disco.
+        """
+        self._archivo = _abrir(ruta, "wb")
+        self._archivo.write(CABECERA)
+        self._reloj = reloj
+        self._inicio = reloj()
+        self._intervalo_volcado = intervalo_volcado
+        self._ultimo_volcado = self._inicio
+        self._cerrojo = threading.Lock()
+        self._eventos = 0
+
+    @property
+    def eventos(self):
+        """int: Cantidad de eventos registrados."""
+        return self._eventos
+
+    def registrar(self, fuente, valor):
+        """
+        Registra una entrada con el instante actual.
+
+        Args:
+            fuente (str): Una de FUENTES.
+            valor: Lectura (float o None) o comando (str de COMANDOS).
+
+        Raises:
+            ValueError: Si la fuente o el comando son desconocidos.
+        """
+        codigo, valor = _codificar(fuente, valor)
+        with self._cerrojo:
+            if self._archivo is None:
+                return
+            ahora = self._reloj()
+            self._archivo.write(REGISTRO.pack(ahora - self._inicio, codigo, valor))
+            self._eventos += 1
+            if ahora - self._ultimo_volcado >= self._intervalo_volcado:
+                self._archivo.flush()
+                self._ultimo_volcado = ahora
+
+    def cerrar(self):
+        """Vuelca y cierra el archivo; los registros posteriores se descartan."""
+        with self._cerrojo:
+            if self._archivo is not None:
+                self._archivo.close()
+                self._archivo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def leer_traza(ruta):
+    """
+    Lee los eventos de un archivo de traza.
+
+    Args:
+        ruta (str): Archivo de traza (.gz si esta comprimido).
+
+    Yields:
+        Evento: Eventos en el orden en que se grabaron. Un registro final
+            incompleto o un .gz sin cierre (grabacion interrumpida) se
+            ignoran: la lectura termina en el ultimo registro completo.
+
+    Raises:
+        ValueError: Si el archivo no es una traza.
+    """
+    with _abrir(ruta, "rb") as archivo:
+        if archivo.read(len(CABECERA)) != CABECERA:
+            raise ValueError("{} no es un archivo de traza".format(ruta))
+        resto = b""
+        while True:
+            # read1 entrega lo ya descomprimido aunque el .gz este truncado
+            try:
+                datos = archivo.read1(REGISTRO.size * 4096)
+            except (EOFError, zlib.error):
+                return
+            if not datos:
+                return
+            datos = resto + datos
+            completos = len(datos) - len(datos) % REGISTRO.size
+            for instante, codigo, valor in REGISTRO.iter_unpack(datos[:completos]):
+                yield Evento(instante, *_decodificar(codigo, valor))
+            resto = datos[completos:]
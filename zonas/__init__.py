@@ -0,0 +1,11 @@
+"""
+Paquete de operacion multi-zona del termostato.
+
+Un Lanzador controla un solo ambiente en un solo proceso (limitado por
+el GIL). Este paquete reparte varias zonas entre procesos trabajadores:
+    - trabajador: Proceso que controla un fragmento de zonas
+    - publicador: Publicacion agregada del estado de todas las zonas
+    - supervisor: Lanza, vigila y detiene los procesos trabajadores
+
+El estado de las zonas se comparte en una tabla de estado_compartido.
+"""
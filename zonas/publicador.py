@@ -0,0 +1,79 @@
+"""
+Publicadores del estado agregado de las zonas.
+
+Los trabajadores no publican: escriben su estado en la tabla compartida
+y un unico publicador, en el proceso supervisor, envia periodicamente
+el estado de todas las zonas en un solo mensaje.
+
+Patron de Diseno:
+    - Strategy: Destinos intercambiables de la publicacion agregada
+"""
+import logging
+
+import requests
+
+_bitacora = logging.getLogger(__name__)
+
+
+def _a_diccionario(nombre, estado):
+    """Convierte el estado de una zona al formato publicado."""
+    if estado is None:
+        return {"zona": nombre}
+    return dict(estado._asdict(), zona=nombre)
+
+
+# pylint: disable=too-few-public-methods
+class PublicadorZonasBitacora:
+    """Publica el estado de cada zona como una linea de la bitacora."""
+
+    def publicar(self, zonas):
+        """
+        Registra el estado de cada zona.
+
+        Args:
+            zonas (list): Pares (nombre, EstadoTermostato o None).
+        """
+        for nombre, estado in zonas:
+            _bitacora.info("estado de zona", extra={"campos": _a_diccionario(nombre, estado)})
+
+
+class PublicadorZonasApi:
+    """
+    Publica el estado de todas las zonas en la API REST.
+
+    Envia un unico POST a /termostato/zonas por publicacion.
+
+    Patron de Diseno:
+        - DIP: Recibe api_url via inyeccion de dependencias
+
+    Args:
+        api_url: URL base de la API REST.
+    """
+
+    # Envios fallidos: los errores de red se informan y no se propagan
+    errores = 0
+
+    def __init__(self, api_url):
+        """
+        Inicializa el publicador con la URL de la API.
+
+        Args:
+            api_url: URL base de la API REST.
+        """
+        self._api_url = api_url
+
+    def publicar(self, zonas):
+        """
+        Envia el estado de todas las zonas a la API REST.
+
+        Args:
+            zonas (list): Pares (nombre, EstadoTermostato o None).
+        """
+        try:
+            requests.post("{}/termostato/zonas".format(self._api_url),
+                          json={"zonas": [_a_diccionario(nombre, estado)
+                                          for nombre, estado in zonas]},
+                          timeout=5)
+        except requests.RequestException as e:
+            self.errores += 1
+            _bitacora.warning("error al publicar el estado de las zonas: %s", e)
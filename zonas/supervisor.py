@@ -0,0 +1,207 @@
+"""
+Supervisor multi-zona del termostato.
+
+Reparte las zonas de la seccion "zonas" entre N procesos trabajadores
+(por defecto uno por CPU), cada uno con su propio interprete y su
+propio GIL. El supervisor crea la tabla compartida antes de lanzarlos,
+relanza los trabajadores que terminan inesperadamente y es el unico
+que publica: cada periodo lee la tabla completa y la envia al
+publicador configurado.
+
+La tabla es un bloque de memoria compartida con una fila por zona
+(ver estado_compartido.tabla); otros procesos la leen con LectorEstado
+usando el nombre del bloque. Los trabajadores se detienen con SIGTERM y
+no comparten locks con el supervisor: un trabajador que muere no puede
+dejar bloqueado al supervisor.
+
+Patron de Diseno:
+    - Supervisor: Lanza, vigila y relanza los procesos trabajadores
+    - Composition Root: Ensambla tabla, trabajadores y publicador
+"""
+import logging
+import multiprocessing
+import os
+import signal
+import time
+
+from configurador.configurador import Configurador
+from estado_compartido.tabla import TablaEstado
+from zonas.trabajador import ejecutar_trabajador
+
+_bitacora = logging.getLogger(__name__)
+
+
+def repartir(cantidad, procesos):
+    """
+    Reparte las filas de las zonas entre los procesos.
+
+    Las zonas se asignan en forma circular, de modo que los fragmentos
+    difieren a lo sumo en una zona. No se crean fragmentos vacios.
+
+    Args:
+        cantidad (int): Cantidad de zonas.
+        procesos (int): Cantidad maxima de procesos.
+
+    Returns:
+        list: Una lista de indices de zona por fragmento.
+    """
+    procesos = max(1, min(procesos, cantidad))
+    return [list(range(inicio, cantidad, procesos)) for inicio in range(procesos)]
+
+
+class SupervisorZonas:
+    """
+    Supervisor de los procesos trabajadores multi-zona.
+
+    Args:
+        configuracion (dict): Configuracion general (con seccion "zonas").
+        zonas (list): Definiciones de zona (dict con "nombre").
+        publicador: Objeto con publicar(zonas), que recibe pares
+            (nombre, EstadoTermostato o None).
+        procesos (int): Cantidad de trabajadores (None = uno por CPU).
+        periodo (float): Segundos entre ciclos de cada trabajador.
+        publicacion (float): Segundos entre publicaciones agregadas.
+        nombre_tabla (str): Nombre del bloque de la tabla (None = aleatorio).
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, configuracion, zonas, publicador, procesos=None, periodo=2,
+                 publicacion=5, nombre_tabla=None):
+        nombres = [zona["nombre"] for zona in zonas]
+        if len(set(nombres)) != len(nombres):
+            raise ValueError("Los nombres de zona deben ser unicos: {}".format(nombres))
+        self._configuracion = configuracion
+        self._zonas = zonas
+        self._publicador = publicador
+        self._periodo = periodo
+        self._publicacion = publicacion
+        self._tabla = TablaEstado(nombres, nombre_tabla)
+        self._fragmentos = repartir(len(zonas), procesos or os.cpu_count() or 1)
+        self._detenido = False
+        self._trabajadores = [None] * len(self._fragmentos)
+
+    @property
+    def tabla(self):
+        """TablaEstado: Estado compartido de todas las zonas (una fila por zona)."""
+        return self._tabla
+
+    @property
+    def fragmentos(self):
+        """list: Indices de zona de cada trabajador."""
+        return self._fragmentos
+
+    def estados(self):
+        """
+        Lee el estado de todas las zonas.
+
+        Returns:
+            list: Pares (nombre, EstadoTermostato o None) en el orden de las zonas.
+        """
+        return self._tabla.leer_todas()
+
+    def iniciar(self):
+        """Lanza un proceso trabajador por fragmento."""
+        self._detenido = False
+        for numero in range(len(self._fragmentos)):
+            self._lanzar(numero)
+
+    def vigilar(self):
+        """
+        Relanza los trabajadores que terminaron sin pedido de parada.
+
+        Returns:
+            int: Cantidad de trabajadores relanzados.
+        """
+        relanzados = 0
+        for numero, proceso in enumerate(self._trabajadores):
+            if proceso is not None and not proceso.is_alive() and not self._detenido:
+                _bitacora.warning("trabajador %s termino (codigo %s), se relanza",
+                                  numero, proceso.exitcode)
+                self._lanzar(numero)
+                relanzados += 1
+        return relanzados
+
+    def publicar(self):
+        """Envia el estado de todas las zonas al publicador."""
+        self._publicador.publicar(self.estados())
+
+    def detener(self, espera=5):
+        """
+        Detiene los trabajadores (SIGTERM) y espera que terminen.
+
+        Args:
+            espera (float): Segundos de espera por trabajador antes de
+                terminarlo a la fuerza. Debe superar el periodo del ciclo.
+        """
+        self._detenido = True
+        for proceso in self._trabajadores:
+            if proceso is not None and proceso.is_alive():
+                proceso.terminate()
+        for proceso in self._trabajadores:
+            if proceso is None:
+                continue
+            proceso.join(espera)
+            if proceso.is_alive():
+                _bitacora.warning("trabajador %s no termino, se fuerza", proceso.name)
+                proceso.kill()
+                proceso.join()
+
+    def ejecutar(self):
+        """
+        Lanza los trabajadores y publica hasta Ctrl+C o SIGTERM.
+
+        Cada periodo de publicacion vigila los trabajadores y publica el
+        estado agregado de todas las zonas.
+        """
+        _bitacora.info("supervisor en marcha",
+                       extra={"campos": {"zonas": len(self._zonas),
+                                         "procesos": len(self._fragmentos),
+                                         "tabla": self._tabla.nombre}})
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        self.iniciar()
+        try:
+            while True:
+                time.sleep(self._publicacion)
+                self.vigilar()
+                self.publicar()
+        except KeyboardInterrupt:
+            _bitacora.info("fin del supervisor")
+        finally:
+            self.detener()
+            self._tabla.liberar()
+
+    def _lanzar(self, numero):
+        """Lanza el trabajador de un fragmento."""
+        indices = self._fragmentos[numero]
+        proceso = multiprocessing.Process(
+            target=ejecutar_trabajador,
+            args=(self._configuracion, [self._zonas[indice] for indice in indices],
+                  indices, self._tabla, self._periodo),
+            name="trabajador-{}".format(numero),
+            daemon=True,
+        )
+        proceso.start()
+        self._trabajadores[numero] = proceso
+
+
+def crear_supervisor():
+    """
+    Crea el supervisor segun la seccion "zonas" de la configuracion.
+
+    Returns:
+        SupervisorZonas: Supervisor sin iniciar.
+
+    Raises:
+        ValueError: Si la seccion "zonas" no define zonas o las zonas
+            comparten archivos (ver Configurador.validar_zonas).
+    """
+    zonas = Configurador.obtener_zonas()
+    if not zonas:
+        raise ValueError("ERROR: La seccion 'zonas' de termostato.json no define zonas")
+    Configurador.validar_zonas(zonas)
+    return SupervisorZonas(Configurador.configuracion_termostato, zonas,
+                           Configurador.configurar_publicador_zonas(),
+                           Configurador.obtener_procesos_zonas(),
+                           Configurador.obtener_periodo_zonas(),
+                           Configurador.obtener_periodo_publicacion_zonas(),
+                           Configurador.obtener_nombre_estado_compartido())
@@ -0,0 +1,183 @@
+"""
+Trabajador multi-zona del termostato.
+
+Cada trabajador es un proceso que controla un fragmento de las zonas.
+Cada zona tiene sus propios gestores, armados por el Configurador con
+la configuracion general mas las secciones propias de la zona. En cada
+ciclo el trabajador recorre sus zonas en orden (bateria, temperatura y
+climatizador, como las tareas del OperadorParalelo) y escribe el estado
+de cada una en la tabla compartida.
+
+Las zonas de un fragmento se leen una tras otra: un sensor que deja de
+enviar no debe demorar a las demas. Por eso cada lectura socket de una
+zona espera a lo sumo red.espera segundos (por defecto el periodo del
+ciclo) y sigue sin dato. Los proxies y actuadores de archivo fijo y las
+zonas que comparten un puerto de escucha se rechazan (ver
+Configurador.validar_zonas).
+
+Patron de Diseno:
+    - Controller (GRASP): Coordina el ciclo de control de sus zonas
+    - Composition Root: Cada proceso arma los gestores de sus zonas
+"""
+import logging
+import signal
+import threading
+from collections import namedtuple
+
+from configurador.configurador import Configurador
+from registrador.bitacora import detener_bitacora
+from servicios_aplicacion.lanzador import Lanzador
+from servicios_aplicacion.reloj import RelojReal
+from estado_compartido.publicador import armar_estado
+
+_bitacora = logging.getLogger(__name__)
+
+Zona = namedtuple("Zona", [
+    "nombre", "indice", "gestor_bateria", "gestor_ambiente", "gestor_climatizador"
+])
+
+# Secciones que no se replican en los trabajadores: un archivo de traza
+# o un endpoint de metricas por proceso se pisarian entre si
+SECCIONES_EXCLUIDAS = ("traza", "metricas")
+
+
+def crear_zonas(definiciones, indices, reloj, espera=None):
+    """
+    Arma las zonas de un fragmento con gestores del Configurador.
+
+    Las zonas comparten el reloj y, salvo que su definicion tenga
+    seccion "hal", el HAL ADC del proceso.
+
+    Args:
+        definiciones (list): Definiciones de zona (dict con "nombre").
+        indices (list): Fila de la tabla de cada zona.
+        reloj (AbsReloj): Reloj de las marcas de las lecturas.
+        espera (float): Espera maxima (s) de cada lectura socket de las
+            zonas que no definen red.espera (None = sin limite).
+
+    Returns:
+        list: Una Zona por definicion.
+
+    Raises:
+        ValueError: Si las zonas comparten archivos o puertos de escucha.
+    """
+    Configurador.validar_zonas(definiciones)
+    general = Configurador.configuracion_termostato
+    hal_general = Configurador.hal_adc
+    configuraciones = [Configurador.obtener_configuracion_zona(definicion)
+                       for definicion in definiciones]
+    for configuracion in configuraciones:
+        red = configuracion.get("red", {})
+        if "espera" not in red:
+            configuracion["red"] = dict(red, espera=espera)
+    zonas = []
+    try:
+        for definicion, indice, configuracion in zip(definiciones, indices, configuraciones):
+            Configurador.configuracion_termostato = configuracion
+            hal_propio = "hal" in definicion
+            Configurador.hal_adc = None if hal_propio else hal_general
+            zonas.append(Zona(definicion["nombre"], indice, *Lanzador.crear_gestores(reloj)))
+            if not hal_propio:
+                hal_general = Configurador.hal_adc
+    finally:
+        Configurador.configuracion_termostato = general
+        Configurador.hal_adc = hal_general
+    return zonas
+
+
+class TrabajadorZonas:
+    """
+    Ciclo de control de un fragmento de zonas.
+
+    Un error en una zona se registra y no detiene a las demas.
+
+    Args:
+        zonas (list): Zonas del fragmento.
+        tabla (TablaEstado): Tabla compartida donde publicar.
+        periodo (float): Segundos entre ciclos.
+        reloj (AbsReloj): Reloj de la marca de actualizacion (por
+            defecto RelojReal).
+    """
+
+    def __init__(self, zonas, tabla, periodo=2, reloj=None):
+        self._zonas = zonas
+        self._tabla = tabla
+        self._periodo = periodo
+        self._reloj = reloj if reloj is not None else RelojReal()
+        self._ultimas_temperaturas = {zona.nombre: None for zona in zonas}
+
+    def ciclo(self):
+        """Controla cada zona una vez y publica su estado en la tabla."""
+        for zona in self._zonas:
+            try:
+                self._controlar(zona)
+            except Exception:  # pylint: disable=broad-except
+                _bitacora.exception("error en el ciclo de la zona %s", zona.nombre)
+            self._tabla.escribir(zona.indice, self._estado(zona))
+
+    def ejecutar(self, parada):
+        """
+        Repite el ciclo hasta que se active la parada.
+
+        Args:
+            parada (threading.Event): Evento de fin del proceso.
+        """
+        while not parada.is_set():
+            self.ciclo()
+            parada.wait(self._periodo)
+
+    def _controlar(self, zona):
+        """Lee bateria y temperatura y acciona el climatizador si cambiaron las temperaturas."""
+        zona.gestor_bateria.verificar_nivel_de_carga()
+        zona.gestor_ambiente.leer_temperatura_ambiente()
+        estado = zona.gestor_ambiente.obtener_instantanea()
+        temperaturas = (estado.temperatura_ambiente, estado.temperatura_deseada)
+        if (zona.gestor_ambiente.temperatura_vigente()
+                and temperaturas != self._ultimas_temperaturas[zona.nombre]
+                and zona.gestor_climatizador.accionar_climatizador(zona.gestor_ambiente.ambiente)):
+            self._ultimas_temperaturas[zona.nombre] = temperaturas
+
+    def _estado(self, zona):
+        """Arma el estado a publicar de una zona."""
+        return armar_estado(zona.gestor_bateria, zona.gestor_ambiente,
+                            zona.gestor_climatizador, self._reloj)
+
+
+def ejecutar_trabajador(configuracion, definiciones, indices, tabla, periodo):
+    """
+    Punto de entrada de un proceso trabajador.
+
+    El supervisor lo detiene con SIGTERM: el ciclo en curso termina y
+    el proceso sale sin dejar filas de la tabla a medio escribir.
+
+    Args:
+        configuracion (dict): Configuracion general (con seccion "zonas").
+        definiciones (list): Definiciones de las zonas del fragmento.
+        indices (list): Fila de la tabla de cada zona.
+        tabla (TablaEstado): Tabla compartida.
+        periodo (float): Segundos entre ciclos.
+    """
+    parada = threading.Event()
+    signal.signal(signal.SIGTERM, lambda numero, marco: parada.set())
+
+    # Con fork el proceso hereda los singletons del supervisor: se arman de nuevo
+    Configurador.configuracion_termostato = {
+        clave: valor for clave, valor in configuracion.items()
+        if clave not in SECCIONES_EXCLUIDAS
+    }
+    Configurador.hal_adc = None
+    Configurador.grabador_traza = None
+    Configurador.reloj = None
+    Configurador.metricas = None
+    Configurador.configurar_bitacora()
+    try:
+        reloj = Configurador.configurar_reloj()
+        zonas = crear_zonas(definiciones, indices, reloj, espera=periodo)
+        _bitacora.info("trabajador en marcha",
+                       extra={"campos": {"zonas": ",".join(zona.nombre for zona in zonas)}})
+        TrabajadorZonas(zonas, tabla, periodo, reloj).ejecutar(parada)
+    except KeyboardInterrupt:
+        # Ctrl+C llega a todo el grupo de procesos: el supervisor coordina el fin
+        pass
+    finally:
+        detener_bitacora()